@@ -1923,6 +1923,38 @@ class TABRND1(Table):
     #def parse_fields(self, xy, nrepeated, is_data=False):
         #self.table = TableObj(xy, nrepeated, is_data)
 
+    def interpolate(self, x) -> np.ndarray:
+        """
+        Gets the power spectral density G(F)
+
+        Parameters
+        ----------
+        x : (n, ) float ndarray
+            the frequencies
+
+        Returns
+        -------
+        y : (n, ) float ndarray
+            the PSD; interpolated on the LINEAR/LOG axes and 0.0 outside
+            of the table
+
+        """
+        x = np.atleast_1d(np.asarray(x, dtype='float64'))
+        xtable = np.log(self.x) if self.xaxis == 'LOG' else self.x
+        ytable = np.log(self.y) if self.yaxis == 'LOG' else self.y
+
+        is_inside = (x >= self.x[0]) & (x <= self.x[-1])
+        x_inside = x[is_inside]
+        if self.xaxis == 'LOG':
+            x_inside = np.log(x_inside)
+        y_inside = np.interp(x_inside, xtable, ytable)
+        if self.yaxis == 'LOG':
+            y_inside = np.exp(y_inside)
+
+        y = np.zeros(x.shape, dtype='float64')
+        y[is_inside] = y_inside
+        return y
+
     def raw_fields(self):
         xy = []
         for xi, yi in zip(self.x, self.y):
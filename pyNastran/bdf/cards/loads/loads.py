@@ -177,8 +177,8 @@ class LoadCombination(BaseCard):
                            '%s' % (load.__class__.__name__, str(load)))
                     raise NotImplementedError(msg)
 
-                load_idi = list(set(load_idsi))
-                assert len(load_idi) == 1, load_idsi
+            load_idi = list(set(load_idsi))
+            assert len(load_idi) == 1, load_idsi
             load_ids.append(load_idi[0])
         return load_ids
 
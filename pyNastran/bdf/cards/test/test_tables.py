@@ -25,6 +25,17 @@ class TestTables(unittest.TestCase):
         str(table)
         save_load_deck(model, run_convert=False, run_quality=False, run_remove_unused=False)
 
+    def test_tabrnd1(self):
+        model = BDF(debug=False)
+        table = model.add_tabrnd1(1, [10., 100., 1000.], [0.01, 0.1, 0.1],
+                                  xaxis='LOG', yaxis='LOG')
+        y = table.interpolate([5., 10., np.sqrt(10. * 100.), 500., 1000., 2000.])
+        assert np.allclose(y, [0., 0.01, np.sqrt(0.01 * 0.1), 0.1, 0.1, 0.])
+
+        table = model.add_tabrnd1(2, [10., 20.], [1., 3.])
+        assert np.allclose(table.interpolate(15.), 2.)
+        save_load_deck(model, run_convert=False, run_quality=False, run_remove_unused=False)
+
     def test_tables1(self):
         model = BDF(debug=False)
         tid = 101
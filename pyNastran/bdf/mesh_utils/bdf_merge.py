@@ -2,16 +2,26 @@
 defines:
  - bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None, size=8,
              is_double=False, cards_to_skip=None, log=None, skip_case_control_deck=False)
+ - bdf_merge_offset(bdf_filenames, bdf_filename_out=None, renumber=True, nprocesses=1,
+                    size=8, is_double=False, cards_to_skip=None,
+                    skip_case_control_deck=False, log=None)
 
 """
 from __future__ import annotations
 from io import StringIO
 from pathlib import PurePath
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Any, TYPE_CHECKING
 
+import numpy as np
+
+from cpylog import get_logger2
+
 from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.case_control_deck import CaseControlDeck
-from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber, get_renumber_starting_ids_from_model
+from pyNastran.bdf.mesh_utils.bdf_renumber import (
+    bdf_renumber, get_renumber_starting_ids_from_model,
+    _create_mid_map, _update_case_control)
 from pyNastran.bdf.mesh_utils.internal_utils import get_bdf_model
 if TYPE_CHECKING:  # pragma: no cover
     from cpylog import SimpleLogger
@@ -210,6 +220,337 @@ def bdf_merge(bdf_filenames: list[str],
                                      mapper_renumber=mapper_renumber)
     return model, mappers_final
 
+def bdf_merge_offset(bdf_filenames: list[str],
+                     bdf_filename_out: Optional[str]=None,
+                     renumber: bool=True,
+                     nprocesses: int=1,
+                     encoding: Optional[str]=None,
+                     size: int=8, is_double: bool=False,
+                     cards_to_skip: Optional[list[str]]=None,
+                     skip_case_control_deck: bool=False,
+                     log: Optional[SimpleLogger]=None) -> tuple[BDF, list[MAPPER]]:
+    """
+    Merges multiple BDFs into one file using precomputed id offsets.
+
+    Unlike ``bdf_merge``, the models are never renumbered to a temporary
+    deck and reread.  The id ranges of every model are found up front,
+    the offsets are computed in one shot, and each model is remapped in
+    place before its cards are moved into the primary model.
+
+    Parameters
+    ----------
+    bdf_filenames : list[str]
+        list of bdf filenames
+    bdf_filename_out : str / None
+        the output bdf filename (default=None; None -> no writing)
+    renumber : bool; default=True
+        True : the merged ids are compressed and start from 1
+        False : the primary model ids are unchanged and the other
+                models are shifted by the maximum id of the prior models
+    nprocesses : int; default=1
+        the number of processes used to read the models
+        (only bdf paths are read in parallel)
+    encoding : str
+        the unicode encoding (default=None; system default)
+    size : int; {8, 16}; default=8
+        the bdf write precision
+    is_double : bool; default=False
+        the field precision to write
+    cards_to_skip : list[str]; (default=None -> don't skip any cards)
+        cards that should be skipped
+    skip_case_control_deck : bool, optional, default : False
+        If true, don't consider the case control deck while merging.
+
+    Returns
+    -------
+    model : BDF
+        Merged model.
+    mappers_all : list[mapper]
+        mapper : dict[bdf_attribute] : old_id_to_new_id_dict
+            List of mapper dictionaries of original ids to merged
+            (see ``bdf_merge``)
+
+    Supports
+      nodes:      GRID
+      coords:     Coord
+      elements:   elements, masses, rigid_elements, plotels
+      properties: properties, properties_mass
+      materials:  materials (including MATTx/MATSx)
+      aero:       CAERO1/2/3/4, splines
+      other:      sets, mpcs
+
+    .. todo:: doesn't support SPOINTs/EPOINTs
+
+    """
+    _check_merge_filenames(bdf_filenames)
+    models = _read_merge_models(
+        bdf_filenames, nprocesses=nprocesses, encoding=encoding,
+        cards_to_skip=cards_to_skip, log=log)
+    model = models[0]
+    if skip_case_control_deck:
+        model.case_control_deck = CaseControlDeck([], log=None)
+    model.log.info('primary=%s' % bdf_filenames[0])
+
+    id_groups = [_get_id_groups(modeli) for modeli in models]
+    offsets = _get_id_offsets(id_groups, renumber)
+
+    mappers = []
+    for i, (modeli, groups) in enumerate(zip(models, id_groups)):
+        mapper = _apply_id_offsets(groups, offsets[i, :], renumber)
+        if i == 0:
+            # only the case control deck of the primary model is kept,
+            # so the secondary models don't map the loads, methods, etc.
+            mapper = {**_get_mapper_0(modeli), **mapper}
+        mappers.append(mapper)
+
+    if renumber and model.case_control_deck is not None:
+        _update_case_control(model, mappers[0])
+
+    data_members = [
+        'coords', 'nodes', 'elements', 'masses', 'plotels', 'properties', 'properties_mass',
+        'sets', 'rigid_elements', 'mpcs', 'mpcadds', 'caeros', 'splines',
+    ]
+    for bdf_filename, model2 in zip(bdf_filenames[1:], models[1:]):
+        model.log.debug('secondary=%s' % bdf_filename)
+        _apply_scalar_cards(model, model2)
+        for data_member in data_members:
+            data1 = getattr(model, data_member)
+            data2 = getattr(model2, data_member)
+            keys = data1.keys() & data2.keys()
+            if data_member == 'coords':
+                keys.discard(0)
+                data2 = {key: value for key, value in data2.items() if key != 0}
+            if keys:
+                raise RuntimeError(f'{data_member} keys={sorted(keys)} are duplicated')
+            data1.update(data2)
+
+        _, all_materials1 = _create_mid_map(model, None)
+        _, all_materials2 = _create_mid_map(model2, None)
+        for materials1, materials2 in zip(all_materials1, all_materials2):
+            keys = materials1.keys() & materials2.keys()
+            if keys:
+                raise RuntimeError(f'materials keys={sorted(keys)} are duplicated')
+            materials1.update(materials2)
+
+    if bdf_filename_out:
+        model.write_bdf(out_filename=bdf_filename_out, encoding=None,
+                        size=size, is_double=is_double,
+                        interspersed=False, enddata=None)
+    return model, mappers
+
+def _check_merge_filenames(bdf_filenames: list[str]) -> None:
+    """checks the filenames for bdf_merge_offset"""
+    if not isinstance(bdf_filenames, (list, tuple)):
+        raise TypeError('bdf_filenames is not a list/tuple...%s' % str(bdf_filenames))
+
+    if not len(bdf_filenames) > 1:
+        raise RuntimeError("You can't merge one BDF...bdf_filenames=%s" % str(bdf_filenames))
+    for bdf_filename in bdf_filenames:
+        if not isinstance(bdf_filename, (str, BDF, StringIO, PurePath)):
+            raise TypeError('bdf_filenames is not a string/BDF...%s' % bdf_filename)
+
+def _read_merge_models(bdf_filenames: list[str],
+                       nprocesses: int=1,
+                       encoding: Optional[str]=None,
+                       cards_to_skip: Optional[list[str]]=None,
+                       log: Optional[SimpleLogger]=None) -> list[BDF]:
+    """
+    Reads the models to merge.  Paths are read in a process pool and
+    the unpickled models are cross-referenced in this process.
+    """
+    models = [None] * len(bdf_filenames)
+    ipaths = [i for i, bdf_filename in enumerate(bdf_filenames)
+              if isinstance(bdf_filename, (str, PurePath))]
+    if nprocesses > 1 and len(ipaths) > 1:
+        with ProcessPoolExecutor(max_workers=min(nprocesses, len(ipaths))) as executor:
+            futures = {
+                i: executor.submit(_read_bdf_no_xref, bdf_filenames[i],
+                                   cards_to_skip, encoding)
+                for i in ipaths}
+            for i, future in futures.items():
+                modeli = future.result()
+                # the logger and card parsers are dropped by the pickling
+                modeli.log = get_logger2(log=log, debug=False)
+                modeli._make_card_parser()
+                modeli.cross_reference()
+                models[i] = modeli
+
+    for i, bdf_filename in enumerate(bdf_filenames):
+        if models[i] is not None:
+            continue
+        models[i] = get_bdf_model(
+            bdf_filename, xref=True,
+            cards_to_skip=cards_to_skip, validate=False,
+            log=log, debug=False)
+    return models
+
+def _read_bdf_no_xref(bdf_filename: str,
+                      cards_to_skip: Optional[list[str]],
+                      encoding: Optional[str]) -> BDF:
+    """reads an uncross-referenced model; process pool helper for _read_merge_models"""
+    model = BDF(debug=False)
+    model.disable_cards(cards_to_skip)
+    model.read_bdf(bdf_filename, validate=False, xref=False, encoding=encoding)
+    return model
+
+def _caero_nboxes(caero) -> int:
+    """gets the number of ids that are consumed by a CAEROx"""
+    if caero.type in ['CAERO1', 'CAERO3', 'CAERO4']: # not CAERO5
+        nboxes = caero.shape[0] * caero.shape[1]
+    elif caero.type == 'CAERO2':
+        nboxes = caero.nboxes
+    else:  # pragma: no cover
+        raise NotImplementedError(caero)
+    return nboxes
+
+def _get_id_groups(model: BDF) -> list[tuple[str, str, list[tuple[str, dict]], np.ndarray, np.ndarray]]:
+    """
+    Gets the id classes that are offset when merging.
+
+    Returns
+    -------
+    id_groups : list[(id_name, attr, sources, ids, nids)]
+        id_name : str
+            the id name (e.g., 'nid')
+        attr : str
+            the card attribute that stores the id (e.g., 'nid')
+        sources : list[(mapper_key, cards_dict)]
+            the dictionaries that share the id
+        ids : (nid, ) int ndarray
+            the sorted unique ids
+        nids : (nid, ) int ndarray
+            the number of ids consumed by each id (1 except for CAEROx)
+
+    """
+    _, all_materials = _create_mid_map(model, None)
+    groups = [
+        ('cid', 'cid', [('coords', model.coords)]),
+        ('nid', 'nid', [('nodes', model.nodes)]),
+        ('eid', 'eid', [('elements', model.elements), ('masses', model.masses),
+                        ('rigid_elements', model.rigid_elements), ('plotels', model.plotels)]),
+        ('pid', 'pid', [('properties', model.properties),
+                        ('properties_mass', model.properties_mass)]),
+        ('mid', 'mid', [('materials', materials) for materials in all_materials]),
+        ('set_id', 'sid', [('sets', model.sets)]),
+        ('mpc_id', 'conid', [('mpcs', model.mpcs), ('mpcadds', model.mpcadds)]),
+        ('caero_id', 'eid', [('caeros', model.caeros)]),
+        ('spline_id', 'eid', [('splines', model.splines)]),
+    ]
+
+    id_groups = []
+    for id_name, attr, sources in groups:
+        keys = [np.fromiter(cards.keys(), dtype='int64', count=len(cards))
+                for unused_key, cards in sources]
+        ids = np.unique(np.hstack(keys)) if keys else np.zeros(0, dtype='int64')
+        if id_name == 'cid':
+            # the global coordinate system is not renumbered
+            ids = ids[ids != 0]
+        nids = np.ones(len(ids), dtype='int64')
+        if id_name == 'caero_id':
+            nids = np.array([_caero_nboxes(model.caeros[caero_id]) for caero_id in ids],
+                            dtype='int64')
+        id_groups.append((id_name, attr, sources, ids, nids))
+    return id_groups
+
+def _get_id_offsets(id_groups_all: list[list[Any]], renumber: bool) -> np.ndarray:
+    """
+    Computes the offsets for all models from the id ranges
+
+    Returns
+    -------
+    offsets : (nmodels, ngroups) int ndarray
+        the value added to the (renumbered) ids
+
+    """
+    nmodels = len(id_groups_all)
+    ngroups = len(id_groups_all[0])
+    extents = np.zeros((nmodels, ngroups), dtype='int64')
+    for imodel, id_groups in enumerate(id_groups_all):
+        for igroup, (unused_name, unused_attr, unused_sources, ids, nids) in enumerate(id_groups):
+            if len(ids) == 0:
+                continue
+            if renumber:
+                extents[imodel, igroup] = nids.sum()
+            else:
+                extents[imodel, igroup] = (ids + nids - 1).max()
+
+    offsets = np.zeros((nmodels, ngroups), dtype='int64')
+    offsets[1:, :] = np.cumsum(extents[:-1, :], axis=0)
+    if renumber:
+        offsets += 1
+    return offsets
+
+def _apply_id_offsets(id_groups: list[Any], offsets: np.ndarray,
+                      renumber: bool) -> MAPPER:
+    """
+    Applies the offsets to the cards and rekeys the card dictionaries
+
+    Returns
+    -------
+    mapper : dict[bdf_attribute] : old_id_to_new_id_dict
+        the mapper for the remapped ids
+
+    """
+    mapper = {}
+    id_maps = {}
+    for (id_name, attr, sources, ids, nids), offset in zip(id_groups, offsets):
+        if renumber:
+            ids_new = offset + np.cumsum(nids) - nids
+        else:
+            ids_new = ids + offset
+        id_map = dict(zip(ids.tolist(), ids_new.tolist()))
+        if id_name == 'cid':
+            id_map[0] = 0
+        id_maps[id_name] = id_map
+
+        if id_name == 'spline_id':
+            _offset_spline_boxes(sources[0][1], id_maps['caero_id'])
+
+        for mapper_key, cards in sources:
+            _offset_cards(cards, attr, id_map)
+            if id_name == 'caero_id':
+                for caero in cards.values():
+                    if hasattr(caero, '_init_ids'):
+                        caero._init_ids()
+            sub_mapper = mapper.setdefault(mapper_key, {})
+            sub_mapper.update((id_old, id_map[id_old]) for id_old in cards)
+            _rekey_cards(cards, attr)
+
+    mapper['elements'] = id_maps['eid']
+    mapper['mpcs'].update(mapper.pop('mpcadds'))
+    del mapper['plotels']
+    return mapper
+
+def _offset_cards(cards: dict[int, Any], attr: str, id_map: dict[int, int]) -> None:
+    """sets the new id on each card"""
+    for id_old, card in cards.items():
+        id_new = id_map[id_old]
+        if isinstance(card, list):
+            for cardi in card:
+                setattr(cardi, attr, id_new)
+        else:
+            setattr(card, attr, id_new)
+
+def _rekey_cards(cards: dict[int, Any], attr: str) -> None:
+    """rekeys the dictionary in place using the new card ids"""
+    values = list(cards.values())
+    cards.clear()
+    for card in values:
+        cardi = card[0] if isinstance(card, list) else card
+        cards[getattr(cardi, attr)] = card
+
+def _offset_spline_boxes(splines: dict[int, Any], caero_map: dict[int, int]) -> None:
+    """shifts the SPLINE1/SPLINE2 boxes to stay with their CAEROx"""
+    for spline in splines.values():
+        if spline.type not in ['SPLINE1', 'SPLINE2']:
+            # should be handled by the xref?
+            continue
+        caero_id_old = spline.caero
+        caero_id_new = caero_map[caero_id_old]
+        spline.box1 = caero_id_new + (spline.box1 - caero_id_old)
+        spline.box2 = caero_id_new + (spline.box2 - caero_id_old)
+        spline.caero = caero_id_new
+
 def _apply_scalar_cards(model: BDF, model2_renumber: BDF) -> None:
     """apply cards from model2 to model if they don't exist in model"""
     if model.aero is None and model2_renumber.aero:
@@ -7,12 +7,13 @@ defines:
         bdf_filename, coord, tol,
         nodal_result, plane_atol=1e-5)
  - slice_edges(xyz_cid0, xyz_cid, edges, nodal_result, plane_atol=1e-5)
+ - cuts = cut_face_model_by_coords(bdf_filename, coords, nodal_result=None, plane_atol=1e-5)
 
 """
 from __future__ import annotations
 import os
 from itertools import count
-from typing import Any, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 import numpy as np
 from pyNastran.bdf.field_writer_8 import print_card_8
@@ -23,7 +24,6 @@ from pyNastran.bdf.cards.coordinate_systems import Coord, xyz_to_rtz_array, rtz_
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF, CTRIA3, CQUAD4
-    from pyNastran.bdf.cards.coordinate_systems import Coord
     from pyNastran.nptyping_interface import NDArrayNint, NDArray3float, NDArrayNfloat
 
 def get_nid_cd_xyz_cid0(model: BDF) -> tuple[NDArrayNint, NDArrayNint,
@@ -1602,3 +1602,370 @@ def _get_shell_inertia(element: CTRIA3 | CQUAD4,
         #x = 1
 
     return thicknessi, areai, imat_rotation_angle_deg, Ex, Ey, Gxy, nu_xy
+
+class FaceCutStations:
+    """
+    Stores the shell cuts for many planes (stations)
+
+    Segment data is sorted by station, so ``self.get_station(istation)``
+    is a slice.
+
+    Segment Attributes
+    ------------------
+    station : (nsegment, ) int ndarray
+        the station index
+    eid : (nsegment, ) int ndarray
+        the element id (negative for the second triangle of a CQUAD4)
+    point_id : (nsegment, 2) int ndarray
+        the hashed end point ids; points are shared by adjacent segments
+    chain : (nsegment, ) int ndarray
+        the connected curve the segment belongs to (unique across stations)
+    xyz_global / xyz_local : (nsegment, 2, 3) float ndarray
+        the end points of the segment in the global/station frames
+    result : (nsegment, 2, nresult) float ndarray / None
+        the interpolated nodal result at the end points
+
+    Station Attributes
+    ------------------
+    length : (nstation, ) float ndarray
+        the total length of the cut
+    area : (nstation, ) float ndarray
+        the length * thickness of the cut
+    centroid : (nstation, 3) float ndarray
+        the area weighted centroid in the station frame
+    inertia : (nstation, 6) float ndarray
+        [Ixx, Iyy, Izz, Ixy, Iyz, Ixz] about the centroid in the station frame;
+        the segment areas are lumped at the segment centers (the same as
+        ``calculate_area_moi``)
+    force : (nstation, nresult) float ndarray / None
+        the integral of result * thickness along the cut
+
+    """
+    def __init__(self, nstations: int, station, eid, point_id, chain,
+                 xyz_global, xyz_local, result, thickness):
+        self.nstations = nstations
+        self.station = station
+        self.eid = eid
+        self.point_id = point_id
+        self.chain = chain
+        self.xyz_global = xyz_global
+        self.xyz_local = xyz_local
+        self.result = result
+        self.istation = np.searchsorted(station, np.arange(nstations + 1))
+        self._integrate(thickness)
+
+    def _integrate(self, thickness: np.ndarray) -> None:
+        """calculates the station properties with segment reductions"""
+        nstations = self.nstations
+        station = self.station
+        dxyz = self.xyz_global[:, 1, :] - self.xyz_global[:, 0, :]
+        length = np.linalg.norm(dxyz, axis=1)
+        area = length * thickness
+        center = self.xyz_local.mean(axis=1)
+
+        self.length = np.bincount(station, weights=length, minlength=nstations)
+        self.area = np.bincount(station, weights=area, minlength=nstations)
+        centroid = np.zeros((nstations, 3), dtype='float64')
+        for j in range(3):
+            centroid[:, j] = np.bincount(station, weights=area * center[:, j],
+                                         minlength=nstations)
+        is_area = self.area > 0.
+        centroid[is_area, :] /= self.area[is_area, np.newaxis]
+        self.centroid = centroid
+
+        x, y, z = (center - centroid[station, :]).T
+        inertia = np.zeros((nstations, 6), dtype='float64')
+        for j, value in enumerate([x * x, y * y, z * z, x * y, y * z, x * z]):
+            inertia[:, j] = np.bincount(station, weights=area * value, minlength=nstations)
+        self.inertia = inertia
+
+        self.force = None
+        if self.result is not None:
+            avg_result = self.result.mean(axis=1)
+            nresults = avg_result.shape[1]
+            force = np.zeros((nstations, nresults), dtype='float64')
+            for j in range(nresults):
+                force[:, j] = np.bincount(station, weights=area * avg_result[:, j],
+                                          minlength=nstations)
+            self.force = force
+
+    def get_station(self, istation: int) -> slice:
+        """gets the slice for the segments of a station"""
+        return slice(self.istation[istation], self.istation[istation + 1])
+
+    def get_chains(self, istation: int) -> list[np.ndarray]:
+        """
+        Gets the ordered segments for each connected curve of a station.
+        C-shaped curves start at an end point; O-shaped curves start at
+        an arbitrary segment.
+
+        Returns
+        -------
+        chains : list[(nsegment_chain, ) int ndarray]
+            the segment indices (into the station) in order
+
+        """
+        i0 = self.istation[istation]
+        i1 = self.istation[istation + 1]
+        point_id = self.point_id[i0:i1, :]
+        chain = self.chain[i0:i1]
+        nsegments = i1 - i0
+
+        # point -> segments table (a point has 1 or 2 segments)
+        points = point_id.ravel()
+        isegments = np.repeat(np.arange(nsegments), 2)
+        isort = np.argsort(points, kind='stable')
+        upoints, istart, counts = np.unique(points[isort], return_index=True,
+                                            return_counts=True)
+        point_segments = isegments[isort]
+
+        chains = []
+        for chain_id in np.unique(chain):
+            isegment_chain = np.where(chain == chain_id)[0]
+            ipoints = np.searchsorted(upoints, point_id[isegment_chain, :].ravel())
+            iend = ipoints[counts[ipoints] == 1]
+            isegment = point_segments[istart[iend[0]]] if len(iend) else isegment_chain[0]
+            ipoint = iend[0] if len(iend) else np.searchsorted(upoints, point_id[isegment, 0])
+
+            ordered = []
+            used = np.zeros(nsegments, dtype='bool')
+            while isegment >= 0 and not used[isegment]:
+                used[isegment] = True
+                ordered.append(isegment)
+                nid1, nid2 = point_id[isegment, :]
+                nid_next = nid2 if upoints[ipoint] == nid1 else nid1
+                ipoint = np.searchsorted(upoints, nid_next)
+                segments = point_segments[istart[ipoint]:istart[ipoint] + counts[ipoint]]
+                segments = segments[~used[segments]]
+                isegment = segments[0] if len(segments) else -1
+            chains.append(np.array(ordered, dtype='int32'))
+        return chains
+
+
+def cut_face_model_by_coords(bdf_filename: str | BDF, coords: list[Coord],
+                             nodal_result: Optional[np.ndarray]=None,
+                             plane_atol: float=1e-5,
+                             max_chunk_size: int=10_000_000) -> FaceCutStations:
+    """
+    Cuts a Nastran shell model with many planes at once
+
+    The cut plane of each coordinate system is the local y=0 plane (the
+    same as ``cut_face_model_by_coord``).  If all planes are parallel,
+    the face/plane pairs are found by sorting the stations and searching
+    the distance range of each face, so the cost doesn't scale with
+    nfaces*nplanes.
+
+    Parameters
+    ----------
+    bdf_filename : str / BDF
+        str : the bdf filename
+        model : a properly configurated BDF object
+    coords : list[Coord]
+        the coordinate systems to cut the model with
+    nodal_result : (nnodes, ) or (nnodes, nresult) float np.ndarray; default=None
+        the result to cut the model with (e.g., a stress)
+    plane_atol : float; default=1e-5
+        the tolerance for a line that's located on the y=0 local plane
+    max_chunk_size : int; default=10_000_000
+        the maximum number of face-plane distances to evaluate at once
+        for non-parallel planes
+
+    Returns
+    -------
+    cuts : FaceCutStations
+        the segments and integrated properties (length, area, centroid,
+        inertia, force) for each station
+
+    """
+    model = get_bdf_model(bdf_filename, xref=False, log=None, debug=False)
+    nids, xyz_cid0, faces, face_eids = _setup_faces(model)
+    faces = np.searchsorted(nids, np.array(faces, dtype='int32'))
+    face_eids = np.array(face_eids, dtype='int32')
+    thickness = _get_face_thickness(model, face_eids)
+
+    nstations = len(coords)
+    origins = np.array([coord.origin for coord in coords], dtype='float64')
+    betas = np.array([coord.beta() for coord in coords], dtype='float64')
+    normals = betas[:, 1, :]
+
+    iface, istation, dface = _get_face_plane_pairs(
+        xyz_cid0, faces, origins, normals, plane_atol, max_chunk_size)
+    iface, istation, inode, percent = _get_face_plane_segments(
+        faces, iface, istation, dface, plane_atol)
+
+    # hash the end points by (station, node1, node2); a vertex hit is (nid, nid)
+    nid1 = nids[inode[:, :, 0]]
+    nid2 = nids[inode[:, :, 1]]
+    isnap1 = percent <= plane_atol
+    isnap2 = percent >= 1. - plane_atol
+    nid2 = np.where(isnap1, nid1, nid2)
+    nid1 = np.where(isnap2, nid2, nid1)
+    key = np.column_stack([
+        np.repeat(istation, 2),
+        np.minimum(nid1, nid2).ravel(),
+        np.maximum(nid1, nid2).ravel()])
+    unused_ukey, point_id = np.unique(key, axis=0, return_inverse=True)
+    point_id = point_id.reshape(-1, 2)
+
+    # drop dots and duplicate segments
+    is_valid = point_id[:, 0] != point_id[:, 1]
+    point_id_sorted = np.sort(point_id, axis=1)
+    unused_useg, iunique = np.unique(point_id_sorted[is_valid, :], axis=0, return_index=True)
+    ikeep = np.where(is_valid)[0][iunique]
+    ikeep = ikeep[np.argsort(istation[ikeep], kind='stable')]
+    iface = iface[ikeep]
+    istation = istation[ikeep]
+    inode = inode[ikeep, :, :]
+    percent = percent[ikeep, :]
+    point_id = point_id[ikeep, :]
+
+    pct = percent[:, :, np.newaxis]
+    xyz_global = (xyz_cid0[inode[:, :, 0], :] * (1. - pct) +
+                  xyz_cid0[inode[:, :, 1], :] * pct)
+    xyz_local = np.einsum('sij,spj->spi', betas[istation, :, :],
+                          xyz_global - origins[istation, np.newaxis, :])
+
+    result = None
+    if nodal_result is not None:
+        nodal_result = np.asarray(nodal_result, dtype='float64')
+        if nodal_result.ndim == 1:
+            nodal_result = nodal_result[:, np.newaxis]
+        result = (nodal_result[inode[:, :, 0], :] * (1. - pct) +
+                  nodal_result[inode[:, :, 1], :] * pct)
+
+    chain = _get_segment_chains(point_id)
+    cuts = FaceCutStations(
+        nstations, istation, face_eids[iface], point_id, chain,
+        xyz_global, xyz_local, result, thickness[iface])
+    return cuts
+
+def _get_face_thickness(model: BDF, face_eids: np.ndarray) -> np.ndarray:
+    """gets the property thickness for each face"""
+    pid_to_thickness = {}
+    thickness = np.zeros(len(face_eids), dtype='float64')
+    for i, eid in enumerate(np.abs(face_eids).tolist()):
+        pid = model.elements[eid].pid
+        if pid not in pid_to_thickness:
+            prop = model.properties.get(pid)
+            pid_to_thickness[pid] = prop.Thickness() if hasattr(prop, 'Thickness') else 0.
+        thickness[i] = pid_to_thickness[pid]
+    return thickness
+
+def _get_face_plane_pairs(xyz_cid0: np.ndarray, faces: np.ndarray,
+                          origins: np.ndarray, normals: np.ndarray,
+                          plane_atol: float,
+                          max_chunk_size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds the faces that may intersect each plane
+
+    Returns
+    -------
+    iface : (npair, ) int ndarray
+        the face index
+    istation : (npair, ) int ndarray
+        the plane index
+    dface : (npair, 3) float ndarray
+        the signed distance of the face nodes to the plane
+
+    """
+    nfaces = faces.shape[0]
+    nstations = len(origins)
+    normal0 = normals[0, :]
+    dots = normals @ normal0
+    is_parallel = np.allclose(np.abs(dots), 1.)
+    if is_parallel:
+        dnode = xyz_cid0 @ normal0
+        offset = (origins * normal0).sum(axis=1)
+        isort = np.argsort(offset)
+        offset_sorted = offset[isort]
+
+        dnode_face = dnode[faces]
+        dmin = dnode_face.min(axis=1) - plane_atol
+        dmax = dnode_face.max(axis=1) + plane_atol
+        i0 = np.searchsorted(offset_sorted, dmin, side='left')
+        i1 = np.searchsorted(offset_sorted, dmax, side='right')
+        counts = i1 - i0
+        iface = np.repeat(np.arange(nfaces), counts)
+        istart = np.repeat(np.cumsum(counts) - counts, counts)
+        isorted = np.repeat(i0, counts) + np.arange(counts.sum()) - istart
+        istation = isort[isorted]
+        dface = (dnode_face[iface, :] - offset[istation, np.newaxis]) * dots[istation, np.newaxis]
+        return iface, istation, dface
+
+    nchunk = max(1, max_chunk_size // max(1, 3 * nfaces))
+    ifaces = []
+    istations = []
+    dfaces = []
+    for i0 in range(0, nstations, nchunk):
+        i1 = min(i0 + nchunk, nstations)
+        # (nnodes, nchunk)
+        dnode = xyz_cid0 @ normals[i0:i1, :].T - (origins[i0:i1, :] * normals[i0:i1, :]).sum(axis=1)
+        dnode_face = dnode[faces, :]
+        is_cut = ((dnode_face.min(axis=1) <= plane_atol) &
+                  (dnode_face.max(axis=1) >= -plane_atol))
+        iface, jstation = np.nonzero(is_cut)
+        ifaces.append(iface)
+        istations.append(jstation + i0)
+        dfaces.append(dnode_face[iface, :, jstation])
+    return np.hstack(ifaces), np.hstack(istations), np.vstack(dfaces)
+
+def _get_face_plane_segments(faces: np.ndarray, iface: np.ndarray, istation: np.ndarray,
+                             dface: np.ndarray, plane_atol: float) -> tuple[
+                                 np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the 2 edge crossings of each face/plane pair
+
+    The edges are 1-2, 2-3, 1-3 (the same as ``_interpolate_face_to_bar``).
+    Edges on the plane are ignored.  If the plane goes through a vertex,
+    3 edges cross, so the crossing closest to the middle of an edge and
+    the next best one are kept.
+
+    Returns
+    -------
+    iface, istation : (nsegment, ) int ndarray
+        the face/plane pairs that have a segment
+    inode : (nsegment, 2, 2) int ndarray
+        the node indices of the 2 cut edges
+    percent : (nsegment, 2) float ndarray
+        the location of the crossing on the cut edge
+
+    """
+    iedge_a = np.array([0, 1, 0])
+    iedge_b = np.array([1, 2, 2])
+    da = dface[:, iedge_a]
+    db = dface[:, iedge_b]
+    dy = db - da
+    is_flat = np.abs(dy) <= plane_atol
+    percent = -da / np.where(is_flat, 1., dy)
+    is_valid = ~is_flat & (np.abs(percent - 0.5) < 0.5 + plane_atol)
+    percent = np.clip(percent, 0., 1.)
+
+    # rank the crossings: interior first, then vertex hits
+    score = np.where(is_valid, np.minimum(percent, 1. - percent), -1.)
+    iorder = np.argsort(-score, axis=1, kind='stable')[:, :2]
+    is_segment = np.take_along_axis(is_valid, iorder, axis=1).all(axis=1)
+
+    iorder = iorder[is_segment, :]
+    iface = iface[is_segment]
+    istation = istation[is_segment]
+    percent = np.take_along_axis(percent[is_segment, :], iorder, axis=1)
+
+    face = faces[iface, :]
+    inode = np.stack([
+        np.take_along_axis(face, iedge_a[iorder], axis=1),
+        np.take_along_axis(face, iedge_b[iorder], axis=1)], axis=2)
+    return iface, istation, inode, percent
+
+def _get_segment_chains(point_id: np.ndarray) -> np.ndarray:
+    """labels the connected segments using the shared end points"""
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    nsegments = point_id.shape[0]
+    if nsegments == 0:
+        return np.zeros(0, dtype='int32')
+    npoints = point_id.max() + 1
+    graph = coo_matrix(
+        (np.ones(nsegments), (point_id[:, 0], point_id[:, 1])),
+        shape=(npoints, npoints))
+    unused_nchains, labels = connected_components(graph, directed=False)
+    return labels[point_id[:, 0]]
@@ -1040,3 +1040,225 @@ def get_min_max_theta(faces, all_node_ids, nid_map, xyz_cid0):
     min_thetai = thetas.min()
     max_thetai = thetas.max()
     return min_thetai, max_thetai, ideal_thetai, min_edge_length
+
+
+def _norm(vector: np.ndarray) -> np.ndarray:
+    """row-wise norm of an (n, 3) array"""
+    return np.sqrt(np.einsum('ij,ij->i', vector, vector))
+
+
+def _dot(vector1: np.ndarray, vector2: np.ndarray) -> np.ndarray:
+    """row-wise dot product of (n, 3) arrays"""
+    return np.einsum('ij,ij->i', vector1, vector2)
+
+
+def tri_quality_vectorized(p1: np.ndarray, p2: np.ndarray,
+                           p3: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Vectorized version of ``tri_quality``
+
+    Parameters
+    ----------
+    p1, p2, p3 : (ntri, 3) float ndarray
+        the corner points of the triangles
+
+    Returns
+    -------
+    area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta, min_edge_length : (ntri, ) float ndarray
+        the quality metrics
+
+    """
+    e1 = (p1 + p2) / 2.
+    e2 = (p2 + p3) / 2.
+    e3 = (p3 + p1) / 2.
+    e21 = e2 - e1
+    e31 = e3 - e1
+    e32 = e3 - e2
+    e3_p2 = e3 - p2
+    e2_p1 = e2 - p1
+    e1_p3 = e1 - p3
+
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v13 = p1 - p3
+    length21 = _norm(v21)
+    length32 = _norm(v32)
+    length13 = _norm(v13)
+    lengths = np.column_stack([length21, length32, length13])
+    min_edge_length = lengths.min(axis=1)
+    area = 0.5 * _norm(np.cross(v21, v13))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_skew1 = _dot(e2_p1, e31) / (_norm(e2_p1) * _norm(e31))
+        cos_skew3 = _dot(e3_p2, e21) / (_norm(e3_p2) * _norm(e21))
+        cos_skew5 = _dot(e1_p3, e32) / (_norm(e1_p3) * _norm(e32))
+        cos_skew = np.column_stack([cos_skew1, -cos_skew1, cos_skew3,
+                                    -cos_skew3, cos_skew5, -cos_skew5])
+        max_skew = np.pi / 2. - np.abs(np.arccos(np.clip(cos_skew, -1., 1.))).min(axis=1)
+
+        is_collapsed = min_edge_length == 0.0
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+        cos_theta1 = _dot(v21, -v13) / (length21 * length13)
+        cos_theta2 = _dot(v32, -v21) / (length32 * length21)
+        cos_theta3 = _dot(v13, -v32) / (length13 * length32)
+    thetas = np.arccos(np.clip(
+        np.column_stack([cos_theta1, cos_theta2, cos_theta3]), -1., 1.))
+    min_theta = thetas.min(axis=1)
+    max_theta = thetas.max(axis=1)
+    dideal_theta = np.maximum(max_theta - PIOVER3, PIOVER3 - min_theta)
+
+    aspect_ratio[is_collapsed] = np.nan
+    min_theta[is_collapsed] = np.nan
+    max_theta[is_collapsed] = np.nan
+    dideal_theta[is_collapsed] = np.nan
+    return area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta, min_edge_length
+
+
+def quad_quality_vectorized(p1: np.ndarray, p2: np.ndarray,
+                            p3: np.ndarray, p4: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Vectorized version of ``quad_quality``
+
+    Parameters
+    ----------
+    p1, p2, p3, p4 : (nquad, 3) float ndarray
+        the corner points of the quads
+
+    Returns
+    -------
+    area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+    min_theta, max_theta, dideal_theta, min_edge_length, max_warp : (nquad, ) float ndarray
+        the quality metrics
+
+    """
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v43 = p4 - p3
+    v14 = p1 - p4
+    length21 = _norm(v21)
+    length32 = _norm(v32)
+    length43 = _norm(v43)
+    length14 = _norm(v14)
+    lengths = np.column_stack([length21, length32, length43, length14])
+    min_edge_length = lengths.min(axis=1)
+
+    p12 = (p1 + p2) / 2.
+    p23 = (p2 + p3) / 2.
+    p34 = (p3 + p4) / 2.
+    p14 = (p4 + p1) / 2.
+    v31 = p3 - p1
+    v42 = p4 - p2
+    normal = np.cross(v31, v42)
+    area = 0.5 * _norm(normal)
+
+    # the ratio of the ideal area to the actual area (hourglass check)
+    areas = np.column_stack([
+        _norm(np.cross(-v14, v21)), # v41 x v21
+        _norm(np.cross(v32, -v21)), # v32 x v12
+        _norm(np.cross(v43, -v32)), # v43 x v23
+        _norm(np.cross(v14, v43)),  # v14 x v43
+    ])
+    min_area = areas.min(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        area_ratio = np.maximum(area / min_area, areas.max(axis=1) / area)
+        area_ratio[min_area == 0.] = np.nan
+
+        area1 = 0.5 * areas[:, 0]                 # v41 x v21
+        area2 = 0.5 * _norm(np.cross(-v21, v32))  # v12 x v32
+        area3 = 0.5 * _norm(np.cross(v43, v32))   # v43 x v32
+        area4 = 0.5 * _norm(np.cross(v14, -v43))  # v14 x v34
+        aavg = (area1 + area2 + area3 + area4) / 4.
+        taper_ratio = (np.abs(area1 - aavg) + np.abs(area2 - aavg) +
+                       np.abs(area3 - aavg) + np.abs(area4 - aavg)) / aavg
+
+        e13 = p34 - p12
+        e42 = p23 - p14
+        cos_skew1 = _dot(e13, e42) / (_norm(e13) * _norm(e42))
+        max_skew = np.pi / 2. - np.abs(np.arccos(
+            np.clip(np.column_stack([cos_skew1, -cos_skew1]), -1., 1.))).min(axis=1)
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+
+        cos_theta = np.column_stack([
+            _dot(v21, -v14) / (length21 * length14),
+            _dot(v32, -v21) / (length32 * length21),
+            _dot(v43, -v32) / (length43 * length32),
+            _dot(v14, -v43) / (length14 * length43),
+        ])
+
+    # a negative sign means the normal is flipped
+    n = np.sign(np.column_stack([
+        _dot(np.cross(v14, v21), normal),
+        _dot(np.cross(v21, v32), normal),
+        _dot(np.cross(v32, v43), normal),
+        _dot(np.cross(v43, v14), normal),
+    ]))
+    theta_additional = np.where(n < 0, 2*np.pi, 0.)
+    theta = n * np.arccos(np.clip(cos_theta, -1., 1.)) + theta_additional
+    min_theta = theta.min(axis=1)
+    max_theta = theta.max(axis=1)
+    dideal_theta = np.maximum(max_theta - PIOVER2, PIOVER2 - min_theta)
+
+    # warp angle; split the quad both ways and take the max angle
+    # between the normals of the two triangles
+    v41 = -v14
+    n123 = np.cross(v21, v31)
+    n134 = np.cross(v31, v41)
+    n124 = np.cross(v21, v41)
+    n234 = np.cross(v32, v42)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_warp1 = _dot(n123, n134) / (_norm(n123) * _norm(n134))
+        cos_warp2 = _dot(n124, n234) / (_norm(n124) * _norm(n234))
+    max_warp = np.abs(np.arccos(
+        np.clip(np.column_stack([cos_warp1, cos_warp2]), -1., 1.))).max(axis=1)
+
+    out = (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+           min_theta, max_theta, dideal_theta, min_edge_length, max_warp)
+    return out
+
+
+def get_min_max_theta_vectorized(faces: tuple[tuple[int, ...], ...],
+                                 inodes: np.ndarray,
+                                 xyz_cid0: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Vectorized version of ``get_min_max_theta`` for a single solid
+    element type (CTETRA, CPENTA, CHEXA, CPYRAM)
+
+    Parameters
+    ----------
+    faces : tuple[tuple[int, ...], ...]
+        the corner indices of the tri/quad faces
+    inodes : (nelement, ncorner) int ndarray
+        the indices of the corner nodes into xyz_cid0
+    xyz_cid0 : (nnode, 3) float ndarray
+        the node locations
+
+    Returns
+    -------
+    min_theta, max_theta, dideal_theta, min_edge_length : (nelement, ) float ndarray
+        the quality metrics; the min_edge_length considers all the faces
+
+    """
+    cos_thetas = []
+    ideal_theta = []
+    edge_lengths = []
+    for face in faces:
+        nface = len(face)
+        ideal = PIOVER3 if nface == 3 else PIOVER2
+        points = [xyz_cid0[inodes[:, iface], :] for iface in face]
+        vectors = [points[(k + 1) % nface] - points[k] for k in range(nface)]
+        lengths = [_norm(vector) for vector in vectors]
+        edge_lengths.extend(lengths)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for k in range(nface):
+                # the angle at corner k+1 between the incoming/outgoing edges
+                cos_thetas.append(_dot(vectors[k + 1 - nface], -vectors[k]) /
+                                  (lengths[k + 1 - nface] * lengths[k]))
+        ideal_theta.extend([ideal] * nface)
+    thetas = np.arccos(np.clip(np.column_stack(cos_thetas), -1., 1.))
+    ideal_theta = np.array(ideal_theta)
+    dideal_theta = np.maximum((thetas - ideal_theta).max(axis=1),
+                              (ideal_theta - thetas).min(axis=1))
+    min_theta = thetas.min(axis=1)
+    max_theta = thetas.max(axis=1)
+    min_edge_length = np.column_stack(edge_lengths).min(axis=1)
+    return min_theta, max_theta, dideal_theta, min_edge_length
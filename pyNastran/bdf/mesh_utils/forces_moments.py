@@ -10,12 +10,15 @@ defines methods to access force/moment/pressure/temperature data:
 
 """
 from __future__ import annotations
+from collections import defaultdict
 from typing import Optional, TYPE_CHECKING
 import numpy as np
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.loads.static_loads import update_pload4_vector
-from pyNastran.bdf.mesh_utils.loads import _mean_pressure_on_pload4
+from pyNastran.bdf.mesh_utils.loads import (
+    _mean_pressure_on_pload4, get_pload4_shell_rows,
+    get_pload4_pressure_direction, get_shell_face_area_centroid_normal)
 
 if TYPE_CHECKING:  # pragma: no cover
     from cpylog import SimpleLogger
@@ -117,6 +120,8 @@ def get_forces_moments_array(model: BDF,
     nodes = model.nodes
 
     log = model.log
+    pload4s: list[PLOAD4] = []
+    pload4_scales: list[float] = []
     debugs_list: list[str] = []
     warnings_list: list[str] = []
     errors_list: list[str] = []
@@ -194,16 +199,10 @@ def get_forces_moments_array(model: BDF,
                         load_case_id, elem.type, load.type))
 
         elif load_type == 'PLOAD4':
+            # the PLOAD4s are evaluated together after the loop
             is_loads = True
-            eids_missing = _get_forces_moments_pload4(
-                model, nid_map, eid_map, normals, load,
-                dependents_nodes,
-                nodal_pressures, centroidal_pressures,
-                forces, scale,
-                fail_nids, fail_count, fail_count_max)
-            if eids_missing:
-                errors_list.append('missing PLOAD4 element ids=%s on:\n%s' % (
-                    eids_missing, load.rstrip()))
+            pload4s.append(load)
+            pload4_scales.append(scale)
 
         elif load_type == 'SPCD':
             is_loads = True
@@ -231,6 +230,15 @@ def get_forces_moments_array(model: BDF,
                 warnings_list.append('  get_forces_moments_array - unsupported '
                                      f'load.type = {load_type}')
 
+    if pload4s:
+        fail_count = _get_forces_moments_pload4_array(
+            model, nid_map, eid_map, normals, pload4s, pload4_scales,
+            dependents_nodes,
+            nodal_pressures, centroidal_pressures,
+            forces,
+            fail_nids, fail_count, fail_count_max,
+            warnings_list, errors_list)
+
     if debugs_list:
         log.debug('\n'.join(debugs_list))
     if warnings_list:
@@ -245,6 +253,92 @@ def get_forces_moments_array(model: BDF,
     return is_loads, (centroidal_pressures, forces, moments, spcd)
 
 
+def _get_forces_moments_pload4_array(model: BDF,
+                                     nid_map: dict[int, int],
+                                     eid_map: dict[int, int],
+                                     normals: np.ndarray,
+                                     loads: list[PLOAD4],
+                                     scales: list[float],
+                                     dependents_nodes,
+                                     nodal_pressures: np.ndarray,
+                                     centroidal_pressures: np.ndarray,
+                                     forces: np.ndarray,
+                                     fail_nids: set[int],
+                                     fail_count: int, fail_count_max: int,
+                                     warnings_list: list[str],
+                                     errors_list: list[str]) -> int:
+    """
+    Applies the PLOAD4s to the nodes.  The shell faces of the SURF loads
+    are evaluated as arrays, while the solid elements and the LINE loads
+    use ``_get_forces_moments_pload4``.
+    """
+    isurf = [i for i, load in enumerate(loads) if load.surf_or_line == 'SURF']
+    for i, load in enumerate(loads):
+        if load.surf_or_line != 'SURF':
+            _get_forces_moments_pload4(
+                model, nid_map, eid_map, normals, load,
+                dependents_nodes,
+                nodal_pressures, centroidal_pressures,
+                forces, scales[i],
+                fail_nids, fail_count, fail_count_max)
+
+    loads = [loads[i] for i in isurf]
+    scales_array = np.array([scales[i] for i in isurf], dtype='float64')
+    iload, row_eids, other_elements, eids_missing = get_pload4_shell_rows(loads)
+    if eids_missing:
+        errors_list.append('missing PLOAD4 element ids=%s' % eids_missing)
+
+    elements_by_load = defaultdict(list)
+    for iloadi, elem in other_elements:
+        elements_by_load[iloadi].append(elem)
+    for iloadi, elements in elements_by_load.items():
+        _get_forces_moments_pload4(
+            model, nid_map, eid_map, normals, loads[iloadi],
+            dependents_nodes,
+            nodal_pressures, centroidal_pressures,
+            forces, scales_array[iloadi],
+            fail_nids, fail_count, fail_count_max,
+            elements=elements)
+    if len(iload) == 0:
+        return fail_count
+
+    ueids, ieid = np.unique(row_eids, return_inverse=True)
+    area, unused_centroid, unused_normal, nface = get_shell_face_area_centroid_normal(
+        model, ueids)
+    pressure, direction, use_normal = get_pload4_pressure_direction(loads, nface[ieid], iload)
+    pressure *= scales_array[iload]
+
+    # all the nodes of the element (including the midside nodes) get a share;
+    # missing midside nodes (None) don't
+    nelements = len(ueids)
+    ielement = np.array([eid_map[eid] for eid in ueids.tolist()], dtype='int32')
+    element_inids = np.full((nelements, 8), -1, dtype='int32')
+    element_nnodes = np.zeros(nelements, dtype='int32')
+    element_nids = []
+    for i, eid in enumerate(ueids.tolist()):
+        node_ids = model.elements[eid].node_ids
+        nids = [nid for nid in node_ids if nid is not None]
+        element_nnodes[i] = len(nids)
+        element_nids.extend(nids)
+        element_inids[i, :len(node_ids)] = [-1 if nid is None else nid_map[nid]
+                                            for nid in node_ids]
+
+    load_dir = np.where(use_normal[:, np.newaxis], normals[ielement[ieid], :], direction)
+    forcei = (pressure * area[ieid] / element_nnodes[ieid])[:, np.newaxis] * load_dir
+    row_inids = element_inids[ieid, :]
+    irow, inode = np.where(row_inids >= 0)
+    np.add.at(forces, row_inids[irow, inode], forcei[irow, :])
+    np.add.at(centroidal_pressures, ielement[ieid], pressure)
+
+    dependent_nids = sorted(set(element_nids).intersection(dependents_nodes))
+    for nid in dependent_nids:
+        fail_nids.add(nid)
+        fail_count += 1
+        if fail_count < fail_count_max:
+            warnings_list.append(f'    nid={nid:d} is a dependent node and has a'
+                                 f' PLOAD4 applied')
+    return fail_count
+
 def _get_forces_moments_pload4(model: BDF,
                                nid_map: dict[int, int],
                                eid_map: dict[int, int],
@@ -256,14 +350,17 @@ def _get_forces_moments_pload4(model: BDF,
                                forces: np.ndarray,
                                scale: float,
                                fail_nids: set[int],
-                               fail_count: int, fail_count_max: int) -> list[int]:
+                               fail_count: int, fail_count_max: int,
+                               elements: Optional[list]=None) -> list[int]:
     # multiple elements
     eids_missing = []
 
     log: SimpleLogger = model.log
     debugs_list = []
     warnings_list = []
-    for elem in load.eids_ref:
+    if elements is None:
+        elements = load.eids_ref
+    for elem in elements:
         if isinstance(elem, integer_types):
             # Nastran is NOT OK with missing element ids
             eids_missing.append(elem)
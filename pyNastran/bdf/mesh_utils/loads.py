@@ -4,12 +4,16 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_array
+      find the net force/moment on the model for many load cases
 
 """
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING
+from itertools import count
+from typing import Any, Optional, TYPE_CHECKING
 from math import radians, sin, cos
 import numpy as np
+import scipy.sparse as sp
 from numpy import array, cross, allclose, mean
 from numpy.linalg import norm  # type: ignore
 from pyNastran.utils.numpy_utils import integer_types
@@ -63,9 +67,7 @@ def sum_forces_moments(model: BDF,
         the moments
 
     .. warning:: not full validated
-    .. todo:: It's super slow for cid != 0.   We can speed this up a lot
-             if we calculate the normal, area, centroid based on
-             precomputed node locations.
+    .. seealso:: ``sum_forces_moments_array`` for multiple load cases
 
     Pressure acts in the normal direction per model/real/loads.bdf and loads.f06
 
@@ -73,131 +75,124 @@ def sum_forces_moments(model: BDF,
     if not isinstance(loadcase_id, integer_types):
         raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
 
-    p = _get_load_summation_point(model, p0, cid=0)
-    loads, scale_factors, unused_is_grav = model.get_reduced_loads(
-        loadcase_id, skip_scale_factor0=True)
-
+    forces, moments = sum_forces_moments_array(
+        model, p0, [loadcase_id], cid=cid,
+        include_grav=include_grav, xyz_cid0=xyz_cid0)
+    return forces[0, :], moments[0, :]
+
+def _sum_forces_moments_card(model: BDF, loadcase_id: int, load, scale: float,
+                             xyz: dict[int, np.ndarray], p: np.ndarray,
+                             include_grav: bool,
+                             unsupported_types: set[tuple[int, str]],
+                             ) -> tuple[NDArray3float, NDArray3float]:
+    """gets the force/moment of a single load for ``sum_forces_moments``"""
     F = array([0., 0., 0.])
     M = array([0., 0., 0.])
-    xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
-
-    unsupported_types = set()
-    for load, scale in zip(loads, scale_factors):
-        #if load.type not in ['FORCE1']:
-            #continue
-        if load.type == 'FORCE':
-            if load.Cid() != 0:
-                cp_ref = load.cid_ref
-                #from pyNastran.bdf.bdf import CORD2R
-                #cp_ref = CORD2R()
-                f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
-            else:
-                f = load.mag * load.xyz * scale
-
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = np.cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE1':
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = np.cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE2':
+    #if load.type not in ['FORCE1']:
+        #continue
+    if load.type == 'FORCE':
+        if load.Cid() != 0:
+            cp_ref = load.cid_ref
+            #from pyNastran.bdf.bdf import CORD2R
+            #cp_ref = CORD2R()
+            f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
+        else:
             f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = np.cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'MOMENT':
-            if load.Cid() != 0:
-                cp = load.cid_ref
-                #from pyNastran.bdf.bdf import CORD2R
-                #cp = CORD2R()
-                m = load.mag * cp.transform_vector_to_global(load.xyz) * scale
-            else:
-                m = load.mag * load.xyz * scale
-            M += m
-        elif load.type == 'MOMENT1':
-            m = load.mag * load.xyz * scale
-            M += m
-        elif load.type == 'MOMENT2':
+
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = np.cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'FORCE1':
+        f = load.mag * load.xyz * scale
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = np.cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'FORCE2':
+        f = load.mag * load.xyz * scale
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = np.cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'MOMENT':
+        if load.Cid() != 0:
+            cp = load.cid_ref
+            #from pyNastran.bdf.bdf import CORD2R
+            #cp = CORD2R()
+            m = load.mag * cp.transform_vector_to_global(load.xyz) * scale
+        else:
             m = load.mag * load.xyz * scale
-            M += m
-
-        elif load.type == 'PLOAD':
-            nodes = load.node_ids
-            nnodes = len(nodes)
-            if nnodes == 3:
-                n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
-                axb = np.cross(n1 - n2, n1 - n3)
-                centroid = (n1 + n2 + n3) / 3.
-            elif nnodes == 4:
-                n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
-                axb = np.cross(n1 - n3, n2 - n4)
-                centroid = (n1 + n2 + n3 + n4) / 4.
-            else:
-                msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
-                raise RuntimeError(msg)
-
-            area, normal = _get_area_normal(axb, nodes, xyz)
-            r = centroid - p
-            f = load.pressure * area * normal * scale
-            m = np.cross(r, f)
-
-            F += f
-            M += m
-
-        elif load.type == 'PLOAD1':
-            _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p)
-
-        elif load.type == 'PLOAD2':
-            pressure = load.pressure * scale
-            for eid in load.element_ids:
-                elem = model.elements[eid]
-                if elem.type in ['CTRIA3', 'CQUAD4', 'CSHEAR', 'CQUADR', 'CTRIAR']:
-                    n = elem.Normal()
-                    area = elem.Area()
-                    f = pressure * n * area
-                    r = elem.Centroid() - p
-                    m = np.cross(r, f)
-                    F += f
-                    M += m
-                else:
-                    model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
-                        loadcase_id, elem.type, load.type))
-        elif load.type == 'PLOAD4':
-            _pload4_total(loadcase_id, load, scale, xyz, F, M, p)
-
-        elif load.type == 'GRAV':
-            if include_grav:  # this will be super slow
-                gravity = load.GravityVector() * scale
-                for eid, elem in model.elements.items():
-                    centroid = elem.Centroid()
-                    mass = elem.Mass()
-                    r = centroid - p
-                    f = mass * gravity
-                    m = np.cross(r, f)
-                    F += f
-                    M += m
+        M += m
+    elif load.type == 'MOMENT1':
+        m = load.mag * load.xyz * scale
+        M += m
+    elif load.type == 'MOMENT2':
+        m = load.mag * load.xyz * scale
+        M += m
+
+    elif load.type == 'PLOAD':
+        nodes = load.node_ids
+        nnodes = len(nodes)
+        if nnodes == 3:
+            n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
+            axb = np.cross(n1 - n2, n1 - n3)
+            centroid = (n1 + n2 + n3) / 3.
+        elif nnodes == 4:
+            n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
+            axb = np.cross(n1 - n3, n2 - n4)
+            centroid = (n1 + n2 + n3 + n4) / 4.
         else:
-            # we collect them so we only get one print
-            unsupported_types.add(load.type)
-
-    for load_type in unsupported_types:
-        model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
+            msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
+            raise RuntimeError(msg)
 
-    #forces, moments = sum_forces_moments(self, p0, loadcase_id,
-    #include_grav=include_grav, xyz_cid0=xyz_cid0)
-    if cid == 0:
-        return F, M
-    cid0 = 0
-    F2, M2 = transform_load(F, M, cid0, cid, model)
-    return F2, M2
+        area, normal = _get_area_normal(axb, nodes, xyz)
+        r = centroid - p
+        f = load.pressure * area * normal * scale
+        m = np.cross(r, f)
+
+        F += f
+        M += m
+
+    elif load.type == 'PLOAD1':
+        _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p)
+
+    elif load.type == 'PLOAD2':
+        pressure = load.pressure * scale
+        for eid in load.element_ids:
+            elem = model.elements[eid]
+            if elem.type in ['CTRIA3', 'CQUAD4', 'CSHEAR', 'CQUADR', 'CTRIAR']:
+                n = elem.Normal()
+                area = elem.Area()
+                f = pressure * n * area
+                r = elem.Centroid() - p
+                m = np.cross(r, f)
+                F += f
+                M += m
+            else:
+                model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
+                    loadcase_id, elem.type, load.type))
+    elif load.type == 'PLOAD4':
+        _pload4_total(loadcase_id, load, scale, xyz, F, M, p)
+
+    elif load.type == 'GRAV':
+        if include_grav:  # this will be super slow
+            gravity = load.GravityVector() * scale
+            for eid, elem in model.elements.items():
+                centroid = elem.Centroid()
+                mass = elem.Mass()
+                r = centroid - p
+                f = mass * gravity
+                m = np.cross(r, f)
+                F += f
+                M += m
+    else:
+        # we collect them so we only get one print
+        unsupported_types.add((loadcase_id, load.type))
+    return F, M
 
 def _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p):
     """helper method for ``sum_forces_moments``"""
@@ -226,9 +221,8 @@ def _pload1_bar_beam(model, unused_loadcase_id, load, elem, scale, xyz, F, M, p)
     p2 = load.p2 * scale
 
     nodes = elem.node_ids
-    n1, n2 = xyz[nodes[0]], xyz[nodes[1]]
-    n1 += elem.wa
-    n2 += elem.wb
+    n1 = xyz[nodes[0]] + elem.wa
+    n2 = xyz[nodes[1]] + elem.wb
 
     bar_vector = n2 - n1
     L = norm(bar_vector)
@@ -410,205 +404,615 @@ def sum_forces_moments_elements(model: BDF,
     """
     if not isinstance(loadcase_id, integer_types):
         raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
-    p = _get_load_summation_point(model, p0, cid=0)
 
     if eids is None:
-        eids = list(model.element_ids)
+        eids = model.element_ids
     if nids is None:
-        nids = list(model.node_ids)
-
-    #for (key, load_case) in model.loads.items():
-        #if key != loadcase_id:
-            #continue
-
-    loads, scale_factors, unused_is_grav = model.get_reduced_loads(
-        loadcase_id, skip_scale_factor0=True)
-
+        nids = model.node_ids
+    forces, moments = sum_forces_moments_array(
+        model, p0, [loadcase_id], cid=cid,
+        include_grav=include_grav, xyz_cid0=xyz_cid0,
+        eids=eids, nids=nids)
+    return forces[0, :], moments[0, :]
+
+def _sum_forces_moments_elements_card(model: BDF, loadcase_id: int, load, scale: float,
+                                      eids: set[int], nids: set[int],
+                                      xyz: dict[int, np.ndarray], p: np.ndarray,
+                                      include_grav: bool,
+                                      unsupported_types: set[tuple[int, str]],
+                                      ) -> tuple[NDArray3float, NDArray3float]:
+    """gets the force/moment of a single load for ``sum_forces_moments_elements``"""
     F = array([0., 0., 0.])
     M = array([0., 0., 0.])
-    xyz = get_xyz_cid0_dict(model, xyz_cid0)
-
-    unsupported_types = set()
     shell_elements = {
         'CTRIA3', 'CQUAD4', 'CTRIAR', 'CQUADR',
         'CTRIA6', 'CQUAD8', 'CQUAD', 'CSHEAR'}
     skip_loads = {'QVOL'}
-    for load, scale in zip(loads, scale_factors):
-        #if load.type not in ['FORCE1']:
-            #continue
-        #print(load.type)
-        loadtype = load.type
-        if loadtype == 'FORCE':
-            if load.node_id not in nids:
+
+    #if load.type not in ['FORCE1']:
+        #continue
+    #print(load.type)
+    loadtype = load.type
+    if loadtype == 'FORCE':
+        if load.node_id not in nids:
+            return F, M
+        if load.Cid() != 0:
+            cp_ref = load.cid_ref
+            #from pyNastran.bdf.bdf import CORD2R
+            #cp = CORD2R()
+            f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
+        else:
+            f = load.mag * load.xyz * scale
+
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = np.cross(r, f)
+        F += f
+        M += m
+
+    elif load.type == 'FORCE1':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return F, M
+
+        f = load.mag * load.xyz * scale
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = np.cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'FORCE2':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return F, M
+
+        f = load.mag * load.xyz * scale
+        node = model.Node(load.node_id)
+        r = xyz[node.nid] - p
+        m = np.cross(r, f)
+        F += f
+        M += m
+    elif load.type == 'MOMENT':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return F, M
+
+        if load.Cid() != 0:
+            cp_ref = load.cid_ref
+            m = cp_ref.transform_vector_to_global(load.xyz)
+        else:
+            m = load.xyz
+        M += load.mag * m * scale
+    elif load.type == 'MOMENT1':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return F, M
+        m = load.mag * load.xyz * scale
+        M += m
+    elif loadtype == 'MOMENT2':
+        not_found_nid = False
+        for nid in load.node_ids:
+            if nid not in nids:
+                not_found_nid = True
+                break
+        if not_found_nid:
+            return F, M
+        m = load.mag * load.xyz * scale
+        M += m
+
+    elif loadtype == 'PLOAD':
+        nodes = load.node_ids
+        nnodes = len(nodes)
+        nodesi = 0
+        if nnodes == 3:
+            n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
+            axb = np.cross(n1 - n2, n1 - n3)
+            centroid = (n1 + n2 + n3) / 3.
+
+        elif nnodes == 4:
+            n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
+            axb = np.cross(n1 - n3, n2 - n4)
+            centroid = (n1 + n2 + n3 + n4) / 4.
+            if nodes[3] in nids:
+                nodesi += 1
+        else:
+            raise RuntimeError('invalid number of nodes on PLOAD card; '
+                               'nodes=%s' % str(nodes))
+        if nodes[0] in nids:
+            nodesi += 1
+        if nodes[1] in nids:
+            nodesi += 1
+        if nodes[2] in nids:
+            nodesi += 1
+
+        area, normal = _get_area_normal(axb, nodes, xyz)
+        r = centroid - p
+        f = load.pressure * area * normal * scale
+        m = np.cross(r, f)
+
+        node_scale = nodesi / float(nnodes)
+        F += f * node_scale
+        M += m * node_scale
+
+    elif loadtype == 'PLOAD1':
+        _pload1_elements(model, loadcase_id, load, scale, eids, xyz, F, M, p)
+
+    elif loadtype == 'PLOAD2':
+        pressure = load.pressure * scale
+        for eid in load.element_ids:
+            if eid not in eids:
                 continue
-            if load.Cid() != 0:
-                cp_ref = load.cid_ref
-                #from pyNastran.bdf.bdf import CORD2R
-                #cp = CORD2R()
-                f = load.mag * cp_ref.transform_vector_to_global(load.xyz) * scale
+            elem = model.elements[eid]
+            if elem.type in shell_elements:
+                normal = elem.Normal()
+                area = elem.Area()
+                f = pressure * normal * area
+                r = elem.Centroid() - p
+                m = np.cross(r, f)
+                F += f
+                M += m
             else:
-                f = load.mag * load.xyz * scale
-
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = np.cross(r, f)
-            F += f
-            M += m
-
-        elif load.type == 'FORCE1':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
-                continue
+                #model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
+                    #loadcase_id, elem.type, loadtype))
+                raise NotImplementedError('case=%s etype=%r loadtype=%r not supported' % (
+                    loadcase_id, elem.type, loadtype))
+    elif loadtype == 'PLOAD4':
+        _pload4_elements(loadcase_id, load, scale, eids, xyz, F, M, p)
+
+    elif loadtype == 'GRAV':
+        if include_grav:  # this will be super slow
+            g = load.GravityVector() * scale
+            for eid, elem in model.elements.items():
+                if eid not in eids:
+                    continue
+                centroid = elem.Centroid()
+                mass = elem.Mass()
+                r = centroid - p
+                f = mass * g
+                m = np.cross(r, f)
+                F += f
+                M += m
+    elif loadtype in skip_loads:
+        return F, M
+    else:
+        # we collect them so we only get one print
+        unsupported_types.add((loadcase_id, loadtype))
+    return F, M
 
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = np.cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'FORCE2':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
+
+NODAL_LOAD_TYPES = {'FORCE', 'FORCE1', 'FORCE2', 'MOMENT', 'MOMENT1', 'MOMENT2'}
+PLOAD4_TRIA_TYPES = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+PLOAD4_QUAD_TYPES = {'CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR'}
+PLOAD4_SHELL_TYPES = PLOAD4_TRIA_TYPES | PLOAD4_QUAD_TYPES
+
+def sum_forces_moments_array(model: BDF,
+                             p0: int | np.ndarray,
+                             loadcase_ids: list[int],
+                             cid: int=0,
+                             include_grav: bool=False,
+                             xyz_cid0: Optional[dict[int, NDArray3float]]=None,
+                             eids: Optional[list[int]]=None,
+                             nids: Optional[list[int]]=None,
+                             ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sums applied forces & moments about a reference point p0 for many
+    load cases at once.
+
+    Each load card is evaluated once (with a scale of 1.0) regardless
+    of how many LOAD cards reference it.  The FORCE/MOMENT and the
+    PLOAD4 (shell) cards are evaluated as arrays, while the other cards
+    use the same methods as ``sum_forces_moments``.  The load cases are
+    then combined with a sparse (nloadcases, ncards) scale matrix.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_ids : list[int]
+        the LOAD=ID values to analyze
+    cid : int; default=0
+        the coordinate system for the summation
+    include_grav : bool; default=False
+        includes gravity in the summation (not supported)
+    xyz_cid0 : None / dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+    eids / nids : list[int]; default=None
+        None : sum the total load (see ``sum_forces_moments``)
+        list[int] : the elements/nodes to include
+                    (see ``sum_forces_moments_elements``)
+
+    Returns
+    -------
+    forces : (nloadcases, 3) float ndarray
+        the forces
+    moments : (nloadcases, 3) float ndarray
+        the moments
+
+    """
+    p = _get_load_summation_point(model, p0, cid=0)
+    xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
+    cards, card_case_ids, scale_matrix = get_load_scale_matrix(model, loadcase_ids)
+
+    is_elements = eids is not None or nids is not None
+    if is_elements:
+        eids = set(model.element_ids if eids is None else eids)
+        nids = set(model.node_ids if nids is None else nids)
+
+    force_moment = np.zeros((len(cards), 6), dtype='float64')
+    unsupported_types = set()
+    inodal = []
+    ipload4 = []
+    for icard, load, loadcase_id in zip(count(), cards, card_case_ids):
+        if load.type in NODAL_LOAD_TYPES:
+            inodal.append(icard)
+            continue
+        elif load.type == 'PLOAD4' and load.surf_or_line == 'SURF':
+            ipload4.append(icard)
+            continue
+
+        if is_elements:
+            F, M = _sum_forces_moments_elements_card(
+                model, loadcase_id, load, 1.0, eids, nids, xyz, p,
+                include_grav, unsupported_types)
+        else:
+            F, M = _sum_forces_moments_card(
+                model, loadcase_id, load, 1.0, xyz, p,
+                include_grav, unsupported_types)
+        force_moment[icard, :3] = F
+        force_moment[icard, 3:] = M
+
+    _nodal_forces_moments_array(cards, inodal, xyz, p, nids, force_moment)
+    _pload4_forces_moments_array(model, cards, card_case_ids, ipload4,
+                                 xyz, p, eids, force_moment)
+
+    for loadcase_id, load_type in sorted(unsupported_types):
+        model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
+
+    case_force_moment = scale_matrix @ force_moment
+    forces = case_force_moment[:, :3]
+    moments = case_force_moment[:, 3:]
+    if cid != 0:
+        cid0 = 0
+        for i, force, moment in zip(count(), forces, moments):
+            forces[i, :], moments[i, :] = transform_load(force, moment, cid0, cid, model)
+    return forces, moments
+
+def get_load_scale_matrix(model: BDF,
+                          loadcase_ids: list[int]) -> tuple[list[Any], list[int], sp.csr_matrix]:
+    """
+    Reduces the load cases to unique load cards and a scale matrix
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    loadcase_ids : list[int]
+        the LOAD=ID values to analyze
+
+    Returns
+    -------
+    cards : list[load]
+        the unique load cards (e.g., FORCE, PLOAD4)
+    card_case_ids : list[int]
+        the first load case id that references each card (for messages)
+    scale_matrix : (nloadcases, ncards) float csr_matrix
+        the scale factor of each card in each load case
+
+    """
+    cards = []
+    card_case_ids = []
+    card_index = {}
+    reduced_loads = {}
+
+    def _reduce_load_id(load_id: int, loadcase_id: int,
+                        unallowed_load_ids: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the card indices and scale factors of a LOAD/FORCE/etc. id.
+        A load id that's used by multiple LOAD cards is only reduced once.
+        """
+        if load_id in reduced_loads:
+            return reduced_loads[load_id]
+        icards = []
+        scales = []
+        for load in model.Load(load_id, consider_load_combinations=True):
+            if load.type == 'LOAD':
+                for load_idi, scalei in zip(load.get_load_ids(), load.scale_factors):
+                    # prevents recursion
+                    if load_idi in unallowed_load_ids:
+                        msg = 'There is a recursion error.  LOAD trace=%s; load_id=%s' % (
+                            unallowed_load_ids, load_idi)
+                        raise RuntimeError(msg)
+                    icardsi, scalesi = _reduce_load_id(
+                        load_idi, loadcase_id, unallowed_load_ids + [load_idi])
+                    icards.append(icardsi)
+                    scales.append(load.scale * scalei * scalesi)
                 continue
 
-            f = load.mag * load.xyz * scale
-            node = model.Node(load.node_id)
-            r = xyz[node.nid] - p
-            m = np.cross(r, f)
-            F += f
-            M += m
-        elif load.type == 'MOMENT':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
+            key = id(load)
+            icard = card_index.get(key)
+            if icard is None:
+                icard = len(cards)
+                card_index[key] = icard
+                cards.append(load)
+                card_case_ids.append(loadcase_id)
+            icards.append(np.array([icard]))
+            scales.append(np.ones(1))
+
+        if len(icards):
+            reduced = (np.hstack(icards), np.hstack(scales))
+        else:
+            reduced = (np.zeros(0, dtype='int32'), np.zeros(0, dtype='float64'))
+        reduced_loads[load_id] = reduced
+        return reduced
+
+    irows = [np.zeros(0, dtype='int32')]
+    icols = [np.zeros(0, dtype='int32')]
+    data = [np.zeros(0, dtype='float64')]
+    for icase, loadcase_id in enumerate(loadcase_ids):
+        if not isinstance(loadcase_id, integer_types):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+        icards, scales = _reduce_load_id(loadcase_id, loadcase_id, [])
+        irows.append(np.full(len(icards), icase))
+        icols.append(icards)
+        data.append(scales)
+
+    # duplicate entries are summed
+    scale_matrix = sp.csr_matrix(
+        (np.hstack(data), (np.hstack(irows), np.hstack(icols))),
+        shape=(len(loadcase_ids), len(cards)))
+    return cards, card_case_ids, scale_matrix
+
+def _nodal_forces_moments_array(cards: list[Any], icards: list[int],
+                                xyz: dict[int, np.ndarray], p: np.ndarray,
+                                nids: Optional[set[int]],
+                                force_moment: np.ndarray) -> None:
+    """
+    helper method for ``sum_forces_moments_array`` for the
+    FORCE, FORCE1, FORCE2, MOMENT, MOMENT1, MOMENT2 cards
+    """
+    if len(icards) == 0:
+        return
+    ncards = len(icards)
+    vectors = np.zeros((ncards, 3), dtype='float64')
+    positions = np.zeros((ncards, 3), dtype='float64')
+    is_force = np.zeros(ncards, dtype='bool')
+    is_valid = np.ones(ncards, dtype='bool')
+    for i, icard in enumerate(icards):
+        load = cards[icard]
+        load_type = load.type
+        if nids is not None:
+            node_ids = [load.node_id] if load_type == 'FORCE' else load.node_ids
+            if any(nid not in nids for nid in node_ids):
+                is_valid[i] = False
                 continue
 
-            if load.Cid() != 0:
-                cp_ref = load.cid_ref
-                m = cp_ref.transform_vector_to_global(load.xyz)
-            else:
-                m = load.xyz
-            M += load.mag * m * scale
-        elif load.type == 'MOMENT1':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
+        if load_type in {'FORCE', 'MOMENT'} and load.Cid() != 0:
+            vectors[i, :] = load.mag * load.cid_ref.transform_vector_to_global(load.xyz)
+        else:
+            vectors[i, :] = load.mag * load.xyz
+        if load_type in {'FORCE', 'FORCE1', 'FORCE2'}:
+            is_force[i] = True
+            positions[i, :] = xyz[load.node_id]
+
+    forces = np.where(is_force[:, np.newaxis], vectors, 0.)
+    moments = np.cross(positions - p, forces)
+    moments[~is_force, :] += vectors[~is_force, :]
+    icards = np.asarray(icards)[is_valid]
+    force_moment[icards, :3] += forces[is_valid, :]
+    force_moment[icards, 3:] += moments[is_valid, :]
+
+def _pload4_forces_moments_array(model: BDF, cards: list[Any],
+                                 card_case_ids: list[int], icards: list[int],
+                                 xyz: dict[int, np.ndarray], p: np.ndarray,
+                                 eids: Optional[set[int]],
+                                 force_moment: np.ndarray) -> None:
+    """
+    helper method for ``sum_forces_moments_array`` for the PLOAD4 SURF cards
+
+    The shell faces are evaluated as arrays, while the solid faces use
+    ``_pload4_helper``.
+    """
+    if len(icards) == 0:
+        return
+    loads = [cards[icard] for icard in icards]
+    for load in loads:
+        assert load.line_load_dir == 'NORM', f'line_load_dir = {load.line_load_dir!r}'
+
+    iload, row_eids, other_elements, eids_missing = get_pload4_shell_rows(loads, eids=eids)
+    if eids_missing:
+        raise KeyError('missing PLOAD4 element ids=%s' % eids_missing)
+    for iloadi, elem in other_elements:
+        icard = icards[iloadi]
+        fi, mi = _pload4_helper(card_case_ids[icard], loads[iloadi], 1.0, elem, xyz, p)
+        force_moment[icard, :3] += fi
+        force_moment[icard, 3:] += mi
+    if len(iload) == 0:
+        return
+
+    ueids, ieid = np.unique(row_eids, return_inverse=True)
+    area, centroid, normal, nface = get_shell_face_area_centroid_normal(model, ueids, xyz)
+    pressure, direction, use_normal = get_pload4_pressure_direction(loads, nface[ieid], iload)
+
+    load_dir = np.where(use_normal[:, np.newaxis], normal[ieid, :], direction)
+    forces = (pressure * area[ieid])[:, np.newaxis] * load_dir
+    moments = np.cross(centroid[ieid, :] - p, forces)
+
+    nloads = len(loads)
+    for j in range(3):
+        force_moment[icards, j] += np.bincount(iload, weights=forces[:, j], minlength=nloads)
+        force_moment[icards, j+3] += np.bincount(iload, weights=moments[:, j], minlength=nloads)
+
+def get_pload4_shell_rows(loads: list[PLOAD4],
+                          eids: Optional[set[int]]=None) -> tuple[
+                              np.ndarray, np.ndarray, list[tuple[int, Any]], list[int]]:
+    """
+    Flattens the PLOAD4 cards into (load, shell element) rows
+
+    Parameters
+    ----------
+    loads : list[PLOAD4]
+        the cross-referenced PLOAD4 cards
+    eids : set[int]; default=None -> all
+        the elements to consider
+
+    Returns
+    -------
+    iload : (nrows, ) int ndarray
+        the index into loads
+    row_eids : (nrows, ) int ndarray
+        the shell element ids
+    other_elements : list[(iload, element)]
+        the non-shell elements (e.g., CHEXA)
+    eids_missing : list[int]
+        element ids that weren't cross-referenced
+
+    """
+    iload_list = []
+    eids_list = []
+    other_elements = []
+    eids_missing = []
+    for iloadi, load in enumerate(loads):
+        eids_load = []
+        for elem in load.eids_ref:
+            if isinstance(elem, integer_types):
+                eids_missing.append(elem)
                 continue
-            m = load.mag * load.xyz * scale
-            M += m
-        elif loadtype == 'MOMENT2':
-            not_found_nid = False
-            for nid in load.node_ids:
-                if nid not in nids:
-                    not_found_nid = True
-                    break
-            if not_found_nid:
+            eid = elem.eid
+            if eids is not None and eid not in eids:
                 continue
-            m = load.mag * load.xyz * scale
-            M += m
-
-        elif loadtype == 'PLOAD':
-            nodes = load.node_ids
-            nnodes = len(nodes)
-            nodesi = 0
-            if nnodes == 3:
-                n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
-                axb = np.cross(n1 - n2, n1 - n3)
-                centroid = (n1 + n2 + n3) / 3.
-
-            elif nnodes == 4:
-                n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
-                axb = np.cross(n1 - n3, n2 - n4)
-                centroid = (n1 + n2 + n3 + n4) / 4.
-                if nodes[3] in nids:
-                    nodesi += 1
+            if elem.type in PLOAD4_SHELL_TYPES:
+                eids_load.append(eid)
             else:
-                raise RuntimeError('invalid number of nodes on PLOAD card; '
-                                   'nodes=%s' % str(nodes))
-            if nodes[0] in nids:
-                nodesi += 1
-            if nodes[1] in nids:
-                nodesi += 1
-            if nodes[2] in nids:
-                nodesi += 1
+                other_elements.append((iloadi, elem))
+        iload_list.append(np.full(len(eids_load), iloadi, dtype='int32'))
+        eids_list.append(eids_load)
+
+    if len(iload_list) == 0:
+        return np.zeros(0, dtype='int32'), np.zeros(0, dtype='int32'), other_elements, eids_missing
+    iload = np.hstack(iload_list)
+    row_eids = np.array([eid for eids_load in eids_list for eid in eids_load], dtype='int32')
+    return iload, row_eids, other_elements, eids_missing
+
+def get_pload4_pressure_direction(loads: list[PLOAD4], nface: np.ndarray,
+                                  iload: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the mean pressure and load direction for each (load, face) row
 
-            area, normal = _get_area_normal(axb, nodes, xyz)
-            r = centroid - p
-            f = load.pressure * area * normal * scale
-            m = np.cross(r, f)
+    Parameters
+    ----------
+    loads : list[PLOAD4]
+        the PLOAD4 cards
+    nface : (nrows, ) int ndarray
+        the number of corner nodes on the face (3 or 4)
+    iload : (nrows, ) int ndarray
+        the index into loads
 
-            node_scale = nodesi / float(nnodes)
-            F += f * node_scale
-            M += m * node_scale
+    Returns
+    -------
+    pressure : (nrows, ) float ndarray
+        the mean pressure on the face (see ``_mean_pressure_on_pload4``)
+    direction : (nrows, 3) float ndarray
+        the unit load direction for a PLOAD4 with an NVECTOR
+    use_normal : (nrows, ) bool ndarray
+        use the face normal instead of direction
 
-        elif loadtype == 'PLOAD1':
-            _pload1_elements(model, loadcase_id, load, scale, eids, xyz, F, M, p)
+    """
+    nloads = len(loads)
+    pressures = np.array([load.pressures[:4] for load in loads], dtype='float64').reshape(nloads, 4)
+    direction = np.zeros((nloads, 3), dtype='float64')
+    use_normal = np.ones(nloads, dtype='bool')
+    for iloadi, load in enumerate(loads):
+        if np.abs(load.nvector).max() != 0.:
+            use_normal[iloadi] = False
+            direction[iloadi, :] = update_pload4_vector(load, None, load.Cid())
+
+    # mean of the face pressures; if they're constant, use P1 directly
+    pressure3 = np.where(pressures[:, :3].min(axis=1) != pressures[:, :3].max(axis=1),
+                         pressures[:, :3].mean(axis=1), pressures[:, 0])
+    pressure4 = np.where(pressures.min(axis=1) != pressures.max(axis=1),
+                         pressures.mean(axis=1), pressures[:, 0])
+    pressure = np.where(nface == 3, pressure3[iload], pressure4[iload])
+    return pressure, direction[iload, :], use_normal[iload]
+
+def get_shell_face_area_centroid_normal(model: BDF, eids: np.ndarray,
+                                        xyz: Optional[dict[int, np.ndarray]]=None) -> tuple[
+                                            np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the face properties of the corner nodes of shell elements
+    (same as ``_get_pload4_area_centroid_normal_nface``)
 
-        elif loadtype == 'PLOAD2':
-            pressure = load.pressure * scale
-            for eid in load.element_ids:
-                if eid not in eids:
-                    continue
-                elem = model.elements[eid]
-                if elem.type in shell_elements:
-                    normal = elem.Normal()
-                    area = elem.Area()
-                    f = pressure * normal * area
-                    r = elem.Centroid() - p
-                    m = np.cross(r, f)
-                    F += f
-                    M += m
-                else:
-                    #model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
-                        #loadcase_id, elem.type, loadtype))
-                    raise NotImplementedError('case=%s etype=%r loadtype=%r not supported' % (
-                        loadcase_id, elem.type, loadtype))
-        elif loadtype == 'PLOAD4':
-            _pload4_elements(loadcase_id, load, scale, eids, xyz, F, M, p)
-
-        elif loadtype == 'GRAV':
-            if include_grav:  # this will be super slow
-                g = load.GravityVector() * scale
-                for eid, elem in model.elements.items():
-                    if eid not in eids:
-                        continue
-                    centroid = elem.Centroid()
-                    mass = elem.Mass()
-                    r = centroid - p
-                    f = mass * g
-                    m = np.cross(r, f)
-                    F += f
-                    M += m
-        elif loadtype in skip_loads:
-            continue
-        else:
-            # we collect them so we only get one print
-            unsupported_types.add(loadtype)
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    eids : (nelements, ) int ndarray
+        the shell element ids
+    xyz : dict[nid] = (3, ) float ndarray; default=None
+        the nodes in the global frame
+        None : use GRID.get_position()
 
-    for loadtype in unsupported_types:
-        model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, loadtype))
-    #model.log.info("case=%s F=%s M=%s\n" % (loadcase_id, F, M))
+    Returns
+    -------
+    area : (nelements, ) float ndarray
+    centroid : (nelements, 3) float ndarray
+    normal : (nelements, 3) float ndarray
+    nface : (nelements, ) int ndarray
+        3 for triangles; 4 for quads
 
-    if cid == 0:
-        return F, M
-    cid0 = 0
-    F2, M2 = transform_load(F, M, cid0, cid, model)
-    return F2, M2
+    """
+    nelements = len(eids)
+    face_nids = np.zeros((nelements, 4), dtype='int64')
+    nface = np.full(nelements, 4, dtype='int32')
+    for i, eid in enumerate(eids):
+        elem = model.elements[eid]
+        node_ids = elem.node_ids
+        if elem.type in PLOAD4_TRIA_TYPES:
+            face_nids[i, :] = node_ids[:3] + node_ids[:1]
+            nface[i] = 3
+        else:
+            face_nids[i, :] = node_ids[:4]
 
+    unids, inid = np.unique(face_nids, return_inverse=True)
+    if xyz is None:
+        nodes = model.nodes
+        xyz_nodes = [nodes[nid].get_position() for nid in unids.tolist()]
+    else:
+        xyz_nodes = [xyz[nid] for nid in unids.tolist()]
+    xyz_nodes = np.array(xyz_nodes, dtype='float64').reshape(len(unids), 3)
+    xyz_face = xyz_nodes[inid.reshape(nelements, 4), :]
+    n1 = xyz_face[:, 0, :]
+    n2 = xyz_face[:, 1, :]
+    n3 = xyz_face[:, 2, :]
+    n4 = xyz_face[:, 3, :]
+
+    is_tri = (nface == 3)[:, np.newaxis]
+    axb = np.where(is_tri, np.cross(n1 - n2, n1 - n3), np.cross(n1 - n3, n2 - n4))
+    centroid = np.where(is_tri, (n1 + n2 + n3) / 3., (n1 + n2 + n3 + n4) / 4.)
+    nunit = np.linalg.norm(axb, axis=1)
+    area = 0.5 * nunit
+    izero = np.where(nunit == 0.)[0]
+    if len(izero):
+        raise FloatingPointError('zero area shell elements; eids=%s' % eids[izero].tolist())
+    normal = axb / nunit[:, np.newaxis]
+    return area, centroid, normal, nface
 
 def _bar_eq_pload1(model: BDF, load, elem, xyz, Ldir,
                    n1, n2,
@@ -637,8 +1041,9 @@ def _bar_eq_pload1(model: BDF, load, elem, xyz, Ldir,
             force_dir = array([0., 1., 0.])
         elif load.Type == 'FZ' and x1 == x2:
             force_dir = array([0., 0., 1.])
-        F += p1 * force_dir
-        M += cross(r - p, F)
+        Fi = p1 * force_dir
+        F += Fi
+        M += cross(r - p, Fi)
     elif load.Type in ['MX', 'MY', 'MZ']:
         if load.Type == 'MX' and x1 == x2:
             moment_dir = array([1., 0., 0.])
@@ -665,14 +1070,15 @@ def _bar_eq_pload1(model: BDF, load, elem, xyz, Ldir,
             force_dir = k
         #print('    force_dir =', force_dir, load.Type)
         try:
-            F += p1 * force_dir
+            Fi = p1 * force_dir
         except FloatingPointError:
             msg = 'eid = %s\n' % elem.eid
             msg += 'i = %s\n' % Ldir
             msg += 'force_dir = %s\n' % force_dir
             msg += 'load = \n%s' % str(load)
             raise FloatingPointError(msg)
-        M += cross(r - p, F)
+        F += Fi
+        M += cross(r - p, Fi)
         del force_dir
 
     elif load.Type in ['MXE', 'MYE', 'MZE']:
@@ -2,7 +2,8 @@ from itertools import count
 
 import numpy as np
 from pyNastran.utils.numpy_utils import zip_strict
-from pyNastran.bdf.bdf import BDF, CTRIA3, CQUAD4, GRID, CBAR, CHEXA8, CPENTA6 #CTRIA6, CQUAD8,
+from pyNastran.bdf.bdf import (
+    BDF, CTRIA3, CQUAD4, GRID, CBAR, CROD, CHEXA8, CPENTA6) #CTRIA6, CQUAD8,
 from pyNastran.bdf.mesh_utils.internal_utils import get_bdf_model, BDF_FILETYPE
 
 
@@ -1377,5 +1378,317 @@ def _penta_nids_to_node_ids(nids_array):
     return nodes
 
 
+def refine_model_vectorized(bdf_filename: BDF_FILETYPE, refinement_ratio: int=2,
+                            skip_solids: bool=False) -> BDF:
+    """
+    Array-based version of ``refine_model``
+
+    Every element is split by applying a lattice template for its type.
+    Each lattice point is defined by the element corner nodes that support
+    it and integer interpolation weights.  Edge and face points that are
+    shared by multiple elements have the same (nodes, weights) key, so they
+    are merged with a single np.unique per key length.
+
+    Parameters
+    ----------
+    bdf_filename : str / BDF
+        the model to refine
+    refinement_ratio : int; default=2
+        the number of elements to split each edge into
+    skip_solids : bool; default=False
+        don't refine the CHEXA/CPENTA elements
+
+    Handles:
+     - nodal continuity across elements
+     - CBAR, CROD, CTRIA3, CQUAD4, CHEXA8, CPENTA6
+     - handles rotated/flipped interface between elememts
+       (e.g., CQUAD4/CQUAD4, CQUAD4/CHEXA8, CTRIA3/CPENTA6)
+
+    .. note:: unsupported elements are kept (e.g., CTETRA, CBEAM, CQUAD8)
+    .. note:: doesn't refine SPCs / RBEs
+    .. warning:: doesn't handle CBAR wa/wb
+
+    """
+    assert refinement_ratio >= 1, refinement_ratio
+    model = get_bdf_model(bdf_filename, xref=False, cards_to_skip=None,
+                          validate=True, log=None, debug=False)
+    log = model.log
+
+    out = model.get_displacement_index_xyz_cp_cd(
+        fdtype='float64', idtype='int32', sort_ids=True)
+    unused_icd_transform, icp_transform, xyz_cp, nid_cp_cd = out
+    all_nodes = nid_cp_cd[:, 0]
+    xyz_cid0 = model.transform_xyzcp_to_xyz_cid(
+        xyz_cp, all_nodes, icp_transform, cid=0)
+
+    elements_to_skip = set(elements_0d)
+    if skip_solids:
+        elements_to_skip |= elements_solid
+
+    # group the elements by lattice
+    eids_by_type = {etype: [] for etype in REFINE_NNODES}
+    elements = {}
+    for eid, elem in model.elements.items():
+        etype = elem.type
+        if etype in elements_to_skip:
+            elements[eid] = elem
+            continue
+        if etype in eids_by_type and len(elem.nodes) == REFINE_NNODES[etype]:
+            eids_by_type[etype].append(eid)
+            continue
+        log.warning(f'skipping {etype} eid={eid}; not supported')
+        elements[eid] = elem
+
+    nid0 = max(model.point_ids) + 1
+    # the element ids are shared with the masses, rigid elements and plotels
+    eid0 = max(max(cards, default=0) for cards in (
+        model.elements, model.masses, model.rigid_elements, model.plotels)) + 1
+    n = refinement_ratio
+
+    # get the lattice node ids for all the elements
+    lattices = {}
+    keys_by_support = {2: [], 3: [], 4: []}
+    for etype, eids in eids_by_type.items():
+        if len(eids) == 0:
+            continue
+        eids = np.array(eids, dtype='int32')
+        nids = np.array([model.elements[eid].nodes for eid in eids], dtype='int32')
+        weights, sub_elements = _get_refine_lattice(etype, n)
+        lattices[etype] = (eids, nids, weights, sub_elements)
+        support = (weights > 0).sum(axis=1)
+        for nsupport, keys in keys_by_support.items():
+            ipoints = np.where(support == nsupport)[0]
+            if len(ipoints):
+                keys.append(_get_lattice_point_keys(nids, weights[ipoints, :]))
+
+    inverses = {}
+    nodes = model.nodes
+    weight_scale = float(n ** 3)
+    for nsupport, keys in keys_by_support.items():
+        if len(keys) == 0:
+            continue
+        keys = np.vstack(keys)
+        ukeys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverses[nsupport] = [nid0 + inverse.ravel(), 0]
+        xyz = _lattice_xyz(all_nodes, xyz_cid0,
+                           ukeys[:, :nsupport], ukeys[:, nsupport:], weight_scale)
+        nid0 = _add_refine_grids(nodes, nid0, xyz)
+
+    log.info('refining')
+    for etype, (eids, nids, weights, sub_elements) in lattices.items():
+        nelements, nvertices = nids.shape
+        npoints = weights.shape[0]
+        support = (weights > 0).sum(axis=1)
+        lattice_nids = np.zeros((nelements, npoints), dtype='int32')
+        for ipoint, (nsupport, weight) in enumerate(zip(support, weights)):
+            if nsupport == 1:
+                lattice_nids[:, ipoint] = nids[:, weight.argmax()]
+
+        for nsupport, inverse_i in inverses.items():
+            ipoints = np.where(support == nsupport)[0]
+            if len(ipoints) == 0:
+                continue
+            inverse, i0 = inverse_i
+            i1 = i0 + nelements * len(ipoints)
+            lattice_nids[:, ipoints] = inverse[i0:i1].reshape(nelements, len(ipoints))
+            inverse_i[1] = i1
+
+        # interior points are unique to an element
+        ipoints = np.where(support == nvertices)[0] if nvertices > 4 else []
+        if len(ipoints):
+            xyz = _lattice_xyz(
+                all_nodes, xyz_cid0,
+                np.repeat(nids[:, np.newaxis, :], len(ipoints), axis=1).reshape(-1, nvertices),
+                np.tile(weights[ipoints, :], (nelements, 1)), weight_scale)
+            lattice_nids[:, ipoints] = np.arange(
+                nid0, nid0 + nelements * len(ipoints)).reshape(nelements, len(ipoints))
+            nid0 = _add_refine_grids(nodes, nid0, xyz)
+
+        # (nelements, nsub, nnodes)
+        sub_nids = lattice_nids[:, sub_elements]
+        nsub = sub_elements.shape[0]
+        sub_eids = np.zeros((nelements, nsub), dtype='int32')
+        sub_eids[:, 0] = eids
+        sub_eids[:, 1:] = np.arange(
+            eid0, eid0 + nelements * (nsub - 1)).reshape(nelements, nsub - 1)
+        eid0 += nelements * (nsub - 1)
+        _add_refined_elements(elements, model.elements, etype,
+                              eids, sub_eids, sub_nids)
+    model.elements = elements
+    return model
+
+REFINE_NNODES = {
+    'CBAR': 2, 'CROD': 2,
+    'CTRIA3': 3, 'CQUAD4': 4,
+    'CPENTA': 6, 'CHEXA': 8,
+}
+
+def _get_refine_lattice(etype: str, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the refinement template for an element type
+
+    Returns
+    -------
+    weights : (npoints, nvertices) int ndarray
+        the weight of each corner node on a lattice point, scaled to n^3
+    sub_elements : (nsub, nnodes) int ndarray
+        the lattice points that define each of the new elements
+
+    """
+    if etype in {'CBAR', 'CROD'}:
+        i = np.arange(n + 1)
+        weights = np.column_stack([n - i, i]) * n ** 2
+        sub_elements = np.column_stack([i[:-1], i[1:]])
+    elif etype == 'CTRIA3':
+        weights, sub_elements = _tri_lattice(n)
+        weights *= n ** 2
+    elif etype == 'CQUAD4':
+        weights, sub_elements = _quad_lattice(n)
+        weights *= n
+    elif etype == 'CPENTA':
+        tri_weights, tri_elements = _tri_lattice(n)
+        ntri = tri_weights.shape[0]
+        k = np.arange(n + 1)
+        # (nlayers, ntri, 6) -> (npoints, 6)
+        weights = np.concatenate([
+            (n - k)[:, np.newaxis, np.newaxis] * tri_weights[np.newaxis, :, :],
+            k[:, np.newaxis, np.newaxis] * tri_weights[np.newaxis, :, :],
+        ], axis=2).reshape((n + 1) * ntri, 6) * n
+        layer = (k[:-1] * ntri)[:, np.newaxis, np.newaxis]
+        sub_elements = np.concatenate([
+            layer + tri_elements[np.newaxis, :, :],
+            layer + ntri + tri_elements[np.newaxis, :, :],
+        ], axis=2).reshape(-1, 6)
+    elif etype == 'CHEXA':
+        i, j, k = np.meshgrid(np.arange(n + 1), np.arange(n + 1), np.arange(n + 1),
+                              indexing='ij')
+        i = i.ravel(order='F')
+        j = j.ravel(order='F')
+        k = k.ravel(order='F')
+        weights = np.column_stack([
+            (n - i) * (n - j) * (n - k), i * (n - j) * (n - k),
+            i * j * (n - k), (n - i) * j * (n - k),
+            (n - i) * (n - j) * k, i * (n - j) * k,
+            i * j * k, (n - i) * j * k,
+        ])
+        m = n + 1
+        ii, jj, kk = np.meshgrid(np.arange(n), np.arange(n), np.arange(n), indexing='ij')
+        ip = (ii + jj * m + kk * m * m).ravel(order='F')
+        sub_elements = np.column_stack([
+            ip, ip + 1, ip + 1 + m, ip + m,
+            ip + m * m, ip + 1 + m * m, ip + 1 + m + m * m, ip + m + m * m,
+        ])
+    else:  # pragma: no cover
+        raise NotImplementedError(etype)
+    return weights.astype('int64'), sub_elements
+
+def _tri_lattice(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """gets the barycentric weights (scaled to n) and sub-triangles of a CTRIA3"""
+    points = [(a, b) for b in range(n + 1) for a in range(n + 1 - b)]
+    index = {point: ipoint for ipoint, point in enumerate(points)}
+    weights = np.array([(n - a - b, a, b) for (a, b) in points])
+    sub_elements = []
+    for (a, b) in points:
+        if a + b < n:
+            sub_elements.append((index[(a, b)], index[(a + 1, b)], index[(a, b + 1)]))
+        if a + b < n - 1:
+            sub_elements.append((index[(a + 1, b)], index[(a + 1, b + 1)], index[(a, b + 1)]))
+    return weights, np.array(sub_elements)
+
+def _quad_lattice(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """gets the bilinear weights (scaled to n^2) and sub-quads of a CQUAD4"""
+    m = n + 1
+    j, i = np.divmod(np.arange(m * m), m)
+    weights = np.column_stack([
+        (n - i) * (n - j), i * (n - j), i * j, (n - i) * j])
+    jj, ii = np.divmod(np.arange(n * n), n)
+    ip = ii + jj * m
+    sub_elements = np.column_stack([ip, ip + 1, ip + 1 + m, ip + m])
+    return weights, sub_elements
+
+def _get_lattice_point_keys(nids: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Gets the (nodes, weights) keys for a set of lattice points.  The
+    support nodes are sorted, so the key doesn't depend on the element
+    orientation.
+
+    Parameters
+    ----------
+    nids : (nelements, nvertices) int ndarray
+        the corner nodes
+    weights : (npoints, nvertices) int ndarray
+        the lattice weights; each point has the same number of nonzero weights
+
+    Returns
+    -------
+    keys : (nelements*npoints, 2*nsupport) int ndarray
+        the sorted support node ids and their weights
+
+    """
+    nelements = nids.shape[0]
+    npoints = weights.shape[0]
+    nsupport = (weights[0, :] > 0).sum()
+    ivertex = np.nonzero(weights > 0)[1].reshape(npoints, nsupport)
+
+    support_nids = nids[:, ivertex].reshape(nelements * npoints, nsupport)
+    support_weights = np.tile(
+        np.take_along_axis(weights, ivertex, axis=1), (nelements, 1))
+    isort = np.argsort(support_nids, axis=1)
+    keys = np.hstack([
+        np.take_along_axis(support_nids, isort, axis=1),
+        np.take_along_axis(support_weights, isort, axis=1),
+    ])
+    return keys
+
+def _lattice_xyz(all_nodes: np.ndarray, xyz_cid0: np.ndarray,
+                 nids: np.ndarray, weights: np.ndarray,
+                 weight_scale: float) -> np.ndarray:
+    """interpolates the lattice point locations"""
+    inids = np.searchsorted(all_nodes, nids)
+    xyz = (weights[:, :, np.newaxis] * xyz_cid0[inids, :]).sum(axis=1) / weight_scale
+    return xyz
+
+def _add_refine_grids(nodes: dict[int, GRID], nid0: int, xyz: np.ndarray) -> int:
+    """adds the new nodes in the global frame"""
+    for nid, xyzi in zip(range(nid0, nid0 + len(xyz)), xyz):
+        nodes[nid] = GRID(nid, xyzi)
+    return nid0 + len(xyz)
+
+def _add_refined_elements(elements: dict, elements_old: dict, etype: str,
+                          eids: np.ndarray, sub_eids: np.ndarray,
+                          sub_nids: np.ndarray) -> None:
+    """creates the new element cards"""
+    nsub = sub_eids.shape[1]
+    for eid, sub_eidsi, sub_nidsi in zip(eids.tolist(), sub_eids.tolist(), sub_nids.tolist()):
+        elem = elements_old[eid]
+        pid = elem.pid
+        if etype in {'CTRIA3', 'CQUAD4'}:
+            args = {'theta_mcid': elem.theta_mcid,
+                    'zoffset': elem.zoffset,
+                    'tflag': elem.tflag,}
+            card_class = CTRIA3 if etype == 'CTRIA3' else CQUAD4
+            for eidi, nidsi in zip(sub_eidsi, sub_nidsi):
+                elements[eidi] = card_class(eidi, pid, nidsi, **args)
+        elif etype == 'CHEXA':
+            for eidi, nidsi in zip(sub_eidsi, sub_nidsi):
+                elements[eidi] = CHEXA8(eidi, pid, nidsi)
+        elif etype == 'CPENTA':
+            for eidi, nidsi in zip(sub_eidsi, sub_nidsi):
+                elements[eidi] = CPENTA6(eidi, pid, nidsi)
+        elif etype == 'CROD':
+            for eidi, nidsi in zip(sub_eidsi, sub_nidsi):
+                elements[eidi] = CROD(eidi, pid, nidsi)
+        elif etype == 'CBAR':
+            for isub, (eidi, nidsi) in enumerate(zip(sub_eidsi, sub_nidsi)):
+                elements[eidi] = CBAR(
+                    eidi, pid, nidsi, elem.x, elem.g0,
+                    pa=elem.pa if isub == 0 else 0,
+                    pb=elem.pb if isub == nsub - 1 else 0,
+                    offt=elem.offt)
+        else:  # pragma: no cover
+            raise NotImplementedError(etype)
+        elements[eid].comment = elem.comment
+
+
 #if __name__ == '__main__':
     #test_refine()
@@ -0,0 +1,344 @@
+"""
+Builds sparse aero-structure interpolation (spline) matrices
+
+defines:
+ - H = get_interpolation_matrix(xyz_from, xyz_to, method='idw', k=4,
+                                power=2., radius=None)
+ - box_ids, xyz_box = get_caero_box_centroids(model, caero_ids=None)
+ - box_ids, nids, H = get_spline_interpolation_matrix(model, spline, method='idw')
+ - box_ids, nids, H = get_spline_interpolation_matrices(model, spline_ids=None,
+                                                        method='idw')
+ - save_interpolation_matrix(npz_filename, H, row_ids, col_ids)
+ - H, row_ids, col_ids = load_interpolation_matrix(npz_filename)
+
+The interpolation matrix H has a shape of (nto, nfrom), so:
+ - displacements: u_aero = H @ u_structure
+ - forces:        F_structure = H.T @ F_aero
+
+Using the transpose for the forces conserves the total force and the
+virtual work.  Since the matrix is sparse and multiple columns may be
+passed at once, many load/displacement vectors are mapped in one product.
+
+"""
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.utils import PathLike
+    from pyNastran.bdf.bdf import BDF
+
+
+def get_interpolation_matrix(xyz_from: np.ndarray, xyz_to: np.ndarray,
+                             method: str='idw', k: int=4, power: float=2.,
+                             radius: Optional[float]=None,
+                             drop_tol: float=1e-10) -> sp.csr_matrix:
+    """
+    Builds a sparse interpolation matrix from one point cloud to another
+
+    Parameters
+    ----------
+    xyz_from : (nfrom, 3) float ndarray
+        the source points (e.g., the structural nodes)
+    xyz_to : (nto, 3) float ndarray
+        the destination points (e.g., the aero box centroids)
+    method : str; default='idw'
+        nearest : the closest source point
+        idw : inverse distance weighting of the k closest source points
+        rbf : Wendland C2 radial basis functions with a compact support
+              of radius and a linear polynomial, so rigid body motions
+              are recovered exactly
+    k : int; default=4
+        the number of points to use for method='idw'
+    power : float; default=2.
+        the inverse distance weighting exponent for method='idw'
+    radius : float; default=None
+        the support radius for method='rbf' (required)
+    drop_tol : float; default=1e-10
+        rbf terms smaller than drop_tol * max(|H[i, :]|) of their row
+        are removed
+
+    Returns
+    -------
+    H : (nto, nfrom) float csr_matrix
+        the interpolation matrix
+
+    """
+    xyz_from = np.asarray(xyz_from, dtype='float64')
+    xyz_to = np.asarray(xyz_to, dtype='float64')
+    nfrom = xyz_from.shape[0]
+    nto = xyz_to.shape[0]
+    assert xyz_from.ndim == 2 and xyz_from.shape[1] == 3, xyz_from.shape
+    assert xyz_to.ndim == 2 and xyz_to.shape[1] == 3, xyz_to.shape
+
+    if method == 'nearest':
+        tree = _get_tree(xyz_from)
+        unused_dist, ifrom = tree.query(xyz_to, k=1)
+        H = sp.csr_matrix((np.ones(nto), (np.arange(nto), ifrom)), shape=(nto, nfrom))
+    elif method == 'idw':
+        H = _get_idw_matrix(xyz_from, xyz_to, min(k, nfrom), power)
+    elif method == 'rbf':
+        if radius is None:
+            raise ValueError("radius is required for method='rbf'")
+        H = _get_rbf_matrix(xyz_from, xyz_to, radius, drop_tol)
+    else:
+        raise NotImplementedError(f'method={method!r} is not [nearest, idw, rbf]')
+    return H
+
+def _get_idw_matrix(xyz_from: np.ndarray, xyz_to: np.ndarray,
+                    k: int, power: float) -> sp.csr_matrix:
+    """builds the inverse distance weighting matrix; the rows sum to 1"""
+    nfrom = xyz_from.shape[0]
+    nto = xyz_to.shape[0]
+    tree = _get_tree(xyz_from)
+    dist, ifrom = tree.query(xyz_to, k=k)
+    dist = dist.reshape(nto, k)
+    ifrom = ifrom.reshape(nto, k)
+
+    # a coincident point gets all the weight
+    is_coincident = dist <= 1e-12 * max(1., dist.max())
+    weight = np.zeros(dist.shape, dtype='float64')
+    is_exact = is_coincident.any(axis=1)
+    weight[is_coincident] = 1.
+    not_exact = ~is_exact
+    weight[not_exact, :] = 1. / dist[not_exact, :] ** power
+    weight /= weight.sum(axis=1)[:, np.newaxis]
+
+    irow = np.repeat(np.arange(nto), k)
+    H = sp.csr_matrix((weight.ravel(), (irow, ifrom.ravel())), shape=(nto, nfrom))
+    H.eliminate_zeros()
+    return H
+
+def _wendland_c2(dist: np.ndarray, radius: float) -> np.ndarray:
+    """phi(r) = (1 - r)^4 * (4 r + 1) for r = dist/radius < 1"""
+    r = dist / radius
+    return (1. - r) ** 4 * (4. * r + 1.)
+
+def _get_rbf_distance_matrix(xyz_a: np.ndarray, xyz_b: np.ndarray,
+                             radius: float) -> sp.csr_matrix:
+    """gets the radial basis values for the points within the support radius"""
+    tree_a = _get_tree(xyz_a)
+    tree_b = _get_tree(xyz_b)
+    # the ndarray output keeps the coincident points (dist=0)
+    pairs = tree_b.sparse_distance_matrix(tree_a, radius, output_type='ndarray')
+    phi = _wendland_c2(pairs['v'], radius)
+    return sp.csr_matrix((phi, (pairs['i'], pairs['j'])),
+                         shape=(xyz_b.shape[0], xyz_a.shape[0]))
+
+def _get_polynomial(xyz: np.ndarray, center: np.ndarray,
+                    axes: np.ndarray) -> np.ndarray:
+    """gets the [1, x', y', z'] polynomial in the principal axes"""
+    return np.column_stack([np.ones(xyz.shape[0]), (xyz - center) @ axes.T])
+
+def _get_rbf_matrix(xyz_from: np.ndarray, xyz_to: np.ndarray,
+                    radius: float, drop_tol: float,
+                    max_nbytes: int=64_000_000) -> sp.csr_matrix:
+    """
+    Builds the compact radial basis function matrix:
+        [Phi_ff  P_f] [a] = [u_f]
+        [P_f.T   0  ] [b]   [0  ]
+        u_t = [Phi_tf  P_t] [a; b]
+
+    The polynomial only uses the principal directions of the source
+    points, so planar (e.g., wing box) or linear (e.g., beam) structures
+    don't make the system singular.  The inverse of the compact system
+    isn't compact, so the rbf matrix is denser than the nearest/idw ones.
+
+    The destination points are solved in blocks, so the dense solution
+    is at most max_nbytes and the small terms are dropped per block.
+    """
+    nfrom = xyz_from.shape[0]
+    center = xyz_from.mean(axis=0)
+    unused_u, sigma, vh = np.linalg.svd(xyz_from - center, full_matrices=False)
+    is_axis = sigma > 1e-8 * max(1., sigma[0]) if len(sigma) else []
+    axes = vh[is_axis, :]
+
+    phi_ff = _get_rbf_distance_matrix(xyz_from, xyz_from, radius)
+    p_f = _get_polynomial(xyz_from, center, axes)
+    A = sp.bmat([
+        [phi_ff, sp.csr_matrix(p_f)],
+        [sp.csr_matrix(p_f.T), None],
+    ], format='csc')
+
+    phi_tf = _get_rbf_distance_matrix(xyz_from, xyz_to, radius)
+    p_t = _get_polynomial(xyz_to, center, axes)
+    B = sp.hstack([phi_tf, sp.csr_matrix(p_t)], format='csr')
+
+    # H = B @ inv(A)[:, :nfrom]; A is symmetric, so solve A @ X = B.T
+    lu = splu(A)
+    Bt = B.T.tocsc()
+    nto = B.shape[0]
+    nblock = max(1, max_nbytes // (8 * A.shape[0]))
+    H_blocks = []
+    for i0 in range(0, nto, nblock):
+        X = lu.solve(Bt[:, i0:i0 + nblock].toarray())
+        H = X[:nfrom, :].T
+        if drop_tol > 0. and H.size:
+            abs_h = np.abs(H)
+            H[abs_h < drop_tol * abs_h.max(axis=1, keepdims=True)] = 0.
+        H_blocks.append(sp.csr_matrix(H))
+
+    if len(H_blocks) == 0:
+        return sp.csr_matrix((nto, nfrom), dtype='float64')
+    return sp.vstack(H_blocks, format='csr')
+
+def get_caero_box_centroids(model: BDF,
+                            caero_ids: Optional[list[int]]=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the aero box ids and centroids for the panel based CAEROx cards
+
+    Parameters
+    ----------
+    model : BDF
+        a cross-referenced model
+    caero_ids : list[int]; default=None -> all
+        the CAEROx ids to consider
+
+    Returns
+    -------
+    box_ids : (nbox, ) int ndarray
+        the sorted aero box ids
+    xyz_box : (nbox, 3) float ndarray
+        the box centroids in the global frame
+
+    """
+    if caero_ids is None:
+        caero_ids = sorted(model.caeros)
+    box_ids_list = []
+    xyz_list = []
+    for caero_id in caero_ids:
+        caero = model.caeros[caero_id]
+        if not hasattr(caero, 'panel_points_elements'):
+            model.log.warning(f'skipping {caero.type} eid={caero_id}')
+            continue
+        points, elements = caero.panel_points_elements()
+        box_ids_list.append(caero.eid + np.arange(len(elements)))
+        xyz_list.append(points[elements, :].mean(axis=1))
+
+    if len(box_ids_list) == 0:
+        return np.zeros(0, dtype='int32'), np.zeros((0, 3), dtype='float64')
+    box_ids = np.hstack(box_ids_list)
+    xyz_box = np.vstack(xyz_list)
+    isort = np.argsort(box_ids)
+    return box_ids[isort], xyz_box[isort, :]
+
+def get_spline_interpolation_matrix(model: BDF, spline,
+                                    method: str='idw', k: int=4, power: float=2.,
+                                    radius: Optional[float]=None) -> tuple[
+                                        np.ndarray, np.ndarray, sp.csr_matrix]:
+    """
+    Builds the interpolation matrix for a SPLINE1/SPLINE2/SPLINE4/SPLINE5
+
+    Parameters
+    ----------
+    model : BDF
+        a cross-referenced model
+    spline : SPLINE1 / SPLINE2 / SPLINE4 / SPLINE5
+        the spline to define the boxes and structural nodes
+    method / k / power / radius
+        see ``get_interpolation_matrix``
+
+    Returns
+    -------
+    box_ids : (nbox, ) int ndarray
+        the aero box ids (the rows)
+    nids : (nnode, ) int ndarray
+        the structural node ids (the columns)
+    H : (nbox, nnode) float csr_matrix
+        the interpolation matrix
+
+    """
+    caero = spline.caero_ref
+    box_ids = np.asarray(spline.aero_element_ids, dtype='int32')
+    nids = np.unique(spline.setg_ref.ids)
+
+    points, elements = caero.panel_points_elements()
+    ibox = box_ids - caero.eid
+    xyz_box = points[elements[ibox, :], :].mean(axis=1)
+    xyz_nodes = np.array([model.nodes[nid].get_position() for nid in nids])
+    H = get_interpolation_matrix(xyz_nodes, xyz_box, method=method,
+                                 k=k, power=power, radius=radius)
+    return box_ids, nids, H
+
+def get_spline_interpolation_matrices(model: BDF,
+                                      spline_ids: Optional[list[int]]=None,
+                                      method: str='idw', k: int=4, power: float=2.,
+                                      radius: Optional[float]=None) -> tuple[
+                                          np.ndarray, np.ndarray, sp.csr_matrix]:
+    """
+    Builds the interpolation matrix for all the boxes in the model
+
+    Each spline is assembled into a global matrix, so a box/node that's
+    referenced by multiple splines gets the sum of the splines.
+
+    Parameters
+    ----------
+    model : BDF
+        a cross-referenced model
+    spline_ids : list[int]; default=None -> all
+        the splines to consider
+    method / k / power / radius
+        see ``get_interpolation_matrix``
+
+    Returns
+    -------
+    box_ids : (nbox, ) int ndarray
+        the sorted aero box ids (the rows)
+    nids : (nnode, ) int ndarray
+        the sorted structural node ids (the columns)
+    H : (nbox, nnode) float csr_matrix
+        the interpolation matrix
+
+    """
+    if spline_ids is None:
+        spline_ids = sorted(model.splines)
+
+    splines = []
+    for spline_id in spline_ids:
+        spline = model.splines[spline_id]
+        if spline.type not in {'SPLINE1', 'SPLINE2', 'SPLINE4', 'SPLINE5'}:
+            model.log.warning(f'skipping {spline.type} eid={spline_id}')
+            continue
+        splines.append(get_spline_interpolation_matrix(
+            model, spline, method=method, k=k, power=power, radius=radius))
+
+    if len(splines) == 0:
+        return (np.zeros(0, dtype='int32'), np.zeros(0, dtype='int32'),
+                sp.csr_matrix((0, 0)))
+
+    box_ids = np.unique(np.hstack([spline[0] for spline in splines]))
+    nids = np.unique(np.hstack([spline[1] for spline in splines]))
+    irows = []
+    icols = []
+    data = []
+    for box_idsi, nidsi, Hi in splines:
+        Hi = Hi.tocoo()
+        irows.append(np.searchsorted(box_ids, box_idsi)[Hi.row])
+        icols.append(np.searchsorted(nids, nidsi)[Hi.col])
+        data.append(Hi.data)
+    H = sp.csr_matrix(
+        (np.hstack(data), (np.hstack(irows), np.hstack(icols))),
+        shape=(len(box_ids), len(nids)))
+    return box_ids, nids, H
+
+def save_interpolation_matrix(npz_filename: PathLike, H: sp.spmatrix,
+                              row_ids: np.ndarray, col_ids: np.ndarray) -> None:
+    """caches an interpolation matrix and its row/column ids to an npz file"""
+    H = sp.csr_matrix(H)
+    assert H.shape == (len(row_ids), len(col_ids)), (H.shape, len(row_ids), len(col_ids))
+    np.savez_compressed(
+        npz_filename, data=H.data, indices=H.indices, indptr=H.indptr,
+        shape=np.array(H.shape), row_ids=row_ids, col_ids=col_ids)
+
+def load_interpolation_matrix(npz_filename: PathLike) -> tuple[
+        sp.csr_matrix, np.ndarray, np.ndarray]:
+    """loads an interpolation matrix saved by ``save_interpolation_matrix``"""
+    with np.load(npz_filename) as npz:
+        H = sp.csr_matrix((npz['data'], npz['indices'], npz['indptr']),
+                          shape=tuple(npz['shape']))
+        row_ids = npz['row_ids']
+        col_ids = npz['col_ids']
+    return H, row_ids, col_ids
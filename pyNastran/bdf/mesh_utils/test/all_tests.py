@@ -9,6 +9,7 @@ from pyNastran.bdf.mesh_utils.test.test_remove_unused import TestRemoveUnused
 from pyNastran.bdf.mesh_utils.test.test_sum_loads import TestLoadSum
 from pyNastran.bdf.mesh_utils.test.test_refine import TestRefine
 from pyNastran.bdf.mesh_utils.test.test_flutter import TestFlutter
+from pyNastran.bdf.mesh_utils.test.test_spline_matrix import TestSplineMatrix
 
 if __name__ == "__main__":  # pragma: no cover
     import os
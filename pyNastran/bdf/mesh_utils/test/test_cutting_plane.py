@@ -22,8 +22,8 @@ from pyNastran.bdf.bdf import read_bdf, BDF, CORD2R
 from cpylog import SimpleLogger
 
 from pyNastran.bdf.mesh_utils.cut_model_by_plane import (
-    cut_edge_model_by_coord, cut_face_model_by_coord, connect_face_rows,
-    split_to_trias, calculate_area_moi, _get_shell_inertia)
+    cut_edge_model_by_coord, cut_face_model_by_coord, cut_face_model_by_coords,
+    connect_face_rows, split_to_trias, calculate_area_moi, _get_shell_inertia)
 from pyNastran.bdf.mesh_utils.cutting_plane_plotter import cut_and_plot_model
 #from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge
 from pyNastran.op2.op2_geom import read_op2_geom
@@ -421,6 +421,63 @@ class TestCuttingPlane(unittest.TestCase):
                                cut_type='face', plot=IS_MATPLOTLIB, show=False)
         os.remove('tris.bdf')
 
+    def test_cut_face_model_by_coords(self):
+        """cuts the 2x1 plate with many planes at once"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(MODEL_PATH, 'plate_py', 'plate_py.dat')
+        model = read_bdf(bdf_filename, log=log)
+        nids = np.array(list(model.nodes.keys()))
+        y = np.array([node.xyz[1] for node in model.nodes.values()])
+        nodal_result = y[np.argsort(nids)]
+        thickness = 0.125
+
+        # parallel planes normal to the x-axis; x=1.0 is on a row of nodes
+        xs = [0.1, 0.5, 1.0, 1.9, 3.0]
+        coords = [CORD2R(i + 1, origin=[x, 0., 0.], zaxis=[x, 0., 1.], xzplane=[x, -1., 0.])
+                  for i, x in enumerate(xs)]
+        cuts = cut_face_model_by_coords(model, coords, nodal_result=nodal_result)
+        assert np.allclose(cuts.length, [1., 1., 1., 1., 0.]), cuts.length
+        assert np.allclose(cuts.area, thickness * cuts.length), cuts.area
+        assert np.allclose(cuts.force[:, 0], [0.0625, 0.0625, 0.0625, 0.0625, 0.]), cuts.force
+        assert np.allclose(cuts.xyz_global[..., 0], np.repeat(xs, np.diff(cuts.istation))[:, np.newaxis])
+        for istation in range(4):
+            chains = cuts.get_chains(istation)
+            assert len(chains) == 1, chains
+            isegments = cuts.get_station(istation)
+            assert len(chains[0]) == isegments.stop - isegments.start
+
+            # the local x-axis is -y, so the centroid is at x=-0.5
+            assert np.allclose(cuts.centroid[istation, :], [-0.5, 0., 0.]), cuts.centroid
+            ixx = cuts.inertia[istation, 0]
+            assert 0. < ixx < thickness / 12., ixx
+        assert len(cuts.get_chains(4)) == 0
+
+        # a non-parallel plane through the diagonal of the plate
+        coords.append(CORD2R(10, origin=[1., 0.5, 0.], zaxis=[1., 0.5, 1.], xzplane=[2., 1.5, 0.]))
+        cuts2 = cut_face_model_by_coords(model, coords, nodal_result=nodal_result,
+                                         max_chunk_size=1000)
+        assert np.allclose(cuts2.length, [1., 1., 1., 1., 0., 2 ** 0.5]), cuts2.length
+        assert np.allclose(cuts2.inertia[:5, :], cuts.inertia)
+        assert len(cuts2.get_chains(5)) == 1
+        assert len(np.unique(cuts2.chain)) == 5, cuts2.chain
+
+        # the same points/results as cutting one plane at a time
+        for istation, coord in enumerate(coords):
+            unused_geometry_arrays, result_arrays, unused_rods = cut_face_model_by_coord(
+                model, coord, 1.0, nodal_result, plane_atol=1e-5)
+            isegments = cuts2.get_station(istation)
+            points = np.hstack([
+                cuts2.xyz_global[isegments].reshape(-1, 3),
+                cuts2.result[isegments].reshape(-1, 1)])
+            if result_arrays is None:
+                assert len(points) == 0, points
+                continue
+            points1 = np.vstack(result_arrays)[:, 3:]
+            assert np.allclose(np.unique(points.round(8), axis=0),
+                               np.unique(points1.round(8), axis=0)), istation
+        os.remove('plane_face.bdf')
+        os.remove('plane_face2.bdf')
+
     def test_connect_face_rows(self):
         """in order"""
         geometry_array = np.array([
@@ -11,7 +11,10 @@ from cpylog import SimpleLogger
 import pyNastran
 from pyNastran.bdf.bdf import read_bdf
 from pyNastran.bdf.mesh_utils.collapse_bad_quads import convert_bad_quads_to_tris
-from pyNastran.bdf.mesh_utils.delete_bad_elements import delete_bad_shells, get_bad_shells
+from pyNastran.bdf.mesh_utils.delete_bad_elements import (
+    delete_bad_shells, get_bad_shells,
+    tri_quality, quad_quality, get_min_max_theta,
+    tri_quality_vectorized, quad_quality_vectorized, get_min_max_theta_vectorized)
 
 PKG_PATH = pyNastran.__path__[0]
 MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
@@ -361,6 +364,40 @@ class TestMeshQuality(unittest.TestCase):
         assert model.card_count['CTRIA3'] == 1, model.card_count
         os.remove(bdf_filename)
 
+    def test_quality_vectorized(self):
+        """the vectorized tri/quad/solid quality matches the element-by-element version"""
+        rng = np.random.default_rng(42)
+        nelements = 20
+        p1, p2, p3, p4 = rng.random((4, nelements, 3))
+        # a collapsed tri
+        p2[0] = p1[0]
+        out = tri_quality_vectorized(p1, p2, p3)
+        for i in range(nelements):
+            # the scalar version divides by the zero length edge of the collapsed tri
+            with np.errstate(divide='ignore', invalid='ignore'):
+                expected = tri_quality(p1[i], p2[i], p3[i])
+            actual = [value[i] for value in out]
+            assert np.allclose(actual, expected, equal_nan=True), (i, actual, expected)
+
+        out = quad_quality_vectorized(p1, p2, p3, p4)
+        for i in range(1, nelements):
+            expected = quad_quality(None, p1[i], p2[i], p3[i], p4[i])
+            actual = [value[i] for value in out]
+            assert np.allclose(actual, expected, equal_nan=True), (i, actual, expected)
+
+        # CPYRAM
+        faces = ((0, 1, 2, 3), (1, 4, 2), (2, 4, 3), (0, 3, 4), (0, 4, 1))
+        xyz_cid0 = rng.random((10, 3))
+        inodes = np.array([rng.permutation(10)[:5] for i in range(nelements)])
+        nid_map = {nid: nid for nid in range(10)}
+        min_theta, max_theta, dideal_theta, min_edge_length = get_min_max_theta_vectorized(
+            faces, inodes, xyz_cid0)
+        for i in range(nelements):
+            expected = get_min_max_theta(faces, inodes[i], nid_map, xyz_cid0)
+            assert np.allclose([min_theta[i], max_theta[i], dideal_theta[i]], expected[:3])
+            # all the faces are used
+            assert min_edge_length[i] <= expected[3] + 1e-12
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
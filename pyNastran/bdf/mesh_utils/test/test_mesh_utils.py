@@ -20,7 +20,7 @@ from pyNastran.bdf.mesh_utils.mirror_mesh import (
 from pyNastran.bdf.mesh_utils.mass_properties import (
     mass_properties, mass_properties_nsm)  #mass_properties_breakdown
 from pyNastran.bdf.mesh_utils.make_half_model import make_half_model
-from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge
+from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge, bdf_merge_offset
 from pyNastran.bdf.mesh_utils.utils import cmd_line, CMD_MAPS
 from pyNastran.bdf.mesh_utils.find_closest_nodes import find_closest_nodes
 from pyNastran.bdf.mesh_utils.find_coplanar_elements import find_coplanar_triangles
@@ -538,6 +538,61 @@ class TestMeshUtils(unittest.TestCase):
         os.remove(bdf_filename_out2)
         os.remove(bdf_filename_out3)
 
+    def test_merge_offset(self):
+        """merges multiple bdfs using precomputed id offsets"""
+        log = SimpleLogger(level='error')
+        bdf_filename1 = BWB_PATH / 'bwb_saero.bdf'
+        bdf_filename2 = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.bdf'
+        bdf_filename3 = MODEL_PATH / 'solid_bending' / 'solid_bending.bdf'
+        bdf_filename_out1 = MODEL_PATH / 'bwb' / 'BWBsaero_offset_renumber.out'
+        bdf_filename_out2 = MODEL_PATH / 'bwb' / 'BWBsaero_offset.out'
+        bdf_filenames = [bdf_filename1, bdf_filename2, bdf_filename3]
+
+        model1, mappers1 = bdf_merge_offset(
+            bdf_filenames, bdf_filename_out=bdf_filename_out1,
+            renumber=True, nprocesses=1, log=log)
+        model2, mappers2 = bdf_merge_offset(
+            bdf_filenames, bdf_filename_out=bdf_filename_out2,
+            renumber=False, nprocesses=1, log=log)
+        model3, unused_mappers3 = bdf_merge(
+            bdf_filenames, renumber=True, log=log)
+
+        assert len(mappers1) == 3, len(mappers1)
+        assert len(model1.nodes) == len(model3.nodes)
+        assert len(model1.elements) == len(model3.elements)
+        assert min(model1.nodes) == 1, min(model1.nodes)
+        assert max(model1.nodes) == len(model1.nodes), max(model1.nodes)
+
+        # the primary model is unchanged without renumbering
+        model_primary = read_bdf(bdf_filename1, log=log)
+        nid_map = mappers2[0]['nodes']
+        assert all(nid_map[nid] == nid for nid in model_primary.nodes)
+        for nid_old, nid_new in mappers2[1]['nodes'].items():
+            assert nid_new in model2.nodes, (nid_old, nid_new)
+
+        # the secondary models don't have a case control deck
+        assert 'LOAD' in mappers1[0], sorted(mappers1[0])
+        for mapper in mappers1[1:]:
+            assert 'LOAD' not in mapper and 'spcs' not in mapper, sorted(mapper)
+
+        mass1 = mass_properties(read_bdf(bdf_filename_out1, log=log))[0]
+        mass2 = mass_properties(read_bdf(bdf_filename_out2, log=log))[0]
+        mass3 = mass_properties(model3)[0]
+        assert np.allclose(mass1, mass3), (mass1, mass3)
+        assert np.allclose(mass2, mass3), (mass2, mass3)
+
+        # the models read in parallel are merged the same way
+        bdf_filename_out3 = MODEL_PATH / 'bwb' / 'BWBsaero_offset_parallel.out'
+        unused_model4, mappers4 = bdf_merge_offset(
+            bdf_filenames, bdf_filename_out=bdf_filename_out3,
+            renumber=True, nprocesses=2, log=log)
+        assert mappers4 == mappers1
+        with open(bdf_filename_out1, 'r') as bdf_file1, open(bdf_filename_out3, 'r') as bdf_file3:
+            assert bdf_file1.read() == bdf_file3.read()
+        os.remove(bdf_filename_out1)
+        os.remove(bdf_filename_out2)
+        os.remove(bdf_filename_out3)
+
     def test_export_mcids(self):
         """creates material coordinate systems"""
         log = SimpleLogger(level='error')
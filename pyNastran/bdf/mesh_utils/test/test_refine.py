@@ -5,7 +5,8 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.mesh_utils.refine import (
-    refine_model, _quad_nids_to_node_ids, _hexa_nids_to_node_ids,
+    refine_model, refine_model_vectorized,
+    _quad_nids_to_node_ids, _hexa_nids_to_node_ids,
     _insert_quad_nodes)
 pkg_path = pyNastran.__path__[0]
 #model_path = os.path.join(pkg_path, '..', 'models')
@@ -379,6 +380,107 @@ class TestRefine(unittest.TestCase):
         x = 1
 
 
+    def test_vectorized_quad_tri_bar(self):
+        """refines shells/bars at multiple refinement ratios"""
+        for ratio in [1, 2, 3, 4]:
+            model = BDF(debug=None)
+            model.add_grid(1, [0., 0., 0.])
+            model.add_grid(2, [1., 0., 0.])
+            model.add_grid(3, [1., 1., 0.])
+            model.add_grid(4, [0., 1., 0.])
+            model.add_grid(5, [2., 0., 0.])
+            model.add_cquad4(1, 1, [1, 2, 3, 4])
+            model.add_ctria3(2, 1, [5, 3, 2])
+            model.add_cbar(3, 2, [2, 1], [0., 0., 1.], None)
+            model.add_conm2(4, 1, 1.0)
+            model.add_pbarl(2, 1, 'BAR', [0., 1.])
+            model.add_pshell(1, mid1=1, t=0.1)
+            model.add_mat1(1, 3.0e7, None, 0.3)
+            model.cross_reference()
+            area0 = _shell_area(model)
+            model.uncross_reference()
+
+            model = refine_model_vectorized(model, refinement_ratio=ratio)
+            model.validate()
+            model.cross_reference()
+            # the new element ids don't reuse the CONM2 id
+            eids_new = set(model.elements) - {1, 2, 3}
+            assert not eids_new & set(model.masses), sorted(model.elements)
+            assert all(eid > 4 for eid in eids_new), sorted(eids_new)
+            nquad_nodes = (ratio + 1) ** 2
+            ntri_nodes = (ratio + 1) * (ratio + 2) // 2 - (ratio + 1)
+            assert len(model.nodes) == nquad_nodes + ntri_nodes, len(model.nodes)
+            assert len(model.elements) == ratio ** 2 * 2 + ratio, len(model.elements)
+            assert len(model.masses) == 1
+            assert np.allclose(_shell_area(model), area0)
+            for elem in model.elements.values():
+                if elem.type in {'CQUAD4', 'CTRIA3'}:
+                    assert np.allclose(elem.Normal(), [0., 0., 1.])
+
+    def test_vectorized_hexa_penta_quad(self):
+        """refines a hexa/penta/quad model that shares faces"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [0., 0., 1.])
+        model.add_grid(6, [1., 0., 1.])
+        model.add_grid(7, [1., 1., 1.])
+        model.add_grid(8, [0., 1., 1.])
+        model.add_grid(9, [2., 0., 0.])
+        model.add_grid(10, [2., 0., 1.])
+        model.add_chexa(1, 1, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_cpenta(2, 1, [2, 9, 3, 6, 10, 7])
+        model.add_cquad4(3, 2, [4, 3, 2, 1])
+        model.add_psolid(1, 1)
+        model.add_pshell(2, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.cross_reference()
+        volume0 = _solid_volume(model)
+        model.uncross_reference()
+
+        ratio = 3
+        model = refine_model_vectorized(model, refinement_ratio=ratio)
+        model.validate()
+        model.cross_reference()
+        nhexa_nodes = (ratio + 1) ** 3
+        npenta_nodes = (ratio + 1) * (ratio + 1) * (ratio + 2) // 2
+        nshared = (ratio + 1) ** 2
+        assert len(model.nodes) == nhexa_nodes + npenta_nodes - nshared, len(model.nodes)
+        assert len(model.elements) == 2 * ratio ** 3 + ratio ** 2, len(model.elements)
+        assert np.allclose(_solid_volume(model), volume0)
+
+    def test_vectorized_skip_solids(self):
+        """the solids are kept when skip_solids=True"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [0., 0., 1.])
+        model.add_grid(6, [1., 0., 1.])
+        model.add_grid(7, [1., 1., 1.])
+        model.add_grid(8, [0., 1., 1.])
+        model.add_grid(9, [2., 0., 0.])
+        model.add_grid(10, [2., 1., 0.])
+        model.add_chexa(1, 1, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_cquad4(2, 2, [2, 9, 10, 3])
+        model.add_psolid(1, 1)
+        model.add_pshell(2, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        model = refine_model_vectorized(model, refinement_ratio=2, skip_solids=True)
+        model.validate()
+        model.cross_reference()
+        hexas = [elem for elem in model.elements.values() if elem.type == 'CHEXA']
+        quads = [elem for elem in model.elements.values() if elem.type == 'CQUAD4']
+        assert len(hexas) == 1, len(hexas)
+        assert hexas[0].eid == 1
+        assert hexas[0].node_ids == [1, 2, 3, 4, 5, 6, 7, 8]
+        assert len(quads) == 4, len(quads)
+        assert np.allclose(_solid_volume(model), 1.)
+
     def _test_refine_bwb(self):
         model_path = os.path.join(pkg_path, '..', 'models')
         bwb_path = os.path.join(model_path, 'bwb')
@@ -392,5 +494,13 @@ class TestRefine(unittest.TestCase):
         model.cross_reference()
         x = 1
 
+def _shell_area(model: BDF) -> float:
+    return sum(elem.Area() for elem in model.elements.values()
+               if elem.type in {'CQUAD4', 'CTRIA3'})
+
+def _solid_volume(model: BDF) -> float:
+    return sum(elem.Volume() for elem in model.elements.values()
+               if elem.type in {'CHEXA', 'CPENTA'})
+
 if __name__ == '__main__':
     unittest.main()
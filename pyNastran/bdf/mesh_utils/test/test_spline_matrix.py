@@ -0,0 +1,135 @@
+import os
+import unittest
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.mesh_utils.spline_matrix import (
+    get_interpolation_matrix, get_caero_box_centroids,
+    get_spline_interpolation_matrices,
+    save_interpolation_matrix, load_interpolation_matrix, _get_rbf_matrix)
+from pyNastran.converters.cart3d.cart3d import Cart3D
+from pyNastran.dev.tools.pressure_map import pressure_map_from_model
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = PKG_PATH / '..' / 'models'
+
+
+class TestSplineMatrix(unittest.TestCase):
+    def test_interpolation_matrix(self):
+        """tests the nearest, idw, and rbf methods on a plate"""
+        x, y = np.meshgrid(np.linspace(0., 1., num=11), np.linspace(0., 2., num=21))
+        xyz_from = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+        xyz_to = np.array([
+            [0.05, 0.05, 0.],
+            [0.5, 1.0, 0.],   # coincident
+            [0.33, 1.77, 0.],
+        ])
+
+        # a rigid body rotation about the x-axis
+        u_from = 1.0 + 0.2 * xyz_from[:, 1]
+        u_to = 1.0 + 0.2 * xyz_to[:, 1]
+        for method in ['nearest', 'idw', 'rbf']:
+            H = get_interpolation_matrix(xyz_from, xyz_to, method=method, radius=0.5)
+            assert H.shape == (3, 231), H.shape
+            assert np.allclose(H.sum(axis=1), 1.), method
+            assert np.allclose((H @ u_from)[1], u_to[1]), method
+
+            # the total force is conserved
+            forces_to = np.array([[1., 2.], [3., 4.], [5., 6.]])
+            forces_from = H.T @ forces_to
+            assert np.allclose(forces_from.sum(axis=0), forces_to.sum(axis=0)), method
+
+        H = get_interpolation_matrix(xyz_from, xyz_to, method='idw', k=4)
+        assert H.nnz == 4 + 1 + 4, H.nnz
+        H = get_interpolation_matrix(xyz_from, xyz_to, method='rbf', radius=0.5)
+        assert np.allclose(H @ u_from, u_to)
+
+        # one destination point per block
+        H2 = _get_rbf_matrix(xyz_from, xyz_to, 0.5, 1e-10, max_nbytes=1)
+        assert isinstance(H2, sp.csr_matrix)
+        assert np.allclose(H2.toarray(), H.toarray())
+
+        with self.assertRaises(ValueError):
+            get_interpolation_matrix(xyz_from, xyz_to, method='rbf')
+        with self.assertRaises(NotImplementedError):
+            get_interpolation_matrix(xyz_from, xyz_to, method='cat')
+
+    def test_spline_interpolation_matrices(self):
+        """builds the SPLINE1 matrix for the bwb and caches it"""
+        log = SimpleLogger(level='warning')
+        bdf_filename = MODEL_PATH / 'bwb' / 'bwb_saero.bdf'
+        npz_filename = MODEL_PATH / 'bwb' / 'bwb_spline.npz'
+        model = read_bdf(bdf_filename, log=log)
+
+        all_box_ids, unused_xyz_box = get_caero_box_centroids(model)
+        box_ids, nids, H = get_spline_interpolation_matrices(model, method='idw')
+        assert H.shape == (len(box_ids), len(nids)), H.shape
+        assert np.all(np.isin(box_ids, all_box_ids))
+        assert np.all(np.isin(nids, list(model.nodes)))
+
+        # unit z-translation of the structure
+        uz = np.ones((len(nids), 2))
+        assert np.allclose(H @ uz, 1.)
+
+        save_interpolation_matrix(npz_filename, H, box_ids, nids)
+        H2, box_ids2, nids2 = load_interpolation_matrix(npz_filename)
+        os.remove(npz_filename)
+        assert np.array_equal(box_ids, box_ids2)
+        assert np.array_equal(nids, nids2)
+        assert (H != H2).nnz == 0
+
+    def test_pressure_map_force(self):
+        """the forces mapped to the structural nodes sum to the aero forces"""
+        log = SimpleLogger(level='warning')
+        structure_model = BDF(log=log)
+        x, y = np.meshgrid(np.linspace(0., 2., num=5), np.linspace(0., 1., num=3))
+        for nid, (xi, yi) in enumerate(zip(x.ravel(), y.ravel()), start=1):
+            structure_model.add_grid(nid, [xi, yi, 0.])
+        eid = 1
+        for j in range(2):
+            for i in range(4):
+                n1 = 5 * j + i + 1
+                structure_model.add_cquad4(eid, 1, [n1, n1 + 1, n1 + 6, n1 + 5])
+                eid += 1
+        structure_model.add_pshell(1, mid1=1, t=0.1)
+        structure_model.add_mat1(1, 3.0e7, None, 0.3)
+        structure_model.cross_reference()
+
+        # a finer, slightly offset aero mesh that is bigger than the mapped elements
+        aero_model = Cart3D(log=log)
+        x, y = np.meshgrid(np.linspace(-0.2, 2.2, num=9), np.linspace(-0.1, 1.1, num=5))
+        aero_model.nodes = np.column_stack([x.ravel(), y.ravel(), np.full(x.size, 0.05)])
+        tris = []
+        for j in range(4):
+            for i in range(8):
+                n1 = 9 * j + i
+                tris.extend([[n1, n1 + 1, n1 + 10], [n1, n1 + 10, n1 + 9]])
+        aero_model.elements = np.array(tris, dtype='int32')
+        aero_model.regions = np.ones(len(tris), dtype='int32')
+        ntris = len(tris)
+        aero_model.loads['Cp'] = np.linspace(-1., 0.5, num=ntris)
+
+        scale = 2.0
+        structure_eids = np.array([1, 2, 3, 6, 7], dtype='int32')
+        model = pressure_map_from_model(
+            aero_model, structure_model, structure_eids,
+            map_type='force', scale=scale, pressure_sid=2)
+
+        xyz = aero_model.nodes[aero_model.elements]
+        normal = np.cross(xyz[:, 1, :] - xyz[:, 0, :], xyz[:, 2, :] - xyz[:, 0, :]) / 2.
+        force_expected = -(aero_model.loads['Cp'] * scale)[:, np.newaxis] * normal
+
+        forces = model.loads[2]
+        nids = [force.node for force in forces]
+        assert set(nids) <= {1, 2, 3, 4, 6, 7, 8, 9, 11, 12, 13, 14}, nids
+        force = np.array([force.mag * force.xyz for force in forces]).sum(axis=0)
+        assert np.allclose(force, force_expected.sum(axis=0)), (force, force_expected.sum(axis=0))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
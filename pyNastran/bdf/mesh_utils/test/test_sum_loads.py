@@ -7,10 +7,37 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_array,
+    _sum_forces_moments_card, _sum_forces_moments_elements_card,
+    _get_load_summation_point)
+from pyNastran.bdf.utils import get_xyz_cid0_dict
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
+def _sum_forces_moments_by_card(model: BDF, p0, loadcase_id: int,
+                                eids=None, nids=None):
+    """sums the loads card by card (the reference for ``sum_forces_moments_array``)"""
+    p = _get_load_summation_point(model, p0, cid=0)
+    xyz = get_xyz_cid0_dict(model)
+    loads, scale_factors, unused_is_grav = model.get_reduced_loads(
+        loadcase_id, skip_scale_factor0=True)
+    F = np.zeros(3)
+    M = np.zeros(3)
+    unsupported_types = set()
+    for load, scale in zip(loads, scale_factors):
+        if eids is None:
+            f, m = _sum_forces_moments_card(
+                model, loadcase_id, load, scale, xyz, p, False, unsupported_types)
+        else:
+            f, m = _sum_forces_moments_elements_card(
+                model, loadcase_id, load, scale, set(eids), set(nids), xyz, p,
+                False, unsupported_types)
+        F += f
+        M += m
+    return F, M
+
+
 class TestLoadSum(unittest.TestCase):
     def test_loads_sum_01(self):
         """tests FORCE"""
@@ -478,5 +505,50 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(M2_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M2_expected, M1))
 
 
+    def test_loads_sum_array(self):
+        """tests sum_forces_moments_array with LOAD/PLOAD4/FORCE/PLOAD"""
+        model = BDF(log=None, debug=None)
+        bdf_filename = os.path.join(model_path, 'real', 'loads', 'loads.bdf')
+        model.read_bdf(bdf_filename)
+        p0 = array([1., 2., 3.])
+        loadcase_ids = [1, 2, 5, 6, 1001, 1002, 1003, 1]
+        forces, moments = sum_forces_moments_array(model, p0, loadcase_ids)
+        assert forces.shape == (8, 3), forces.shape
+        assert moments.shape == (8, 3), moments.shape
+        for loadcase_id, force, moment in zip(loadcase_ids, forces, moments):
+            F1, M1 = _sum_forces_moments_by_card(model, p0, loadcase_id)
+            assert np.allclose(F1, force), 'loadcase_id=%s F1=%s F=%s' % (loadcase_id, F1, force)
+            assert np.allclose(M1, moment), 'loadcase_id=%s M1=%s M=%s' % (loadcase_id, M1, moment)
+
+        # the per-card values before sum_forces_moments_array existed
+        forces_expected = [
+            [0., 0., 3.], [0., 0., 4.], [0., 1.414214, 1.414214], [0., 0., 2.],
+            [0., 0., 3.], [0., 0., 1.], [0., 0., 9.], [0., 0., 3.]]
+        moments_expected = [
+            [-1.5, 1.5, 0.], [-1.5, -1.5, 0.], [2.12132, 0.707107, -0.707107], [-3., 1., 0.],
+            [-1.5, 1.5, 0.], [0., -3., 0.], [-13.5, 4.5, 0.], [-1.5, 1.5, 0.]]
+        assert np.allclose(forces, forces_expected, atol=1e-6), forces
+        assert np.allclose(moments, moments_expected, atol=1e-6), moments
+
+        # a subset of the elements
+        eids = list(model.elements)[::2]
+        nids = list(model.nodes)[::2]
+        forces, moments = sum_forces_moments_array(model, p0, loadcase_ids, eids=eids, nids=nids)
+        for loadcase_id, force, moment in zip(loadcase_ids, forces, moments):
+            F2, M2 = _sum_forces_moments_by_card(model, p0, loadcase_id, eids=eids, nids=nids)
+            assert np.allclose(F2, force), 'loadcase_id=%s F2=%s F=%s' % (loadcase_id, F2, force)
+            assert np.allclose(M2, moment), 'loadcase_id=%s M2=%s M=%s' % (loadcase_id, M2, moment)
+
+        # many combinations of the same PLOAD4s
+        for i, load_id in enumerate(range(2000, 2010)):
+            model.add_load(load_id, 2., [1., -0.5 * i], [1001, 5])
+        F1001, M1001 = sum_forces_moments(model, p0, 1001)
+        F5, M5 = sum_forces_moments(model, p0, 5)
+        forces, moments = sum_forces_moments_array(model, p0, list(range(2000, 2010)))
+        scales = -np.arange(10) * 0.5
+        assert np.allclose(forces, 2. * (F1001 + scales[:, np.newaxis] * F5))
+        assert np.allclose(moments, 2. * (M1001 + scales[:, np.newaxis] * M5))
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -276,6 +276,36 @@ class TestBDFUnit(Tester):
         assert np.allclose(expected_forces, forces)
         x = 1
 
+    def test_forces_moments_ctria6_missing_midside(self):
+        """the PLOAD4 is only split between the nodes that exist"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [2., 0., 0.])
+        model.add_grid(3, [0., 2., 0.])
+        model.add_grid(4, [1., 0., 0.])
+        model.add_ctria6(1, 10, [1, 2, 3, 4, None, None])
+        model.add_pshell(10, mid1=100, t=0.1)
+        model.add_mat1(100, 3.0e7, None, 0.3)
+        model.add_pload4(10004, [1], [3., None, None, None])
+        model.card_count['PLOAD4'] = 1  # set by read_bdf
+        model.cross_reference()
+
+        nnodes = 4
+        nid_map = {1: 0, 2: 1, 3: 2, 4: 3}
+        normals = np.array([[0., 0., 1.]])
+        eid_map = {1: 0}
+        is_loads, out = get_forces_moments_array(
+            model, [0., 0., 0.], 10004,
+            eid_map, nnodes, normals, set(), nid_map,
+            include_grav=False, fdtype='float32')
+        assert is_loads
+        centroidal_pressures, forces, moments, spcd = out
+        assert np.allclose(centroidal_pressures, [3.])
+        # pressure * area = 3 * 2 = 6 split over the 4 nodes
+        expected_forces = np.zeros((4, 3))
+        expected_forces[:, 2] = 1.5
+        assert np.allclose(expected_forces, forces), forces
+
     def test_write_path(self):
         include_name = r'C:\NASA\formats\pynastran_v0.6\pyNastran\bdf\writePath.py'
         msg1 = write_include(include_name, is_windows=True)
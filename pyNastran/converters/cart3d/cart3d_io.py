@@ -47,6 +47,7 @@ class Cart3dIO:
             skip_reading = True
         else:
             gui.turn_corner_text_off()
+            gui._reset_level_of_detail()
             gui.grid.Reset()
 
             gui.result_cases = {}
@@ -5,6 +5,7 @@ import os
 import sys
 from pathlib import PurePath
 import traceback
+from functools import partial
 from itertools import chain
 from io import StringIO
 from collections import defaultdict
@@ -94,6 +95,7 @@ from pyNastran.op2.op2 import OP2
 from pyNastran.op2.result_objects.stress_object import StressObject
 
 
+from pyNastran.gui.vtk_util import vtk_to_numpy
 from pyNastran.gui.utils.vtk.vtk_utils import (
     numpy_to_vtk_points,
     create_vtk_cells_of_constant_element_type,
@@ -103,9 +105,12 @@ from pyNastran.gui.qt_files.colors import (
     RED_FLOAT, BLUE_FLOAT, GREEN_FLOAT, LIGHT_GREEN_FLOAT, PINK_FLOAT, PURPLE_FLOAT,
     YELLOW_FLOAT, ORANGE_FLOAT)
 from pyNastran.gui.errors import NoGeometry, NoSuperelements
-from pyNastran.gui.gui_objects.gui_result import GuiResult # , NormalResult
+from pyNastran.gui.gui_objects.gui_result import GuiResult, LazyGuiResult # , NormalResult
 from pyNastran.gui.gui_objects.displacements import ForceTableResults # , ElementalTableResults
+from pyNastran.gui.gui_objects.result_cache import ResultCache
+from pyNastran.gui.gui_objects.result_store import ResultStore, get_geometry_hash
 from pyNastran.converters.nastran.gui.result_objects.force_results import ForceResults2
+from pyNastran.converters.nastran.gui.result_objects.vector_results import VectorResultsCommon
 
 
 from pyNastran.converters.nastran.gui.types import CasesDict
@@ -125,8 +130,9 @@ from .nastran_io_utils import (
     build_normals_quality, create_monpnt,
     map_elements1_quality_helper,
     map_elements1_no_quality_helper,
+    map_elements_vectorized_helper,
     get_caero_control_surface_grid,
-    get_model_unvectorized,
+    get_model_unvectorized, read_op2_results,
     create_ugrid_from_elements,
 )
 
@@ -191,8 +197,18 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
         self.create_secondary_actors = True
         self.stop_on_failure = False
 
+        # the (optional) persistent store of the computed fringes
+        #  - None : disabled
+        #  - '' : ~/.pyNastran/result_store
+        self.result_store_dir: Optional[str] = None
+        self.result_store_compression: Optional[str] = None
+        self.prebuild_result_store = False
+
     def clear_nastran(self):
         """cleans up variables specific to Nastran"""
+        if hasattr(self, 'result_store'):
+            self.close_result_store()
+        self.result_store: Optional[ResultStore] = None
         self.eid_map = {}
         self.nid_map = {}
         self.eid_to_nid_map = {}
@@ -209,6 +225,7 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
         self.xyz_cid0 = np.zeros((0, 3), dtype='float64')
         self.nnodes = 0
         self.nelements = 0
+        self.result_cache = ResultCache()
         self.bar_eids = {}
         self.bar_lines = {}
         self.gui.isubcase_name_map = {}
@@ -359,6 +376,7 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
         else:
             gui: MainWindow = self.gui
             gui.turn_corner_text_off()
+            gui._reset_level_of_detail()
             gui.grid.Reset()
 
             #self.gui.eid_map = {}
@@ -432,9 +450,15 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
                                 bdf_filename: str | BDF,
                                 xref_loads: bool=True) -> tuple[BDF, bool]:
         """Loads the BDF/OP2 geometry"""
-        log = self.gui.log
-        model, xref_nodes = get_model_unvectorized(
-            log, bdf_filename, xref_loads=xref_loads, is_h5py=IS_H5PY)
+        if isinstance(bdf_filename, str):
+            # read/cross-reference the model in a worker thread
+            func = partial(get_model_unvectorized, bdf_filename=bdf_filename,
+                           xref_loads=xref_loads, is_h5py=IS_H5PY)
+            title = f'Loading {os.path.basename(bdf_filename)}'
+            model, xref_nodes = self.gui.load_actions.run_in_background(title, func)
+        else:
+            model, xref_nodes = get_model_unvectorized(
+                self.gui.log, bdf_filename, xref_loads=xref_loads, is_h5py=IS_H5PY)
         self.model_type = 'nastran'
         return model, xref_nodes
 
@@ -2088,10 +2112,14 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
             material_theta = None
         else:
             xyz_cid0 = self.xyz_cid0
+            out = map_elements_vectorized_helper(
+                self, model, xyz_cid0, nid_cp_cd, quality=False)
+            if out is None:
+                out = map_elements1_no_quality_helper(
+                    self, xyz_cid0, nid_cp_cd, model, nid_map, j)
             (nid_to_pid_map, xyz_cid0, superelements,
              pids, nelements, material_coord,
-             material_theta) = map_elements1_no_quality_helper(
-                 self, xyz_cid0, nid_cp_cd, model, nid_map, j)
+             material_theta) = out[:7]
             self._build_plotels(model)
             self.gui.nelements = nelements
         out = (
@@ -2237,8 +2265,13 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
             )
         else:
             xyz_cid0 = self.xyz_cid0
-            out = map_elements1_quality_helper(
-                self, model, xyz_cid0, nid_cp_cd, nid_map, j)
+            out = map_elements_vectorized_helper(
+                self, model, xyz_cid0, nid_cp_cd, quality=True)
+            if out is None:
+                out = map_elements1_quality_helper(
+                    self, model, xyz_cid0, nid_cp_cd, nid_map, j)
+            else:
+                self._build_plotels(model)
         return out
 
     def _build_properties(self, model: BDF, nelements: int,
@@ -2783,6 +2816,7 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
                                 # in model.isubcase_name_map.items()}
 
         form = self._fill_op2_output(results_filename, cases, model, form, icase, log)
+        self._set_result_cache(cases, icase, log, results_filename=results_filename)
         gui._finish_results_io2(model_name, form, cases)
 
         #name = 'spike'
@@ -2790,6 +2824,109 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
         #self.create_group_with_name(name, eids)
         #self.post_group_by_name(name)
 
+    def set_result_store(self, is_enabled: bool=True,
+                         store_dir: str='',
+                         compression: Optional[str]=None,
+                         prebuild: bool=False) -> None:
+        """
+        Enables the persistent store of the computed fringes for the
+        next OP2 that is loaded (see ResultStore)
+
+        Parameters
+        ----------
+        is_enabled : bool; default=True
+            enables/disables the store
+        store_dir : str; default='' -> ~/.pyNastran/result_store
+            the directory of the stores
+        compression : str; default=None
+            None : contiguous datasets, which are memory-mapped
+            'gzip', 'lzf' : chunked, compressed datasets
+        prebuild : bool; default=False
+            derive the default fringe of every case when the OP2 is
+            loaded for the first time
+
+        """
+        self.result_store_dir = store_dir if is_enabled else None
+        self.result_store_compression = compression
+        self.prebuild_result_store = prebuild
+
+    def _set_result_cache(self, cases: CasesDict, icase: int,
+                          log: SimpleLogger,
+                          results_filename: str='') -> None:
+        """
+        The VectorResultsCommon and LazyGuiResult result objects compute
+        the fringes on demand from the OP2 arrays, so share an LRU cache
+        of the computed cases to make switching between recently viewed
+        cases fast.  The optional ResultStore keeps the computed
+        VectorResultsCommon cases for the next session.  The other
+        GuiResult cases are filled when the OP2 is loaded and are skipped.
+        """
+        result_cache = self.result_cache
+        result_cache.log = log
+        result_store = self._get_result_store(results_filename, log)
+        is_prebuild = result_store is not None and self.prebuild_result_store and len(result_store) == 0
+
+        nobjects = 0
+        for icasei, case in cases.items():
+            if icasei < icase:
+                continue
+            obj = case[0]
+            if isinstance(obj, VectorResultsCommon) and obj.result_cache is None:
+                obj.result_cache = result_cache
+                if result_store is not None:
+                    obj.result_store = result_store
+                    obj.store_name = get_result_store_name(obj)
+                nobjects += 1
+            elif isinstance(obj, LazyGuiResult) and obj.result_cache is None:
+                obj.result_cache = result_cache
+                nobjects += 1
+            if is_prebuild and isinstance(obj, VectorResultsCommon):
+                i, res_name = case[1]
+                try:
+                    obj.get_fringe_result(i, res_name)
+                except Exception:  # pragma: no cover
+                    log.warning(f'cannot prebuild icase={icasei}\n{traceback.format_exc()}')
+        log.debug(f'result cache: nobjects={nobjects}; {result_cache.get_stats()}')
+        if result_store is not None:
+            log.debug(str(result_store))
+
+    def _get_result_store(self, results_filename: str,
+                          log: SimpleLogger) -> Optional[ResultStore]:
+        """opens the ResultStore of an OP2 if it's enabled"""
+        self.close_result_store()
+        if self.result_store_dir is None or not isinstance(results_filename, (str, PurePath)):
+            return None
+        results_filename = str(results_filename)
+        if not results_filename.lower().endswith('.op2') or not IS_H5PY:
+            return None
+        store_dir = self.result_store_dir if self.result_store_dir else None
+        try:
+            result_store = ResultStore.from_op2_filename(
+                results_filename, store_dir=store_dir,
+                geometry_hash=self._get_geometry_hash(),
+                compression=self.result_store_compression, log=log)
+        except Exception:  # pragma: no cover
+            # e.g., a read-only directory or the file is open in another session
+            log.warning(f'cannot open the result store\n{traceback.format_exc()}')
+            return None
+        self.result_store = result_store
+        return result_store
+
+    def _get_geometry_hash(self) -> str:
+        """hashes the nodes and elements of the model in the GUI"""
+        cells = self.gui.grid.GetCells()
+        offsets = vtk_to_numpy(cells.GetOffsetsArray())
+        connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+        return get_geometry_hash(
+            self.node_ids, self.xyz_cid0, self.element_ids,
+            np.hstack([offsets, connectivity]))
+
+    def close_result_store(self) -> None:
+        """closes the ResultStore of the loaded OP2"""
+        if self.result_store is not None:
+            self.result_store.close()
+            self.result_store = None
+
     def _load_nastran_results_str(self, results_filename: str,
                                   log: SimpleLogger) -> Optional[OP2]:
         print("trying to read...%s" % results_filename)
@@ -2800,12 +2937,8 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
         nastran_settings: NastranSettings = settings.nastran_settings
 
         mode = get_nastran_format(self.model, nastran_settings)
+        title = f'Loading {os.path.basename(results_filename)}'
         if ext == '.op2':
-            op2_filename = results_filename
-            model = OP2(log=log, mode=mode, debug=True)
-            model.IS_TESTING = False
-            model.read_matpool = False
-
             #if 0:  # pragma: no cover
                 #model._results.saved = set()
                 #all_results = model.get_all_results()
@@ -2813,14 +2946,10 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
                     #if result in all_results:
                         #model._results.saved.add(result)
 
-            nastran_settings: NastranSettings = gui.settings.nastran_settings
             exclude_results = get_results_to_exclude(nastran_settings)
-            model.include_exclude_results(
-                exclude_results=exclude_results,
-                #include_results=include_results,
-            )
-
-            model.read_op2(op2_filename, combine=False)
+            func = partial(read_op2_results, results_filename, mode,
+                           exclude_results=exclude_results)
+            model = gui.load_actions.run_in_background(title, func)
 
             if not IS_TESTING or self.is_testing_flag:
                 log.info(model.get_op2_stats())
@@ -2831,10 +2960,8 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
             gui.cycle_results_explicit()  # start at icase=0
             return None
         elif ext == '.h5' and IS_H5PY:
-            model = OP2(log=log, mode=mode, debug=True)
-            model.read_matpool = False
-            hdf5_filename = results_filename
-            model.load_hdf5_filename(hdf5_filename, combine=False)
+            func = partial(read_op2_results, results_filename, mode)
+            model = gui.load_actions.run_in_background(title, func)
         #elif ext == '.pch':
             #raise NotImplementedError('*.pch is not implemented; filename=%r' % op2_filename)
         #elif ext == '.f06':
@@ -2906,6 +3033,10 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
         key_itimes = []
 
         icase, form_optimization = fill_responses(cases, model, icase)
+        eid_to_nid_map = {}
+        for eid, elem in self.model.elements.items():
+            eid_to_nid_map[eid] = elem.nodes
+
         for key in keys:
             unused_is_data, unused_is_static, unused_is_real, times = _get_times(model, key)
             if times is None:
@@ -2925,10 +3056,6 @@ class NastranIO_(NastranGuiResults, NastranGeometryHelper):
 
             ncases_old = icase
 
-            eid_to_nid_map = {}
-            for eid, elem in self.model.elements.items():
-                eid_to_nid_map[eid] = elem.nodes
-
             stop_on_failure = self.stop_on_failure
             icase = self._fill_op2_oug_oqg(
                 cases, model, key, icase,
@@ -3900,3 +4027,19 @@ def plotels_to_groups(model: BDF) -> tuple[
         else:  # pragma: no cover
             log.warning(f'skipping {etype} eid={eid}')
     return lines, tris, quads
+
+
+def get_result_store_name(obj: VectorResultsCommon) -> str:
+    """
+    Gets the name of a result object in the ResultStore.  The name
+    doesn't depend on the case order (e.g., another OP2 was loaded first),
+    so it's built from the class, subcase, result name and the OP2 tables.
+    The itime/res_name and the sidebar state are added by the result
+    object.
+    """
+    cases = obj.cases if hasattr(obj, 'cases') else [obj.case]
+    tables = ','.join(
+        f"{getattr(case, 'table_name', None) or case.__class__.__name__}/"
+        f"{getattr(case, 'element_name', '')}"
+        for case in cases)
+    return f'{obj.__class__.__name__}:{obj.subcase_id}:{obj.uname}:{tables}'
@@ -46,7 +46,9 @@ from pyNastran.bdf.cards.elements.solid import (
     CPYRAM5, CPYRAM13,
 )
 from pyNastran.bdf.mesh_utils.delete_bad_elements import (
-    tri_quality, quad_quality, get_min_max_theta)
+    tri_quality, quad_quality, get_min_max_theta,
+    tri_quality_vectorized, quad_quality_vectorized, get_min_max_theta_vectorized)
+from pyNastran.op2.op2 import OP2
 from pyNastran.op2.op2_geom import OP2Geom
 
 #
@@ -60,6 +62,7 @@ from .utils import (
 # gui
 from pyNastran.gui.utils.vtk.vtk_utils import (
     numpy_to_vtk_points, create_vtk_cells_of_constant_element_type)
+from pyNastran.gui.utils.vtk.vectorized_geometry import build_vtk_geometry
 from pyNastran.gui.qt_files.colors import (
     RED_FLOAT, BLUE_FLOAT)
 from pyNastran.gui.gui_objects.gui_result import GuiResult, NormalResult
@@ -1034,6 +1037,301 @@ def map_elements1_quality_helper(self,
     )
     return out
 
+# the VTK node order of the CHEXA20 midside nodes is flipped
+_CHEXA20_VTK_ORDER = list(range(12)) + [16, 17, 18, 19, 12, 13, 14, 15]
+
+# these normals point inwards (same as map_elements1_quality_helper)
+_CTETRA_FACES = ((0, 1, 2), (0, 3, 1), (0, 3, 2), (1, 3, 2))
+_CPYRAM_FACES = ((0, 1, 2, 3), (1, 4, 2), (2, 4, 3), (0, 3, 4), (0, 4, 1))
+_CPENTA_FACES = ((0, 2, 1), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (0, 3, 5, 2))
+_CHEXA_FACES = ((4, 5, 6, 7), (0, 3, 2, 1), (1, 2, 6, 5),
+                (2, 3, 7, 6), (0, 4, 7, 3), (0, 6, 5, 4))
+
+# element class/type -> (shape, linear VTK type, quadratic VTK type,
+#                        ncorner nodes, VTK order of the quadratic nodes)
+#  - the quadratic elements are drawn as linear elements if a midside node is missing
+VECTORIZED_ELEMENTS = {
+    CTRIA3: ('tri', 5, None, 3, None),
+    CTRIAR: ('tri', 5, None, 3, None),
+    CQUAD4: ('quad', 9, None, 4, None),
+    CQUADR: ('quad', 9, None, 4, None),
+    CSHEAR: ('quad', 9, None, 4, None),
+    CTETRA4: (_CTETRA_FACES, 10, None, 4, None),
+    CTETRA10: (_CTETRA_FACES, 10, 24, 4, list(range(10))),
+    CPENTA6: (_CPENTA_FACES, 13, None, 6, None),
+    CPENTA15: (_CPENTA_FACES, 13, 26, 6, list(range(15))),
+    CHEXA8: (_CHEXA_FACES, 12, None, 8, None),
+    CIHEX1: (_CHEXA_FACES, 12, None, 8, None),
+    CHEXA1: (_CHEXA_FACES, 12, None, 8, None),
+    CHEXA20: (_CHEXA_FACES, 12, 25, 8, _CHEXA20_VTK_ORDER),
+    CIHEX2: (_CHEXA_FACES, 12, 25, 8, _CHEXA20_VTK_ORDER),
+    CPYRAM5: (_CPYRAM_FACES, 14, None, 5, None),
+    CPYRAM13: (_CPYRAM_FACES, 14, 27, 5, list(range(13))),
+    'CBAR': ('line', 3, None, 2, None),
+    'CBEAM': ('line', 3, None, 2, None),
+    'CROD': ('line', 3, None, 2, None),
+    'CONROD': ('line', 3, None, 2, None),
+    'CTUBE': ('line', 3, None, 2, None),
+}
+# the springs/dampers are drawn as lines if both nodes are defined
+for _etype in ['CBUSH', 'CBUSH1D', 'CFAST', 'CGAP', 'CVISC',
+               'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
+               'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5']:
+    VECTORIZED_ELEMENTS[_etype] = ('spring', 3, None, 2, None)
+del _etype
+MATERIAL_COORD_ELEMENTS = {CTRIA3, CTRIAR, CQUAD4, CQUADR}
+QUALITY_NAMES = [
+    'area', 'min_interior_angle', 'max_interior_angle', 'max_aspect_ratio',
+    'max_skew_angle', 'taper_ratio', 'dideal_theta',
+    'area_ratio', 'min_edge_length', 'max_warp_angle',
+]
+
+
+def map_elements_vectorized_helper(self,
+                                   model: BDF,
+                                   xyz_cid0: np.ndarray,
+                                   nid_cp_cd: np.ndarray,
+                                   quality: bool=True) -> Optional[tuple]:
+    """
+    Vectorized version of map_elements1_quality_helper and
+    map_elements1_no_quality_helper.  The connectivity, offsets,
+    cell types and quality metrics are built with numpy per element
+    type and the cells are passed to VTK in a single call.
+
+    Returns None if the model has an element type that isn't in
+    VECTORIZED_ELEMENTS (or superelements), so the element-by-element
+    helpers must be used.
+    """
+    nids = nid_cp_cd[:, 0]
+    if model.superelement_models or len(model.elements) == 0:
+        return None
+    if not np.all(nids[:-1] < nids[1:]):
+        return None
+
+    groups = defaultdict(list)
+    for element in model.elements.values():
+        key = element.type if element.type in VECTORIZED_ELEMENTS else element.__class__
+        if key not in VECTORIZED_ELEMENTS:
+            return None
+        groups[key].append(element)
+
+    # per VTK cell type
+    all_eids = []
+    all_cell_types = []
+    all_inodes = []
+    # per element
+    all_pids = []
+    all_node_ids = []
+    all_material_coord = []
+    all_material_theta = []
+    all_quality = []
+    eid_to_nid_map = {}
+
+    for key, elements in groups.items():
+        shape, vtk_linear, vtk_quadratic, ncorner, quadratic_order = VECTORIZED_ELEMENTS[key]
+        nelementsi = len(elements)
+        eids = np.array([element.eid for element in elements], dtype='int64')
+        node_ids_list = [element.node_ids for element in elements]
+        if shape == 'spring':
+            if any(None in node_idsi for node_idsi in node_ids_list):
+                # grounded spring
+                return None
+            node_ids = np.array(node_ids_list, dtype='int64')
+            is_quadratic = np.zeros(nelementsi, dtype='bool')
+        elif vtk_quadratic is None:
+            node_ids = np.array(node_ids_list, dtype='int64')
+            is_quadratic = np.zeros(nelementsi, dtype='bool')
+        else:
+            node_ids = np.array(node_ids_list, dtype='object')
+            is_blank = np.equal(node_ids, None)
+            node_ids[is_blank] = 0
+            node_ids = node_ids.astype('int64')
+            is_quadratic = ~is_blank.any(axis=1)
+            node_ids[is_blank] = -1
+
+        inodes = np.searchsorted(nids, node_ids).clip(max=len(nids) - 1)
+        inodes[node_ids == -1] = 0
+        if np.any(nids[inodes] != np.where(node_ids == -1, nids[0], node_ids)):
+            # missing node; use the element-by-element error handling
+            return None
+
+        for eid, node_idsi, is_quadratici in zip(eids.tolist(), node_ids_list, is_quadratic.tolist()):
+            eid_to_nid_map[eid] = node_idsi if is_quadratici else node_idsi[:ncorner]
+
+        if key == 'CONROD':
+            pids = np.zeros(nelementsi, dtype='int32')
+        elif shape == 'spring':
+            # CELAS2, CELAS4 don't have a property
+            pids = np.array([getattr(element, 'pid', 0) for element in elements], dtype='int32')
+        else:
+            pids = np.array([element.Pid() for element in elements], dtype='int32')
+
+        material_coord = np.full(nelementsi, -1, dtype='int32')
+        material_theta = np.full(nelementsi, np.nan, dtype='float32')
+        if key in MATERIAL_COORD_ELEMENTS:
+            theta_mcid = [element.theta_mcid for element in elements]
+            is_theta = np.array([isinstance(value, float) for value in theta_mcid])
+            theta_mcid = np.array(theta_mcid, dtype='float64')
+            material_theta[is_theta] = theta_mcid[is_theta]
+            material_coord[~is_theta] = theta_mcid[~is_theta]
+
+        if quality:
+            quality_array = _get_element_quality_vectorized(
+                key, elements, shape, inodes[:, :ncorner], xyz_cid0)
+
+        # the linear cells and the quadratic cells
+        for is_cell, vtk_type, order in [(~is_quadratic, vtk_linear, slice(0, ncorner)),
+                                         (is_quadratic, vtk_quadratic, quadratic_order)]:
+            if not is_cell.any():
+                continue
+            all_eids.append(eids[is_cell])
+            all_cell_types.append(np.full(is_cell.sum(), vtk_type, dtype='uint8'))
+            all_inodes.append(inodes[is_cell][:, order])
+            all_pids.append(pids[is_cell])
+            all_node_ids.append(node_ids[is_cell])
+            all_material_coord.append(material_coord[is_cell])
+            all_material_theta.append(material_theta[is_cell])
+            if quality:
+                all_quality.append(quality_array[is_cell])
+
+    # the cells are stored in sorted element id order
+    eids = np.hstack(all_eids)
+    nelements = len(eids)
+    isort = np.argsort(eids)
+    ipos = np.empty(nelements, dtype='int64')
+    ipos[isort] = np.arange(nelements)
+
+    nnodes = np.hstack([np.full(len(inodes), inodes.shape[1]) for inodes in all_inodes])
+    nnodes_sorted = nnodes[isort]
+    cell_offset = np.zeros(nelements, dtype='int64')
+    cell_offset[1:] = np.cumsum(nnodes_sorted + 1)[:-1]
+    cells = np.zeros(cell_offset[-1] + nnodes_sorted[-1] + 1, dtype='int64')
+    cell_type = np.hstack(all_cell_types)[isort]
+
+    pids = np.hstack(all_pids)[isort]
+    material_coord = np.hstack(all_material_coord)[isort]
+    material_theta = np.hstack(all_material_theta)[isort]
+
+    nid_to_pid_map = defaultdict(list)
+    nids_flat = []
+    pids_flat = []
+    ipos_flat = []
+    i0 = 0
+    for inodes, node_ids, pidsi in zip(all_inodes, all_node_ids, all_pids):
+        i1 = i0 + len(inodes)
+        iposi = ipos[i0:i1]
+        offset = cell_offset[iposi]
+        nnodesi = inodes.shape[1]
+        cells[offset] = nnodesi
+        cells[offset[:, np.newaxis] + np.arange(1, nnodesi + 1)] = inodes
+
+        is_node = node_ids != -1
+        nids_flat.append(node_ids[is_node])
+        pids_flat.append(np.broadcast_to(pidsi[:, np.newaxis], node_ids.shape)[is_node])
+        ipos_flat.append(np.broadcast_to(iposi[:, np.newaxis], node_ids.shape)[is_node])
+        i0 = i1
+
+    # nid -> pids in element order
+    nids_flat = np.hstack(nids_flat)
+    pids_flat = np.hstack(pids_flat)
+    ipos_flat = np.hstack(ipos_flat)
+    inid_sort = np.lexsort((ipos_flat, nids_flat))
+    unids, istart = np.unique(nids_flat[inid_sort], return_index=True)
+    for nid, pidsi in zip(unids.tolist(), np.split(pids_flat[inid_sort], istart[1:])):
+        nid_to_pid_map[nid] = pidsi.tolist()
+
+    grid = self.gui.grid
+    build_vtk_geometry(nelements, grid, cells, cell_type, cell_offset)
+
+    eid_map = self.gui.eid_map
+    eid_map.update(zip(eids[isort].tolist(), range(nelements)))
+    self.eid_to_nid_map = eid_to_nid_map
+    self.gui.nelements = nelements
+
+    superelements = None
+    if quality:
+        quality_array = np.vstack(all_quality)[isort]
+        (area, min_interior_angle, max_interior_angle, max_aspect_ratio,
+         max_skew_angle, taper_ratio, dideal_theta,
+         area_ratio, min_edge_length, max_warp_angle) = quality_array.T.copy()
+    else:
+        area = min_interior_angle = max_interior_angle = max_aspect_ratio = None
+        max_skew_angle = taper_ratio = dideal_theta = None
+        area_ratio = min_edge_length = max_warp_angle = None
+
+    out = (
+        nid_to_pid_map, xyz_cid0, superelements, pids, nelements,
+        material_coord, material_theta,
+        area, min_interior_angle, max_interior_angle, max_aspect_ratio,
+        max_skew_angle, taper_ratio, dideal_theta,
+        area_ratio, min_edge_length, max_warp_angle,
+    )
+    return out
+
+
+def _get_element_quality_vectorized(key: Any, elements: list[Any],
+                                    shape: str | tuple[tuple[int, ...], ...],
+                                    inodes: np.ndarray,
+                                    xyz_cid0: np.ndarray) -> np.ndarray:
+    """
+    Gets the quality metrics for a single element type
+
+    Returns
+    -------
+    quality : (nelement, 10) float32 ndarray
+        the metrics in QUALITY_NAMES order; np.nan if undefined
+
+    """
+    nelement = len(inodes)
+    quality = np.full((nelement, len(QUALITY_NAMES)), np.nan, dtype='float32')
+    if shape == 'tri':
+        p1, p2, p3 = (xyz_cid0[inodes[:, i], :] for i in range(3))
+        (area, max_skew, aspect_ratio,
+         min_theta, max_theta, dideal_theta, min_edge_length) = tri_quality_vectorized(p1, p2, p3)
+        quality[:, 0] = area
+        quality[:, 3] = aspect_ratio
+        quality[:, 4] = max_skew
+    elif shape == 'quad':
+        p1, p2, p3, p4 = (xyz_cid0[inodes[:, i], :] for i in range(4))
+        (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+         min_theta, max_theta, dideal_theta, min_edge_length,
+         max_warp) = quad_quality_vectorized(p1, p2, p3, p4)
+        quality[:, 0] = area
+        quality[:, 3] = aspect_ratio
+        quality[:, 4] = max_skew
+        quality[:, 5] = taper_ratio
+        quality[:, 7] = area_ratio
+        quality[:, 9] = max_warp
+    elif shape == 'spring':
+        return quality
+    elif shape == 'line':
+        xyz1 = xyz_cid0[inodes[:, 0], :]
+        xyz2 = xyz_cid0[inodes[:, 1], :]
+        quality[:, 8] = norm(xyz2 - xyz1, axis=1)
+        if key == 'CONROD':
+            quality[:, 0] = [element.Area() for element in elements]
+        else:
+            area = []
+            for element in elements:
+                try:
+                    area.append(element.pid_ref.Area())
+                except AttributeError:
+                    area.append(-1.)
+            quality[:, 0] = area
+        return quality
+    else:
+        min_theta, max_theta, dideal_theta, min_edge_length = get_min_max_theta_vectorized(
+            shape, inodes, xyz_cid0)
+
+    # a nan max_theta is set to 360 degrees
+    max_theta = np.where(np.isnan(max_theta), 2 * np.pi, max_theta)
+    quality[:, 1] = min_theta
+    quality[:, 2] = max_theta
+    quality[:, 6] = dideal_theta
+    quality[:, 8] = min_edge_length
+    return quality
+
+
 def map_elements1_no_quality_helper(self,
                                     xyz_cid0: np.ndarray,
                                     nid_cp_cd: np.ndarray,
@@ -3079,3 +3377,25 @@ def get_model_unvectorized(log: SimpleLogger,
         create_superelement_geometry=True,
     )
     return model, xref_nodes
+
+
+def read_op2_results(results_filename: str, mode: Optional[str],
+                     exclude_results: Optional[list[str]]=None,
+                     log: Optional[SimpleLogger]=None) -> OP2:
+    """
+    Loads the OP2/HDF5 results.  There is no VTK/Qt, so it's safe to call
+    from a worker thread (see ``LoadActions.run_in_background``).
+    """
+    ext = os.path.splitext(results_filename)[1].lower()
+    model = OP2(log=log, mode=mode, debug=True)
+    model.IS_TESTING = False
+    model.read_matpool = False
+    if ext == '.op2':
+        model.include_exclude_results(
+            exclude_results=exclude_results,
+            #include_results=include_results,
+        )
+        model.read_op2(results_filename, combine=False)
+    else:
+        model.load_hdf5_filename(results_filename, combine=False)
+    return model
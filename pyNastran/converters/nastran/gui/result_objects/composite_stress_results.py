@@ -507,7 +507,8 @@ class CompositeStrainStressResults2(VectorResultsCommon):
 
     def get_fringe_result(self, itime: int,
                           case_tuple: CaseTuple) -> np.ndarray:
-        fringe = self._get_fringe_data_dense(itime, case_tuple)
+        fringe = self._get_cached('fringe', self._get_fringe_data_dense,
+                                  itime, case_tuple)
         return fringe
     def get_fringe_vector_result(self, itime: int,
                                  case_tuple: CaseTuple) -> tuple[np.ndarray, None]:
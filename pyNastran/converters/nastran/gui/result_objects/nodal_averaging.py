@@ -47,6 +47,12 @@ def nodal_average(nodal_combine_func: Callable[[np.ndarray], np.ndarray],
                   nids: np.ndarray,
                   #inid: np.ndarray,
                   nid_to_inid_map: dict[int, int]) -> np.ndarray:
+    """
+    Legacy (slow) nodal averaging that calls nodal_combine_func once per node.
+
+    Prefer ``NodalAverager``, which builds the scatter operator once
+    and evaluates all the nodes in a few vectorized calls.
+    """
     data_dict = defaultdict(list)
     nnode = len(nids)
 
@@ -58,3 +64,96 @@ def nodal_average(nodal_combine_func: Callable[[np.ndarray], np.ndarray],
         inidi = nid_to_inid_map[nid]
         data2[inidi] = collapsed_value
     return data2
+
+
+class NodalAverager:
+    """
+    Precomputed element-node -> node scatter operator.
+
+    The (eid, nid) rows are sorted by node, so every node owns a
+    contiguous segment of the sorted rows.  The nodal combine
+    methods are then segment reductions (``np.ufunc.reduceat``),
+    which are evaluated for every node (and every time step) at once.
+
+    Parameters
+    ----------
+    element_node : (nrow, 2) int ndarray
+        the (eid, nid) pairs that define the rows of the data
+
+    """
+    def __init__(self, element_node: np.ndarray):
+        assert element_node.ndim == 2 and element_node.shape[1] == 2, element_node.shape
+        self.nrow = element_node.shape[0]
+
+        # nids is unique, so every node has at least 1 row
+        self.nids, inode = np.unique(element_node[:, 1], return_inverse=True)
+        self.nnode = len(self.nids)
+        self.isort = np.argsort(inode, kind='stable')
+
+        # the node index of the sorted rows and the segment offsets
+        self.inode_sorted = inode[self.isort]
+        self.istart = np.searchsorted(self.inode_sorted, np.arange(self.nnode))
+
+    def average(self, nodal_combine: str, data: np.ndarray) -> np.ndarray:
+        """
+        Combines the element-node data at the nodes
+
+        Parameters
+        ----------
+        nodal_combine : str
+            'Absolute Max', 'Mean', 'Max', 'Min', 'Difference', 'Std. Dev.'
+        data : (..., nrow) float ndarray
+            the element-node data; the leading axes (e.g., time) are
+            carried through
+
+        Returns
+        -------
+        data2 : (..., nnode) float ndarray
+            the nodal data sorted by self.nids; NaNs are ignored
+            (a node with only NaNs is NaN)
+
+        """
+        assert data.shape[-1] == self.nrow, (data.shape, self.nrow)
+        if self.nrow == 0:
+            return np.full(data.shape[:-1] + (0, ), np.nan, dtype=data.dtype)
+
+        data_sorted = data[..., self.isort]
+        if nodal_combine == 'Max':
+            data2 = self._max(data_sorted)
+        elif nodal_combine == 'Min':
+            data2 = self._min(data_sorted)
+        elif nodal_combine == 'Absolute Max':
+            mini = self._min(data_sorted)
+            maxi = self._max(data_sorted)
+            data2 = np.where(np.abs(mini) > np.abs(maxi), mini, maxi)
+        elif nodal_combine == 'Difference':
+            data2 = self._max(data_sorted) - self._min(data_sorted)
+        elif nodal_combine == 'Mean':
+            data2, unused_count, unused_is_valid = self._mean(data_sorted)
+        elif nodal_combine == 'Std. Dev.':
+            # two pass to avoid the cancellation of the E[x^2] - E[x]^2 form
+            mean, count, is_valid = self._mean(data_sorted)
+            delta = np.where(is_valid, data_sorted - mean[..., self.inode_sorted], 0.)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                data2 = np.sqrt(np.add.reduceat(delta * delta, self.istart, axis=-1) / count)
+        else:  # pragma: no cover
+            raise NotImplementedError(nodal_combine)
+        return data2.astype(data.dtype, copy=False)
+
+    def _max(self, data_sorted: np.ndarray) -> np.ndarray:
+        # fmax ignores NaNs
+        return np.fmax.reduceat(data_sorted, self.istart, axis=-1)
+
+    def _min(self, data_sorted: np.ndarray) -> np.ndarray:
+        return np.fmin.reduceat(data_sorted, self.istart, axis=-1)
+
+    def _mean(self, data_sorted: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """accumulates in double precision to avoid float32 underflow/roundoff"""
+        is_valid = ~np.isnan(data_sorted)
+        count = np.add.reduceat(is_valid, self.istart, axis=-1, dtype='int64')
+        dtype = np.result_type(data_sorted.dtype, np.float64)
+        total = np.add.reduceat(np.where(is_valid, data_sorted, 0.), self.istart,
+                                axis=-1, dtype=dtype)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = total / count
+        return mean, count, is_valid
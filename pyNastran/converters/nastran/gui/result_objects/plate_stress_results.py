@@ -7,8 +7,8 @@ from pyNastran.utils.mathematics import get_abs_max
 from pyNastran.femutils.utils import abs_nan_min_max, safe_nanstd
 
 from .vector_results import VectorResultsCommon, filter_ids
-from .stress_reduction import von_mises_2d, max_shear
-from .nodal_averaging import nodal_average, nodal_combine_map, derivation_map
+from pyNastran.op2.tables.oes_stressStrain.stress_invariants import von_mises, max_shear
+from .nodal_averaging import NodalAverager, derivation_map
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
@@ -192,6 +192,9 @@ class PlateStrainStressResults2(VectorResultsCommon):
         self.element_node = element_node
         self.node_data = node_data
 
+        # the element-node -> node scatter operator; built on the first nodal fringe
+        self._nodal_averager: Optional[NodalAverager] = None
+
         assert len(np.unique(self.centroid_eids)) == len(self.centroid_eids)
 
         common_eids = np.intersect1d(self.centroid_eids, element_id)
@@ -454,6 +457,10 @@ class PlateStrainStressResults2(VectorResultsCommon):
         #if self.is_linked_scale_factor:
             #itime = 0
 
+        # set the layers before the result cache key is made, so a cached
+        # fringe (e.g., from the result store) doesn't skip it
+        if self.layer_indices == (-1, ):
+            self.layer_indices = (0, 1)
         return itime, (itime, iresult, self.layer_indices, self.min_max_method, self.nodal_combine)
 
     def get_default_legend_title(self, itime: int, case_tuple: str) -> str:
@@ -556,15 +563,10 @@ class PlateStrainStressResults2(VectorResultsCommon):
                           ilayer: np.ndarray) -> np.ndarray:
         #(ntime, neidsi_nnode, nlayer, nresult) = node_data.shape
         node_data = self.node_data
-        element_node = self.element_node
 
         # make sure we never have an issue with these
-        nodal_combine_func = nodal_combine_map[self.nodal_combine]
         derivation_func = derivation_map[self.min_max_method]
-
-        nids = np.unique(element_node[:, 1])
-        nnode = len(nids)
-        nid_to_inid_map = {nid: i for i, nid in enumerate(nids)}
+        nodal_averager = self._get_nodal_averager()
 
         #ioxx = 1
         #ioyy = 2
@@ -583,11 +585,11 @@ class PlateStrainStressResults2(VectorResultsCommon):
             oxx = node_data[itime, :, ilayer, 1]
             oyy = node_data[itime, :, ilayer, 2]
             txy = node_data[itime, :, ilayer, 3]
-            data = von_mises_2d(oxx, oyy, txy)
+            data = von_mises(oxx, oyy, txy=txy, is_stress=self.is_stress)
         elif iresult == 'max_shear':
             omax = node_data[itime, :, ilayer, 5]
             omin = node_data[itime, :, ilayer, 6]
-            data = max_shear(omax, omin)
+            data = max_shear(omax, omin, is_stress=self.is_stress)
         else:  # pragma: no cover
             raise RuntimeError(iresult)
         assert data.ndim == 2, data.shape
@@ -606,18 +608,22 @@ class PlateStrainStressResults2(VectorResultsCommon):
         else:
             # 2 layers
             derived_data = derivation_func(data, axis=0)
-        element_node2 = element_node[::2, :]
 
         # ----------------------------------------------------------------------
         ## nodal combine step
         # time to nodal average
-        data2 = nodal_average(
-            nodal_combine_func,
-            element_node2, derived_data,
-            nids, nid_to_inid_map)
-        assert len(data2) == nnode, (len(data2), nnode)
+        data2 = nodal_averager.average(self.nodal_combine, derived_data)
+        assert len(data2) == nodal_averager.nnode, (len(data2), nodal_averager.nnode)
         return data2
 
+    def _get_nodal_averager(self) -> NodalAverager:
+        """gets the cached element-node -> node scatter operator"""
+        if self._nodal_averager is None:
+            # the element_node rows are duplicated for the top/bottom layers
+            element_node2 = self.element_node[::2, :]
+            self._nodal_averager = NodalAverager(element_node2)
+        return self._nodal_averager
+
     def _get_centroid_result(self, itime: int,
                              iresult: int | str,
                              ilayer: np.ndarray) -> np.ndarray:
@@ -639,12 +645,11 @@ class PlateStrainStressResults2(VectorResultsCommon):
             oxx = centroid_data[itime, :, ilayer, 1]
             oyy = centroid_data[itime, :, ilayer, 2]
             txy = centroid_data[itime, :, ilayer, 3]
-            data = von_mises_2d(oxx, oyy, txy)
+            data = von_mises(oxx, oyy, txy=txy, is_stress=self.is_stress)
         elif iresult == 'max_shear':
-            # not checked for strain
             omax = centroid_data[itime, :, ilayer, 5]
             omin = centroid_data[itime, :, ilayer, 6]
-            data = max_shear(omax, omin)
+            data = max_shear(omax, omin, is_stress=self.is_stress)
         else:
             raise RuntimeError(iresult)
         return data
@@ -692,7 +697,8 @@ class PlateStrainStressResults2(VectorResultsCommon):
 
     def get_fringe_result(self, itime: int, res_name: str) -> np.ndarray:
         """get_fringe_value"""
-        fringe = self._get_fringe_data_dense(itime, res_name)
+        fringe = self._get_cached('fringe', self._get_fringe_data_dense,
+                                  itime, res_name)
         return fringe
     def get_fringe_vector_result(self, itime: int, res_name: str) -> tuple[np.ndarray, None]:
         """get_fringe_value"""
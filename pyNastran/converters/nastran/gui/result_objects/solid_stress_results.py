@@ -5,11 +5,11 @@ from typing import Optional, Any, TYPE_CHECKING
 
 from pyNastran.utils.mathematics import get_abs_max
 #from pyNastran.femutils.utils import abs_nan_min_max # , pivot_table,  # abs_min_max
-from .nodal_averaging import nodal_average, nodal_combine_map
+from .nodal_averaging import NodalAverager
 #from pyNastran.bdf.utils import write_patran_syntax_dict
 
 from .vector_results import VectorResultsCommon, filter_ids
-from .stress_reduction import von_mises_3d, max_shear
+from pyNastran.op2.tables.oes_stressStrain.stress_invariants import von_mises, max_shear
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
     from pyNastran.op2.op2 import OP2
@@ -125,6 +125,9 @@ class SolidStrainStressResults2(VectorResultsCommon):
         self.element_node = element_node
         self.node_data = node_data
 
+        # the element-node -> node scatter operator; built on the first nodal fringe
+        self._nodal_averager: Optional[NodalAverager] = None
+
         #common_eids = np.intersect1d(self.centroid_eids, element_id)
         #if len(common_eids) == 0:
             #raise IndexError('no solid elements found...')
@@ -430,12 +433,11 @@ class SolidStrainStressResults2(VectorResultsCommon):
             txy = centroid_data[itime, :, itxy]
             txz = centroid_data[itime, :, itxz]
             tyz = centroid_data[itime, :, ityz]
-            data = von_mises_3d(oxx, oyy, ozz, txy, tyz, txz)
-        elif iresult == 'max_shear': #  probably wrong
-            # not checked for strain
+            data = von_mises(oxx, oyy, ozz, txy, tyz, txz, is_stress=self.is_stress)
+        elif iresult == 'max_shear':
             omax = centroid_data[itime, :, imax]
             omin = centroid_data[itime, :, imin]
-            data = max_shear(omax, omin)
+            data = max_shear(omax, omin, is_stress=self.is_stress)
         else:
             data = centroid_data[itime, :, iresult].copy()
         return data
@@ -454,16 +456,7 @@ class SolidStrainStressResults2(VectorResultsCommon):
         ## TODO: consider implementing Average/Derive
         # ----------------------------------------------------------
         # setup
-        nodal_combine_func = nodal_combine_map[self.nodal_combine]
-
-        element_node = self.element_node
-        nids = np.unique(element_node[:, 1])
-        #ids = np.arange(len(unode_id))
-
-        #inid = self.inode   # this is the global mapper
-        #inid = np.searchsorted(unode_id, nids)
-        #nid_to_inid_map = {nid: inidi for nid, inidi in zip(nids, inid)}
-        nid_to_inid_map = {nid: i for i, nid in enumerate(nids)}
+        nodal_averager = self._get_nodal_averager()
 
         ## Derive/Average
         node_data = self.node_data
@@ -476,11 +469,11 @@ class SolidStrainStressResults2(VectorResultsCommon):
             txy = node_data[itime, :, itxy]
             txz = node_data[itime, :, itxz]
             tyz = node_data[itime, :, ityz]
-            datai = von_mises_3d(oxx, oyy, ozz, txy, tyz, txz)
+            datai = von_mises(oxx, oyy, ozz, txy, tyz, txz, is_stress=self.is_stress)
         elif iresult == 'max_shear':
             omax = node_data[itime, :, imax]
             omin = node_data[itime, :, imin]
-            datai = max_shear(omax, omin)
+            datai = max_shear(omax, omin, is_stress=self.is_stress)
         elif iresult == 'abs_principal':
             data_max = node_data[itime, :, imax]
             data_min = node_data[itime, :, imin]
@@ -489,12 +482,15 @@ class SolidStrainStressResults2(VectorResultsCommon):
         else:  # pragma: no cover
             raise NotImplementedError(iresult)
 
-        data = nodal_average(
-            nodal_combine_func,
-            element_node, datai,
-            nids, nid_to_inid_map)
+        data = nodal_averager.average(self.nodal_combine, datai)
         return data
 
+    def _get_nodal_averager(self) -> NodalAverager:
+        """gets the cached element-node -> node scatter operator"""
+        if self._nodal_averager is None:
+            self._nodal_averager = NodalAverager(self.element_node)
+        return self._nodal_averager
+
     #def _get_complex_data(self, itime: int) -> np.ndarray:
         #return self._get_real_data(itime)
 
@@ -545,7 +541,8 @@ class SolidStrainStressResults2(VectorResultsCommon):
          - GuiResult:           fringe; (n,)   array
          - DisplacementResults: vector; (n, 3) array
         """
-        fringe = self._get_fringe_data_dense(itime, case_tuple)
+        fringe = self._get_cached('fringe', self._get_fringe_data_dense,
+                                  itime, case_tuple)
         return fringe
 
     def get_fringe_vector_result(self, itime: int,
@@ -11,6 +11,8 @@ from pyNastran.femutils.utils import safe_norm
 from pyNastran.op2.result_objects.table_object import (
     RealTableArray, ComplexTableArray)
 from pyNastran.gui.gui_objects.gui_result import GuiResultCommon
+from pyNastran.gui.gui_objects.result_cache import ResultCache, RESULT_CACHE_IDS
+from pyNastran.gui.gui_objects.result_store import ResultStore
 from pyNastran.gui.utils.utils import is_blank, is_value
 
 
@@ -106,8 +108,34 @@ class VectorResultsCommon(GuiResultCommon):
         self.location = ''
         self.min_max_method = ''
         self.nodal_combine = ''
+        self.transform = ''
         self.is_method_array = True
 
+        # the (optional) shared LRU cache of the computed fringes/vectors
+        self.result_cache: Optional[ResultCache] = None
+        self.cache_id = next(RESULT_CACHE_IDS)
+
+        # the (optional) persistent store of the computed fringes/vectors
+        # and the stable (across sessions) name of the object in it
+        self.result_store: Optional[ResultStore] = None
+        self.store_name = ''
+
+    def _get_cached(self, name: str, func, itime: int, res_name) -> Any:
+        """
+        Gets the result from the result_cache (or calculates it)
+
+        The key includes the sidebar state, so changing the derivation,
+        nodal combine, layers, components or transform is a new case.
+        """
+        if self.result_cache is None:
+            return func(itime, res_name)
+        unused_itime, case_flag = self.get_case_flag(itime, res_name)
+        key = (self.cache_id, name, itime, res_name, case_flag,
+               self.transform, self.nodal_combine)
+        store_key = '|'.join(repr(value) for value in (self.store_name,) + key[1:])
+        return self.result_cache.get(key, func, itime, res_name,
+                                     store=self.result_store, store_key=store_key)
+
     # --------------------------------------------------------------------------
     # abstractmethods - results access
     @abstractmethod
@@ -757,6 +785,12 @@ class DispForceVectorResults(VectorResultsCommon):
 
     def get_fringe_vector_result(self, itime: int,
                                  res_name: str) -> tuple[np.ndarray, np.ndarray]:
+        """gets the fringe/vector result (see ``_get_fringe_vector_result``)"""
+        return self._get_cached('fringe_vector', self._get_fringe_vector_result,
+                                itime, res_name)
+
+    def _get_fringe_vector_result(self, itime: int,
+                                  res_name: str) -> tuple[np.ndarray, np.ndarray]:
         """
         gets the 'typical' result which is a vector
          - GuiResult:           fringe; (n,)   array
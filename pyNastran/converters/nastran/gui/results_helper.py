@@ -3,13 +3,14 @@
 from __future__ import annotations
 import os
 from collections import defaultdict
+from functools import partial
 from typing import Optional, Any, TYPE_CHECKING
 
 import numpy as np
 #from numpy.linalg import norm  # type: ignore
 
 from pyNastran.femutils.utils import safe_norm
-from pyNastran.gui.gui_objects.gui_result import GuiResult, GuiResultIDs
+from pyNastran.gui.gui_objects.gui_result import GuiResult, GuiResultIDs, LazyGuiResult
 from pyNastran.gui.gui_objects.displacements import (
     DisplacementResults, ForceTableResults) #, TransientElementResults
 from pyNastran.op2.result_objects.stress_object import (
@@ -242,19 +243,11 @@ class NastranGuiResults(NastranGuiAttributes):
             #energy, percent, density
             #modes = [1, 2, 3]
 
-        nelements = self.nelements
-        eids = self.element_ids
-
         for itime, unused_dt in enumerate(times):
-            ese = np.full(nelements, np.nan, dtype='float32')
-            percent = np.full(nelements, np.nan, dtype='float32')
-            strain_energy_density = np.full(nelements, np.nan, dtype='float32')
             for istrain_energy, is_true in enumerate(has_strain_energy):
                 if not is_true:
                     continue
-                resdict, name, unused_flag = strain_energies[istrain_energy]
-                case = resdict[key]
-
+                case = strain_energies[istrain_energy][0][key]
                 dt = case._times[itime]
                 header = _get_nastran_header(case, dt, itime)
                 header_dict[(key, itime)] = header
@@ -262,41 +255,12 @@ class NastranGuiResults(NastranGuiAttributes):
                                        case.superelement_adaptivity_index,
                                        case.pval_step)
 
-                if case.is_complex:
-                    continue
-
-                data = case.data
-                itotals = np.where(case.element[itime, :] == 100000000)[0]
-                assert len(itotals) == 1, itotals
-                itotal = itotals[0]
-
-                eidsi2 = case.element[itime, :itotal]
-
-                # find eids2i in eids
-                i = np.searchsorted(eids, eidsi2)
-                #if 0 and name == 'CELAS1':  # pragma: no cover
-                    ## check that the elements were mapped correctly
-                    #eids_actual = self.element_ids[i]
-                    #for eid in eids_actual:
-                        #element = self.model.elements[eid]
-                        #assert element.type == name, element
-                    #assert np.all(eids_actual == eidsi2)
-
-                if len(i) != len(np.unique(i)):
-                    msg = 'Strain Energy i%s=%s is not unique because there are missing elements' % (name, str(i))
-                    log.warning(msg)
-                    continue
-
-                # verifies the try-except is what we think it is (missing elements)
-                esei = data[itime, :itotal, 0]
-
-                try:
-                    ese[i] = esei
-                    percent[i] = data[itime, :itotal, 1]
-                    strain_energy_density[i] = data[itime, :itotal, 2]
-                except IndexError:
-                    log.warning('error reading Strain Energy')
-                    continue
+            # the arrays are calculated again when the case is shown
+            ese, unused_percent, strain_energy_density = self._get_strain_energy_arrays(
+                strain_energies, has_strain_energy, key, itime, log)
+            is_ese = np.any(np.isfinite(ese))
+            is_sed = np.any(np.isfinite(strain_energy_density))
+            del ese, unused_percent, strain_energy_density
 
             # helicopter.dat
             #CBEAM : 10
@@ -305,28 +269,88 @@ class NastranGuiResults(NastranGuiAttributes):
             #CTRIA3 : 151
             # nelements = 12093
 
-            if np.any(np.isfinite(ese)):
-                ese_res = GuiResult(subcase_id, header='Strain Energy: ' + header,
-                                    title='Strain Energy', data_format='%.3e',
-                                    location='centroid', scalar=ese)
-                percent_res = GuiResult(subcase_id, header='Percent of Total: '+ header,
-                                        title='Percent of Total', data_format='%.3f',
-                                        location='centroid', scalar=percent)
+            if is_ese:
+                args = (strain_energies, has_strain_energy, key, itime, log)
+                ese_res = LazyGuiResult(subcase_id, header='Strain Energy: ' + header,
+                                        title='Strain Energy', data_format='%.3e',
+                                        location='centroid',
+                                        get_scalar=partial(self._get_strain_energy_array, 0, *args))
+                percent_res = LazyGuiResult(subcase_id, header='Percent of Total: '+ header,
+                                            title='Percent of Total', data_format='%.3f',
+                                            location='centroid',
+                                            get_scalar=partial(self._get_strain_energy_array, 1, *args))
                 cases[icase] = (ese_res, (subcase_id, 'Strain Energy'))
                 cases[icase + 1] = (percent_res, (subcase_id, 'Percent of Total Strain'))
 
                 form_dict[(key, itime)].append(('Strain Energy', icase, []))
                 form_dict[(key, itime)].append(('Percent of Total Strain', icase + 1, []))
                 icase += 2
-                if np.any(np.isfinite(strain_energy_density)):
-                    sed_res = GuiResult(subcase_id, header='Strain Energy Density: ' + header,
-                                        title='Strain Energy Density', data_format='%.3e',
-                                        location='centroid', scalar=strain_energy_density)
+                if is_sed:
+                    sed_res = LazyGuiResult(subcase_id, header='Strain Energy Density: ' + header,
+                                            title='Strain Energy Density', data_format='%.3e',
+                                            location='centroid',
+                                            get_scalar=partial(self._get_strain_energy_array, 2, *args))
                     cases[icase] = (sed_res, (subcase_id, 'Strain Energy Density'))
                     form_dict[(key, itime)].append(('Strain Energy Density', icase, []))
                     icase += 1
         return icase
 
+    def _get_strain_energy_array(self, iresult: int, *args) -> np.ndarray:
+        """gets the strain energy (0), percent (1) or density (2)"""
+        return self._get_strain_energy_arrays(*args)[iresult]
+
+    def _get_strain_energy_arrays(self, strain_energies: list[tuple[Any, str, bool]],
+                                  has_strain_energy: list[bool],
+                                  key: NastranKey, itime: int,
+                                  log: SimpleLogger) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """gets the centroidal strain energy, percent and density at a time"""
+        nelements = self.nelements
+        eids = self.element_ids
+        ese = np.full(nelements, np.nan, dtype='float32')
+        percent = np.full(nelements, np.nan, dtype='float32')
+        strain_energy_density = np.full(nelements, np.nan, dtype='float32')
+        for istrain_energy, is_true in enumerate(has_strain_energy):
+            if not is_true:
+                continue
+            resdict, name, unused_flag = strain_energies[istrain_energy]
+            case = resdict[key]
+            if case.is_complex:
+                continue
+
+            data = case.data
+            itotals = np.where(case.element[itime, :] == 100000000)[0]
+            assert len(itotals) == 1, itotals
+            itotal = itotals[0]
+
+            eidsi2 = case.element[itime, :itotal]
+
+            # find eids2i in eids
+            i = np.searchsorted(eids, eidsi2)
+            #if 0 and name == 'CELAS1':  # pragma: no cover
+                ## check that the elements were mapped correctly
+                #eids_actual = self.element_ids[i]
+                #for eid in eids_actual:
+                    #element = self.model.elements[eid]
+                    #assert element.type == name, element
+                #assert np.all(eids_actual == eidsi2)
+
+            if len(i) != len(np.unique(i)):
+                msg = 'Strain Energy i%s=%s is not unique because there are missing elements' % (name, str(i))
+                log.warning(msg)
+                continue
+
+            # verifies the try-except is what we think it is (missing elements)
+            esei = data[itime, :itotal, 0]
+
+            try:
+                ese[i] = esei
+                percent[i] = data[itime, :itotal, 1]
+                strain_energy_density[i] = data[itime, :itotal, 2]
+            except IndexError:
+                log.warning('error reading Strain Energy')
+                continue
+        return ese, percent, strain_energy_density
+
     def _create_op2_time_centroidal_force_arrays(self, model: OP2, nelements: int,
                                                  key,
                                                  itime: int,
@@ -545,38 +569,48 @@ class NastranGuiResults(NastranGuiAttributes):
             is_rx = np.any(np.isfinite(rx)) and np.nanmin(rx) != np.nanmax(rx)
             #is_ry = np.any(np.isfinite(ry)) and np.nanmin(ry) != np.nanmax(ry)
             #is_rz = np.any(np.isfinite(rz)) and np.nanmin(rz) != np.nanmax(rz)
+
+            # the arrays are calculated again when the case is shown
+            del fx, fy, fz, rx, ry, rz, is_element_on
+            args = (model, nelements, key, itime, log, stop_on_failure)
             if is_fx or is_rx and not num_off == nelements:
                 # header = _get_nastran_header(case, dt, itime)
                 header = header_dict[(key, itime)]
                 form_dicti = form_dict[(key, itime)]
                 if is_fx:
-                    fx_res = GuiResult(subcase_id, header=f'Axial: {header}', title='Axial',
-                                       location='centroid', scalar=fx)
+                    fx_res = LazyGuiResult(subcase_id, header=f'Axial: {header}', title='Axial',
+                                           location='centroid',
+                                           get_scalar=partial(self._get_centroidal_force_array, 0, *args))
                     form_dicti.append(('Axial', icase, []))
                     cases[icase] = (fx_res, (subcase_id, 'Axial'))
                     icase += 1
 
                 if is_fy:
-                    fy_res = GuiResult(subcase_id, header=f'ShearY: {header}', title='ShearY',
-                                       location='centroid', scalar=fy)
+                    fy_res = LazyGuiResult(subcase_id, header=f'ShearY: {header}', title='ShearY',
+                                           location='centroid',
+                                           get_scalar=partial(self._get_centroidal_force_array, 1, *args))
                     form_dicti.append(('ShearY', icase, []))
                     cases[icase] = (fy_res, (subcase_id, 'ShearY'))
                     icase += 1
 
                 if is_fz:
-                    fz_res = GuiResult(subcase_id, header=f'ShearZ: {header}', title='ShearZ',
-                                       location='centroid', scalar=fz)
+                    fz_res = LazyGuiResult(subcase_id, header=f'ShearZ: {header}', title='ShearZ',
+                                           location='centroid',
+                                           get_scalar=partial(self._get_centroidal_force_array, 2, *args))
                     form_dicti.append(('ShearZ', icase, []))
                     cases[icase + 2] = (fz_res, (subcase_id, 'ShearZ'))
                     icase += 1
 
                 if is_rx:
-                    mx_res = GuiResult(subcase_id, header=f'Torsion: {header}', title='Torsion',
-                                       location='centroid', scalar=rx)
-                    my_res = GuiResult(subcase_id, header=f'BendingY: {header}', title='BendingY',
-                                       location='centroid', scalar=ry)
-                    mz_res = GuiResult(subcase_id, header=f'BendingZ: {header}', title='BendingZ',
-                                       location='centroid', scalar=rz)
+                    mx_res = LazyGuiResult(subcase_id, header=f'Torsion: {header}', title='Torsion',
+                                           location='centroid',
+                                           get_scalar=partial(self._get_centroidal_force_array, 3, *args))
+                    my_res = LazyGuiResult(subcase_id, header=f'BendingY: {header}', title='BendingY',
+                                           location='centroid',
+                                           get_scalar=partial(self._get_centroidal_force_array, 4, *args))
+                    mz_res = LazyGuiResult(subcase_id, header=f'BendingZ: {header}', title='BendingZ',
+                                           location='centroid',
+                                           get_scalar=partial(self._get_centroidal_force_array, 5, *args))
 
                     form_dicti.append(('Torsion', icase, []))
                     form_dicti.append(('BendingY', icase + 1, []))
@@ -586,65 +620,48 @@ class NastranGuiResults(NastranGuiAttributes):
                     cases[icase + 2] = (mz_res, (subcase_id, 'BendingZ'))
                     icase += 3
 
-                is_axial = np.full(nelements, -1, dtype='int8')
-                is_shear_y = np.full(nelements, -1, dtype='int8')
-                is_shear_z = np.full(nelements, -1, dtype='int8')
-                is_torsion = np.full(nelements, -1, dtype='int8')
-                is_bending_y = np.full(nelements, -1, dtype='int8')
-                is_bending_z = np.full(nelements, -1, dtype='int8')
-
-                arrays = [
-                    (is_axial, fx), (is_shear_y, fy), (is_shear_z, fz),
-                    (is_torsion, rx), (is_bending_y, ry), (is_bending_z, rz),
-                ]
-                for is_array, force in arrays:
-                    iany = np.where(is_element_on)
-                    iwhere = np.where(np.abs(force) > 0.0)[0]
-                    is_array[iany] = 0
-                    is_array[iwhere] = 1
-                #is_axial[np.where(np.abs(fx) > 0.0)[0]] = 1
-                #is_shear_y[np.where(np.abs(fy) > 0.0)[0]] = 1
-                #is_shear_z[np.where(np.abs(fz) > 0.0)[0]] = 1
-                #is_torsion[np.where(np.abs(rx) > 0.0)[0]] = 1
-                #is_bending_y[np.where(np.abs(ry) > 0.0)[0]] = 1
-                #is_bending_z[np.where(np.abs(rz) > 0.0)[0]] = 1
-                #is_bending[where(abs(rx) > 0.0)[0]] = 1
-
-                is_fx_res = GuiResult(subcase_id, header='IsAxial', title='IsAxial',
-                                      location='centroid', scalar=is_axial, data_format=fmt,
-                                      mask_value=-1)
-                is_fy_res = GuiResult(subcase_id, header='IsShearY', title='IsShearY',
-                                      location='centroid', scalar=is_shear_y, data_format=fmt,
-                                      mask_value=-1)
-                is_fz_res = GuiResult(subcase_id, header='IsShearZ', title='IsShearZ',
-                                      location='centroid', scalar=is_shear_z, data_format=fmt,
-                                      mask_value=-1)
-                is_mx_res = GuiResult(subcase_id, header='IsTorsion', title='IsTorsion',
-                                      location='centroid', scalar=is_torsion, data_format=fmt,
-                                      mask_value=-1)
-                is_my_res = GuiResult(subcase_id, header='IsBendingY', title='IsBendingY',
-                                      location='centroid', scalar=is_bending_y, data_format=fmt,
-                                      mask_value=-1)
-                is_mz_res = GuiResult(subcase_id, header='IsBendingZ', title='IsBendingZ',
-                                      location='centroid', scalar=is_bending_z, data_format=fmt,
-                                      mask_value=-1)
-
-                cases[icase] = (is_fx_res, (subcase_id, 'IsAxial'))
-                cases[icase + 1] = (is_fy_res, (subcase_id, 'IsShearY'))
-                cases[icase + 2] = (is_fz_res, (subcase_id, 'IsShearZ'))
-                cases[icase + 3] = (is_mx_res, (subcase_id, 'IsTorsion'))
-                cases[icase + 4] = (is_my_res, (subcase_id, 'IsBendingY'))
-                cases[icase + 5] = (is_mz_res, (subcase_id, 'IsBendingZ'))
-
-                form_dicti.append(('IsAxial', icase, []))
-                form_dicti.append(('IsShearY', icase + 1, []))
-                form_dicti.append(('IsShearZ', icase + 2, []))
-                form_dicti.append(('IsTorsion', icase + 3, []))
-                form_dicti.append(('IsBendingY', icase + 4, []))
-                form_dicti.append(('IsBendingZ', icase + 5, []))
-                icase += 6
+                names = ['IsAxial', 'IsShearY', 'IsShearZ',
+                         'IsTorsion', 'IsBendingY', 'IsBendingZ']
+                for iresult, name in enumerate(names):
+                    is_res = LazyGuiResult(subcase_id, header=name, title=name,
+                                           location='centroid', data_format=fmt, mask_value=-1,
+                                           get_scalar=partial(self._get_centroidal_is_force_array, iresult, *args))
+                    cases[icase] = (is_res, (subcase_id, name))
+                    form_dicti.append((name, icase, []))
+                    icase += 1
         return icase
 
+    def _get_centroidal_force_array(self, iresult: int, model: OP2, nelements: int,
+                                    key: NastranKey, itime: int,
+                                    log: SimpleLogger,
+                                    stop_on_failure: bool) -> np.ndarray:
+        """gets the fx (0), fy, fz, rx, ry or rz (5) array at a time"""
+        out = self._create_op2_time_centroidal_force_arrays(
+            model, nelements, key, itime, {}, {}, log, stop_on_failure)
+        return out[1 + iresult]
+
+    def _get_centroidal_is_force_array(self, iresult: int, model: OP2, nelements: int,
+                                       key: NastranKey, itime: int,
+                                       log: SimpleLogger,
+                                       stop_on_failure: bool) -> np.ndarray:
+        """
+        gets the is_axial (0), is_shear_y, is_shear_z, is_torsion,
+        is_bending_y or is_bending_z (5) array at a time:
+         - -1: the element has no force
+         - 0: the force is 0.0
+         - 1: the force is nonzero
+        """
+        out = self._create_op2_time_centroidal_force_arrays(
+            model, nelements, key, itime, {}, {}, log, stop_on_failure)
+        force = out[1 + iresult]
+        is_element_on = out[7]
+        is_array = np.full(nelements, -1, dtype='int8')
+        iany = np.where(is_element_on)
+        iwhere = np.where(np.abs(force) > 0.0)[0]
+        is_array[iany] = 0
+        is_array[iwhere] = 1
+        return is_array
+
     def save_filtered_forces(self, key: NastranKey,
                              itime: int, icase: int,
                              is_element_on: bool, subcase_id: int,
@@ -1608,10 +1625,10 @@ def _fill_nastran_temperatures(cases: Cases, model: OP2,
                                    case.superelement_adaptivity_index,
                                    case.pval_step)
 
+            # a view of the OP2 array, so there is no copy per time step
             loads = case.data[itime, :, :]
-            nxyz = safe_norm(loads[:, :3], axis=1)
-            assert len(nxyz) == nnodes, 'len(nxyz)=%s nnodes=%s' % (
-                len(nxyz), nnodes)
+            assert loads.shape[0] == nnodes, 'nloads=%s nnodes=%s' % (
+                loads.shape[0], nnodes)
 
             temp_res = GuiResult(subcase_idi, header=f'{name}: {header}', title=name,
                                  location='node', scalar=loads[:, 0])
@@ -0,0 +1,424 @@
+"""
+Renders a Nastran animation (gif/mp4) off-screen without the GUI
+
+Defines:
+ - nastran_to_animation(bdf_filename, op2_filename, animation_filename, frames, ...)
+ - OffscreenRenderer
+ - cmd_line_animation(argv=None, quiet=False)
+
+The frames are defined by ``get_animation_frames``, which uses the same
+scales/phases/time steps as the GUI's animation menu.  The frames are split
+into contiguous ranges that are rendered in a process pool.  Each process
+builds an OffscreenRenderer once when it starts (VTK objects can't be
+pickled) and returns the images, which are streamed into the encoder in
+order.
+"""
+from __future__ import annotations
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+
+import numpy as np
+from cpylog import get_logger
+from vtkmodules.vtkRenderingCore import (
+    vtkRenderer, vtkRenderWindow, vtkActor, vtkDataSetMapper, vtkWindowToImageFilter)
+from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules import vtkRenderingOpenGL2  # registers the render window
+
+from pyNastran.gui.utils.vtk.base_utils import numpy_to_vtk
+from pyNastran.gui.utils.vtk.vtk_utils import numpy_to_vtk_points
+from pyNastran.gui.menus.legend.write_gif import (
+    IS_IMAGEIO, get_animation_frames, split_frames, write_animation)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+    from pyNastran.op2.op2 import OP2
+
+# (istep, icase_fringe, icase_disp, icase_vector, scale, phase)
+Frame = tuple[int, Optional[int], Optional[int], Optional[int], float, float]
+# (position, focal_point, view_up)
+CameraTuple = tuple[tuple[float, float, float],
+                    tuple[float, float, float],
+                    tuple[float, float, float]]
+
+
+class OffscreenRenderer:
+    """
+    Builds the model and results without a window and renders frames
+    into numpy images
+    """
+    def __init__(self, bdf_filename: str | BDF,
+                 op2_filename: str | OP2,
+                 width: int=800, height: int=600,
+                 camera: Optional[CameraTuple]=None,
+                 min_value: Optional[float]=None,
+                 max_value: Optional[float]=None,
+                 log_level: str='error'):
+        """
+        Parameters
+        ----------
+        bdf_filename : str / BDF
+            the geometry
+        op2_filename : str / OP2
+            the results
+        width / height : int; default=800/600
+            the size of the image in pixels
+        camera : (position, focal_point, view_up); default=None
+            None : isometric view of the undeformed model
+        min_value / max_value : float; default=None
+            the fringe range; None uses the range of the fringe
+            of the first frame
+
+        """
+        # avoids importing the gui when the module is imported
+        from pyNastran.converters.nastran.nastran_to_vtk import NastranGUI
+        gui = NastranGUI()
+        gui.create_secondary_actors = False
+        gui.log.level = log_level
+        gui.load_nastran_geometry(bdf_filename)
+        if op2_filename:
+            gui.load_nastran_results(op2_filename)
+        self.gui = gui
+        self.log = gui.log
+
+        grid = gui.grid
+        if grid is None:
+            raise RuntimeError('vtk_ugrid is None')
+        self.grid = grid
+        self.xyz_nominal = vtk_to_numpy(grid.GetPoints().GetData()).copy()
+        self.min_value = min_value
+        self.max_value = max_value
+
+        mapper = vtkDataSetMapper()
+        mapper.SetInputData(grid)
+        mapper.ScalarVisibilityOff()
+        actor = vtkActor()
+        actor.SetMapper(mapper)
+
+        renderer = vtkRenderer()
+        renderer.AddActor(actor)
+        renderer.SetBackground(1., 1., 1.)
+
+        render_window = vtkRenderWindow()
+        render_window.SetOffScreenRendering(1)
+        render_window.AddRenderer(renderer)
+        render_window.SetSize(width, height)
+
+        window_to_image = vtkWindowToImageFilter()
+        window_to_image.SetInput(render_window)
+        window_to_image.SetInputBufferTypeToRGB()
+        window_to_image.ReadFrontBufferOff()
+
+        self.mapper = mapper
+        self.renderer = renderer
+        self.render_window = render_window
+        self.window_to_image = window_to_image
+        self.set_camera(camera)
+
+    def set_camera(self, camera: Optional[CameraTuple]=None) -> None:
+        """sets the camera; None is an isometric view"""
+        vtk_camera = self.renderer.GetActiveCamera()
+        if camera is None:
+            self.renderer.ResetCamera()
+            vtk_camera.Azimuth(45.)
+            vtk_camera.Elevation(30.)
+            self.renderer.ResetCamera()
+        else:
+            position, focal_point, view_up = camera
+            vtk_camera.SetPosition(*position)
+            vtk_camera.SetFocalPoint(*focal_point)
+            vtk_camera.SetViewUp(*view_up)
+            self.renderer.ResetCameraClippingRange()
+
+    def _update_displacement(self, icase_disp: Optional[int],
+                             scale: float, phase: float) -> None:
+        if icase_disp is None:
+            xyz = self.xyz_nominal
+        else:
+            (obj, (i, res_name)) = self.gui.result_cases[icase_disp]
+            unused_xyz_nominal, xyz = obj.get_vector_result_by_scale_phase(
+                i, res_name, scale, phase)
+        numpy_to_vtk_points(xyz, points=self.grid.GetPoints(), dtype='<f', deep=1)
+        self.grid.Modified()
+
+    def _update_fringe(self, icase_fringe: Optional[int]) -> None:
+        if icase_fringe is None:
+            self.mapper.ScalarVisibilityOff()
+            return
+        (obj, (i, res_name)) = self.gui.result_cases[icase_fringe]
+        fringe = np.asarray(obj.get_fringe_result(i, res_name), dtype='float32')
+        location = obj.get_location(i, res_name)
+        if location == 'node':
+            data = self.grid.GetPointData()
+            self.mapper.SetScalarModeToUsePointData()
+        else:
+            data = self.grid.GetCellData()
+            self.mapper.SetScalarModeToUseCellData()
+
+        vtk_fringe = numpy_to_vtk(fringe, deep=1)
+        vtk_fringe.SetName('fringe')
+        data.SetScalars(vtk_fringe)
+
+        # lock the fringe range on the first frame, so the colors are consistent
+        if self.min_value is None:
+            self.min_value = float(np.nanmin(fringe))
+        if self.max_value is None:
+            self.max_value = float(np.nanmax(fringe))
+        self.mapper.ScalarVisibilityOn()
+        self.mapper.SetScalarRange(self.min_value, self.max_value)
+
+    def render_frame(self, frame: Frame) -> np.ndarray:
+        """
+        Renders a frame
+
+        Returns
+        -------
+        image : (height, width, 3) uint8 ndarray
+            the rgb image
+
+        """
+        unused_istep, icase_fringe, icase_disp, unused_icase_vector, scale, phase = frame
+        self._update_displacement(icase_disp, scale, phase)
+        self._update_fringe(icase_fringe)
+        self.render_window.Render()
+
+        window_to_image = self.window_to_image
+        window_to_image.Modified()
+        window_to_image.Update()
+        image_data = window_to_image.GetOutput()
+        width, height, unused_nz = image_data.GetDimensions()
+        rgb = vtk_to_numpy(image_data.GetPointData().GetScalars())
+
+        # vtk images start at the bottom left
+        image = rgb.reshape(height, width, -1)[::-1, :, :3]
+        return np.ascontiguousarray(image, dtype='uint8')
+
+    def render_frames(self, frames: Iterable[Frame]) -> list[np.ndarray]:
+        """renders a series of frames"""
+        return [self.render_frame(frame) for frame in frames]
+
+
+# the renderer of a process pool worker, which is built by _init_worker
+_WORKER_RENDERER: Optional[OffscreenRenderer] = None
+
+
+def _init_worker(bdf_filename: str, op2_filename: str,
+                 width: int, height: int, camera: CameraTuple,
+                 min_value: Optional[float], max_value: Optional[float],
+                 log_level: str) -> None:
+    """process pool initializer; builds the model once per process"""
+    global _WORKER_RENDERER
+    _WORKER_RENDERER = OffscreenRenderer(
+        bdf_filename, op2_filename, width=width, height=height, camera=camera,
+        min_value=min_value, max_value=max_value, log_level=log_level)
+
+
+def _render_frame_range(frames: list[Frame]) -> list[np.ndarray]:
+    """process pool worker; renders a frame range"""
+    return _WORKER_RENDERER.render_frames(frames)
+
+
+def _get_fringe_range(renderer: OffscreenRenderer,
+                      frames: list[Frame]) -> tuple[Optional[float], Optional[float]]:
+    """gets the fringe range over all the frames, so every process uses the same colors"""
+    min_value = None
+    max_value = None
+    for icase_fringe in {frame[1] for frame in frames}:
+        if icase_fringe is None:
+            continue
+        (obj, (i, res_name)) = renderer.gui.result_cases[icase_fringe]
+        fringe = obj.get_fringe_result(i, res_name)
+        mini = float(np.nanmin(fringe))
+        maxi = float(np.nanmax(fringe))
+        min_value = mini if min_value is None else min(min_value, mini)
+        max_value = maxi if max_value is None else max(max_value, maxi)
+    return min_value, max_value
+
+
+def nastran_to_animation(bdf_filename: str,
+                         op2_filename: str,
+                         animation_filename: str,
+                         frames: list[Frame],
+                         time: float=2.0, nrepeat: int=0,
+                         width: int=800, height: int=600,
+                         camera: Optional[CameraTuple]=None,
+                         min_value: Optional[float]=None,
+                         max_value: Optional[float]=None,
+                         nprocs: int=1,
+                         progress_callback: Optional[Callable[[int, int], None]]=None,
+                         log_level: str='error') -> bool:
+    """
+    Renders an animation off-screen
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the geometry
+    op2_filename : str
+        the results
+    animation_filename : str
+        the *.gif or *.mp4 file
+    frames : list[(istep, icase_fringe, icase_disp, icase_vector, scale, phase)]
+        the frames from ``get_animation_frames``
+    time : float; default=2.0
+        the runtime of the animation (seconds)
+    nrepeat : int; default=0
+        0 : loop infinitely
+    width / height : int; default=800/600
+        the size of the image in pixels
+    camera : (position, focal_point, view_up); default=None
+        None : isometric view
+    min_value / max_value : float; default=None
+        the fringe range; None uses the range over all the frames
+    nprocs : int; default=1
+        the number of processes
+        1 : render in this process
+    progress_callback : Callable(nframes_done, nframes); default=None
+        called after every frame range is encoded
+    log_level : str; default='error'
+        'debug', 'info', 'warning', 'error'
+
+    Returns
+    -------
+    success : bool
+        was the animation made (imageio is required)
+
+    """
+    nframes = len(frames)
+    assert nframes > 0, frames
+    if not IS_IMAGEIO:
+        log = get_logger(log=None, level=log_level)
+        log.error(f'imageio is required to write {animation_filename!r}')
+        return False
+
+    renderer = OffscreenRenderer(
+        bdf_filename, op2_filename, width=width, height=height, camera=camera,
+        min_value=min_value, max_value=max_value, log_level=log_level)
+    log = renderer.log
+    if min_value is None or max_value is None:
+        min_valuei, max_valuei = _get_fringe_range(renderer, frames)
+        min_value = min_valuei if min_value is None else min_value
+        max_value = max_valuei if max_value is None else max_value
+        renderer.min_value = min_value
+        renderer.max_value = max_value
+
+    # all the processes use the same camera
+    if camera is None:
+        vtk_camera = renderer.renderer.GetActiveCamera()
+        camera = (vtk_camera.GetPosition(), vtk_camera.GetFocalPoint(),
+                  vtk_camera.GetViewUp())
+
+    # ~4 ranges per process to balance the load
+    nprocs = max(1, min(nprocs, nframes))
+    chunks = split_frames(nframes, 1 if nprocs == 1 else 4 * nprocs)
+    log.info(f'rendering {nframes} frames in {len(chunks)} ranges with nprocs={nprocs}')
+
+    def _images() -> Iterable[np.ndarray]:
+        nframes_done = 0
+        if nprocs == 1:
+            for istart, iend in chunks:
+                images = renderer.render_frames(frames[istart:iend])
+                nframes_done += len(images)
+                yield from images
+                if progress_callback is not None:
+                    progress_callback(nframes_done, nframes)
+            return
+
+        frame_ranges = [frames[istart:iend] for istart, iend in chunks]
+        initargs = (bdf_filename, op2_filename, width, height, camera,
+                    min_value, max_value, log_level)
+        with ProcessPoolExecutor(max_workers=nprocs, initializer=_init_worker,
+                                 initargs=initargs) as executor:
+            # map returns the ranges in order, so the frames can be streamed
+            for images in executor.map(_render_frame_range, frame_ranges):
+                nframes_done += len(images)
+                yield from images
+                if progress_callback is not None:
+                    progress_callback(nframes_done, nframes)
+
+    is_passed = write_animation(animation_filename, _images(), nframes,
+                                time=time, nrepeat=nrepeat)
+    return is_passed
+
+
+def cmd_line_animation(argv=None, quiet: bool=False) -> None:
+    """command line interface to nastran_to_animation"""
+    if argv is None:  # pragma: no cover
+        argv = sys.argv
+
+    msg = (
+        'Usage:\n'
+        '  nastran_animation BDF_FILENAME OP2_FILENAME OUT_FILENAME --disp ICASE [--fringe ICASE] [--phase] [options]\n'
+        '  nastran_animation BDF_FILENAME OP2_FILENAME OUT_FILENAME --disp ICASE --end ICASE [--delta DELTA] [--fringe ICASE] [options]\n'
+        '  nastran_animation -h | --help\n'
+        '  nastran_animation -v | --version\n'
+        '\n'
+        'Positional Arguments:\n'
+        '  BDF_FILENAME   path to input BDF/DAT/NAS file\n'
+        '  OP2_FILENAME   path to input OP2 file\n'
+        '  OUT_FILENAME   path to output *.gif or *.mp4 file\n'
+        '\n'
+        'Options:\n'
+        '  --disp ICASE          the displacement case id\n'
+        '  --fringe ICASE        the fringe case id (default=the displacement case)\n'
+        '  --phase               animate the phase angle of a complex result\n'
+        '  --end ICASE           animate the time steps from the --disp case to the --end case\n'
+        '  --delta DELTA         the case step for a time animation (default=1)\n'
+        '  --scale SCALE         the deflection scale factor; true scale (default=1.0)\n'
+        "  --profile PROFILE     the animation profile (default='0 to scale to 0')\n"
+        '  --runtime RUNTIME     the runtime of the animation in seconds (default=2.0)\n'
+        '  --fps FPS             the frames/second (default=30)\n'
+        '  --size SIZE           the image size in pixels WIDTHxHEIGHT (default=800x600)\n'
+        '  -n NPROCS, --nprocs NPROCS  the number of processes (default=1)\n'
+        '\n'
+        'Info:\n'
+        '  -h, --help      show this help message and exit\n'
+        "  -v, --version   show program's version number and exit\n"
+    )
+    from docopt import docopt
+    import pyNastran
+    ver = str(pyNastran.__version__)
+    data = docopt(msg, version=ver, argv=argv[1:])
+    if not quiet:  # pragma: no cover
+        print(data)
+
+    scale = float(data['--scale'] or 1.0)
+    runtime = float(data['--runtime'] or 2.0)
+    fps = int(data['--fps'] or 30)
+    profile = data['--profile'] or '0 to scale to 0'
+    width, height = (int(val) for val in (data['--size'] or '800x600').lower().split('x'))
+    nprocs = int(data['--nprocs'] or 1)
+
+    icase_disp = int(data['--disp'])
+    icase_fringe = int(data['--fringe']) if data['--fringe'] else icase_disp
+    if data['--end']:
+        # each case is a time step
+        icase_delta = int(data['--delta'] or 1)
+        ncases = int(data['--end']) - icase_disp
+        frames = get_animation_frames(
+            scale, animate_scale=False, animate_time=True,
+            icase_fringe_start=icase_fringe, icase_fringe_end=icase_fringe + ncases,
+            icase_fringe_delta=icase_delta,
+            icase_disp_start=icase_disp, icase_disp_end=icase_disp + ncases,
+            icase_disp_delta=icase_delta,
+            time=runtime, fps=fps)
+    else:
+        is_phase = data['--phase']
+        frames = get_animation_frames(
+            scale, animate_scale=not is_phase, animate_phase=is_phase,
+            icase_fringe=icase_fringe, icase_disp=icase_disp,
+            time=runtime, animation_profile=profile, fps=fps)
+
+    def progress(nframes_done: int, nframes: int) -> None:
+        if not quiet:  # pragma: no cover
+            print(f'rendered {nframes_done}/{nframes} frames')
+
+    is_passed = nastran_to_animation(
+        data['BDF_FILENAME'], data['OP2_FILENAME'], data['OUT_FILENAME'], frames,
+        time=runtime, width=width, height=height, nprocs=nprocs,
+        progress_callback=progress)
+    if not is_passed:
+        sys.exit(f'failed to write {data["OUT_FILENAME"]!r}')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    cmd_line_animation()
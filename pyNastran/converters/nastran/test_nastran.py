@@ -30,6 +30,8 @@ from pyNastran.converters.nastran.gui.result_objects.force_results import ForceR
 from pyNastran.converters.nastran.gui.result_objects.displacement_results import DisplacementResults2
 from pyNastran.converters.nastran.gui.result_objects.plate_stress_results import PlateStrainStressResults2, DERIVATION_METHODS as shell_derivation_methods
 from pyNastran.converters.nastran.gui.result_objects.solid_stress_results import SolidStrainStressResults2
+from pyNastran.converters.nastran.gui.result_objects.nodal_averaging import (
+    NodalAverager, nodal_average, nodal_combine_map)
 
 
 PKG_PATH = pyNastran.__path__[0]
@@ -417,6 +419,39 @@ class TestNastranGUIObjects(unittest.TestCase):
         obj.get_default_arrow_scale(itime, res_name)
         #ll_ids, ids = obj.get_location_arrays()
 
+    def test_nodal_averager(self):
+        """the vectorized nodal averaging matches the per-node version"""
+        # 3 quads sharing nodes 2, 5
+        element_node = np.array([
+            [1, 1], [1, 2], [1, 5], [1, 4],
+            [2, 2], [2, 3], [2, 6], [2, 5],
+            [3, 5], [3, 6], [3, 8], [3, 7],
+        ], dtype='int32')
+        data = np.array([1., -4., 2., 3.,
+                         5., 6., np.nan, 7.,
+                         -8., 9., 10., np.nan], dtype='float32')
+        nids = np.unique(element_node[:, 1])
+        nid_to_inid_map = {nid: i for i, nid in enumerate(nids)}
+
+        averager = NodalAverager(element_node)
+        assert np.array_equal(averager.nids, nids)
+        for nodal_combine, nodal_combine_func in nodal_combine_map.items():
+            expected = nodal_average(nodal_combine_func, element_node, data,
+                                     nids, nid_to_inid_map)
+            actual = averager.average(nodal_combine, data)
+            assert actual.dtype == data.dtype, nodal_combine
+            assert np.allclose(actual, expected, equal_nan=True), nodal_combine
+
+            # all the time steps at once
+            data2 = np.vstack([data, 2 * data])
+            actual2 = averager.average(nodal_combine, data2)
+            assert actual2.shape == (2, len(nids)), actual2.shape
+            assert np.allclose(actual2[1], 2 * expected, equal_nan=True), nodal_combine
+
+        # node 7 only has NaNs
+        assert np.isnan(averager.average('Mean', data)[-2])
+        assert np.allclose(averager.average('Mean', data)[4], (2. + 7. - 8.) / 3.)
+
 class FakeCase:
     def __init__(self, times: np.ndarray):
         self._times = times
@@ -7,6 +7,7 @@ from copy import deepcopy
 import getpass
 from collections import defaultdict
 import unittest
+from tempfile import TemporaryDirectory
 
 import numpy as np
 try:
@@ -17,7 +18,7 @@ except ModuleNotFoundError:  # pyparsing is missing
     IS_MATPLOTLIB = False
 
 import vtkmodules
-from vtk import vtkRenderLargeImage, vtkAxesActor, vtkOrientationMarkerWidget
+from vtk import vtkRenderLargeImage, vtkAxesActor, vtkOrientationMarkerWidget, vtkPlanes
 
 from cpylog import SimpleLogger
 
@@ -34,12 +35,26 @@ from pyNastran.gui import (
 
 USE_OLD_TERMS = not USE_NEW_TERMS
 from pyNastran.gui.testing_methods import FakeGUIMethods
-
-from pyNastran.converters.nastran.gui.nastran_io import NastranIO
+from pyNastran.gui.vtk_interface import vtkUnstructuredGrid
+from pyNastran.gui.vtk_util import vtk_to_numpy
+from pyNastran.gui.utils.vtk.vtk_utils import find_point_id_closest_to_xyz
+from pyNastran.gui.vtk_rendering_core import vtkDataSetMapper, vtkRenderer, vtkRenderWindowInteractor
+from pyNastran.gui.styles.area_pick_utils import get_depth_ids
+
+from pyNastran.converters.nastran.gui.nastran_io import NastranIO, get_result_store_name
+from pyNastran.converters.nastran.gui.result_objects.vector_results import VectorResultsCommon
+from pyNastran.converters.nastran.gui.nastran_io_utils import (
+    map_elements1_quality_helper, map_elements_vectorized_helper)
 from pyNastran.converters.nastran.nastran_to_vtk import nastran_to_vtk, save_nastran_results
+from pyNastran.converters.nastran.nastran_to_animation import (
+    OffscreenRenderer, nastran_to_animation, cmd_line_animation)
+from pyNastran.gui.menus.legend.write_gif import IS_IMAGEIO, get_animation_frames
 from pyNastran.converters.nastran.gui.stress import get_composite_sort
 
 from pyNastran.gui.qt_files.gui_attributes import IS_CUTTING_PLANE
+from pyNastran.gui.gui_common import GuiCommon
+from pyNastran.gui.utils.vtk.animation_callback import AnimationCallback, build_animation_buffers
+from pyNastran.gui.gui_objects.result_store import get_op2_hash
 
 from pyNastran.gui.gui_objects.gui_result import GuiResult, NormalResult, GridPointForceResult
 from pyNastran.gui.gui_objects.displacements import DisplacementResults, ForceTableResults, ElementalTableResults
@@ -286,6 +301,9 @@ class NastranGUI(NastranIO, FakeGUIMethods):
             checks[key] = True
         return
 
+# VTK needs an X server to render off-screen on linux (without OSMesa/EGL)
+IS_RENDER = sys.platform != 'linux' or 'DISPLAY' in os.environ
+
 PKG_PATH = Path(pyNastran.__path__[0])
 STL_PATH = PKG_PATH / 'converters' / 'stl'
 MODEL_PATH = PKG_PATH / '..' / 'models'
@@ -401,8 +419,10 @@ class TestNastranGUI(unittest.TestCase):
             nplanes=5,
             #plane_color=None, plane_opacity=0.5,
             csv_filename=None, show=False, stop_on_failure=True)
-        assert np.allclose(np.abs(force_sum).max(), 0.000732421875), np.abs(force_sum).max()
-        assert np.allclose(np.abs(moment_sum).max(), 0.000244140625), np.abs(moment_sum).max()
+        # the free body is in equilibrium; the sums are float32 round-off
+        # relative to the 10000 lb FORCE
+        assert np.allclose(force_sum, 0., atol=1e-3), np.abs(force_sum).max()
+        assert np.allclose(moment_sum, 0., atol=1e-3), np.abs(moment_sum).max()
 
         p1 = np.array([0, 0, 0]) # origin
         p2 = np.array([1, 0, 0]) # xaxis
@@ -744,6 +764,77 @@ class TestNastranGUI(unittest.TestCase):
         # missing nodes
         test.on_load_custom_results(out_filename=deflection_filename2, restype='Deflection')
 
+    def test_solid_bending_animate_in_gui(self):
+        """drives the buffered in-gui animation"""
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        op2_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.op2')
+        test = NastranGUI()
+        test.vtk_interactor = vtkRenderWindowInteractor()
+        test.load_nastran_geometry(bdf_filename)
+        test.load_nastran_results(op2_filename)
+        icases = {res_name: icase
+                  for icase, (unused_obj, (unused_i, res_name)) in test.result_cases.items()}
+        icase_disp = icases['Displacement T_XYZ']
+        icase_fringe = icases['vonMises']
+        # the fake gui doesn't have the animation methods of the main window
+        test.animation_update = GuiCommon.animation_update.__get__(test)
+        test.animation_update_fringe = GuiCommon.animation_update_fringe.__get__(test)
+
+        scales = np.linspace(0., 100., num=5)
+        phases = np.zeros(5)
+        icases_fringe = [icase_fringe] * 5
+        icases_disp = [icase_disp] * 5
+        icases_vector = [None] * 5
+        buffers = build_animation_buffers(test.result_cases, scales, phases, icases_disp)
+        callback = AnimationCallback(
+            test, scales, phases, icases_fringe, icases_disp, icases_vector,
+            False, False, None, None, buffers=buffers)
+        assert callback.is_buffered.sum() == 5, callback.is_buffered
+
+        for iframe in range(10):
+            callback.execute(test.vtk_interactor, 'TimerEvent')
+            i = iframe % 5
+            xyz = vtk_to_numpy(test.grid.GetPoints().GetData())
+            assert np.allclose(xyz, buffers.xyz[i], atol=1e-4), i
+            assert test.icase_fringe == icase_fringe, test.icase_fringe
+        callback.close()
+
+    def test_solid_bending_level_of_detail_reload(self):
+        """the LOD display is turned off when a new geometry is loaded"""
+        bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        op2_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.op2')
+        bdf_filename2 = os.path.join(MODEL_PATH, 'elements', 'static_elements.bdf')
+
+        test = NastranGUI()
+        # the LOD needs a real mapper/renderer/interactor
+        test.main_grid_mappers['main'] = vtkDataSetMapper()
+        test.rend = vtkRenderer()
+        test.vtk_interactor = vtkRenderWindowInteractor()
+        test.load_nastran_geometry(bdf_filename)
+        test.grid_mapper.SetInputData(test.grid)
+        test.load_nastran_results(op2_filename)
+
+        test.set_level_of_detail(True, target_reduction=0.5)
+        lod = test.lod_interactor.lod
+        assert test.grid_mapper.GetInput() is lod.skin_grid
+        nskin = lod.skin_grid.GetNumberOfCells()
+        assert 0 < nskin < test.grid.GetNumberOfCells() * 6
+        test.cycle_results()
+
+        test.load_nastran_geometry(bdf_filename2)
+        assert test.lod_interactor is None
+        assert test.grid_mapper.GetInput() is test.grid
+        test.cycle_results()
+
+        # the LOD is rebuilt from the new grid
+        test.set_level_of_detail(True, target_reduction=0.0)
+        lod = test.lod_interactor.lod
+        assert lod.proxy is None
+        assert lod.skin_cell_map.max() < test.grid.GetNumberOfCells()
+        test.cycle_results()
+        test.set_level_of_detail(False)
+        assert test.grid_mapper.GetInput() is test.grid
+
     def test_solid_bending_missing_eids(self):
         """
         same as the nominal version, but:
@@ -1274,6 +1365,146 @@ class TestNastranGUI(unittest.TestCase):
         vtu_filename = os.path.join(dirname, 'demo.vtu')
         nastran_to_vtk(bdf_filename, op2_filename, vtu_filename, log_level='error')
 
+    def test_gui_elements_01_vectorized(self):
+        """the vectorized element mapping matches the element-by-element version"""
+        bdf_filename = os.path.join(MODEL_PATH, 'elements', 'static_elements.bdf')
+        log = SimpleLogger(level='error')
+        model = read_bdf(bdf_filename, log=log)
+        # the quadratic shells and grounded springs aren't vectorized
+        for eid, elem in list(model.elements.items()):
+            if elem.type in {'CTRIA6', 'CQUAD8', 'CELAS4', 'CDAMP4'}:
+                del model.elements[eid]
+
+        test = NastranGUI()
+        test.load_nastran_geometry(model)
+        xyz_cid0, nid_cp_cd = test.get_xyz_in_coord(model, cid=0, fdtype='float32')
+
+        points = test.grid.GetPoints()
+        outs = []
+        cells = []
+        for i in range(2):
+            test.grid = vtkUnstructuredGrid()
+            test.grid.SetPoints(points)
+            test.grid.Allocate(len(model.elements), 1000)
+            test.eid_map = {}
+            if i == 0:
+                out = map_elements1_quality_helper(test, model, xyz_cid0, nid_cp_cd, test.nid_map, 0)
+            else:
+                out = map_elements_vectorized_helper(test, model, xyz_cid0, nid_cp_cd, quality=True)
+                assert out is not None
+            grid = test.grid
+            cell_types = [grid.GetCellType(icell) for icell in range(grid.GetNumberOfCells())]
+            point_ids = []
+            for icell in range(grid.GetNumberOfCells()):
+                cell_ids = grid.GetCell(icell).GetPointIds()
+                point_ids.append([cell_ids.GetId(j) for j in range(cell_ids.GetNumberOfIds())])
+            cells.append((dict(test.eid_map), cell_types, point_ids, dict(test.eid_to_nid_map)))
+            outs.append(out)
+
+        (eid_map1, cell_types1, point_ids1, eid_to_nid_map1) = cells[0]
+        (eid_map2, cell_types2, point_ids2, eid_to_nid_map2) = cells[1]
+        assert len(cell_types1) == len(model.elements), len(cell_types1)
+        assert eid_map1 == eid_map2
+        assert cell_types1 == cell_types2
+        assert point_ids1 == point_ids2
+        assert eid_to_nid_map1.keys() == eid_to_nid_map2.keys()
+        for eid, nids in eid_to_nid_map1.items():
+            assert list(nids) == list(eid_to_nid_map2[eid]), eid
+
+        names = [
+            'nid_to_pid_map', 'xyz_cid0', 'superelements', 'pids', 'nelements',
+            'material_coord', 'material_theta',
+            'area', 'min_interior_angle', 'max_interior_angle', 'max_aspect_ratio',
+            'max_skew_angle', 'taper_ratio', 'dideal_theta',
+            'area_ratio', 'min_edge_length', 'max_warp_angle']
+        out1 = dict(zip(names, outs[0]))
+        out2 = dict(zip(names, outs[1]))
+        assert out1['nelements'] == out2['nelements']
+        assert dict(out1['nid_to_pid_map']) == dict(out2['nid_to_pid_map'])
+        for name in names[3:]:
+            if name == 'nelements':
+                continue
+            assert np.allclose(out1[name], out2[name], equal_nan=True), name
+
+    def test_gui_result_store(self):
+        """the result store is named by the OP2/model and closed with the model"""
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        test = NastranGUI()
+        with TemporaryDirectory() as store_dir:
+            test.set_result_store(store_dir=store_dir)
+            test.load_nastran_geometry(bdf_filename)
+            test.load_nastran_results(op2_filename)
+            store = test.result_store
+            assert store is not None and store.is_open
+            h5_filename = f'{get_op2_hash(op2_filename)}-{test._get_geometry_hash()}.h5'
+            assert os.path.basename(store.h5_filename) == h5_filename, store.h5_filename
+            assert len(store) > 0
+
+            # the store keys are unique and don't use the case ids
+            keys = _get_result_store_keys(test.result_cases)
+            assert len(set(keys)) == len(keys), keys
+            assert all(not key[0][0].isdigit() for key in keys), keys
+
+            # the next session reads the stored cases
+            test2 = NastranGUI()
+            test2.set_result_store(store_dir=store_dir)
+            test2.load_nastran_geometry(bdf_filename)
+            test2.load_nastran_results(op2_filename)
+            store2 = test2.result_store
+            assert store2.h5_filename == store.h5_filename
+            assert store2.nreads > 0 and store2.nwrites == 0, (store2.nreads, store2.nwrites)
+            assert _get_result_store_keys(test2.result_cases) == keys
+            test2.close_result_store()
+
+            # a new model closes the store
+            test.load_nastran_geometry(bdf_filename)
+            assert test.result_store is None
+            assert not store.is_open
+
+    def test_gui_spatial_index_picking(self):
+        """node picking and area picking use the spatial index"""
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        test = NastranGUI()
+        test.load_nastran_geometry(bdf_filename)
+        grid = test.grid
+        assert test.is_spatial_index_grid(grid)
+
+        # the closest node to a location near each cell
+        for cell_id in range(grid.GetNumberOfCells()):
+            point_id = grid.GetCell(cell_id).GetPointId(0)
+            xyz = np.array(grid.GetPoint(point_id)) + 0.01
+            assert test.get_closest_point_id(grid, cell_id, xyz) == point_id, cell_id
+
+        # the closest node in the model isn't a node of the picked cell
+        cell_id = 0
+        cell = grid.GetCell(cell_id)
+        cell_point_ids = [cell.GetPointId(i) for i in range(cell.GetNumberOfPoints())]
+        other_point_id = [point_id for point_id in range(grid.GetNumberOfPoints())
+                          if point_id not in cell_point_ids][0]
+        xyz = np.array(grid.GetPoint(other_point_id))
+        closest_point_id = test.get_closest_point_id(grid, cell_id, xyz)
+        assert closest_point_id in cell_point_ids, closest_point_id
+        assert closest_point_id == find_point_id_closest_to_xyz(grid, cell_id, xyz)
+
+        # the nodes/elements inside a box match the VTK frustum extraction
+        frustum = vtkPlanes()
+        frustum.SetBounds(-1., 1.1, -1., 1.1, -1., 1.1)
+        ugrid, eids, nids = get_depth_ids(test.mouse_actions, frustum)
+        assert np.array_equal(eids, [1, 2, 3, 6, 7, 8, 9, 10, 11, 16, 17, 18, 19, 20, 21]), eids
+        assert np.array_equal(nids, [1, 2, 3, 4, 5, 6, 7, 8, 14, 15, 16, 17]), nids
+        assert ugrid.GetNumberOfCells() == len(eids)
+
+        ugrid, eids, nids = get_depth_ids(test.mouse_actions, frustum, is_eids=False)
+        assert eids is None
+        assert ugrid.GetNumberOfPoints() == len(nids)
+
+        # a wire/surface node pick highlights the elements in the frustum
+        ugrid, eids, nids = get_depth_ids(test.mouse_actions, frustum, is_eids=False,
+                                          representation='wire')
+        assert eids is None
+        assert ugrid.GetNumberOfCells() == 15, ugrid.GetNumberOfCells()
+
     def test_gui_vtk1_elements_01(self):
         """tests forces/pressure in SOL 101 using an op2 model object"""
         op2_filename = os.path.join(MODEL_PATH, 'elements', 'static_elements.op2')
@@ -2093,5 +2324,111 @@ def get_nreal_nresults(test,
     assert nresults > 0, nresults
     return nresults
 
+def _get_result_store_keys(result_cases) -> list[tuple]:
+    """gets the (store_name, itime, res_name) of the stored result cases"""
+    keys = []
+    for unused_icase, (obj, (itime, res_name)) in sorted(result_cases.items()):
+        if isinstance(obj, VectorResultsCommon):
+            keys.append((get_result_store_name(obj), itime, res_name))
+    return keys
+
+
+class TestNastranAnimation(unittest.TestCase):
+    """tests the off-screen animation renderer"""
+    def setUp(self):
+        self.bdf_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        self.op2_filename = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.op2')
+
+    def _get_icases(self, renderer: OffscreenRenderer) -> tuple[int, int]:
+        icases = {res_name: icase for icase, (unused_obj, (unused_i, res_name))
+                  in renderer.gui.result_cases.items()}
+        return icases['vonMises'], icases['Displacement T_XYZ']
+
+    def test_offscreen_renderer(self):
+        """builds the model without a window and updates a frame"""
+        renderer = OffscreenRenderer(self.bdf_filename, self.op2_filename,
+                                     width=40, height=30)
+        icase_fringe, icase_disp = self._get_icases(renderer)
+        frames = get_animation_frames(
+            10., icase_fringe=icase_fringe, icase_disp=icase_disp, time=0.5, fps=4)
+        assert len(frames) > 1, frames
+
+        renderer._update_displacement(icase_disp, 10., 0.)
+        (obj, (i, res_name)) = renderer.gui.result_cases[icase_disp]
+        unused_xyz_nominal, xyz_expected = obj.get_vector_result_by_scale_phase(
+            i, res_name, 10., 0.)
+        xyz = vtk_to_numpy(renderer.grid.GetPoints().GetData())
+        assert np.allclose(xyz, xyz_expected, atol=1e-4)
+        renderer._update_displacement(None, 10., 0.)
+        xyz = vtk_to_numpy(renderer.grid.GetPoints().GetData())
+        assert np.allclose(xyz, renderer.xyz_nominal)
+
+        # the fringe range is locked on the first fringe
+        renderer._update_fringe(icase_fringe)
+        (obj, (i, res_name)) = renderer.gui.result_cases[icase_fringe]
+        fringe = obj.get_fringe_result(i, res_name)
+        assert renderer.mapper.GetScalarVisibility()
+        assert np.allclose(renderer.mapper.GetScalarRange(),
+                           [np.nanmin(fringe), np.nanmax(fringe)])
+        renderer._update_fringe(None)
+        assert not renderer.mapper.GetScalarVisibility()
+
+        camera = ((10., 0., 0.), (0., 0., 0.), (0., 0., 1.))
+        renderer.set_camera(camera)
+        assert np.allclose(renderer.renderer.GetActiveCamera().GetPosition(), camera[0])
+
+        if IS_RENDER:
+            image = renderer.render_frame(frames[0])
+            assert image.shape == (30, 40, 3), image.shape
+            assert image.dtype.name == 'uint8'
+
+    def test_nastran_to_animation(self):
+        """renders a gif in 2 processes"""
+        renderer = OffscreenRenderer(self.bdf_filename, self.op2_filename)
+        icase_fringe, icase_disp = self._get_icases(renderer)
+        frames = get_animation_frames(
+            10., icase_fringe=icase_fringe, icase_disp=icase_disp, time=0.5, fps=4)
+
+        progress = []
+        def progress_callback(nframes_done: int, nframes: int) -> None:
+            progress.append((nframes_done, nframes))
+
+        with TemporaryDirectory() as dirname:
+            gif_filename = os.path.join(dirname, 'solid_bending.gif')
+            if not IS_IMAGEIO:
+                # fails before the model is loaded
+                assert not nastran_to_animation(
+                    'missing.bdf', 'missing.op2', gif_filename, frames)
+                return
+            if not IS_RENDER:  # pragma: no cover
+                return
+            is_passed = nastran_to_animation(
+                self.bdf_filename, self.op2_filename, gif_filename, frames,
+                time=0.5, width=40, height=30, nprocs=2,
+                progress_callback=progress_callback)
+            assert is_passed
+            assert os.path.exists(gif_filename)
+        assert progress[-1] == (len(frames), len(frames)), progress
+
+    def test_cmd_line_animation(self):
+        """tests nastran_animation"""
+        renderer = OffscreenRenderer(self.bdf_filename, self.op2_filename)
+        unused_icase_fringe, icase_disp = self._get_icases(renderer)
+        with TemporaryDirectory() as dirname:
+            gif_filename = os.path.join(dirname, 'solid_bending.gif')
+            argv = ['nastran_animation', self.bdf_filename, self.op2_filename, gif_filename,
+                    '--disp', str(icase_disp), '--scale', '10.',
+                    '--runtime', '0.5', '--fps', '4', '--size', '40x30']
+            with self.assertRaises(SystemExit):
+                cmd_line_animation(argv[:4], quiet=True)
+
+            if not IS_IMAGEIO:
+                with self.assertRaises(SystemExit):
+                    cmd_line_animation(argv, quiet=True)
+            elif IS_RENDER:  # pragma: no cover
+                cmd_line_animation(argv, quiet=True)
+                assert os.path.exists(gif_filename)
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
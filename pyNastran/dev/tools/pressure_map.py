@@ -6,6 +6,7 @@ import numpy as np
 from pyNastran.utils import PathLike
 from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree
+from pyNastran.bdf.mesh_utils.spline_matrix import get_interpolation_matrix
 
 from pyNastran.converters.cart3d.cart3d import Cart3D
 #from pyNastran.converters.fluent.fluent import read_fluent
@@ -167,22 +168,23 @@ def pressure_map_from_model(aero_model: Cart3D | Tecplot,
             forces_temp[nid] += force * dist / dist_total
             nforce_total[nid] += 1
     elif map_type == 'force':
-        aero_pressure_centroidal = aero_Cp_centroidal[iaero] * scale
-        aero_force_centroidal = aero_pressure_centroidal * aero_area
-        #pressure_nodal = Cp_nodal[iaero] * scale
-        mapped_structure_nodes = structure_nodes[istructure]
-        #mapped_structure_xyz = structure_xyz[istructure, :]
-        forces_temp = defaultdict(array3)
-        nforce_total = defaultdict(int)
-        for nid, force in zip(mapped_structure_nodes, aero_force_centroidal):
-            forces_temp[nid] += force
-            nforce_total[nid] += 1
-        #forces = {}
+        # conservative transfer of the aero forces to the structural nodes
+        # of the mapped elements: F_structure = H.T @ F_aero
+        aero_xyz_centroidal = aero_dict['xyz_centroidal']
+        aero_normal = aero_dict['normal']
+        aero_pressure_centroidal = aero_Cp_centroidal * scale
+        aero_force_centroidal = -(aero_pressure_centroidal * aero_area)[:, np.newaxis] * aero_normal
+
+        mapped_nids = np.unique([nid for eid in structure_eids
+                                 for nid in structure_model.elements[eid].node_ids])
+        inid = np.searchsorted(structure_nodes, mapped_nids)
+        H = get_interpolation_matrix(structure_xyz[inid, :], aero_xyz_centroidal, method='idw')
+        structure_forces = H.T @ aero_force_centroidal
+
         mag = 1.0
-        for nid, force in forces_temp.items():
-            nforce_totali = nforce_total[nid]
-            force2 = force / nforce_totali
-            model2.add_force(pressure_sid, nid, mag, force2, cid=0)
+        is_force = np.abs(structure_forces).max(axis=1) > 0.
+        for nid, force in zip(mapped_nids[is_force], structure_forces[is_force, :]):
+            model2.add_force(pressure_sid, nid, mag, force, cid=0)
     else:  # pragma: no cover
         raise RuntimeError(map_type)
 
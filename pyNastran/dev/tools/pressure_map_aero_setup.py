@@ -54,12 +54,12 @@ def get_aero_pressure_centroid(aero_model: Cart3D | Tecplot | Fluent,
         xyz1 = aero_xyz_nodal[aero_elements[:, 0], :]
         xyz2 = aero_xyz_nodal[aero_elements[:, 1], :]
         xyz3 = aero_xyz_nodal[aero_elements[:, 2], :]
-        #aero_xyz_centroid = (xyz1 + xyz2 + xyz3) / 3
+        aero_xyz_centroidal = (xyz1 + xyz2 + xyz3) / 3
         aero_normal = np.cross(xyz2-xyz1, xyz3-xyz1)
-        aero_area = 0.5 * np.linalg.norm(aero_normal)
+        aero_area = 0.5 * np.linalg.norm(aero_normal, axis=1)
+        aero_normal /= (2 * aero_area)[:, np.newaxis]
         aero_Cp_centroidal = aero_model.loads['Cp']
         assert len(aero_Cp_centroidal) == len(aero_elements)
-        assert len(aero_Cp_centroidal) == len(aero_xyz)
     elif aero_format == 'tecplot':
         aero_model = cast(Tecplot, aero_model)
         #raise RuntimeError(aero_model)
@@ -77,6 +77,8 @@ def get_aero_pressure_centroid(aero_model: Cart3D | Tecplot | Fluent,
             regions_to_remove, regions_to_include)
         iresult = aero_model.titles[1:].index('Pressure Coefficient')
         aero_area = np.hstack([quad_area, tri_area])
+        aero_xyz_centroidal = np.vstack([quad_centroid, tri_centroid])
+        aero_normal = np.vstack([quad_normal, tri_normal])
         aero_Cp_centroidal = np.hstack([
             quad_results[:, iresult],
             tri_results[:, iresult],
@@ -90,6 +92,8 @@ def get_aero_pressure_centroid(aero_model: Cart3D | Tecplot | Fluent,
         'xyz_nodal' : aero_xyz_nodal,
         'Cp_centroidal' : aero_Cp_centroidal,
         'area' : aero_area,
+        'xyz_centroidal' : aero_xyz_centroidal,
+        'normal' : aero_normal,
     }
     # aero_Cp_centroidal = out_dict['aero_Cp_centroidal']
     # aero_area = out_dict['aero_area']
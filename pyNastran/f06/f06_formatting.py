@@ -1,3 +1,4 @@
+from typing import TextIO, Callable, Optional
 import numpy as np
 from pyNastran.utils import object_attributes
 
@@ -149,6 +150,391 @@ def write_floats_8p1e(vals: list[float]) -> list[str]:
     return vals2
 
 
+# The F06 blocks are built as (nrows, nchars) uint8 arrays, one per field,
+# that are stacked and written at once.  The fields have a fixed width,
+# so the unused characters (e.g., the ' 0.0' of a zero or a skipped
+# field) are nulls, which are removed from the final text.
+NULL = 0
+SPACE = ord(' ')
+ZERO = ord('0')
+
+def _digits_table(ndigits: int, prefix: bytes=b'', dot_after: int=-1) -> np.ndarray:
+    """
+    Gets the characters of 0-10^ndigits (e.g., '0123'), which are a
+    fixed size bytes dtype, so the lookup is a 1D take.
+    """
+    chars = (np.arange(10 ** ndigits)[:, np.newaxis] //
+             10 ** np.arange(ndigits - 1, -1, -1) % 10 + ZERO).astype('uint8')
+    if dot_after >= 0:
+        chars = np.insert(chars, dot_after + 1, ord('.'), axis=1)
+    if prefix:
+        prefix_chars = np.frombuffer(prefix, dtype='uint8')
+        chars = np.hstack([np.broadcast_to(prefix_chars, (len(chars), len(prefix_chars))), chars])
+    return chars.view('V%i' % chars.shape[1]).ravel()
+
+# ' 1.234567E+01' = [sign, '1.234', '567', 'E+01']
+MANTISSA_HIGH = _digits_table(4, dot_after=0)
+MANTISSA_LOW = _digits_table(3)
+EXPONENTS = np.hstack([_digits_table(2, prefix=b'E-')[99:0:-1], _digits_table(2, prefix=b'E+')])
+SIGNS = np.array([b' ', b'-'], dtype='V1')
+DIGITS4 = _digits_table(4)
+# the scale factors of the 2 digit exponents
+POWERS_OF_10 = 10. ** np.arange(-105, 106)
+# 10, 100, ...; the number of digits of an integer is the insertion point
+POWERS_OF_10_INT = 10 ** np.arange(1, 19, dtype='int64')
+
+
+def text_field(text: str, nrows: int,
+               is_skipped: Optional[np.ndarray]=None) -> np.ndarray:
+    """
+    Gets the characters of a constant text field.
+
+    Parameters
+    ----------
+    text : str
+        the text (e.g., '  XY  ')
+    nrows : int
+        the number of rows
+    is_skipped : (nrows, ) bool ndarray; default=None
+        the rows that don't have the field
+
+    Returns
+    -------
+    chars : (nrows, nchars) uint8 ndarray
+        the characters
+
+    """
+    chars = np.frombuffer(text.encode('latin-1'), dtype='uint8')
+    chars = np.broadcast_to(chars, (nrows, len(chars)))
+    if is_skipped is not None:
+        chars = chars.copy()
+        chars[is_skipped, :] = NULL
+    return chars
+
+
+def texts_field(texts: list[str], itexts: np.ndarray,
+                is_skipped: Optional[np.ndarray]=None) -> np.ndarray:
+    """
+    Gets the characters of a text field that varies by row.
+
+    Parameters
+    ----------
+    texts : list[str]
+        the possible texts (e.g., the gridtypes)
+    itexts : (nrows, ) int ndarray
+        the index into texts of each row
+    is_skipped : (nrows, ) bool ndarray; default=None
+        the rows that don't have the field
+
+    Returns
+    -------
+    chars : (nrows, nchars) uint8 ndarray
+        the characters
+
+    """
+    nchars = max(len(text) for text in texts)
+    table = np.zeros((len(texts), nchars), dtype='uint8')
+    for i, text in enumerate(texts):
+        table[i, :len(text)] = np.frombuffer(text.encode('latin-1'), dtype='uint8')
+    chars = table[itexts]
+    if is_skipped is not None:
+        chars[is_skipped, :] = NULL
+    return chars
+
+
+def int_field(values: np.ndarray, width: int,
+              is_skipped: Optional[np.ndarray]=None) -> np.ndarray:
+    """
+    Gets the characters of an integer field (e.g., '%8i').
+
+    Parameters
+    ----------
+    values : (nrows, ) int ndarray
+        the integers
+    width : int
+        the minimum width
+    is_skipped : (nrows, ) bool ndarray; default=None
+        the rows that don't have the field
+
+    Returns
+    -------
+    chars : (nrows, nchars) uint8 ndarray
+        the characters
+
+    """
+    values = np.asarray(values).astype('int64')
+    is_negative = values < 0
+    content, ndigits = _get_digits(np.abs(values), 1)
+    nchars = _add_sign(content, ndigits, is_negative)
+    return _right_justify(content, nchars, width, is_skipped)
+
+
+def fixed_field(values: np.ndarray, width: int, ndecimals: int,
+                is_skipped: Optional[np.ndarray]=None) -> np.ndarray:
+    """
+    Gets the characters of a fixed point field (e.g., '%8.4f').
+
+    The values that are within 1e-6 of a rounding tie and the non-finite
+    and large values are formatted by Python.
+
+    Parameters
+    ----------
+    values : (nrows, ) float ndarray
+        the floats
+    width : int
+        the minimum width
+    ndecimals : int
+        the number of decimal places
+    is_skipped : (nrows, ) bool ndarray; default=None
+        the rows that don't have the field
+
+    Returns
+    -------
+    chars : (nrows, nchars) uint8 ndarray
+        the characters
+
+    """
+    values = np.asarray(values).astype('float64')
+    is_negative = np.signbit(values)
+    scaled = np.abs(values) * 10. ** ndecimals
+    is_fast = np.isfinite(scaled) & (scaled < 1e15)
+    scaled[~is_fast] = 0.
+    floor_scaled = np.floor(scaled)
+    is_fast &= np.abs(scaled - floor_scaled - 0.5) > 1e-6
+    rounded = (floor_scaled + (scaled - floor_scaled >= 0.5)).astype('int64')
+
+    # [sign, integer digits, '.', decimal digits]
+    digits, ndigits = _get_digits(rounded, ndecimals + 1)
+    ndigits_max = digits.shape[1]
+    content = np.empty((len(values), ndigits_max + 1), dtype='uint8')
+    content[:, :ndigits_max-ndecimals] = digits[:, :ndigits_max-ndecimals]
+    content[:, ndigits_max-ndecimals] = ord('.')
+    content[:, ndigits_max-ndecimals+1:] = digits[:, ndigits_max-ndecimals:]
+    nchars = _add_sign(content, ndigits + 1, is_negative)
+    chars = _right_justify(content, nchars, width, is_skipped)
+
+    is_slow = ~is_fast
+    if is_skipped is not None:
+        is_slow &= ~is_skipped
+    if is_slow.any():
+        float_format = '%%%i.%if' % (width, ndecimals)
+        texts = [float_format % value for value in values[is_slow].tolist()]
+        chars = _set_texts(chars, is_slow, texts, is_right=True)
+    return chars
+
+
+def _get_digits(values: np.ndarray, min_ndigits: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the right aligned digits of non-negative integers.
+
+    Parameters
+    ----------
+    values : (nrows, ) int ndarray
+        the non-negative integers
+    min_ndigits : int
+        the leading zeros are written up to min_ndigits (e.g., '0.0001'
+        is written from 1 with 5 digits)
+
+    Returns
+    -------
+    chars : (nrows, 1 + ndigits_max) uint8 ndarray
+        the digits with a leading null and nulls for the unused digits,
+        so there is space for a sign
+    ndigits : (nrows, ) int ndarray
+        the number of digits
+
+    """
+    nrows = len(values)
+    ndigits = np.maximum(np.searchsorted(POWERS_OF_10_INT, values, side='right') + 1, min_ndigits)
+    ngroups = (max(ndigits.max() if nrows else 1, 1) + 3) // 4
+    groups = np.empty((nrows, ngroups), dtype='V4')
+    remainder = values.copy()
+    for igroup in range(ngroups - 1, -1, -1):
+        groups[:, igroup] = DIGITS4.take(remainder % 10_000)
+        remainder //= 10_000
+
+    ncolumns = 4 * ngroups
+    chars = np.full((nrows, ncolumns + 1), NULL, dtype='uint8')
+    chars[:, 1:] = groups.view('uint8').reshape(nrows, ncolumns)
+    is_leading = np.arange(ncolumns + 1) < (ncolumns + 1 - ndigits)[:, np.newaxis]
+    chars[is_leading] = NULL
+    return chars, ndigits
+
+
+def _add_sign(chars: np.ndarray, nchars: np.ndarray, is_negative: np.ndarray) -> np.ndarray:
+    """adds the sign to the right aligned characters"""
+    inegative = np.where(is_negative)[0]
+    chars[inegative, chars.shape[1] - 1 - nchars[inegative]] = ord('-')
+    return nchars + is_negative
+
+
+def float_13e_field(values: np.ndarray, is_padded=True,
+                    is_skipped: Optional[np.ndarray]=None) -> np.ndarray:
+    """
+    Gets the characters of a Nastran 13.6 float field (see
+    ``write_floats_13e``).
+
+    The mantissa and exponent digits are found with numpy.  The values
+    that are within 1e-4 of a rounding tie (the float64 scaling isn't
+    exact), the non-finite values and the 3 digit exponents are
+    formatted by Python.
+
+    Parameters
+    ----------
+    values : (nrows, ) float ndarray
+        the floats
+    is_padded : bool / (nrows, ) bool ndarray; default=True
+        True : the value is padded to 13 characters ('%-13s')
+        False : the value isn't padded ('%s'), so a zero is ' 0.0'
+    is_skipped : (nrows, ) bool ndarray; default=None
+        the rows that don't have the field
+
+    Returns
+    -------
+    chars : (nrows, nchars) uint8 ndarray
+        the characters
+
+    """
+    values = np.asarray(values).astype('float64')
+    nrows = len(values)
+    abs_values = np.abs(values)
+    is_zero = (abs_values == 0.)
+    is_fast = np.isfinite(values) & ~is_zero
+
+    # |value| = mantissa * 10^(exponent - 6)
+    abs_values[~is_fast] = 1.
+    exponent = np.floor(np.log10(abs_values)).astype('int64')
+    is_fast &= (np.abs(exponent) <= 98)
+    abs_values[~is_fast] = 1.
+    exponent[~is_fast] = 0
+    scaled = abs_values * POWERS_OF_10[105 + 6 - exponent]
+    is_low = scaled < 1e6
+    scaled[is_low] *= 10.
+    exponent[is_low] -= 1
+    is_high = scaled >= 1e7
+    scaled[is_high] /= 10.
+    exponent[is_high] += 1
+
+    floor_scaled = np.floor(scaled)
+    is_fast &= np.abs(scaled - floor_scaled - 0.5) > 1e-4
+    mantissa = (floor_scaled + (scaled - floor_scaled >= 0.5)).astype('int64')
+    is_round_up = mantissa == 10_000_000
+    mantissa[is_round_up] = 1_000_000
+    exponent[is_round_up] += 1
+    is_fast &= np.abs(exponent) <= 99
+    exponent[~is_fast] = 0
+
+    # ' 1.234567E+01'
+    row = np.empty(nrows, dtype=[('sign', 'V1'), ('high', 'V5'), ('low', 'V3'),
+                                 ('exponent', 'V4'), ('null', 'V1')])
+    row['sign'] = SIGNS.take(values < 0.)
+    row['high'] = MANTISSA_HIGH.take(mantissa // 1000)
+    row['low'] = MANTISSA_LOW.take(mantissa % 1000)
+    row['exponent'] = EXPONENTS.take(exponent + 99)
+    chars = row.view('uint8').reshape(nrows, 14)
+    chars[:, 13] = NULL
+
+    # ' 0.0' padded to 13 characters or not
+    chars[is_zero, 4:13] = np.where(np.broadcast_to(is_padded, (nrows, ))[is_zero, np.newaxis],
+                                    SPACE, NULL)
+    chars[is_zero, :4] = np.frombuffer(b' 0.0', dtype='uint8')
+
+    is_slow = ~(is_fast | is_zero)
+    if is_skipped is not None:
+        chars[is_skipped, :] = NULL
+        is_slow &= ~is_skipped
+    if is_slow.any():
+        # NAN/INF are 13 characters; the 3 digit exponents are 14
+        texts = write_floats_13e(values[is_slow].tolist())
+        chars = _set_texts(chars, is_slow, texts, is_right=False)
+    return chars
+
+
+def _right_justify(content: np.ndarray, nchars: np.ndarray, width: int,
+                   is_skipped: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Pads the right aligned content (with nchars characters per row) with
+    spaces to width characters.
+    """
+    nrows, ncontent = content.shape
+    ncolumns = max(ncontent, width)
+    chars = np.full((nrows, ncolumns), NULL, dtype='uint8')
+    chars[:, ncolumns-ncontent:] = content
+    icolumn = np.arange(ncolumns)
+    is_space = ((icolumn >= ncolumns - np.maximum(nchars, width)[:, np.newaxis]) &
+                (icolumn < ncolumns - nchars[:, np.newaxis]))
+    chars[is_space] = SPACE
+    if is_skipped is not None:
+        chars[is_skipped, :] = NULL
+    return chars
+
+
+def _set_texts(chars: np.ndarray, is_set: np.ndarray, texts: list[str],
+               is_right: bool) -> np.ndarray:
+    """sets the characters of a few rows (e.g., the NaNs)"""
+    ncolumns = max(chars.shape[1], max(len(text) for text in texts))
+    if ncolumns > chars.shape[1]:
+        chars2 = np.full((chars.shape[0], ncolumns), NULL, dtype='uint8')
+        if is_right:
+            chars2[:, ncolumns-chars.shape[1]:] = chars
+        else:
+            chars2[:, :chars.shape[1]] = chars
+        chars = chars2
+    for irow, text in zip(np.where(is_set)[0], texts):
+        chars[irow, :] = NULL
+        text_chars = np.frombuffer(text.encode('latin-1'), dtype='uint8')
+        if is_right:
+            chars[irow, ncolumns-len(text):] = text_chars
+        else:
+            chars[irow, :len(text)] = text_chars
+    return chars
+
+
+def format_f06_block(fields: list) -> str:
+    """
+    Joins the fields of a block of F06 lines.
+
+    Parameters
+    ----------
+    fields : list[(nrows, nchars) uint8 ndarray / str]
+        the characters of the fields from ``text_field``, ``int_field``,
+        ``float_13e_field``, ... or a str, which is the same for all rows
+
+    Returns
+    -------
+    msg : str
+        the lines
+
+    """
+    nrows = [len(field) for field in fields if not isinstance(field, str)][0]
+    fields = [text_field(field, nrows) if isinstance(field, str) else field
+              for field in fields]
+    chars = np.hstack(fields)
+    return chars.tobytes().replace(b'\x00', b'').decode('latin-1')
+
+
+def write_f06_block(f06_file: TextIO, get_fields: Callable[[int, int], list],
+                    nrows: int, nrows_per_write: int=10_000) -> None:
+    """
+    Writes a block of F06 lines in a few large writes.
+
+    Parameters
+    ----------
+    f06_file : file
+        the file to write to
+    get_fields : func(irow0, irow1) -> fields
+        gets the fields (see ``format_f06_block``) of rows irow0:irow1
+    nrows : int
+        the number of rows
+    nrows_per_write : int; default=10000
+        the number of rows that are formatted at once
+
+    """
+    for irow0 in range(0, nrows, nrows_per_write):
+        irow1 = min(irow0 + nrows_per_write, nrows)
+        f06_file.write(format_f06_block(get_fields(irow0, irow1)))
+
+
 def _eigenvalue_header(obj, header, itime: int, ntimes: int, dt):
     if obj.nonlinear_factor not in (None, np.nan):
         name = obj.data_code['name']
@@ -1,8 +1,12 @@
 import unittest
+from io import StringIO
+import numpy as np
 from pyNastran.f06.f06_formatting import (
     write_floats_8p4f, write_floats_8p1e,
-    write_floats_10e, write_floats_12e,
-    write_imag_floats_13e)
+    write_floats_10e, write_floats_12e, write_floats_13e,
+    write_imag_floats_13e,
+    text_field, int_field, fixed_field, float_13e_field,
+    format_f06_block, write_f06_block)
 from pyNastran.f06.f06_writer import (
     make_end, sorted_bulk_data_header, make_f06_header, make_stamp)
 
@@ -174,5 +178,58 @@ class TestF06Formatting(unittest.TestCase):
         make_f06_header()
         make_stamp(title=None)
 
+    def test_float_13e_field(self):
+        """the vectorized '%13.6E' field matches write_floats_13e"""
+        values = np.array([
+            0., -0., 1., -1., 0.125, 1.0000005, 9.9999995, 9.9999996, 123456.75,
+            1e-5, -2.5e-7, 1e10, 1.234567e99, 1e100, -3.3e-101, 1e300, 1e-300,
+            np.nan, np.inf, -np.inf, 5e-324])
+        rng = np.random.default_rng(42)
+        random_values = rng.standard_normal(1000) * 10. ** rng.integers(-30, 30, 1000)
+        for dtype in ['float32', 'float64']:
+            for vals in [values, random_values]:
+                with np.errstate(over='ignore', under='ignore'):
+                    vals = vals.astype(dtype)
+                for is_padded in [True, False]:
+                    expected = write_floats_13e(vals)
+                    if is_padded:
+                        expected = [word.ljust(13) for word in expected]
+                    chars = float_13e_field(vals, is_padded=is_padded)
+                    actual = [row.tobytes().replace(b'\x00', b'').decode('latin-1')
+                              for row in chars]
+                    self.assertEqual(actual, expected)
+
+    def test_int_fixed_field(self):
+        """the vectorized '%8i' and '%8.4f' fields match Python"""
+        ints = np.array([0, 1, -1, 9, 10, 99999999, 123456789, -12345678, 2**40])
+        actual = format_f06_block([int_field(ints, 8), '\n'])
+        expected = ''.join('%8i\n' % value for value in ints)
+        self.assertEqual(actual, expected)
+
+        floats = np.array([0., -0., 0.00005, 0.00015, -0.00004, 1.23456, -45.5,
+                           12345.678949, 1e20, np.nan, -np.inf])
+        for width, ndecimals in [(8, 4), (5, 2)]:
+            fmt = '%%%i.%if\n' % (width, ndecimals)
+            actual = format_f06_block([fixed_field(floats, width, ndecimals), '\n'])
+            expected = ''.join(fmt % value for value in floats)
+            self.assertEqual(actual, expected)
+
+    def test_write_f06_block(self):
+        """skipped fields are dropped and the rows are written in blocks"""
+        nids = np.array([1, 2, 3, 4, 5])
+        values = np.array([1., 2., -3., 0., 5.])
+        is_skipped = nids % 2 == 0
+        def get_fields(i0, i1):
+            return [
+                int_field(nids[i0:i1], 4),
+                text_field(' G', i1 - i0, is_skipped[i0:i1]),
+                ' ', float_13e_field(values[i0:i1], is_padded=False), '\n']
+        f06_file = StringIO()
+        write_f06_block(f06_file, get_fields, len(nids), nrows_per_write=2)
+        expected = ''.join(
+            '%4i%s %s\n' % (nid, '' if skip else ' G', write_floats_13e([value])[0])
+            for nid, skip, value in zip(nids, is_skipped, values))
+        self.assertEqual(f06_file.getvalue(), expected)
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
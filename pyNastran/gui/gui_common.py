@@ -55,7 +55,8 @@ from .menus.menus import (
 
 from .menus.legend.write_gif import (
     setup_animation, update_animation_inputs, write_gif, make_two_sided)
-from .utils.vtk.animation_callback import AnimationCallback
+from .utils.vtk.animation_callback import (
+    AnimationCallback, get_buffered_frames, build_animation_buffers)
 from .utils.vtk.base_utils import numpy_to_vtk_idtype
 
 try:
@@ -1871,10 +1872,21 @@ class GuiCommon(QMainWindow, GuiVTKCommon):
                         animate_fringe, animate_vector,
                         fps):
         """helper method for ``make_gif``"""
+        # only the frames that don't change a result case are buffered
+        buffers = None
+        is_buffered = get_buffered_frames(
+            icases_fringe, icases_disp, icases_vector, animate_fringe)
+        if is_buffered.any():
+            buffers = build_animation_buffers(
+                self.result_cases, scales, phases,
+                icases_disp, log=self.log)
+
         callback = AnimationCallback(self, scales, phases,
                                      icases_fringe, icases_disp, icases_vector,
                                      animate_fringe, animate_vector,
-                                     min_value, max_value)
+                                     min_value, max_value,
+                                     buffers=buffers)
+        self.animation_callback = callback
 
         # Sign up to receive TimerEvent
         observer_name = self.vtk_interactor.AddObserver('TimerEvent', callback.execute)
@@ -1896,6 +1908,9 @@ class GuiCommon(QMainWindow, GuiVTKCommon):
             self.vtk_interactor.RemoveObserver(observer_name)
             del self.observers['TimerEvent']
             self.mouse_actions.setup_mouse_buttons(mode='default', force=True)
+        if self.animation_callback is not None:
+            self.animation_callback.close()
+            self.animation_callback = None
         return is_failed
 
     def animation_update(self,
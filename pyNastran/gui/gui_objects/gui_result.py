@@ -2,13 +2,15 @@
 defines:
  - GuiResultCommon
  - GuiResult
+ - LazyGuiResult
 
 """
 from __future__ import annotations
 from abc import abstractmethod
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 import numpy as np
 from pyNastran.utils.numpy_utils import integer_types, integer_float_types
+from pyNastran.gui.gui_objects.result_cache import ResultCache, RESULT_CACHE_IDS
 if TYPE_CHECKING:
     from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForceArray
 
@@ -20,6 +22,72 @@ REAL_TYPES = ['<i4', '<i8', '<f4', '<f8',
 INT_TYPES = ['<i4', '<i8', '|i1',
              '>i4', '>i8']
 
+def get_scalar_min_max(scalar: np.ndarray, mask_value: Optional[int],
+                       title: str='') -> tuple[np.ndarray, int, int, Any, Any, bool]:
+    """
+    Gets the default min/max of a GuiResult scalar
+
+    Integer scalars with a mask_value are cast to floats, so the masked
+    values can be NaN.  The inf values of float scalars are set to NaN.
+
+    Returns
+    -------
+    scalar : (n, ) ndarray
+        the (possibly recast) scalar
+    imin / imax : int
+        the index of the min/max value
+    min_default / max_default : int/float
+        the min/max value (excluding the masked/inf values)
+    is_masked : bool
+        the scalar was cast to a float array
+
+    """
+    imin = np.nanargmin(scalar)
+    imax = np.nanargmax(scalar)
+    assert isinstance(imin, integer_types), imin
+    assert isinstance(imax, integer_types), imax
+    min_default = scalar[imin]
+    max_default = scalar[imax]
+    is_masked = False
+    if scalar.dtype.str in INT_TYPES:
+        # turns out you can't have a NaN/inf with an integer array
+        # we need to recast it
+        if mask_value is not None:
+            inan_short = np.where(scalar == mask_value)[0]
+            if len(inan_short):
+                # overly complicated way to allow us to use ~inan to invert the array
+                inan = np.isin(np.arange(len(scalar)), inan_short)
+                inan_remaining = scalar[~inan]
+
+                scalar = np.asarray(scalar, 'f')
+                scalar[inan] = np.nan
+                is_masked = True
+                try:
+                    min_default = inan_remaining.min()
+                except ValueError:  # pragma: no cover
+                    print('inan_remaining =', inan_remaining)
+                    raise
+                max_default = inan_remaining.max()
+                #imax = np.where(scalar == min_default)[0]
+                #imin = np.where(scalar == max_default)[0]
+    else:
+        # handling VTK NaN oddinty
+        # filtering the inf values and replacing them with NaN
+        # 1.#R = inf
+        # 1.#J = nan
+        ifinite = np.isfinite(scalar)
+        if not np.all(ifinite):
+            scalar[~ifinite] = np.nan
+            try:
+                min_default = scalar[ifinite].min()
+            except ValueError:
+                print(title)
+                print(scalar)
+                raise
+            max_default = scalar[ifinite].max()
+    return scalar, imin, imax, min_default, max_default, is_masked
+
+
 class GuiResultCommon:
     def __init__(self):
         self.class_name = self.__class__.__name__
@@ -480,16 +548,23 @@ class GuiResult(GuiResultCommon):
         if scalar is None:
             raise RuntimeError('title=%r scalar is None...' % self.title)
         assert scalar.shape[0] == scalar.size, 'shape=%s size=%s' % (str(scalar.shape), scalar.size)
-        self.scalar = scalar
-        #self.data_type = self.dxyz.dtype.str # '<c8', '<f4'
-        self.data_type = self.scalar.dtype.str # '<c8', '<f4'
-        self.is_real = True if self.data_type in REAL_TYPES else False
-        self.is_complex = not self.is_real
         self.nlabels = nlabels
         self.labelsize = labelsize
         self.ncolors = ncolors
         self.colormap = colormap
 
+        self.title_default = self.title
+        self.header_default = self.header
+        self._set_scalar(scalar, mask_value, data_format)
+
+    def _set_scalar(self, scalar: np.ndarray, mask_value: Optional[int],
+                    data_format: Optional[str]) -> None:
+        """sets the scalar, the data type/format and the default min/max"""
+        #self.data_type = self.dxyz.dtype.str # '<c8', '<f4'
+        self.data_type = scalar.dtype.str # '<c8', '<f4'
+        self.is_real = True if self.data_type in REAL_TYPES else False
+        self.is_complex = not self.is_real
+
         #print('title=%r data_type=%r' % (self.title, self.data_type))
         if self.data_type in INT_TYPES:
             self.data_format = '%i'
@@ -497,54 +572,14 @@ class GuiResult(GuiResultCommon):
             self.data_format = '%.2f'
         else:
             self.data_format = data_format
-
-        self.title_default = self.title
-        self.header_default = self.header
         self.data_format_default = self.data_format
 
-        self.imin = np.nanargmin(self.scalar)
-        self.imax = np.nanargmax(self.scalar)
-        assert isinstance(self.imin, integer_types), self.imin
-        assert isinstance(self.imax, integer_types), self.imax
-        self.min_default = self.scalar[self.imin]
-        self.max_default = self.scalar[self.imax]
-        if self.data_type in INT_TYPES:
-            # turns out you can't have a NaN/inf with an integer array
-            # we need to recast it
-            if mask_value is not None:
-                inan_short = np.where(self.scalar == mask_value)[0]
-                if len(inan_short):
-                    # overly complicated way to allow us to use ~inan to invert the array
-                    inan = np.isin(np.arange(len(self.scalar)), inan_short)
-                    inan_remaining = self.scalar[~inan]
-
-                    self.scalar = np.asarray(self.scalar, 'f')
-                    self.data_type = self.scalar.dtype.str
-                    self.data_format = '%.0f'
-                    self.scalar[inan] = np.nan
-                    try:
-                        self.min_default = inan_remaining.min()
-                    except ValueError:  # pragma: no cover
-                        print('inan_remaining =', inan_remaining)
-                        raise
-                    self.max_default = inan_remaining.max()
-                    #self.imax = np.where(self.scalar == self.min_default)[0]
-                    #self.imin = np.where(self.scalar == self.max_default)[0]
-        else:
-            # handling VTK NaN oddinty
-            # filtering the inf values and replacing them with NaN
-            # 1.#R = inf
-            # 1.#J = nan
-            ifinite = np.isfinite(self.scalar)
-            if not np.all(ifinite):
-                self.scalar[~ifinite] = np.nan
-                try:
-                    self.min_default = self.scalar[ifinite].min()
-                except ValueError:
-                    print(self.title)
-                    print(self.scalar)
-                    raise
-                self.max_default = self.scalar[ifinite].max()
+        scalar, self.imin, self.imax, self.min_default, self.max_default, is_masked = (
+            get_scalar_min_max(scalar, mask_value, self.title))
+        if is_masked:
+            self.data_type = scalar.dtype.str
+            self.data_format = '%.0f'
+        self.scalar = scalar
         self.min_value = self.min_default
         self.max_value = self.max_default
 
@@ -856,6 +891,103 @@ class GuiResultIDs(GuiResult):
             data_format, uname)
 
 
+
+class LazyGuiResult(GuiResult):
+    """
+    A GuiResult that calculates the scalar with ``get_scalar()`` the
+    first time it's used instead of when the results are loaded.
+
+    The scalar is held by the (optional) shared ResultCache, so the
+    least recently used cases are freed and calculated again when
+    they're shown.  The data type/format and the default min/max are
+    found the first time the scalar is calculated.
+    """
+    def __init__(self, subcase_id: int, header: str, title: str, location: str,
+                 get_scalar: Callable[[], np.ndarray],
+                 mask_value: Optional[int]=None, nlabels: Optional[int]=None,
+                 labelsize: Optional[int]=None, ncolors: Optional[int]=None,
+                 colormap: str='jet',
+                 data_map: Any=None,
+                 data_format: Optional[str]=None,
+                 scale_type: str='',
+                 uname: str='LazyGuiResult'):
+        """
+        Parameters
+        ----------
+        get_scalar : Callable[[], ndarray]
+            calculates the (n,) int/float scalar
+        the other parameters are the same as GuiResult
+
+        """
+        GuiResultCommon.__init__(self)
+        # set by _set_scalar
+        del self.is_real, self.is_complex
+
+        self.scale_type = scale_type
+        self.data_map = data_map
+        self.subcase_id = subcase_id
+        self.title = title
+        self.header = header
+        self.location = location
+        assert location in ('node', 'centroid'), location
+        self.uname = uname
+
+        self.nlabels = nlabels
+        self.labelsize = labelsize
+        self.ncolors = ncolors
+        self.colormap = colormap
+        self.title_default = self.title
+        self.header_default = self.header
+
+        self._get_scalar = get_scalar
+        self._mask_value = mask_value
+        self._data_format = data_format
+
+        # the (optional) shared LRU cache of the scalar
+        self.result_cache: Optional[ResultCache] = None
+        self.cache_id = next(RESULT_CACHE_IDS)
+
+    def __getattr__(self, name: str) -> Any:
+        """calculates the scalar and the attributes that depend on it"""
+        # only called for the attributes that haven't been set
+        if name == 'scalar':
+            return self._get_cached_scalar()
+        if name in LAZY_GUI_RESULT_ATTRIBUTES:
+            self._get_cached_scalar()
+            return self.__dict__[name]
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+    def _get_cached_scalar(self) -> np.ndarray:
+        """gets the scalar from the result_cache (or calculates it)"""
+        if self.result_cache is None:
+            scalar = self._calculate_scalar()
+            # there is no cache, so hold the scalar like a GuiResult
+            self.__dict__['scalar'] = scalar
+            return scalar
+        return self.result_cache.get((self.cache_id, 'scalar'), self._calculate_scalar)
+
+    def _calculate_scalar(self) -> np.ndarray:
+        scalar = self._get_scalar()
+        assert scalar.shape[0] == scalar.size, 'shape=%s size=%s' % (str(scalar.shape), scalar.size)
+        if 'data_type' not in self.__dict__:
+            self._set_scalar(scalar, self._mask_value, self._data_format)
+            return self.__dict__.pop('scalar')
+        return get_scalar_min_max(scalar, self._mask_value, self.title)[0]
+
+    def __repr__(self) -> str:
+        msg = 'LazyGuiResult\n'
+        msg += '    title=%r\n' % self.title
+        msg += '    uname=%r\n' % self.uname
+        msg += '    is_calculated=%s\n' % ('data_type' in self.__dict__)
+        return msg
+
+# the attributes set by GuiResult._set_scalar
+LAZY_GUI_RESULT_ATTRIBUTES = {
+    'data_type', 'is_real', 'is_complex', 'data_format', 'data_format_default',
+    'imin', 'imax', 'min_default', 'max_default', 'min_value', 'max_value',
+}
+
+
 def check_title(title: str, used_titles: set[str]) -> str:
     if title in used_titles:
         # add a counter
@@ -0,0 +1,168 @@
+"""
+defines:
+ - ResultCache
+
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Callable, Optional, TYPE_CHECKING
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+    from pyNastran.gui.gui_objects.result_store import ResultStore
+
+# 512 MB
+DEFAULT_MAX_NBYTES = 512 * 1024 ** 2
+
+# unique ids for the result objects; id(obj) may be reused
+RESULT_CACHE_IDS = count()
+
+
+def get_nbytes(value: Any) -> int:
+    """gets the size of an array or a tuple/list of arrays"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(get_nbytes(valuei) for valuei in value)
+    return 0
+
+
+def get_read_only(value: Any) -> Any:
+    """gets a read-only view of an array or a tuple/list of arrays"""
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.setflags(write=False)
+        return view
+    if isinstance(value, (tuple, list)):
+        return type(value)(get_read_only(valuei) for valuei in value)
+    return value
+
+
+class ResultCache:
+    """
+    A least recently used (LRU) cache for the computed fringe/vector
+    arrays of the on-demand GUI result objects:
+     - the VectorResultsCommon subclasses (DisplacementResults2,
+       ForceResults2 and the plate, solid and composite stress/strain
+       results)
+     - LazyGuiResult (strain energy and bar/beam forces)
+
+    These result objects keep references to the OP2 arrays and compute
+    the per-case fringe on demand.  The computed arrays are held until
+    the total size exceeds max_nbytes, which evicts the least recently
+    used cases.  The cached arrays are returned as read-only views.
+
+    The other GuiResult cases (e.g., temperatures, which are views of
+    the OP2 arrays, and grid point stresses) are still filled when the
+    OP2 is loaded, so they don't use the cache.
+
+    An optional ResultStore persists the computed arrays across
+    sessions, which is checked before calculating a case.
+    """
+    def __init__(self, max_nbytes: int=DEFAULT_MAX_NBYTES,
+                 log: Optional[SimpleLogger]=None):
+        """
+        Parameters
+        ----------
+        max_nbytes : int; default=512 MB
+            the memory limit of the cached arrays
+            0 disables the cache
+        log : SimpleLogger; default=None
+            logs the hits/misses/evictions at the debug level
+
+        """
+        self.max_nbytes = max_nbytes
+        self.log = log
+        self._data: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+        self.nbytes = 0
+        self.nhits = 0
+        self.nmisses = 0
+        self.nevictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def get(self, key: Any, func: Callable[..., Any], *args,
+            store: Optional[ResultStore]=None, store_key: str='') -> Any:
+        """
+        Gets a cached value or calculates it with ``func(*args)``
+
+        Parameters
+        ----------
+        key : hashable
+            the unique key of the case (result object id, itime,
+            res_name, sidebar state)
+        func : Callable
+            calculates the value (an array or a tuple of arrays) on a miss
+        args : tuple
+            the arguments to func
+        store : ResultStore; default=None
+            the persistent store of the result object
+        store_key : str; default=''
+            the stable (across sessions) key of the case in the store
+
+        Returns
+        -------
+        value : Any
+            read-only views of the cached arrays, so the caller can't
+            change the value of the next hit
+
+        """
+        try:
+            value, unused_nbytes = self._data[key]
+        except KeyError:
+            pass
+        else:
+            self._data.move_to_end(key)
+            self.nhits += 1
+            return get_read_only(value)
+
+        self.nmisses += 1
+        value = None if store is None else store.get(store_key)
+        if value is None:
+            value = func(*args)
+            if store is not None:
+                store.add(store_key, value)
+        self.add(key, value)
+        if self.log is not None:
+            self.log.debug(f'result cache miss; {self.get_stats()}')
+        return get_read_only(value)
+
+    def add(self, key: Any, value: Any) -> None:
+        """adds a value and evicts the oldest values to stay under max_nbytes"""
+        nbytes = get_nbytes(value)
+        if nbytes > self.max_nbytes:
+            # too big to cache
+            return
+
+        if key in self._data:
+            self.nbytes -= self._data.pop(key)[1]
+        self._data[key] = (value, nbytes)
+        self.nbytes += nbytes
+
+        while self.nbytes > self.max_nbytes:
+            unused_key, (unused_value, nbytes_old) = self._data.popitem(last=False)
+            self.nbytes -= nbytes_old
+            self.nevictions += 1
+
+    def clear(self) -> None:
+        """clears the cached values (the counters are kept)"""
+        self._data.clear()
+        self.nbytes = 0
+
+    def get_stats(self) -> str:
+        """gets the hit/miss counters"""
+        ncalls = self.nhits + self.nmisses
+        hit_rate = 100. * self.nhits / ncalls if ncalls else 0.
+        msg = (f'ncases={len(self._data)} nbytes={self.nbytes/1024**2:.1f}/'
+               f'{self.max_nbytes/1024**2:.1f} MB; hits={self.nhits} '
+               f'misses={self.nmisses} ({hit_rate:.1f}% hit rate) '
+               f'evictions={self.nevictions}')
+        return msg
+
+    def __repr__(self) -> str:
+        return f'ResultCache({self.get_stats()})'
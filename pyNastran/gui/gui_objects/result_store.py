@@ -0,0 +1,258 @@
+"""
+defines:
+ - ResultStore
+ - op2_hash = get_op2_hash(op2_filename)
+ - geometry_hash = get_geometry_hash(node_ids, xyz, element_ids, connectivity)
+
+"""
+from __future__ import annotations
+import os
+import hashlib
+from typing import Any, Optional, TYPE_CHECKING
+import numpy as np
+try:
+    import h5py
+    IS_H5PY = True
+except ModuleNotFoundError:  # pragma: no cover
+    IS_H5PY = False
+
+import pyNastran
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+
+# the number of bytes at the start/end of the OP2 that are hashed
+NHASH_BYTES = 1024 ** 2
+
+
+def get_op2_hash(op2_filename: str) -> str:
+    """
+    Gets a hash of an OP2, which is used to name the result store.
+
+    Hashing a multi-GB file takes too long, so the hash is the size,
+    modification time and the first/last 1 MB (the header/subcases and
+    the last table) of the file.
+    """
+    stat = os.stat(op2_filename)
+    sha1 = hashlib.sha1()
+    sha1.update(f'{stat.st_size} {stat.st_mtime_ns} {pyNastran.__version__}'.encode('utf8'))
+    with open(op2_filename, 'rb') as op2_file:
+        sha1.update(op2_file.read(NHASH_BYTES))
+        if stat.st_size > 2 * NHASH_BYTES:
+            op2_file.seek(-NHASH_BYTES, os.SEEK_END)
+            sha1.update(op2_file.read(NHASH_BYTES))
+    return sha1.hexdigest()
+
+
+def get_geometry_hash(node_ids: Optional[np.ndarray],
+                      xyz: Optional[np.ndarray],
+                      element_ids: Optional[np.ndarray],
+                      connectivity: Optional[np.ndarray]) -> str:
+    """
+    Gets a hash of the model geometry, which is used to name the result
+    store, so an OP2 that's loaded on a different (e.g., renumbered or
+    remeshed) model doesn't use the fringes of the other model.
+
+    Parameters
+    ----------
+    node_ids : (nnode, ) int ndarray
+        the node ids
+    xyz : (nnode, 3) float ndarray
+        the node locations
+    element_ids : (nelement, ) int ndarray
+        the element ids
+    connectivity : (n, ) int ndarray
+        the element connectivity (e.g., the VTK offsets/connectivity)
+
+    """
+    sha1 = hashlib.sha1()
+    for array in [node_ids, xyz, element_ids, connectivity]:
+        if array is None:
+            sha1.update(b'None')
+            continue
+        array = np.ascontiguousarray(array)
+        sha1.update(f'{array.dtype.str} {array.shape}'.encode('utf8'))
+        sha1.update(array.tobytes())
+    return sha1.hexdigest()
+
+
+def get_default_result_store_dir() -> str:
+    """~/.pyNastran/result_store"""
+    return os.path.join(os.path.expanduser('~'), '.pyNastran', 'result_store')
+
+
+class ResultStore:
+    """
+    A persistent (HDF5) store of the derived GUI fringes/vectors of an
+    OP2 (e.g., von Mises, max principal, nodal averaged), which is used
+    under the in-memory ResultCache.  The first session writes each
+    computed case to the store; later sessions of the same OP2 read (or
+    memory-map) only the case that is displayed.
+
+    The file is named by the OP2 and geometry hashes, so a modified OP2
+    or model gets a new store.
+    """
+    def __init__(self, h5_filename: str, compression: Optional[str]=None,
+                 log: Optional[SimpleLogger]=None):
+        """
+        Parameters
+        ----------
+        h5_filename : str
+            the HDF5 file
+        compression : str; default=None
+            None : contiguous datasets, which are memory-mapped
+            'gzip', 'lzf' : chunked, compressed datasets, which are read
+        log : SimpleLogger; default=None
+            logs the store hits/writes at the debug level
+
+        """
+        assert IS_H5PY, 'h5py is required for the result store'
+        self.h5_filename = h5_filename
+        self.compression = compression
+        self.log = log
+        self.nreads = 0
+        self.nwrites = 0
+        self._h5_file = h5py.File(h5_filename, 'a')
+        self._h5_file.attrs['pyNastran_version'] = pyNastran.__version__
+
+    @classmethod
+    def from_op2_filename(cls, op2_filename: str,
+                          store_dir: Optional[str]=None,
+                          geometry_hash: str='',
+                          compression: Optional[str]=None,
+                          log: Optional[SimpleLogger]=None) -> ResultStore:
+        """
+        Opens the store of an OP2 (or creates it on the first load)
+
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 file
+        store_dir : str; default=None -> ~/.pyNastran/result_store
+            the directory of the stores
+        geometry_hash : str; default=''
+            the hash of the model (see get_geometry_hash)
+
+        """
+        if store_dir is None:
+            store_dir = get_default_result_store_dir()
+        os.makedirs(store_dir, exist_ok=True)
+        store_hash = get_op2_hash(op2_filename)
+        if geometry_hash:
+            store_hash += f'-{geometry_hash}'
+        h5_filename = os.path.join(store_dir, f'{store_hash}.h5')
+        is_new = not os.path.exists(h5_filename)
+        store = cls(h5_filename, compression=compression, log=log)
+        store._h5_file.attrs['op2_filename'] = os.path.abspath(op2_filename)
+        if log is not None:
+            nstored = len(store)
+            log.info(f'result store: {h5_filename!r} (new={is_new}; ncases={nstored})')
+        return store
+
+    @property
+    def is_open(self) -> bool:
+        return self._h5_file is not None
+
+    def __len__(self) -> int:
+        if self._h5_file is None:
+            return 0
+        return len(self._h5_file)
+
+    def __contains__(self, key: str) -> bool:
+        if self._h5_file is None:
+            return False
+        return _get_name(key) in self._h5_file
+
+    def get(self, key: str) -> Any:
+        """
+        Gets a stored value
+
+        Parameters
+        ----------
+        key : str
+            the stable (across sessions) key of the case
+
+        Returns
+        -------
+        value : ndarray / tuple[ndarray/None] / None
+            None : not stored or the store is closed
+
+        """
+        name = _get_name(key)
+        if self._h5_file is None or name not in self._h5_file:
+            return None
+        group = self._h5_file[name]
+        if group.attrs['key'] != key:  # pragma: no cover
+            # a hash collision
+            return None
+
+        values = []
+        for i in range(group.attrs['nvalues']):
+            namei = str(i)
+            values.append(self._read(group[namei]) if namei in group else None)
+        self.nreads += 1
+        if group.attrs['is_tuple']:
+            return tuple(values)
+        return values[0]
+
+    def _read(self, dataset) -> np.ndarray:
+        """memory-maps the contiguous datasets and reads the chunked ones"""
+        offset = dataset.id.get_offset()
+        if dataset.chunks is None and offset is not None:
+            # copy-on-write, so the cached array may be modified
+            return np.memmap(self.h5_filename, mode='c', dtype=dataset.dtype,
+                             shape=dataset.shape, offset=offset)
+        return dataset[()]
+
+    def add(self, key: str, value: Any) -> None:
+        """
+        Stores a value
+
+        Parameters
+        ----------
+        key : str
+            the stable (across sessions) key of the case
+        value : ndarray / tuple[ndarray/None]
+            the array(s); other values aren't stored
+
+        """
+        if self._h5_file is None:
+            return
+        is_tuple = isinstance(value, (tuple, list))
+        values = value if is_tuple else [value]
+        if not all(valuei is None or isinstance(valuei, np.ndarray) for valuei in values):
+            return
+
+        name = _get_name(key)
+        if name in self._h5_file:
+            del self._h5_file[name]
+        group = self._h5_file.create_group(name)
+        group.attrs['key'] = key
+        group.attrs['is_tuple'] = is_tuple
+        group.attrs['nvalues'] = len(values)
+        for i, valuei in enumerate(values):
+            if valuei is None:
+                continue
+            if self.compression is None or valuei.size == 0:
+                group.create_dataset(str(i), data=valuei)
+            else:
+                group.create_dataset(str(i), data=valuei, chunks=True,
+                                     compression=self.compression)
+        self._h5_file.flush()
+        self.nwrites += 1
+
+    def close(self) -> None:
+        """closes the HDF5 file; the memory-mapped arrays stay valid"""
+        if self._h5_file is not None:
+            self._h5_file.close()
+            self._h5_file = None
+
+    def get_stats(self) -> str:
+        return f'ncases={len(self)} reads={self.nreads} writes={self.nwrites}'
+
+    def __repr__(self) -> str:
+        return f'ResultStore({self.h5_filename!r}, {self.get_stats()})'
+
+
+def _get_name(key: str) -> str:
+    """the HDF5 group name of a key"""
+    return hashlib.sha1(key.encode('utf8')).hexdigest()
@@ -0,0 +1,189 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+import numpy as np
+from cpylog import SimpleLogger
+from pyNastran.gui.gui_objects.gui_result import LazyGuiResult
+from pyNastran.gui.gui_objects.result_cache import ResultCache
+from pyNastran.gui.gui_objects.result_store import (
+    ResultStore, get_op2_hash, get_geometry_hash, IS_H5PY)
+
+
+class TestResultCache(unittest.TestCase):
+    def test_result_cache(self):
+        """tests the LRU eviction and the hit/miss counters"""
+        log = SimpleLogger(level='warning')
+        ncalls = []
+        def func(itime: int, res_name: str) -> np.ndarray:
+            ncalls.append(itime)
+            return np.full(100, itime, dtype='float64')  # 800 bytes
+
+        cache = ResultCache(max_nbytes=2000, log=log)
+        fringe = cache.get((0, 'fringe'), func, 0, 'Displacement')
+        assert fringe[0] == 0.
+        fringe = cache.get((0, 'fringe'), func, 0, 'Displacement')
+        assert ncalls == [0], ncalls
+        assert (cache.nhits, cache.nmisses) == (1, 1)
+        assert cache.nbytes == 800, cache.nbytes
+
+        cache.get((1, 'fringe'), func, 1, 'Displacement')
+        # touch 0, so 1 is the least recently used
+        cache.get((0, 'fringe'), func, 0, 'Displacement')
+        cache.get((2, 'fringe'), func, 2, 'Displacement')
+        assert len(cache) == 2, len(cache)
+        assert (0, 'fringe') in cache
+        assert (1, 'fringe') not in cache
+        assert cache.nevictions == 1, cache.nevictions
+        assert cache.nbytes == 1600, cache.nbytes
+
+        # tuples of arrays are supported
+        cache.add((3, 'fringe_vector'), (np.zeros(10), None))
+        assert cache.nbytes == 1680, cache.nbytes
+
+        # too big to cache
+        cache.add((4, 'fringe'), np.zeros(1000))
+        assert (4, 'fringe') not in cache
+        str(cache)
+
+        cache.clear()
+        assert len(cache) == 0 and cache.nbytes == 0
+        assert cache.nmisses == 3, cache.nmisses
+
+    def test_result_cache_read_only(self):
+        """changing a returned value doesn't change the next hit"""
+        cache = ResultCache()
+        def func() -> tuple[np.ndarray, np.ndarray]:
+            return np.zeros(3), np.ones((3, 3))
+
+        fringe, vector = cache.get(0, func)
+        assert cache.nmisses == 1, cache.nmisses
+        with self.assertRaises(ValueError):
+            fringe[0] = 1.
+        with self.assertRaises(ValueError):
+            vector[:, 0] = 2.
+        fringe2 = fringe.copy()
+        fringe2[0] = 1.
+
+        fringe, vector = cache.get(0, func)
+        assert cache.nhits == 1, cache.nhits
+        assert np.array_equal(fringe, np.zeros(3))
+        assert np.array_equal(vector, np.ones((3, 3)))
+
+    def test_lazy_gui_result(self):
+        """the scalar is calculated when it's used and is dropped by the cache"""
+        ncalls = []
+        def get_scalar() -> np.ndarray:
+            ncalls.append(1)
+            return np.array([1., 2., np.inf, 4.], dtype='float32')
+
+        res = LazyGuiResult(1, 'Strain Energy: header', 'Strain Energy', 'centroid',
+                            get_scalar, data_format='%.3e')
+        assert res.get_legend_title(0, 'Strain Energy') == 'Strain Energy'
+        assert res.get_location(0, 'Strain Energy') == 'centroid'
+        assert len(ncalls) == 0, ncalls
+        str(res)
+
+        cache = ResultCache(max_nbytes=16)
+        res.result_cache = cache
+        assert res.get_min_max(0, 'Strain Energy') == (1., 4.)
+        assert len(ncalls) == 1, ncalls
+        assert res.get_data_format(0, 'Strain Energy') == '%.3e'
+        assert res.get_methods(0, 'Strain Energy') == ['centroid']
+        res.set_min_max(0, 'Strain Energy', 0., 10.)
+
+        fringe = res.get_fringe_result(0, 'Strain Energy')
+        assert np.isnan(fringe[2])
+        assert len(ncalls) == 1, ncalls
+
+        # evict it
+        cache.add('other', np.zeros(2))
+        assert len(cache) == 1, len(cache)
+        fringe = res.get_fringe_result(0, 'Strain Energy')
+        assert len(ncalls) == 2, ncalls
+        assert np.isnan(fringe[2])
+        assert res.get_min_max(0, 'Strain Energy') == (0., 10.)
+        assert res.get_default_min_max(0, 'Strain Energy') == (1., 4.)
+
+        # an int result with a mask and no cache
+        res = LazyGuiResult(1, 'IsAxial', 'IsAxial', 'centroid',
+                            lambda: np.array([-1, 0, 1], dtype='int8'), mask_value=-1)
+        assert res.get_data_format(0, 'IsAxial') == '%.0f'
+        assert res.get_default_min_max(0, 'IsAxial') == (0, 1)
+        assert np.isnan(res.scalar[0])
+        assert 'scalar' in res.__dict__
+        with self.assertRaises(AttributeError):
+            res.missing
+
+    @unittest.skipIf(not IS_H5PY, 'h5py is required')
+    def test_result_store(self):
+        """tests the persistent store under the LRU cache"""
+        log = SimpleLogger(level='warning')
+        ncalls = []
+        def func(itime: int, res_name: str) -> np.ndarray:
+            ncalls.append(itime)
+            return np.full(100, itime, dtype='float32')
+
+        with TemporaryDirectory() as dirname:
+            op2_filename = os.path.join(dirname, 'model.op2')
+            with open(op2_filename, 'wb') as op2_file:
+                op2_file.write(b'fake op2')
+            store_dir = os.path.join(dirname, 'store')
+
+            # the first session calculates the cases
+            store = ResultStore.from_op2_filename(op2_filename, store_dir=store_dir, log=log)
+            cache = ResultCache(log=log)
+            fringe = cache.get((0, 'fringe'), func, 1, 'Stress', store=store, store_key='1:Stress')
+            assert ncalls == [1], ncalls
+            store.add('vector', (np.zeros((3, 3)), None))
+            store.add('skipped', 'not an array')
+            assert len(store) == 2, len(store)
+            store.close()
+
+            # the second session reads them
+            store = ResultStore.from_op2_filename(op2_filename, store_dir=store_dir, log=log)
+            assert store.h5_filename.endswith(get_op2_hash(op2_filename) + '.h5')
+            cache = ResultCache(log=log)
+            fringe2 = cache.get((0, 'fringe'), func, 1, 'Stress', store=store, store_key='1:Stress')
+            assert ncalls == [1], ncalls
+            assert isinstance(fringe2, np.memmap)
+            assert np.array_equal(fringe2, fringe)
+            # read-only, so the memory-mapped store isn't changed
+            assert not fringe2.flags.writeable
+            vector = store.get('vector')
+            assert isinstance(vector, tuple) and vector[1] is None and vector[0].shape == (3, 3)
+            assert store.get('missing') is None
+            del fringe2
+            store.close()
+
+            # a closed store doesn't read/write
+            assert not store.is_open
+            assert len(store) == 0 and '1:Stress' not in store
+            assert store.get('1:Stress') is None
+            store.add('fringe', np.zeros(3))
+            store.close()
+
+            # a different model gets a different store
+            nids = np.array([1, 2, 3])
+            xyz = np.zeros((3, 3), dtype='float32')
+            eids = np.array([10])
+            geometry_hash = get_geometry_hash(nids, xyz, eids, np.array([0, 3, 0, 1, 2]))
+            geometry_hash2 = get_geometry_hash(nids, xyz, eids, np.array([0, 3, 0, 2, 1]))
+            assert geometry_hash != geometry_hash2
+            store = ResultStore.from_op2_filename(op2_filename, store_dir=store_dir,
+                                                  geometry_hash=geometry_hash, log=log)
+            assert store.h5_filename.endswith(f'{get_op2_hash(op2_filename)}-{geometry_hash}.h5')
+            assert len(store) == 0, len(store)
+            store.close()
+
+            # chunked and compressed
+            store = ResultStore(os.path.join(dirname, 'compressed.h5'), compression='gzip')
+            store.add('fringe', np.arange(1000.))
+            fringe3 = store.get('fringe')
+            assert not isinstance(fringe3, np.memmap)
+            assert np.array_equal(fringe3, np.arange(1000.))
+            str(store)
+            store.close()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -408,6 +408,8 @@ class MainWindow(GuiCommon, NastranIO):
         if hasattr(qsettings, 'save_json'):
             qsettings.save_json()
 
+        self.close_result_store()
+
         q_app = QApplication.instance()
         if q_app is None:
             sys.exit()
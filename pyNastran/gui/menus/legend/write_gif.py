@@ -3,10 +3,12 @@ Defines:
  - write_gif(gif_filename, png_filenames, time=2.0, fps=30,
               onesided=True, nrepeat=0,
               delete_images=False, make_gif=True)
+ - frames = get_animation_frames(scale, ...)
+ - write_animation(animation_filename, images, nframes, time=2.0, nrepeat=0)
 
 """
 import os
-from typing import Optional
+from typing import Iterable, Optional
 
 import numpy as np
 from pyNastran.utils import int_version
@@ -124,6 +126,71 @@ def setup_animation(scale, istep=None,
     return phases2, icases_fringe2, icases_disp2, icases_vector2, isteps2, scales2, analysis_time, onesided, endpoint
 
 
+def get_animation_frames(scale: float,
+                         animate_scale: bool=True,
+                         animate_phase: bool=False,
+                         animate_time: bool=False,
+                         icase_fringe=None, icase_disp=None, icase_vector=None,
+                         icase_fringe_start=None, icase_fringe_end=None, icase_fringe_delta=None,
+                         icase_disp_start=None, icase_disp_end=None, icase_disp_delta=None,
+                         icase_vector_start=None, icase_vector_end=None, icase_vector_delta=None,
+                         time: float=2.0, animation_profile: str='0 to scale',
+                         fps: int=30) -> list[tuple[int, Optional[int], Optional[int],
+                                                    Optional[int], float, float]]:
+    """
+    Gets the frame list of an animation (e.g., for an off-screen renderer)
+
+    Returns
+    -------
+    frames : list[(istep, icase_fringe, icase_disp, icase_vector, scale, phase)]
+        istep : int
+            the frame number
+        icase_fringe/disp/vector : int/None
+            the result cases of the frame
+        scale : float
+            the displacement scale factor; true scale
+        phase : float
+            the phase angle (degrees)
+
+    """
+    out = setup_animation(
+        scale, istep=None,
+        animate_scale=animate_scale, animate_phase=animate_phase, animate_time=animate_time,
+        icase_fringe=icase_fringe, icase_disp=icase_disp, icase_vector=icase_vector,
+        icase_fringe_start=icase_fringe_start, icase_fringe_end=icase_fringe_end,
+        icase_fringe_delta=icase_fringe_delta,
+        icase_disp_start=icase_disp_start, icase_disp_end=icase_disp_end,
+        icase_disp_delta=icase_disp_delta,
+        icase_vector_start=icase_vector_start, icase_vector_end=icase_vector_end,
+        icase_vector_delta=icase_vector_delta,
+        time=time, animation_profile=animation_profile,
+        fps=fps, animate_in_gui=False)
+    (phases, icases_fringe, icases_disp, icases_vector,
+     isteps, scales, unused_analysis_time, unused_onesided, unused_endpoint) = out
+
+    def _icase(icase) -> Optional[int]:
+        return None if icase is None else int(icase)
+
+    frames = [
+        (int(istep), _icase(icase_fringei), _icase(icase_dispi), _icase(icase_vectori),
+         float(scalei), float(phasei))
+        for istep, icase_fringei, icase_dispi, icase_vectori, scalei, phasei in zip(
+            isteps, icases_fringe, icases_disp, icases_vector, scales, phases)]
+    return frames
+
+
+def split_frames(nframes: int, nchunks: int) -> list[tuple[int, int]]:
+    """
+    Splits the frames into contiguous (istart, iend) ranges, so each
+    process renders one range.
+    """
+    nchunks = max(1, min(nchunks, nframes))
+    bounds = np.linspace(0, nframes, num=nchunks + 1).round().astype('int64')
+    chunks = [(int(istart), int(iend)) for istart, iend in zip(bounds[:-1], bounds[1:])
+              if iend > istart]
+    return chunks
+
+
 def fix_nframes(nframes: int, profile: str) -> int:
     """
     make sure we break at the "true scale" max
@@ -668,3 +735,58 @@ def write_gif(gif_filename: PathLike, png_filenames: list[PathLike], time: float
     if delete_images:
         remove_files(png_filenames)
     return True
+
+
+def write_animation(animation_filename: PathLike,
+                    images: Iterable[np.ndarray],
+                    nframes: int,
+                    time: float=2.0,
+                    nrepeat: int=0) -> bool:
+    """
+    Streams the frames into an animated gif/mp4, so the frames don't
+    need to be held in memory or written as png files
+
+    Parameters
+    ----------
+    animation_filename : str
+        the *.gif or *.mp4 file (mp4 requires imageio-ffmpeg)
+    images : Iterable[(ny, nx, 3) uint8 ndarray]
+        the frames in order
+    nframes : int
+        the number of frames; used to define the frame rate
+    time : float; default=2.0
+        the runtime of the animation (seconds)
+    nrepeat : int; default=0
+        0 : loop infinitely
+        1 : loop 1 time
+        only for gifs
+
+    Returns
+    -------
+    success : bool
+        was the animation made
+
+    """
+    if not IS_IMAGEIO:
+        return False
+    assert nframes > 0, nframes
+    dirname = os.path.dirname(os.path.abspath(animation_filename))
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    ext = os.path.splitext(str(animation_filename))[1].lower()
+    if ext == '.gif':
+        duration = time / nframes
+        writer = imageio.get_writer(animation_filename, mode='I',
+                                    duration=duration, loop=nrepeat)
+    elif ext == '.mp4':
+        fps = nframes / time
+        writer = imageio.get_writer(animation_filename, fps=fps)
+    else:
+        raise NotImplementedError(f'animation_filename={animation_filename!r}; '
+                                  'expected a *.gif or *.mp4')
+
+    with writer:
+        for image in images:
+            writer.append_data(image)
+    return True
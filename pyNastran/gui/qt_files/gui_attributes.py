@@ -27,6 +27,7 @@ from pyNastran import DEV
 from pyNastran.gui.typing import ColorFloat, Format
 from pyNastran.gui.vtk_rendering_core import vtkPolyDataMapper, vtkActor
 from pyNastran.gui.vtk_interface import vtkUnstructuredGrid
+from pyNastran.gui.vtk_util import vtk_to_numpy
 from pyNastran.gui.gui_objects.settings import Settings, FONT_SIZE_MIN, FONT_SIZE_MAX, force_ranged
 
 from pyNastran.gui.qt_files.vtk_actor_actions import VtkActorActions
@@ -37,6 +38,7 @@ from pyNastran.gui.qt_files.mouse_actions import MouseActions
 from pyNastran.gui.qt_files.load_actions import LoadActions
 from pyNastran.gui.qt_files.mark_actions import MarkActions
 from pyNastran.gui.utils.qt.pydialog import make_font
+from pyNastran.gui.utils.spatial_index import SpatialIndex
 
 from pyNastran.gui.menus.legend.legend_object import LegendObject
 from pyNastran.gui.menus.highlight.highlight_object import HighlightObject, MarkObject
@@ -58,7 +60,8 @@ from pyNastran.gui.menus.edit_geometry_properties.edit_geometry_properties_objec
 from pyNastran.gui.qt_files.base_gui import BaseGui
 from pyNastran.gui.utils.vtk.gui_utils import remove_actors_from_gui
 from pyNastran.gui.utils.vtk.vtk_utils import (
-    numpy_to_vtk_points, create_vtk_cells_of_constant_element_type)
+    numpy_to_vtk_points, create_vtk_cells_of_constant_element_type,
+    find_point_id_closest_to_xyz)
 
 from pyNastran.gui.menus.edit_geometry_properties.manage_actors import AltGeometry
 from pyNastran.bdf.cards.base_card import deprecated
@@ -155,6 +158,12 @@ class GuiAttributes:
 
         self.min_max_actors = []
 
+        # the node/element spatial index for picking and probing, which
+        # is rebuilt when the geometry changes (see spatial_index)
+        self._spatial_index = None
+        self._spatial_index_key = None
+        self._spatial_index_points_mtime = -1
+
         self.glyph_scale_factor = 1.0
         self.html_logging = False
 
@@ -168,6 +177,7 @@ class GuiAttributes:
         self.res_widget: ResultsSidebar = res_widget
         self._show_flag = True
         self.observers = {}
+        self.animation_callback = None
 
         # the gui is actually running
         # we set this to False when testing
@@ -682,6 +692,7 @@ class GuiAttributes:
             return skip_reading
         else:
             self.turn_corner_text_off()
+            self._reset_level_of_detail()
             self.grid.Reset()
 
             self.model_data.result_cases = {}
@@ -1722,6 +1733,86 @@ class GuiAttributes:
         nids2 = np.intersect1d(nids, group_nids)
         return nids2
 
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """
+        Gets the spatial index of the nodes/elements of the main model,
+        which is used for node picking and area picking and may be used
+        from the python console:
+
+        >>> nids, distance = self.spatial_index.nearest_nodes([0., 0., 1.], k=3)
+        >>> eids = self.spatial_index.elements_within_radius([0., 0., 1.], 0.5)
+        >>> eids = self.spatial_index.elements_in_box([0., 0., 0.], [1., 1., 1.])
+
+        The index is built on the first call.  It's rebuilt when the
+        topology changes and lazily updated when the model is deflected.
+        """
+        grid = self.grid
+        cells = grid.GetCells()
+        points = grid.GetPoints()
+        key = (id(grid), grid.GetNumberOfPoints(), grid.GetNumberOfCells(), cells.GetMTime())
+        if self._spatial_index is None or key != self._spatial_index_key:
+            node_ids = self.node_ids
+            element_ids = self.element_ids
+            if node_ids is None or len(node_ids) != grid.GetNumberOfPoints():
+                node_ids = None
+            if element_ids is None or len(element_ids) != grid.GetNumberOfCells():
+                element_ids = None
+            self._spatial_index = SpatialIndex.from_grid(
+                grid, node_ids=node_ids, element_ids=element_ids)
+            self._spatial_index_key = key
+            self._spatial_index_points_mtime = points.GetMTime()
+        elif points.GetMTime() != self._spatial_index_points_mtime:
+            # the model was deflected
+            self._spatial_index.update_xyz(vtk_to_numpy(points.GetData()))
+            self._spatial_index_points_mtime = points.GetMTime()
+        return self._spatial_index
+
+    def is_spatial_index_grid(self, grid: vtkUnstructuredGrid) -> bool:
+        """
+        Can the spatial index be used for picking on the grid?
+
+        The index holds the main grid, so a secondary grid or a group
+        (where the nodes of the hidden elements are still in the grid)
+        isn't supported.
+        """
+        return grid is self.grid and self.group_active == 'main'
+
+    def get_closest_point_id(self, grid: vtkUnstructuredGrid, cell_id: int,
+                             xyz: np.ndarray) -> Optional[int]:
+        """
+        Gets the point id of the node closest to a picked location
+
+        Parameters
+        ----------
+        grid : vtkUnstructuredGrid
+            the picked grid
+        cell_id : int
+            the picked cell; the closest node must be a node of the cell,
+            so it's searched if the spatial index finds a different node
+        xyz : (3, ) float ndarray
+            the picked location
+
+        Returns
+        -------
+        point_id : int / None
+            the point id in the grid
+
+        """
+        if self.is_spatial_index_grid(grid):
+            point_ids, unused_distance = self.spatial_index.nearest_nodes(
+                xyz, k=1, return_index=True)
+            point_id = int(point_ids[0])
+
+            # the closest node may belong to a different (e.g., hidden)
+            # element, so it must be a node of the picked cell
+            cell = grid.GetCell(cell_id)
+            if cell is not None:
+                cell_point_ids = [cell.GetPointId(i) for i in range(cell.GetNumberOfPoints())]
+                if point_id in cell_point_ids:
+                    return point_id
+        return find_point_id_closest_to_xyz(grid, cell_id, xyz)
+
     def get_reverse_node_ids(self, model_name=None, ids=None):
         """wrapper around node_ids"""
         if ids is None:
@@ -29,9 +29,11 @@ from pyNastran.gui.gui_objects.alt_geometry_storage import AltGeometry
 from pyNastran.gui.qt_files.gui_attributes import GuiAttributes
 from pyNastran.gui.qt_files.colors import RED_FLOAT, WHITE_FLOAT, BLUE_FLOAT
 #from pyNastran.gui.vtk_common_core import VTK_VERSION
+from pyNastran.gui.vtk_util import vtk_to_numpy
 from pyNastran.gui.utils.vtk.base_utils import numpy_to_vtk, VTK_VERSION_SPLIT
 from pyNastran.gui.utils.vtk.vtk_utils import numpy_to_vtk_points
 from pyNastran.gui.utils.vtk.gui_utils import numpy_array_to_vtk_array
+from pyNastran.gui.utils.vtk.lod import LodGeometry, LodInteractor
 from pyNastran.gui.utils.utils import is_blank
 #from pyNastran.gui import IS_DEV
 IS_TESTING = 'test' in sys.argv[0]
@@ -78,9 +80,56 @@ class GuiQtCommon(GuiAttributes):
         self._names_storage = NamesStorage()
 
         self.vtk_version = VTK_VERSION_SPLIT
+        self.lod_interactor: Optional[LodInteractor] = None
         #if not IS_TESTING or not pyNastran.is_pynastrangui_exe:  # pragma: no cover
             #print('vtk_version = %s' % (self.vtk_version))
 
+    def set_level_of_detail(self, is_lod: bool,
+                            target_reduction: float=0.9,
+                            skin_only: bool=True) -> None:
+        """
+        Turns on/off the level-of-detail (LOD) display for very large
+        models.  The solid elements are drawn with their exterior faces
+        and a decimated proxy is drawn while the camera is moving.
+
+        Parameters
+        ----------
+        is_lod : bool
+            turns the LOD on/off
+        target_reduction : float; default=0.9
+            the fraction of the skin triangles to remove for the proxy;
+            0.0 skips the proxy
+        skin_only : bool; default=True
+            show the skin (instead of the full grid) when the camera stops
+
+        """
+        if self.lod_interactor is not None:
+            self.lod_interactor.remove()
+            self.log_info(f'LOD frame times; {self.lod_interactor.frame_times.get_stats()}')
+            self.lod_interactor = None
+        if is_lod:
+            # the skin is built from the full grid, so groups are ignored
+            lod = LodGeometry(self.grid, target_reduction=target_reduction, log=self.log)
+            self.lod_interactor = LodInteractor(
+                self.grid_mapper, self.rend, self.vtk_interactor, lod,
+                skin_only=skin_only, log=self.log)
+            lod.sync()
+        self.vtk_interactor.Render()
+
+    def _reset_level_of_detail(self) -> None:
+        """
+        Turns off the LOD before the grid is reset for a new geometry.
+        The skin/proxy and their maps are built from the old grid.
+        """
+        if self.lod_interactor is not None:
+            self.log_info('turning off the level-of-detail display for the new geometry')
+            self.set_level_of_detail(False)
+
+    def _update_lod(self) -> None:
+        """maps the deflection/fringe onto the LOD geometry"""
+        if self.lod_interactor is not None:
+            self.lod_interactor.lod.sync()
+
     def _cycle_results(self, icase: int=0) -> None:
         """used for testing"""
         self.icase = icase
@@ -1545,6 +1594,7 @@ class GuiQtCommon(GuiAttributes):
         #self.update_all()
         if len(self.groups):
             self.post_group_by_name(self.group_active)
+        self._update_lod()
 
         self.vtk_interactor.Render()
 
@@ -1608,6 +1658,27 @@ class GuiQtCommon(GuiAttributes):
         self.grid_selected.Modified()
         self._update_follower_grids(nodes)
         self._update_follower_grids_complex(nodes)
+        self._update_lod()
+
+    def update_grid_inplace(self, nodes: np.ndarray) -> bool:
+        """
+        Deflects the geometry by writing into the existing vtkPoints,
+        which is used by the buffered animation.  Returns False if the
+        number of points doesn't match.
+        """
+        grid = self.grid
+        points = grid.GetPoints()
+        xyz = vtk_to_numpy(points.GetData())
+        if xyz.shape != nodes.shape:
+            return False
+        xyz[:] = nodes
+        points.Modified()
+        grid.Modified()
+        self.grid_selected.Modified()
+        self._update_follower_grids(nodes)
+        self._update_follower_grids_complex(nodes)
+        self._update_lod()
+        return True
 
     def _update_follower_grids(self, nodes: np.ndarray) -> None:
         """updates grids that use the same ids as the parent model"""
@@ -5,6 +5,8 @@ import time as time_module
 from typing import Optional, Any, cast, Callable, TYPE_CHECKING
 
 import numpy as np
+from qtpy.QtCore import Qt, QEventLoop, QTimer
+from qtpy.QtWidgets import QProgressDialog
 from qtpy.compat import getopenfilename
 
 from pyNastran.utils import check_path, print_bad_path
@@ -19,6 +21,7 @@ from pyNastran.gui.utils.load_results import (
     load_user_geom,
 )
 from pyNastran.gui.qt_files.user_geometry import add_user_geometry
+from pyNastran.gui.utils.background_loader import BackgroundLoader, LoadCancelled
 from pyNastran.gui.utils.vtk.vtk_utils import (
     create_vtk_cells_of_constant_element_type, numpy_to_vtk_points)
 
@@ -147,6 +150,9 @@ class LoadActions(BaseGui):
                                    #"args[-1]=%r" % (name, args[-1]))
                     #has_results = load_function(infile_name) # , self.last_dir
                     #form, cases = load_function(infile_name) # , self.last_dir
+            except LoadCancelled:
+                gui.log_info(f'cancelled loading {infile_name!r}')
+                return
             except Exception as error:
                 #raise
                 msg = traceback.format_exc()
@@ -363,6 +369,9 @@ class LoadActions(BaseGui):
 
             try:
                 load_function(out_filenamei)
+            except LoadCancelled:
+                gui.log_info(f'cancelled loading {out_filenamei!r}')
+                return
             except Exception: #  as e
                 msg = traceback.format_exc()
                 gui.log_error(msg)
@@ -986,6 +995,71 @@ class LoadActions(BaseGui):
             gui.res_widget.update_results(form, 'main')
 
     #---------------------------------------------------------------------------
+    def run_in_background(self, title: str, func: Callable[..., Any]) -> Any:
+        """
+        Runs the slow, VTK-free part of a load (e.g., reading an OP2) in a
+        worker thread, while the GUI keeps processing events.  The log
+        messages are shown in the status bar and the load may be cancelled.
+
+        Parameters
+        ----------
+        title : str
+            the title of the progress dialog
+        func : Callable
+            ``func(log=log)`` does the load; it must not touch VTK/Qt
+
+        Returns
+        -------
+        result : Any
+            the result of func
+
+        Raises
+        ------
+        LoadCancelled : the user cancelled the load
+
+        """
+        gui: MainWindow = self.gui
+        if not gui.is_gui:
+            # testing; there is no event loop
+            return func(log=gui.log)
+
+        status_bar = gui.statusBar()
+        dialog = QProgressDialog(title, 'Cancel', 0, 0, gui)  # busy indicator
+        dialog.setWindowTitle(title)
+        dialog.setWindowModality(Qt.WindowModal)
+        dialog.setMinimumDuration(500)
+
+        def on_progress(msg: str) -> None:
+            msg = msg.strip().split('\n')[0][:120]
+            dialog.setLabelText(f'{title}\n{msg}')
+            status_bar.showMessage(msg)
+
+        loader = BackgroundLoader(func, gui.log, on_progress=on_progress)
+        dialog.canceled.connect(loader.cancel)
+
+        # run a local event loop until the worker is done, so the GUI
+        # stays responsive and the VTK hand-off is on the GUI thread
+        loop = QEventLoop()
+        timer = QTimer()
+        def on_timeout() -> None:
+            if loader.poll():
+                timer.stop()
+                loop.quit()
+        timer.timeout.connect(on_timeout)
+
+        time0 = time_module.time()
+        loader.start()
+        timer.start(100)
+        loop.exec_()
+
+        dialog.canceled.disconnect(loader.cancel)
+        dialog.reset()
+        dialog.deleteLater()
+        dt = time_module.time() - time0
+        msg = 'Cancelled' if loader.is_cancelled else f'{title}: {dt:.2f} sec'
+        status_bar.showMessage(msg)
+        return loader.get_result()
+
     def create_load_file_dialog(self, qt_wildcard: str, title: str,
                                 default_filename: str='') -> tuple[str, str]:
         #options = QFileDialog.Options()
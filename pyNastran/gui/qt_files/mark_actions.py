@@ -12,7 +12,6 @@ from vtkmodules.vtkFiltersExtraction import vtkExtractSelection
 from pyNastran.gui.vtk_rendering_core import vtkBillboardTextActor3D
 
 from pyNastran.utils.numpy_utils import integer_types
-from pyNastran.gui.vtk_common_core import vtkMath
 from pyNastran.gui.utils.vtk.vtk_utils import numpy_to_vtk_points, create_unstructured_point_grid
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.gui.main_window import MainWindow
@@ -60,41 +59,10 @@ class MarkActions:
         result_name = self.gui.result_name
 
         grid = self.gui.grid_selected
-        cell = grid.GetCell(cell_id)
-        if cell is None:
+        node_id = self.gui.get_closest_point_id(grid, cell_id, node_xyz)
+        if node_id is None:
             return
-        #if cell is None:
-            #print('cell_id = %s' % cell)
-            #self.log.error('cell_id = %s' % cell)
-            #return
-        nnodes = cell.GetNumberOfPoints()
-        points = cell.GetPoints()
-
-        #node_xyz = array(node_xyz, dtype='float32')
-        #point0 = array(points.GetPoint(0), dtype='float32')
-        #dist_min = norm(point0 - node_xyz)
-
-        try:
-            point0 = points.GetPoint(0)
-        except ValueError:
-            #ValueError: expects 0 <= id && id < GetNumberOfPoints()
-            return None
-        dist_min = vtkMath.Distance2BetweenPoints(point0, node_xyz)
-
-        point_min = point0
-        imin = 0
-        for ipoint in range(1, nnodes):
-            #point = array(points.GetPoint(ipoint), dtype='float32')
-            #dist = norm(point - node_xyz)
-            point = points.GetPoint(ipoint)
-            dist = vtkMath.Distance2BetweenPoints(point, node_xyz)
-            if dist < dist_min:
-                dist_min = dist
-                imin = ipoint
-                point_min = point
-
-        node_id = cell.GetPointId(imin)
-        xyz = np.array(point_min, dtype='float32')
+        xyz = np.array(grid.GetPoint(node_id), dtype='float32')
         case = self.gui.result_cases[case_key]
         assert isinstance(case_key, integer_types), case_key
         (obj, (i, res_name)) = case
@@ -29,11 +29,11 @@ from pyNastran.gui.styles.zoom_style import ZoomStyle
 #from pyNastran.gui.styles.probe_style import ProbeResultStyle
 from pyNastran.gui.styles.rotation_center_style import RotationCenterStyle
 from pyNastran.gui.styles.trackball_style_camera import TrackballStyleCamera, JoystickStyleCamera
-from pyNastran.gui.utils.vtk.vtk_utils import (
-        find_point_id_closest_to_xyz, create_vtk_selection_node_by_cell_ids)
+from pyNastran.gui.utils.vtk.vtk_utils import create_vtk_selection_node_by_cell_ids
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.gui.gui import MainWindow
+    from pyNastran.gui.utils.spatial_index import SpatialIndex
 
 
 class MouseActions:
@@ -558,7 +558,7 @@ class MouseActions:
 
     def _highlight_picker_node(self, cell_id: int, grid, node_xyz) -> vtkLODActor:
         """won't handle multiple cell_ids/node_xyz"""
-        point_id = find_point_id_closest_to_xyz(grid, cell_id, node_xyz)
+        point_id = self.gui.get_closest_point_id(grid, cell_id, node_xyz)
 
         ids = vtkIdTypeArray()
         ids.SetNumberOfComponents(1)
@@ -936,6 +936,13 @@ class MouseActions:
     def grid(self):
         return self.gui.grid
 
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        return self.gui.spatial_index
+
+    def is_spatial_index_grid(self, grid: vtkUnstructuredGrid) -> bool:
+        return self.gui.is_spatial_index_grid(grid)
+
     @property
     def node_ids(self) -> np.ndarray:
         return self.gui.node_ids
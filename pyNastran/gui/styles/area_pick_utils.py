@@ -70,6 +70,16 @@ def get_actors_by_area_picker(gui: MainWindow, area_picker: vtkAreaPicker,
     return actors, eids, nids
 
 
+def get_frustum_planes(frustum: vtkPlanes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the (6, 3) outward normals and origins of an area pick frustum,
+    which are passed to ``SpatialIndex.nodes_in_frustum``.
+    """
+    normals = vtk_to_numpy(frustum.GetNormals()).copy()
+    origins = vtk_to_numpy(frustum.GetPoints().GetData()).copy()
+    return normals, origins
+
+
 def get_depth_ids(gui: MainWindow,
                   frustum: vtkPlanes,
                   model_name: str='main',
@@ -79,6 +89,9 @@ def get_depth_ids(gui: MainWindow,
     """
     Picks the nodes and/or elements.  Only one grid (e.g., the elements)
     is currently returned.
+
+    The main grid is picked with the spatial index.  Other grids use the
+    VTK frustum extraction.
     """
     #len(gui.node_ids)
     #2675
@@ -88,6 +101,11 @@ def get_depth_ids(gui: MainWindow,
     #Number Of Points: 2675
     #Number Of Cells: 2657
     grid = gui.get_grid_selected(model_name)
+    if gui.is_spatial_index_grid(grid):
+        return get_depth_ids_by_spatial_index(
+            gui, grid, frustum, model_name=model_name,
+            is_nids=is_nids, is_eids=is_eids,
+            representation=representation)
 
     #Number Of Points: 2675
     #Number Of Cells: 2657
@@ -137,6 +155,59 @@ def get_depth_ids(gui: MainWindow,
     return ugrid, eids, nids
 
 
+def get_depth_ids_by_spatial_index(gui: MainWindow,
+                                   grid: vtkUnstructuredGrid,
+                                   frustum: vtkPlanes,
+                                   model_name: str='main',
+                                   is_nids: bool=True,
+                                   is_eids: bool=True,
+                                   representation: str='points') -> tuple[vtkUnstructuredGrid, np.ndarray, np.ndarray]:
+    """
+    Picks the nodes and/or elements inside the frustum with the spatial
+    index.  An element is picked if it's not entirely outside one of
+    the frustum planes (see ``SpatialIndex.elements_in_frustum``).
+
+    As with the VTK frustum extraction, the highlighted grid is:
+     - the picked elements
+     - the picked nodes for representation='points'
+     - the elements in the frustum for the other representations
+
+    """
+    normals, origins = get_frustum_planes(frustum)
+    spatial_index = gui.spatial_index
+
+    eids = None
+    if is_eids:
+        cell_ids = spatial_index.elements_in_frustum(
+            normals, origins, overlap=True, return_index=True)
+        eids = gui.get_element_ids(model_name, cell_ids)
+
+    # an empty grid is highlighted if nothing is picked
+    point_ids = np.zeros(0, dtype='int64')
+    nids = None
+    if is_nids:
+        point_ids = spatial_index.nodes_in_frustum(normals, origins, return_index=True)
+        nids = gui.get_node_ids(model_name, point_ids)
+
+    highlighted_eids = []
+    if is_eids and len(eids):
+        highlighted_eids = eids
+    elif is_nids and representation != 'points':
+        cell_ids = spatial_index.elements_in_frustum(
+            normals, origins, overlap=True, return_index=True)
+        highlighted_eids = gui.get_element_ids(model_name, cell_ids)
+
+    if len(highlighted_eids):
+        unused_ugrid_node, ugrid = create_highlighted_ugrids(
+            gui, grid,
+            all_elements=gui.element_ids, elements=highlighted_eids,
+            set_element_scalars=True)
+    else:
+        points = numpy_to_vtk_points(spatial_index.xyz[point_ids, :])
+        ugrid = create_unstructured_point_grid(points, len(point_ids))
+    return ugrid, eids, nids
+
+
 def get_inside_point_ids(gui, ugrid: vtkUnstructuredGrid,
                          ugrid_flipped: vtkUnstructuredGrid,
                          model_name: str,
@@ -19,7 +19,6 @@ from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.gui.utils.vtk.vtk_utils import (
     extract_selection_node_from_grid_to_ugrid,
-    find_point_id_closest_to_xyz,
     create_vtk_selection_node_by_point_ids,
     create_vtk_selection_node_by_cell_ids)
 
@@ -131,7 +130,7 @@ class HighlightStyle(vtkInteractorStyleTrackballCamera):  # works
 
     def _highlight_picker_node(self, cell_id, grid, node_xyz, add_actor=True):
         """won't handle multiple cell_ids/node_xyz"""
-        point_id = find_point_id_closest_to_xyz(grid, cell_id, node_xyz)
+        point_id = self.parent.gui.get_closest_point_id(grid, cell_id, node_xyz)
         selection_node = create_vtk_selection_node_by_point_ids([point_id])
         ugrid = extract_selection_node_from_grid_to_ugrid(grid, selection_node)
         actor = self.parent.create_highlighted_actor(
@@ -2,7 +2,9 @@
 import os
 import shutil
 import unittest
+from functools import partial
 import numpy as np
+from cpylog import SimpleLogger
 
 try:
     import matplotlib.pyplot as plt
@@ -17,7 +19,19 @@ from pyNastran.gui.utils.version import check_for_newer_version
 from pyNastran.gui.utils.utils import find_next_value_in_sorted_list
 
 from pyNastran.gui.menus.legend.write_gif import (
-    setup_animation, make_two_sided, make_symmetric, write_gif, IS_IMAGEIO)
+    setup_animation, make_two_sided, make_symmetric, write_gif, IS_IMAGEIO,
+    get_animation_frames, split_frames)
+from pyNastran.gui.utils.skin import get_exterior_faces, get_skin_cells
+from pyNastran.gui.utils.spatial_index import SpatialIndex
+from pyNastran.gui.utils.background_loader import BackgroundLoader, LoadCancelled
+from pyNastran.gui.utils.vtk.animation_callback import (
+    AnimationCallback, get_buffered_frames, build_animation_buffers)
+from pyNastran.gui.utils.vtk.lod import LodGeometry
+from pyNastran.gui.utils.vtk.vtk_utils import numpy_to_vtk_points
+from pyNastran.gui.vtk_common_core import vtkUnsignedCharArray
+from pyNastran.gui.vtk_interface import vtkUnstructuredGrid, vtkCellArray
+from pyNastran.gui.vtk_util import numpy_to_vtk, vtk_to_numpy, numpy_to_vtkIdTypeArray
+from pyNastran.gui.gui_objects.displacements import DisplacementResults
 from pyNastran.gui.menus.results_sidebar_utils import get_cases_from_tree, build_pruned_tree
 
 PKG_PATH = pyNastran.__path__[0]
@@ -540,6 +554,315 @@ class GuiUtils(unittest.TestCase):
         assert np.allclose(phases[0], 0.), phases
         assert np.allclose(phases[-1], 354.), phases
 
+    def test_animation_frames(self):
+        """tests the frame list for the off-screen renderer"""
+        frames = get_animation_frames(
+            2.0, animate_scale=True,
+            icase_fringe=3, icase_disp=4,
+            time=1.0, animation_profile='0 to scale', fps=5)
+        assert len(frames) == 5, frames
+        istep, icase_fringe, icase_disp, icase_vector, scale, phase = frames[-1]
+        assert (icase_fringe, icase_disp, icase_vector) == (3, 4, None)
+        assert np.allclose(scale, 2.0) and phase == 0.
+
+        frames = get_animation_frames(
+            1.0, animate_scale=False, animate_time=True,
+            icase_disp_start=1, icase_disp_end=10, icase_disp_delta=2,
+            time=2.0, fps=30)
+        assert [frame[2] for frame in frames] == [1, 3, 5, 7, 9], frames
+        assert [frame[1] for frame in frames] == [1, 3, 5, 7, 9], frames
+
+        assert split_frames(10, 3) == [(0, 3), (3, 7), (7, 10)]
+        assert split_frames(2, 8) == [(0, 1), (1, 2)]
+        assert split_frames(5, 1) == [(0, 5)]
+
+    def test_skin_cells(self):
+        """tests the exterior faces of 2 HEXAs, a TETRA, and a QUAD"""
+        hexa1 = [0, 1, 2, 3, 4, 5, 6, 7]
+        hexa2 = [4, 5, 6, 7, 8, 9, 10, 11]
+        tetra = [8, 9, 10, 12]
+        quad = [0, 1, 2, 3]
+        cell_type = np.array([12, 12, 10, 9])
+        connectivity = np.array(hexa1 + hexa2 + tetra + quad)
+        offsets = np.array([0, 8, 16, 20, 24])
+
+        faces, face_cell = get_exterior_faces(cell_type, connectivity, offsets)
+        # 2 hexas share a face: 2*6 - 2 = 10
+        # the hexa/tetra share a tri face, which is not a shared face
+        assert len(faces) == 10 + 4, faces
+        assert np.array_equal(np.bincount(face_cell, minlength=4), [5, 5, 4, 0])
+        assert np.sum(faces[:, 3] == -1) == 4
+        assert not np.any(np.all(np.sort(faces, axis=1) == [4, 5, 6, 7], axis=1))
+
+        skin_type, skin_connectivity, skin_offsets, skin_cell_map = get_skin_cells(
+            cell_type, connectivity, offsets)
+        assert np.array_equal(skin_type[:1], [9]), skin_type
+        assert np.array_equal(skin_connectivity[:4], quad)
+        assert np.array_equal(skin_cell_map[:1], [3])
+        assert len(skin_type) == 15 and len(skin_offsets) == 16
+        assert skin_offsets[-1] == len(skin_connectivity) == 4 + 10 * 4 + 4 * 3
+
+        # mapping a centroidal result
+        eids = np.array([11, 12, 13, 14])
+        assert np.array_equal(np.unique(eids[skin_cell_map]), [11, 12, 13, 14])
+
+    def test_lod_geometry(self):
+        """tests the skin/proxy maps of a 2x2x2 block of HEXAs"""
+        x, y, z = np.meshgrid(np.arange(3.), np.arange(3.), np.arange(3.), indexing='ij')
+        xyz = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+        def inode(i, j, k):
+            return 9 * i + 3 * j + k
+
+        connectivity = []
+        for i in range(2):
+            for j in range(2):
+                for k in range(2):
+                    connectivity.extend([
+                        inode(i, j, k), inode(i+1, j, k), inode(i+1, j+1, k), inode(i, j+1, k),
+                        inode(i, j, k+1), inode(i+1, j, k+1), inode(i+1, j+1, k+1), inode(i, j+1, k+1)])
+        grid = vtkUnstructuredGrid()
+        grid.SetPoints(numpy_to_vtk_points(xyz))
+        cells = vtkCellArray()
+        cells.SetData(numpy_to_vtkIdTypeArray(np.arange(9, dtype='int64') * 8, deep=1),
+                      numpy_to_vtkIdTypeArray(np.array(connectivity, dtype='int64'), deep=1))
+        grid.SetCells(
+            numpy_to_vtk(np.full(8, 12, dtype='uint8'), deep=1,
+                         array_type=vtkUnsignedCharArray().GetDataType()), cells)
+
+        lod = LodGeometry(grid, target_reduction=0.0)
+        assert lod.proxy is None
+        assert lod.skin_grid.GetNumberOfCells() == 24
+        assert np.array_equal(np.unique(lod.skin_cell_map), np.arange(8))
+        assert lod.map_point_result(np.arange(27)) is None
+
+        lod = LodGeometry(grid, target_reduction=0.5)
+        assert lod.proxy is not None
+        nproxy = lod.proxy.GetNumberOfCells()
+        assert 0 < nproxy < 48, nproxy
+        proxy_xyz = vtk_to_numpy(lod.proxy.GetPoints().GetData())
+        assert np.allclose(proxy_xyz, xyz[lod.proxy_point_map])
+        assert len(lod.proxy_cell_map) == nproxy
+        assert lod.proxy_cell_map.min() >= 0 and lod.proxy_cell_map.max() < 8
+
+        # centroidal result
+        eids = np.arange(8) + 101.
+        cell_array = numpy_to_vtk(eids, deep=1)
+        cell_array.SetName('eids')
+        grid.GetCellData().SetScalars(cell_array)
+        lod.sync()
+        skin_eids = vtk_to_numpy(lod.skin_grid.GetCellData().GetScalars())
+        proxy_eids = vtk_to_numpy(lod.proxy.GetCellData().GetScalars())
+        assert np.array_equal(skin_eids, eids[lod.skin_cell_map])
+        assert np.array_equal(proxy_eids, eids[lod.proxy_cell_map])
+
+        # nodal result
+        grid.GetCellData().SetScalars(None)
+        nids = np.arange(27) + 1.
+        point_array = numpy_to_vtk(nids, deep=1)
+        point_array.SetName('nids')
+        grid.GetPointData().SetScalars(point_array)
+        lod.sync()
+        assert lod.skin_grid.GetCellData().GetScalars() is None
+        assert lod.proxy.GetCellData().GetScalars() is None
+        proxy_nids = vtk_to_numpy(lod.proxy.GetPointData().GetScalars())
+        assert np.array_equal(proxy_nids, nids[lod.proxy_point_map])
+
+        # deflected shape
+        lod.update_points(xyz + 1.)
+        proxy_xyz = vtk_to_numpy(lod.proxy.GetPoints().GetData())
+        assert np.allclose(proxy_xyz, xyz[lod.proxy_point_map] + 1.)
+
+    def test_spatial_index(self):
+        """tests the picking/probing queries on a 3x3 grid of QUADs"""
+        x, y = np.meshgrid(np.arange(4.), np.arange(4.))
+        xyz = np.column_stack([x.ravel(), y.ravel(), np.zeros(16)])
+        node_ids = np.arange(16) + 101
+        connectivity = []
+        for j in range(3):
+            for i in range(3):
+                n1 = 4 * j + i
+                connectivity.extend([n1, n1 + 1, n1 + 5, n1 + 4])
+        offsets = np.arange(10) * 4
+        element_ids = np.arange(9) + 1
+        index = SpatialIndex(xyz, node_ids, np.array(connectivity), offsets, element_ids)
+        assert np.allclose(index.centroids[0], [0.5, 0.5, 0.])
+
+        nids, distance = index.nearest_nodes([0.1, 0.1, 0.], k=1)
+        assert np.array_equal(nids, [101]), nids
+        assert np.allclose(distance, [0.1 * 2 ** 0.5])
+        eids, unused_distance = index.nearest_elements([2.4, 2.6, 1.], k=2)
+        assert eids[0] == 9, eids
+
+        assert np.array_equal(index.nodes_within_radius([0., 0., 0.], 1.01), [101, 102, 105])
+        # the element bounding boxes touching a small sphere at a shared node
+        assert np.array_equal(index.elements_within_radius([1., 1., 0.], 0.01), [1, 2, 4, 5])
+
+        assert np.array_equal(index.nodes_in_box([-1., -1., -1.], [1., 0.5, 1.]), [101, 102])
+        assert np.array_equal(index.elements_in_box([0., 0., 0.], [1.5, 1.5, 0.]), [1, 2, 4, 5])
+        assert np.array_equal(index.elements_in_box([0., 0., 0.], [1.5, 1.5, 0.], inside=True), [1])
+
+        # x <= 1.4 and y <= 1.4 with outward normals
+        normals = [[1., 0., 0.], [0., 1., 0.]]
+        origins = [[1.4, 0., 0.], [0., 1.4, 0.]]
+        assert np.array_equal(index.nodes_in_frustum(normals, origins), [101, 102, 105, 106])
+        assert np.array_equal(index.elements_in_frustum(normals, origins), [1])
+        assert np.array_equal(index.elements_in_frustum(normals, origins, overlap=True), [1, 2, 4, 5])
+
+        # 1.2 <= x <= 1.4 crosses the middle column without a node inside
+        slab_normals = [[1., 0., 0.], [-1., 0., 0.]]
+        slab_origins = [[1.4, 0., 0.], [1.2, 0., 0.]]
+        assert len(index.nodes_in_frustum(slab_normals, slab_origins)) == 0
+        assert np.array_equal(index.elements_in_frustum(slab_normals, slab_origins, overlap=True), [2, 5, 8])
+
+        # the 0-based indices used for picking
+        inode, unused_distance = index.nearest_nodes([0.1, 0.1, 0.], k=1, return_index=True)
+        assert np.array_equal(inode, [0]), inode
+        assert np.array_equal(index.nodes_in_frustum(normals, origins, return_index=True), [0, 1, 4, 5])
+        assert np.array_equal(index.elements_in_frustum(normals, origins, return_index=True), [0])
+
+        # deflect the model, which rebuilds the trees
+        index.update_xyz(xyz + [10., 0., 0.])
+        nids, unused_distance = index.nearest_nodes([10., 0., 0.], k=1)
+        assert np.array_equal(nids, [101]), nids
+        assert np.array_equal(index.elements_in_box([10., 0., 0.], [11., 1., 0.], inside=True), [1])
+
+    def test_background_loader(self):
+        """tests the worker thread loading"""
+        messages = []
+        def log_func(typ, filename, lineno, msg):
+            messages.append((typ, msg))
+        log = SimpleLogger(level='debug', log_func=log_func)
+
+        def read(nlines, log=None):
+            for i in range(nlines):
+                log.debug(f'line {i}')
+            return nlines
+
+        progress = []
+        loader = BackgroundLoader(partial(read, 3), log, on_progress=progress.append)
+        assert loader.run() == 3
+        assert messages == [('DEBUG', 'line 0'), ('DEBUG', 'line 1'), ('DEBUG', 'line 2')], messages
+        assert progress == ['line 2'], progress
+
+        # the worker stops at the next log message
+        loader = BackgroundLoader(partial(read, 3), log)
+        loader.cancel()
+        with self.assertRaises(LoadCancelled):
+            loader.run()
+        assert loader.is_cancelled
+
+        # the log of the loaded model now logs directly
+        loader.log.info('done')
+        assert messages[-1] == ('INFO', 'done'), messages
+
+    def test_animation_buffers(self):
+        """tests the precomputed animation frames"""
+        xyz = np.array([[0., 0., 0.], [1., 0., 0.], [1., 1., 0.]])
+        dxyz = np.zeros((2, 3, 3))
+        dxyz[0, :, 2] = 1.
+        dxyz[1, :, 2] = [1., 2., 3.]
+        disp = DisplacementResults(1, ['T1', 'T2'], ['T1', 'T2'], xyz, dxyz, None, [1., 1.])
+        result_cases = {
+            0: (disp, (0, 'T1')),
+            1: (disp, (1, 'T2')),
+        }
+        scales = np.array([0., 0.5, 1.0, 2.0])
+        phases = np.zeros(4)
+        icases_disp = [0, 0, 1, None]
+        buffers = build_animation_buffers(
+            result_cases, scales, phases, icases_disp)
+        assert buffers.xyz.shape == (4, 3, 3), buffers.xyz.shape
+        assert buffers.xyz.dtype.name == 'float32'
+        assert np.allclose(buffers.xyz[0], xyz)
+        assert np.allclose(buffers.xyz[1, :, 2], 0.5)
+        assert np.allclose(buffers.xyz[2, :, 2], [1., 2., 3.])
+        assert np.allclose(buffers.xyz[3], xyz)
+
+        # stream the frames from a memmap
+        buffers = build_animation_buffers(
+            result_cases, scales, phases, icases_disp, max_nbytes=0)
+        assert isinstance(buffers.xyz, np.memmap), buffers
+        assert np.allclose(buffers.xyz[2, :, 2], [1., 2., 3.])
+        str(buffers)
+        file_obj = buffers.file_obj
+        buffers.close()
+        assert buffers.xyz is None and file_obj.closed
+
+        # a changed result case updates the fringe/legend
+        is_buffered = get_buffered_frames(
+            [0, 0, 1, 1], icases_disp, [None] * 4, animate_fringe=False)
+        assert np.array_equal(is_buffered, [False, True, False, False]), is_buffered
+        is_buffered = get_buffered_frames(
+            [0, 0, 0, 0], [0, 0, 0, 0], [None] * 4, animate_fringe=True)
+        assert not is_buffered.any(), is_buffered
+
+    def test_animation_callback(self):
+        """drives the in-GUI animation over several frames"""
+        class FakeInteractor:
+            def Render(self):
+                pass
+
+        class FakeGui:
+            def __init__(self):
+                self.vtk_interactor = FakeInteractor()
+                self.xyz = np.zeros((3, 3), dtype='float32')
+                self.frames = []
+                self.is_stopped = False
+
+            def animation_update(self, icase_fringe0, icase_disp0, icase_vector0,
+                                 icase_fringe, icase_disp, icase_vector,
+                                 scale, phase, *args):
+                self.frames.append(('update', icase_fringe, icase_disp, scale))
+                self.xyz = disp.get_vector_result_by_scale_phase(
+                    icase_disp, 'T', scale, phase)[1].astype('float32')
+                return True
+
+            def update_grid_inplace(self, nodes):
+                if nodes.shape != self.xyz.shape:
+                    return False
+                self.frames.append(('inplace', nodes[0, 2]))
+                self.xyz[:] = nodes
+                return True
+
+            def stop_animation(self):
+                self.is_stopped = True
+
+        xyz = np.array([[0., 0., 0.], [1., 0., 0.], [1., 1., 0.]])
+        dxyz = np.zeros((2, 3, 3))
+        dxyz[:, :, 2] = 1.
+        disp = DisplacementResults(1, ['T1', 'T2'], ['T1', 'T2'], xyz, dxyz, None, [1., 1.])
+        result_cases = {0: (disp, (0, 'T')), 1: (disp, (1, 'T'))}
+
+        # a scale animation of case 0; the fringe changes on the last frame
+        scales = np.array([0., 1., 2., 3.])
+        phases = np.zeros(4)
+        icases_fringe = [0, 0, 0, 1]
+        icases_disp = [0, 0, 0, 0]
+        icases_vector = [None] * 4
+        buffers = build_animation_buffers(result_cases, scales, phases, icases_disp)
+        gui = FakeGui()
+        callback = AnimationCallback(
+            gui, scales, phases, icases_fringe, icases_disp, icases_vector,
+            False, False, None, None, buffers=buffers)
+        for unused_i in range(8):
+            callback.execute(None, None)
+            assert np.allclose(gui.xyz[:, 2], scales[(callback.timer_count - 1) % 4])
+        assert gui.frames == [
+            ('update', 0, 0, 0.), ('inplace', 1.), ('inplace', 2.), ('update', 1, 0, 3.),
+            ('update', 0, 0, 0.), ('inplace', 1.), ('inplace', 2.), ('update', 1, 0, 3.),
+        ], gui.frames
+
+        # the grid was reloaded, so the buffers don't fit
+        callback.execute(None, None)
+        gui.frames = []
+        gui.xyz = np.zeros((2, 3), dtype='float32')
+        callback.execute(None, None)
+        assert gui.frames == [('update', 0, 0, 1.)], gui.frames
+        assert not gui.is_stopped
+
+        callback.close()
+        assert callback.buffers is None and not callback.is_buffered.any()
+
     def test_animation_time_disp(self):
         """time plot"""
         scale = 1.0
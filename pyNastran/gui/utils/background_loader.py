@@ -0,0 +1,188 @@
+"""
+Runs the slow, VTK-free part of a load (e.g., reading/cross-referencing a
+BDF or reading an OP2) in a worker thread, so the GUI thread can keep
+processing events.  The GUI thread polls the loader, which:
+
+ - forwards the log messages of the worker to the GUI log (the log
+   widget may only be touched from the GUI thread)
+ - returns the result (or raises the error) of the worker once it's done
+
+The worker is cancelled at the next log message, which is frequent for
+the BDF/OP2 readers.
+
+defines:
+ - LoadCancelled
+ - QueueLog
+ - BackgroundLoader
+
+"""
+from __future__ import annotations
+import queue
+import threading
+import traceback
+from typing import Any, Callable, Optional
+from cpylog import SimpleLogger
+
+
+class LoadCancelled(Exception):
+    """the user cancelled a background load"""
+    pass
+
+
+class QueueLog(SimpleLogger):
+    """
+    A logger for a worker thread that queues the messages for the
+    GUI thread.  Raises LoadCancelled once the load is cancelled.
+    """
+    def __init__(self, log: SimpleLogger):
+        """
+        Parameters
+        ----------
+        log : SimpleLogger
+            the GUI log, which gets the messages in ``flush``
+
+        """
+        super().__init__(level=log.level, encoding=log.encoding,
+                         log_func=self._queue_message)
+        self.base_log = log
+        self.messages = queue.SimpleQueue()
+        self._cancel = threading.Event()
+
+    def _queue_message(self, typ: str, filename: str, lineno: int, msg: str) -> None:
+        if self._cancel.is_set():
+            raise LoadCancelled(msg)
+        self.messages.put((typ, filename, lineno, msg))
+
+    def cancel(self) -> None:
+        """the next message will cancel the worker"""
+        self._cancel.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def flush(self) -> Optional[str]:
+        """
+        Sends the queued messages to the GUI log
+
+        Returns
+        -------
+        msg : str / None
+            the last message (for the status bar)
+
+        """
+        msg = None
+        while True:
+            try:
+                typ, filename, lineno, msg = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            self.base_log.log_func(typ, filename, lineno, msg)
+        return msg
+
+    def detach(self) -> None:
+        """
+        Logs directly to the GUI log.  The loaded model keeps a reference
+        to this log, so it's called after the worker is done.
+        """
+        self.flush()
+        self.log_func = self.base_log.log_func
+
+
+class BackgroundLoader:
+    """
+    Runs ``func(log=queue_log)`` in a worker thread
+
+    Example
+    -------
+    >>> func = functools.partial(read_bdf_func, bdf_filename)
+    >>> loader = BackgroundLoader(func, gui.log)
+    >>> loader.start()
+    >>> while not loader.poll():  # call from a QTimer
+    ...     pass
+    >>> model = loader.get_result()
+
+    """
+    def __init__(self, func: Callable[..., Any],
+                 log: SimpleLogger,
+                 on_progress: Optional[Callable[[str], None]]=None):
+        """
+        Parameters
+        ----------
+        func : Callable
+            the VTK-free reader, which takes a ``log`` keyword argument
+        log : SimpleLogger
+            the GUI log
+        on_progress : Callable[[str], None]; default=None
+            gets the most recent log message on each poll (e.g., to
+            update the status bar)
+
+        """
+        self.func = func
+        self.log = QueueLog(log)
+        self.on_progress = on_progress
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.traceback = ''
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        """the worker thread"""
+        try:
+            self.result = self.func(log=self.log)
+        except BaseException as error:  # includes LoadCancelled
+            self.error = error
+            self.traceback = traceback.format_exc()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self.log.cancel()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.log.is_cancelled
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def poll(self) -> bool:
+        """
+        Forwards the log messages to the GUI log; called from the GUI thread
+
+        Returns
+        -------
+        is_done : bool
+            the worker is done
+
+        """
+        is_done = not self._thread.is_alive()
+        msg = self.log.flush()
+        if msg is not None and self.on_progress is not None:
+            self.on_progress(msg)
+        if is_done:
+            self.log.detach()
+        return is_done
+
+    def get_result(self) -> Any:
+        """
+        Gets the result of the finished worker
+
+        Raises
+        ------
+        LoadCancelled : the user cancelled the load
+        Exception : the worker failed
+        """
+        assert not self._thread.is_alive(), 'the worker is still running'
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def run(self, timeout: Optional[float]=None) -> Any:
+        """runs the worker and waits for it (e.g., when there is no event loop)"""
+        self.start()
+        self._thread.join(timeout)
+        self.poll()
+        return self.get_result()
@@ -0,0 +1,187 @@
+"""
+Vectorized exterior face extraction for the level-of-detail (LOD) display.
+
+The arrays use the VTK (>=9) unstructured grid layout, so they can be
+pulled directly out of a vtkUnstructuredGrid with ``vtk_to_numpy``:
+
+ - cell_type    : (ncell, ) VTK cell type (e.g., VTK_TETRA=10)
+ - connectivity : (nconnectivity, ) the point ids of all the cells
+ - offsets      : (ncell + 1, ) the start of each cell in connectivity
+
+defines:
+ - faces, face_cell = get_exterior_faces(cell_type, connectivity, offsets)
+ - skin_cell_type, skin_connectivity, skin_offsets, skin_cell_map = get_skin_cells(
+       cell_type, connectivity, offsets)
+
+"""
+from __future__ import annotations
+import numpy as np
+
+VTK_TRIANGLE = 5
+VTK_QUAD = 9
+
+# the corner faces of the solid elements using the VTK face ordering,
+# so the normals point out of the element
+#  - tri faces are padded with -1
+_TETRA_FACES = np.array([
+    [0, 1, 3, -1],
+    [1, 2, 3, -1],
+    [2, 0, 3, -1],
+    [0, 2, 1, -1],
+])
+_HEXA_FACES = np.array([
+    [0, 4, 7, 3],
+    [1, 2, 6, 5],
+    [0, 1, 5, 4],
+    [3, 7, 6, 2],
+    [0, 3, 2, 1],
+    [4, 5, 6, 7],
+])
+_PENTA_FACES = np.array([
+    [0, 1, 2, -1],
+    [3, 5, 4, -1],
+    [0, 3, 4, 1],
+    [1, 4, 5, 2],
+    [2, 5, 3, 0],
+])
+_PYRAM_FACES = np.array([
+    [0, 3, 2, 1],
+    [0, 1, 4, -1],
+    [1, 2, 4, -1],
+    [2, 3, 4, -1],
+    [3, 0, 4, -1],
+])
+
+# VTK cell type -> (ncorner_nodes, nnodes, faces)
+#  - the quadratic elements are drawn with their corner nodes
+SOLID_FACES = {
+    10: (4, 4, _TETRA_FACES),   # VTK_TETRA
+    12: (8, 8, _HEXA_FACES),    # VTK_HEXAHEDRON
+    13: (6, 6, _PENTA_FACES),   # VTK_WEDGE
+    14: (5, 5, _PYRAM_FACES),   # VTK_PYRAMID
+    24: (4, 10, _TETRA_FACES),  # VTK_QUADRATIC_TETRA
+    25: (8, 20, _HEXA_FACES),   # VTK_QUADRATIC_HEXAHEDRON
+    26: (6, 15, _PENTA_FACES),  # VTK_QUADRATIC_WEDGE
+    27: (5, 13, _PYRAM_FACES),  # VTK_QUADRATIC_PYRAMID
+}
+
+
+def get_exterior_faces(cell_type: np.ndarray,
+                       connectivity: np.ndarray,
+                       offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the faces of the solid cells that are used by a single cell.
+
+    Parameters
+    ----------
+    cell_type : (ncell, ) int array
+        the VTK cell types
+    connectivity : (nconnectivity, ) int array
+        the point ids of the cells
+    offsets : (ncell + 1, ) int array
+        the start of each cell in connectivity
+
+    Returns
+    -------
+    faces : (nface, 4) int array
+        the point ids of the exterior faces; tri faces end in -1
+    face_cell : (nface, ) int array
+        the solid cell that owns each face
+
+    """
+    cell_type = np.asarray(cell_type)
+    connectivity = np.asarray(connectivity)
+    offsets = np.asarray(offsets)
+
+    all_faces = []
+    all_face_cells = []
+    for vtk_type, (unused_ncorner, nnodes, face_map) in SOLID_FACES.items():
+        icell = np.flatnonzero(cell_type == vtk_type)
+        if len(icell) == 0:
+            continue
+        assert np.all(offsets[icell + 1] - offsets[icell] == nnodes), f'vtk_type={vtk_type}'
+        # (ncell, nnodes)
+        nodes = connectivity[offsets[icell][:, np.newaxis] + np.arange(nnodes)]
+
+        # (ncell, nface, 4)
+        faces = nodes[:, face_map]
+        faces[:, face_map == -1] = -1
+        nface = face_map.shape[0]
+        all_faces.append(faces.reshape(len(icell) * nface, 4))
+        all_face_cells.append(np.repeat(icell, nface))
+
+    if len(all_faces) == 0:
+        return np.zeros((0, 4), dtype=connectivity.dtype), np.zeros(0, dtype='int64')
+
+    faces = np.vstack(all_faces)
+    face_cell = np.hstack(all_face_cells)
+
+    # a face is interior if it is shared by 2 cells, so sort the
+    # point ids of each face and drop the duplicates
+    sorted_faces = np.sort(faces, axis=1)
+    isort = np.lexsort(sorted_faces.T[::-1])
+    sorted_faces = sorted_faces[isort]
+    is_new = np.ones(len(isort) + 1, dtype='bool')
+    is_new[1:-1] = np.any(sorted_faces[1:] != sorted_faces[:-1], axis=1)
+    istart = np.flatnonzero(is_new)
+    count = np.diff(istart)
+    iexterior = np.sort(isort[istart[:-1][count == 1]])
+    return faces[iexterior], face_cell[iexterior]
+
+
+def get_skin_cells(cell_type: np.ndarray,
+                   connectivity: np.ndarray,
+                   offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray,
+                                                 np.ndarray, np.ndarray]:
+    """
+    Replaces the solid cells with their exterior faces.  The non-solid
+    cells (e.g., shells, bars, points) are kept as is.
+
+    Parameters
+    ----------
+    cell_type : (ncell, ) int array
+        the VTK cell types
+    connectivity : (nconnectivity, ) int array
+        the point ids of the cells
+    offsets : (ncell + 1, ) int array
+        the start of each cell in connectivity
+
+    Returns
+    -------
+    skin_cell_type : (nskin, ) uint8 array
+        the VTK cell types of the skin
+    skin_connectivity : (nskin_connectivity, ) int array
+        the point ids of the skin cells
+    skin_offsets : (nskin + 1, ) int array
+        the start of each skin cell in skin_connectivity
+    skin_cell_map : (nskin, ) int array
+        the cell in the full grid for each skin cell, which is used to
+        map a centroidal result: ``skin_result = result[skin_cell_map]``
+
+    The points are not changed, so nodal results don't need to be mapped.
+
+    """
+    cell_type = np.asarray(cell_type)
+    connectivity = np.asarray(connectivity)
+    offsets = np.asarray(offsets)
+    faces, face_cell = get_exterior_faces(cell_type, connectivity, offsets)
+
+    is_solid = np.isin(cell_type, list(SOLID_FACES))
+    icell = np.flatnonzero(~is_solid)
+    nnodes = offsets[icell + 1] - offsets[icell]
+
+    # the kept cells may have a variable number of nodes
+    ikeep = np.repeat(offsets[icell] - np.cumsum(nnodes) + nnodes, nnodes) + np.arange(nnodes.sum())
+    keep_connectivity = connectivity[ikeep]
+
+    is_tri = faces[:, 3] == -1
+    face_nnodes = np.where(is_tri, 3, 4)
+    face_connectivity = faces[faces != -1]
+    face_type = np.where(is_tri, VTK_TRIANGLE, VTK_QUAD)
+
+    skin_cell_type = np.hstack([cell_type[icell], face_type]).astype('uint8')
+    skin_connectivity = np.hstack([keep_connectivity, face_connectivity])
+    skin_offsets = np.zeros(len(skin_cell_type) + 1, dtype=offsets.dtype)
+    skin_offsets[1:] = np.cumsum(np.hstack([nnodes, face_nnodes]))
+    skin_cell_map = np.hstack([icell, face_cell])
+    return skin_cell_type, skin_connectivity, skin_offsets, skin_cell_map
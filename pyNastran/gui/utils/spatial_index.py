@@ -0,0 +1,407 @@
+"""
+A persistent spatial index of the nodes and elements of a model for
+picking, probing and area selection.
+
+The element arrays use the VTK (>=9) unstructured grid layout, so they
+can be pulled directly out of a vtkUnstructuredGrid with ``vtk_to_numpy``:
+
+ - connectivity : (nconnectivity, ) the point ids of all the cells
+ - offsets      : (ncell + 1, ) the start of each cell in connectivity
+
+The index is built once per geometry.  Deflecting the model (e.g., an
+animation) only calls ``update_xyz``, which lazily rebuilds the trees on
+the next query.
+
+defines:
+ - SpatialIndex
+
+"""
+from __future__ import annotations
+from typing import Optional
+import numpy as np
+from scipy.spatial import KDTree
+
+
+class SpatialIndex:
+    """
+    Spatial index of the node locations, element centroids and element
+    bounding boxes.
+
+    Queries return node/element ids (or the 0-based indices if the ids
+    weren't given).
+
+    Example
+    -------
+    >>> index = SpatialIndex(xyz, node_ids, connectivity, offsets, element_ids)
+    >>> nids, distance = index.nearest_nodes([0., 0., 1.], k=3)
+    >>> eids = index.elements_within_radius([0., 0., 1.], 0.5)
+    >>> eids = index.elements_in_box([0., 0., 0.], [1., 1., 1.])
+
+    """
+    def __init__(self, xyz: np.ndarray,
+                 node_ids: Optional[np.ndarray]=None,
+                 connectivity: Optional[np.ndarray]=None,
+                 offsets: Optional[np.ndarray]=None,
+                 element_ids: Optional[np.ndarray]=None):
+        """
+        Parameters
+        ----------
+        xyz : (nnodes, 3) float ndarray
+            the node locations
+        node_ids : (nnodes, ) int ndarray; default=None -> 0...nnodes-1
+            the node ids
+        connectivity : (nconnectivity, ) int ndarray; default=None
+            the 0-based node indices of the elements
+            None : there are no elements
+        offsets : (nelements + 1, ) int ndarray; default=None
+            the start of each element in connectivity
+        element_ids : (nelements, ) int ndarray; default=None -> 0...nelements-1
+            the element ids
+
+        """
+        xyz = np.asarray(xyz)
+        nnodes = len(xyz)
+        if node_ids is None:
+            node_ids = np.arange(nnodes)
+        assert len(node_ids) == nnodes, f'nnodes={nnodes} nnode_ids={len(node_ids)}'
+
+        if connectivity is None:
+            connectivity = np.zeros(0, dtype='int64')
+            offsets = np.zeros(1, dtype='int64')
+        connectivity = np.asarray(connectivity)
+        offsets = np.asarray(offsets)
+        nelements = len(offsets) - 1
+        if element_ids is None:
+            element_ids = np.arange(nelements)
+        assert len(element_ids) == nelements, f'nelements={nelements} nelement_ids={len(element_ids)}'
+        # empty cells (e.g., a deleted cell) don't work with reduceat
+        assert np.all(np.diff(offsets) > 0), 'all the elements must have nodes'
+
+        self.node_ids = np.asarray(node_ids)
+        self.element_ids = np.asarray(element_ids)
+        self.connectivity = connectivity
+        self.offsets = offsets
+        self.xyz = xyz
+        self._clear()
+
+    @classmethod
+    def from_grid(cls, grid, node_ids: Optional[np.ndarray]=None,
+                  element_ids: Optional[np.ndarray]=None) -> SpatialIndex:
+        """
+        Creates a SpatialIndex from a vtkUnstructuredGrid
+
+        Parameters
+        ----------
+        grid : vtkUnstructuredGrid
+            the grid
+        node_ids / element_ids : (n, ) int ndarray; default=None
+            the ids of the points/cells
+            None : use the point/cell indices
+
+        """
+        from pyNastran.gui.vtk_util import vtk_to_numpy
+        xyz = vtk_to_numpy(grid.GetPoints().GetData())
+        cells = grid.GetCells()
+        connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+        offsets = vtk_to_numpy(cells.GetOffsetsArray())
+        return cls(xyz, node_ids=node_ids, connectivity=connectivity,
+                   offsets=offsets, element_ids=element_ids)
+
+    @property
+    def nnodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def nelements(self) -> int:
+        return len(self.element_ids)
+
+    def update_xyz(self, xyz: np.ndarray) -> None:
+        """
+        Updates the node locations (e.g., the model is deflected), which
+        invalidates the trees.  The topology is unchanged.
+        """
+        xyz = np.asarray(xyz)
+        assert xyz.shape == self.xyz.shape, f'xyz.shape={xyz.shape}; expected={self.xyz.shape}'
+        self.xyz = xyz
+        self._clear()
+
+    def _clear(self) -> None:
+        """clears the derived data, which is built on the first query"""
+        self._node_tree = None
+        self._centroid_tree = None
+        self._centroids = None
+        self._bbox_min = None
+        self._bbox_max = None
+        self._max_half_diagonal = 0.
+
+    #---------------------------------------------------------------------------
+    # lazily built data
+    @property
+    def node_tree(self) -> KDTree:
+        if self._node_tree is None:
+            self._node_tree = KDTree(self.xyz)
+        return self._node_tree
+
+    @property
+    def centroids(self) -> np.ndarray:
+        """the (nelements, 3) element centroids (average of the nodes)"""
+        if self._centroids is None:
+            self._build_elements()
+        return self._centroids
+
+    @property
+    def bounding_boxes(self) -> tuple[np.ndarray, np.ndarray]:
+        """the (nelements, 3) min/max corners of the element bounding boxes"""
+        if self._bbox_min is None:
+            self._build_elements()
+        return self._bbox_min, self._bbox_max
+
+    @property
+    def centroid_tree(self) -> KDTree:
+        if self._centroid_tree is None:
+            self._centroid_tree = KDTree(self.centroids.reshape(-1, 3))
+        return self._centroid_tree
+
+    def _build_elements(self) -> None:
+        """calculates the centroids/bounding boxes of all the elements"""
+        if self.nelements == 0:
+            self._centroids = np.zeros((0, 3), dtype=self.xyz.dtype)
+            self._bbox_min = self._centroids
+            self._bbox_max = self._centroids
+            self._max_half_diagonal = 0.
+            return
+
+        xyz = self.xyz[self.connectivity]
+        istart = self.offsets[:-1]
+        nnodes = np.diff(self.offsets)
+        self._centroids = np.add.reduceat(xyz, istart, axis=0) / nnodes[:, np.newaxis]
+        self._bbox_min = np.minimum.reduceat(xyz, istart, axis=0)
+        self._bbox_max = np.maximum.reduceat(xyz, istart, axis=0)
+        half_diagonal = np.linalg.norm(self._bbox_max - self._bbox_min, axis=1) / 2.
+        self._max_half_diagonal = half_diagonal.max()
+
+    #---------------------------------------------------------------------------
+    # nearest
+    def nearest_nodes(self, xyz: np.ndarray, k: int=1,
+                      return_index: bool=False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the closest nodes to a point
+
+        Parameters
+        ----------
+        xyz : (3, ) float ndarray
+            the point
+        k : int; default=1
+            the number of nodes to find
+        return_index : bool; default=False
+            return the 0-based node indices instead of the node ids
+
+        Returns
+        -------
+        node_ids : (k, ) int ndarray
+            the node ids sorted by distance
+        distance : (k, ) float ndarray
+            the distance to each node
+
+        """
+        k = min(k, self.nnodes)
+        distance, inode = self.node_tree.query(np.asarray(xyz, dtype='float64'), k=[*range(1, k+1)])
+        if return_index:
+            return inode, distance
+        return self.node_ids[inode], distance
+
+    def nearest_elements(self, xyz: np.ndarray, k: int=1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the elements with the closest centroids to a point
+
+        Parameters
+        ----------
+        xyz : (3, ) float ndarray
+            the point
+        k : int; default=1
+            the number of elements to find
+
+        Returns
+        -------
+        element_ids : (k, ) int ndarray
+            the element ids sorted by distance
+        distance : (k, ) float ndarray
+            the distance to each centroid
+
+        """
+        k = min(k, self.nelements)
+        distance, ielement = self.centroid_tree.query(np.asarray(xyz, dtype='float64'), k=[*range(1, k+1)])
+        return self.element_ids[ielement], distance
+
+    #---------------------------------------------------------------------------
+    # radius
+    def nodes_within_radius(self, xyz: np.ndarray, radius: float) -> np.ndarray:
+        """gets the sorted node ids within a radius of a point"""
+        inode = self.node_tree.query_ball_point(np.asarray(xyz, dtype='float64'), radius)
+        return np.sort(self.node_ids[np.array(inode, dtype='int64')])
+
+    def elements_within_radius(self, xyz: np.ndarray, radius: float) -> np.ndarray:
+        """
+        Gets the sorted element ids with a bounding box within a radius
+        of a point
+
+        Parameters
+        ----------
+        xyz : (3, ) float ndarray
+            the point
+        radius : float
+            the search radius
+
+        Returns
+        -------
+        element_ids : (n, ) int ndarray
+            the element ids
+
+        """
+        xyz = np.asarray(xyz, dtype='float64')
+        bbox_min, bbox_max = self.bounding_boxes
+        if self.nelements == 0:
+            return self.element_ids[:0]
+
+        # the centroid is inside the bounding box, so no box within the
+        # radius is further than radius + max_half_diagonal from the point
+        ielement = self.centroid_tree.query_ball_point(
+            xyz, radius + self._max_half_diagonal)
+        ielement = np.array(ielement, dtype='int64')
+
+        # the distance from the point to the boxes
+        dxyz = np.maximum(bbox_min[ielement] - xyz, 0.) + np.maximum(xyz - bbox_max[ielement], 0.)
+        is_inside = np.linalg.norm(dxyz, axis=1) <= radius
+        return np.sort(self.element_ids[ielement[is_inside]])
+
+    #---------------------------------------------------------------------------
+    # box
+    def nodes_in_box(self, xyz_min: np.ndarray, xyz_max: np.ndarray) -> np.ndarray:
+        """gets the sorted node ids inside an axis-aligned box"""
+        xyz_min = np.asarray(xyz_min)
+        xyz_max = np.asarray(xyz_max)
+        is_inside = np.all((self.xyz >= xyz_min) & (self.xyz <= xyz_max), axis=1)
+        return np.sort(self.node_ids[is_inside])
+
+    def elements_in_box(self, xyz_min: np.ndarray, xyz_max: np.ndarray,
+                        inside: bool=False) -> np.ndarray:
+        """
+        Gets the sorted element ids in an axis-aligned box
+
+        Parameters
+        ----------
+        xyz_min / xyz_max : (3, ) float ndarray
+            the corners of the box
+        inside : bool; default=False
+            True : the element is entirely inside the box
+            False : the element overlaps the box
+
+        Returns
+        -------
+        element_ids : (n, ) int ndarray
+            the element ids
+
+        """
+        xyz_min = np.asarray(xyz_min)
+        xyz_max = np.asarray(xyz_max)
+        bbox_min, bbox_max = self.bounding_boxes
+        if inside:
+            is_selected = np.all((bbox_min >= xyz_min) & (bbox_max <= xyz_max), axis=1)
+        else:
+            is_selected = np.all((bbox_max >= xyz_min) & (bbox_min <= xyz_max), axis=1)
+        return np.sort(self.element_ids[is_selected])
+
+    #---------------------------------------------------------------------------
+    # frustum
+    def nodes_in_frustum(self, normals: np.ndarray, origins: np.ndarray,
+                         return_index: bool=False) -> np.ndarray:
+        """
+        Gets the sorted node ids inside a convex region (e.g., the view
+        frustum of an area pick)
+
+        Parameters
+        ----------
+        normals : (nplanes, 3) float ndarray
+            the outward normals of the planes (the vtkPlanes convention)
+        origins : (nplanes, 3) float ndarray
+            a point on each plane
+        return_index : bool; default=False
+            return the sorted 0-based node indices instead of the node ids
+
+        Returns
+        -------
+        node_ids : (n, ) int ndarray
+            the node ids
+
+        """
+        is_inside = _is_inside_planes(self.xyz, normals, origins)
+        if return_index:
+            return np.flatnonzero(is_inside)
+        return np.sort(self.node_ids[is_inside])
+
+    def elements_in_frustum(self, normals: np.ndarray, origins: np.ndarray,
+                            overlap: bool=False,
+                            return_index: bool=False) -> np.ndarray:
+        """
+        Gets the sorted ids of the elements inside a convex region
+        (e.g., the view frustum of an area pick)
+
+        Parameters
+        ----------
+        normals : (nplanes, 3) float ndarray
+            the outward normals of the planes (the vtkPlanes convention)
+        origins : (nplanes, 3) float ndarray
+            a point on each plane
+        overlap : bool; default=False
+            True : an element that overlaps the region is picked,
+                   including an element that crosses the region without
+                   a node inside it
+            False : an element with the centroid inside the region is picked
+        return_index : bool; default=False
+            return the sorted 0-based element indices instead of the element ids
+
+        Returns
+        -------
+        element_ids : (n, ) int ndarray
+            the element ids
+
+        Notes
+        -----
+        For overlap=True, an element is rejected when all of its nodes
+        are outside one of the planes.  Only the planes of the region are
+        tried as separating planes, so an element that passes diagonally
+        by an edge/corner of the region may also be picked (the same
+        conservative test as a bounding box in a view frustum cull).
+
+        """
+        if overlap and self.nelements:
+            is_inside = np.ones(self.nelements, dtype='bool')
+            for normal, origin in zip(*_get_planes(normals, origins)):
+                is_node_outside = (self.xyz - origin) @ normal > 0.
+                is_inside &= ~np.logical_and.reduceat(
+                    is_node_outside[self.connectivity], self.offsets[:-1])
+        else:
+            is_inside = _is_inside_planes(self.centroids, normals, origins)
+        if return_index:
+            return np.flatnonzero(is_inside)
+        return np.sort(self.element_ids[is_inside])
+
+    def __repr__(self) -> str:
+        return f'SpatialIndex(nnodes={self.nnodes}, nelements={self.nelements})'
+
+
+def _is_inside_planes(xyz: np.ndarray, normals: np.ndarray,
+                      origins: np.ndarray) -> np.ndarray:
+    """checks if the points are on the negative side of all the planes"""
+    is_inside = np.ones(len(xyz), dtype='bool')
+    for normal, origin in zip(*_get_planes(normals, origins)):
+        is_inside &= (xyz - origin) @ normal <= 0.
+    return is_inside
+
+
+def _get_planes(normals: np.ndarray,
+                origins: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """gets the (nplanes, 3) float normals/origins"""
+    normals = np.asarray(normals, dtype='float64').reshape(-1, 3)
+    origins = np.asarray(origins, dtype='float64').reshape(-1, 3)
+    return normals, origins
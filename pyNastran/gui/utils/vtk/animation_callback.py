@@ -1,13 +1,175 @@
 """
 defines:
  - AnimationCallback
+ - AnimationBuffers
+ - is_buffered = get_buffered_frames(icases_fringe, icases_disp, icases_vector,
+                                     animate_fringe)
+ - buffers = build_animation_buffers(result_cases, scales, phases,
+                                     icases_disp)
 """
 from __future__ import annotations
 from itertools import cycle
-from typing import TYPE_CHECKING
+from tempfile import TemporaryFile
+from typing import Any, Optional, TYPE_CHECKING
+import numpy as np
 if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
     from pyNastran.gui.main_window import MainWindow
 
+# buffers larger than this are streamed from a memmap (1 GB)
+MAX_ANIMATION_NBYTES = 1024 ** 3
+
+
+class AnimationBuffers:
+    """
+    The precomputed deflected xyz locations of an animation, so a frame
+    is an in-place update of the vtkPoints.
+    """
+    def __init__(self, xyz: Optional[np.ndarray], file_obj=None):
+        """
+        Parameters
+        ----------
+        xyz : (nframes, nnodes, 3) float32 ndarray / memmap; None
+            the deflected xyz locations for each frame
+            None : there is no displacement
+        file_obj : TemporaryFile; default=None
+            the temporary file of the memmap, which is closed by ``close``
+
+        """
+        self.xyz = xyz
+        self.file_obj = file_obj
+
+    @property
+    def nbytes(self) -> int:
+        nbytes = 0
+        if self.xyz is not None:
+            nbytes += self.xyz.nbytes
+        return nbytes
+
+    def close(self) -> None:
+        """releases the buffer and the temporary file of the memmap"""
+        # the memmap is unmapped when the array is deleted
+        if isinstance(self.xyz, np.memmap):
+            self.xyz.flush()
+        self.xyz = None
+        if self.file_obj is not None:
+            self.file_obj.close()
+            self.file_obj = None
+
+    def __repr__(self) -> str:
+        xyz_shape = None if self.xyz is None else self.xyz.shape
+        is_memmap = isinstance(self.xyz, np.memmap)
+        return (f'AnimationBuffers(xyz={xyz_shape}, '
+                f'nbytes={self.nbytes/1024**2:.1f} MB, is_memmap={is_memmap})')
+
+
+def get_buffered_frames(icases_fringe: list[Optional[int]],
+                        icases_disp: list[Optional[int]],
+                        icases_vector: list[Optional[int]],
+                        animate_fringe: bool) -> np.ndarray:
+    """
+    Finds the frames that only move the points, so they can be written
+    from the buffers.  A frame that changes the fringe, displacement or
+    vector case (relative to the previous frame) updates the fringe,
+    legend, min/max actors and corner text, so it's not buffered.
+
+    Parameters
+    ----------
+    icases_fringe / icases_disp / icases_vector : (nframes, ) list[int/None]
+        the result cases of each frame
+    animate_fringe : bool
+        the fringe is scaled with the deflection, so no frame is buffered
+
+    Returns
+    -------
+    is_buffered : (nframes, ) bool ndarray
+        the frames that may be written from the buffers; the animation
+        cycles, so the first frame is compared to the last frame
+
+    """
+    nframes = len(icases_disp)
+    is_buffered = np.zeros(nframes, dtype='bool')
+    if animate_fringe or nframes == 0:
+        return is_buffered
+
+    for iframe in range(nframes):
+        iframe0 = iframe - 1
+        is_buffered[iframe] = (
+            icases_fringe[iframe] == icases_fringe[iframe0] and
+            icases_disp[iframe] == icases_disp[iframe0] and
+            icases_vector[iframe] == icases_vector[iframe0])
+    return is_buffered
+
+
+def build_animation_buffers(result_cases: dict[int, Any],
+                            scales: np.ndarray, phases: np.ndarray,
+                            icases_disp: list[Optional[int]],
+                            memmap_filename: Optional[str]=None,
+                            max_nbytes: int=MAX_ANIMATION_NBYTES,
+                            log: Optional[SimpleLogger]=None) -> AnimationBuffers:
+    """
+    Precomputes the deflected xyz locations of each frame
+
+    Parameters
+    ----------
+    result_cases : dict[icase] = (obj, (i, res_name))
+        the GUI result cases
+    scales : (nframes, ) float ndarray
+        the deflection scale factors; true scale
+    phases : (nframes, ) float ndarray
+        the phase angles (degrees)
+    icases_disp : (nframes, ) list[int/None]
+        the displacement cases of each frame
+    memmap_filename : str; default=None
+        stream the displacement buffer from this file
+        None : use memory (or a temporary file if the buffer is bigger
+               than max_nbytes)
+    max_nbytes : int; default=1 GB
+        the in-memory size limit of the displacement buffer
+    log : SimpleLogger; default=None
+        logs the buffer size
+
+    Returns
+    -------
+    buffers : AnimationBuffers
+        the precomputed frames
+
+    """
+    nframes = len(icases_disp)
+    xyz = None
+    xyz_nominal = None
+    file_obj = None
+    for icase_disp in icases_disp:
+        if icase_disp is not None:
+            (obj, (i, res_name)) = result_cases[icase_disp]
+            xyz_nominal = obj.get_vector_result_by_scale_phase(i, res_name, 0., 0.)[0]
+            break
+
+    if xyz_nominal is not None:
+        shape = (nframes, ) + xyz_nominal.shape
+        nbytes = 4 * np.prod(shape)
+        if memmap_filename is not None:
+            xyz = np.memmap(memmap_filename, dtype='float32', mode='w+', shape=shape)
+        elif nbytes > max_nbytes:
+            file_obj = TemporaryFile()
+            xyz = np.memmap(file_obj, dtype='float32', mode='w+', shape=shape)
+        else:
+            xyz = np.empty(shape, dtype='float32')
+
+        for iframe, (icase_disp, scale, phase) in enumerate(zip(icases_disp, scales, phases)):
+            if icase_disp is None:
+                xyz[iframe] = xyz_nominal
+                continue
+            (obj, (i, res_name)) = result_cases[icase_disp]
+            unused_xyz_nominal, deflected_xyz = obj.get_vector_result_by_scale_phase(
+                i, res_name, scale, phase)
+            xyz[iframe] = deflected_xyz
+
+    buffers = AnimationBuffers(xyz, file_obj=file_obj)
+    if log is not None:
+        log.debug(str(buffers))
+    return buffers
+
 
 class AnimationCallback:
     """
@@ -16,9 +178,18 @@ class AnimationCallback:
     def __init__(self, parent: MainWindow, scales, phases,
                  icases_fringe, icases_disp, icases_vector,
                  animate_fringe, animate_vector,
-                 min_value, max_value):
+                 min_value, max_value,
+                 buffers: Optional[AnimationBuffers]=None):
         """
         creates AnimationCallback
+
+        Parameters
+        ----------
+        buffers : AnimationBuffers; default=None
+            the precomputed deflections, which are written into the
+            vtkPoints for the frames that don't change a result case
+            None : the frames are calculated by the result objects
+
         """
         self.parent = parent
         self.timer_count = 0
@@ -41,11 +212,30 @@ class AnimationCallback:
         self.max_value = max_value
         self.scale_max = max(abs(self.scales.max()), abs(self.scales.min()))
         #self.isteps = isteps
+        self.buffers = buffers
+        self.is_buffered = np.zeros(self.ncases, dtype='bool')
+        if buffers is not None and buffers.xyz is not None:
+            self.is_buffered = get_buffered_frames(
+                icases_fringe, icases_disp, icases_vector, animate_fringe)
 
     def execute(self, obj, unused_event):
         """creates the ith frame"""
         unused_iren = obj
         i = self.timer_count % self.ncases
+
+        # the first frame sets up the fringe/legend
+        is_buffered = self.timer_count > 0 and self.is_buffered[i]
+        if not (is_buffered and self._execute_buffered(i)):
+            is_valid = self._execute_unbuffered(i)
+            if not is_valid:
+                self.parent.stop_animation()
+                return
+
+        self.parent.vtk_interactor.Render()
+        self.timer_count += 1
+
+    def _execute_unbuffered(self, i: int) -> bool:
+        """updates the frame with the result objects"""
         #j = next(self.cycler)
         icase_fringe = self.icases_fringe[i]
         icase_disp = self.icases_disp[i]
@@ -60,12 +250,22 @@ class AnimationCallback:
             self.animate_fringe, self.animate_vector,
             normalized_fringe_scale,
             self.min_value, self.max_value)
-        if not is_valid:
-            self.parent.stop_animation()
 
         self.icase_disp0 = icase_disp
         self.icase_fringe0 = icase_fringe
         self.icase_vector0 = icase_vector
+        return is_valid
 
-        self.parent.vtk_interactor.Render()
-        self.timer_count += 1
+    def _execute_buffered(self, i: int) -> bool:
+        """
+        Updates the vtkPoints in place from the buffers.  Returns False
+        if the grid doesn't match the buffers (e.g., it was reloaded).
+        """
+        return self.parent.update_grid_inplace(self.buffers.xyz[i])
+
+    def close(self) -> None:
+        """releases the buffers"""
+        if self.buffers is not None:
+            self.buffers.close()
+            self.buffers = None
+        self.is_buffered[:] = False
@@ -0,0 +1,364 @@
+"""
+Level-of-detail (LOD) rendering for very large models.
+
+The full grid is replaced by:
+ - a skin grid, which drops the interior faces of the solid elements;
+   it shares the points with the full grid and is built once
+ - an optional decimated proxy of the skin, which is drawn while the
+   camera is moving
+
+The results are mapped onto the reduced geometry with the stored index
+maps, so a new result case only requires fancy indexing.
+
+defines:
+ - LodGeometry
+ - LodInteractor
+ - FrameTimes
+
+"""
+from __future__ import annotations
+from time import perf_counter
+from typing import Optional, TYPE_CHECKING
+import numpy as np
+from scipy.spatial import KDTree
+
+from vtkmodules.vtkFiltersCore import vtkQuadricDecimation, vtkTriangleFilter
+from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
+from pyNastran.gui.vtk_common_core import vtkUnsignedCharArray
+from pyNastran.gui.vtk_interface import vtkUnstructuredGrid, vtkCellArray, vtkPolyData
+from pyNastran.gui.vtk_util import numpy_to_vtk, vtk_to_numpy, numpy_to_vtkIdTypeArray
+from pyNastran.gui.utils.vtk.base_utils import get_numpy_idtype_for_vtk
+from pyNastran.gui.utils.vtk.vtk_utils import numpy_to_vtk_points
+from pyNastran.gui.utils.skin import get_skin_cells
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+    from pyNastran.gui.vtk_rendering_core import (
+        vtkRenderer, vtkRenderWindowInteractor, vtkDataSetMapper)
+
+
+class LodGeometry:
+    """
+    Stores the skin/proxy geometry of a grid and the index maps that
+    are used to map results onto it.
+    """
+    def __init__(self, grid: vtkUnstructuredGrid,
+                 target_reduction: float=0.0,
+                 log: Optional[SimpleLogger]=None):
+        """
+        Parameters
+        ----------
+        grid : vtkUnstructuredGrid
+            the full resolution grid
+        target_reduction : float; default=0.0
+            the fraction of the skin triangles to remove for the proxy
+            (e.g., 0.9 keeps 10%); 0.0 skips the proxy
+        log : SimpleLogger; default=None
+            logs the build time
+
+        """
+        self.grid = grid
+        self.log = log
+        t0 = perf_counter()
+        self.skin_grid, self.skin_cell_map = build_skin_grid(grid)
+        t1 = perf_counter()
+
+        self.proxy: Optional[vtkPolyData] = None
+        self.proxy_point_map = np.zeros(0, dtype='int64')
+        self.proxy_cell_map = np.zeros(0, dtype='int64')
+        if target_reduction > 0.0:
+            self.proxy, self.proxy_point_map, self.proxy_cell_map = build_decimated_proxy(
+                self.skin_grid, self.skin_cell_map, target_reduction)
+        t2 = perf_counter()
+
+        if log is not None:
+            nproxy = 0 if self.proxy is None else self.proxy.GetNumberOfCells()
+            log.info(f'LOD: ncells={grid.GetNumberOfCells()} '
+                     f'nskin={self.skin_grid.GetNumberOfCells()} ({t1-t0:.3f} sec); '
+                     f'nproxy={nproxy} ({t2-t1:.3f} sec)')
+
+    def map_cell_result(self, cell_result: np.ndarray) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Maps a centroidal result from the full grid onto the skin/proxy
+
+        Parameters
+        ----------
+        cell_result : (ncell, ...) array
+            the result on the full grid
+
+        Returns
+        -------
+        skin_result : (nskin, ...) array
+            the result on the skin
+        proxy_result : (nproxy, ...) array or None
+            the result on the proxy
+
+        """
+        skin_result = cell_result[self.skin_cell_map]
+        proxy_result = None
+        if self.proxy is not None:
+            proxy_result = cell_result[self.proxy_cell_map]
+        return skin_result, proxy_result
+
+    def map_point_result(self, point_result: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Maps a nodal result onto the proxy.  The skin shares the points
+        of the full grid, so it doesn't need to be mapped.
+        """
+        if self.proxy is None:
+            return None
+        return point_result[self.proxy_point_map]
+
+    def update_points(self, xyz: np.ndarray) -> None:
+        """
+        Moves the proxy points (e.g., for a deflected shape), which are
+        a subset of the full grid points
+        """
+        if self.proxy is None:
+            return
+        points = numpy_to_vtk_points(xyz[self.proxy_point_map])
+        self.proxy.SetPoints(points)
+        self.proxy.Modified()
+
+    def sync(self) -> None:
+        """
+        Copies the deflected points and the active scalars of the full
+        grid onto the skin/proxy
+        """
+        if self.proxy is not None:
+            xyz = vtk_to_numpy(self.grid.GetPoints().GetData())
+            self.update_points(xyz)
+
+        cell_scalars = self.grid.GetCellData().GetScalars()
+        point_scalars = self.grid.GetPointData().GetScalars()
+        if cell_scalars is not None:
+            self.set_cell_array(cell_scalars.GetName(), vtk_to_numpy(cell_scalars))
+        elif point_scalars is not None:
+            self.set_point_array(point_scalars.GetName(), vtk_to_numpy(point_scalars))
+        self.skin_grid.Modified()
+
+    def set_cell_array(self, vtk_name: str, cell_result: np.ndarray) -> None:
+        """sets the active centroidal scalars on the skin/proxy"""
+        skin_result, proxy_result = self.map_cell_result(cell_result)
+        _set_active_scalars(self.skin_grid.GetCellData(), vtk_name, skin_result)
+        self.skin_grid.GetPointData().SetScalars(None)
+        if self.proxy is not None:
+            _set_active_scalars(self.proxy.GetCellData(), vtk_name, proxy_result)
+            self.proxy.GetPointData().SetScalars(None)
+
+    def set_point_array(self, vtk_name: str, point_result: np.ndarray) -> None:
+        """sets the active nodal scalars on the skin/proxy"""
+        _set_active_scalars(self.skin_grid.GetPointData(), vtk_name, point_result)
+        self.skin_grid.GetCellData().SetScalars(None)
+        if self.proxy is not None:
+            _set_active_scalars(self.proxy.GetPointData(), vtk_name,
+                                self.map_point_result(point_result))
+            self.proxy.GetCellData().SetScalars(None)
+
+
+def _set_active_scalars(data, vtk_name: str, result: np.ndarray) -> None:
+    vtk_array = numpy_to_vtk(np.ascontiguousarray(result), deep=1)
+    vtk_array.SetName(vtk_name)
+    data.SetScalars(vtk_array)
+
+
+def build_skin_grid(grid: vtkUnstructuredGrid) -> tuple[vtkUnstructuredGrid, np.ndarray]:
+    """
+    Builds a grid of the exterior faces of the solid elements and the
+    non-solid elements.  The points are shared with the full grid.
+
+    Returns
+    -------
+    skin_grid : vtkUnstructuredGrid
+        the skin
+    skin_cell_map : (nskin, ) int array
+        the cell in the full grid for each skin cell
+
+    """
+    cells = grid.GetCells()
+    cell_type = vtk_to_numpy(grid.GetCellTypesArray())
+    connectivity = vtk_to_numpy(cells.GetConnectivityArray())
+    offsets = vtk_to_numpy(cells.GetOffsetsArray())
+    skin_cell_type, skin_connectivity, skin_offsets, skin_cell_map = get_skin_cells(
+        cell_type, connectivity, offsets)
+
+    idtype = get_numpy_idtype_for_vtk()
+    vtk_cells = vtkCellArray()
+    vtk_cells.SetData(
+        numpy_to_vtkIdTypeArray(skin_offsets.astype(idtype), deep=1),
+        numpy_to_vtkIdTypeArray(skin_connectivity.astype(idtype), deep=1))
+
+    vtk_cell_type = numpy_to_vtk(
+        skin_cell_type, deep=1,
+        array_type=vtkUnsignedCharArray().GetDataType())
+
+    skin_grid = vtkUnstructuredGrid()
+    skin_grid.SetPoints(grid.GetPoints())
+    skin_grid.SetCells(vtk_cell_type, vtk_cells)
+    return skin_grid, skin_cell_map
+
+
+def build_decimated_proxy(skin_grid: vtkUnstructuredGrid,
+                          skin_cell_map: np.ndarray,
+                          target_reduction: float) -> tuple[vtkPolyData, np.ndarray, np.ndarray]:
+    """
+    Builds a quadric decimated, triangulated proxy of the skin
+
+    Returns
+    -------
+    proxy : vtkPolyData
+        the decimated skin
+    proxy_point_map : (nproxy_point, ) int array
+        the point in the full grid for each proxy point
+    proxy_cell_map : (nproxy, ) int array
+        the cell in the full grid for each proxy cell
+
+    """
+    geometry_filter = vtkGeometryFilter()
+    geometry_filter.SetInputData(skin_grid)
+    geometry_filter.PassThroughCellIdsOn()
+    geometry_filter.SetOriginalCellIdsName('skin_cell_ids')
+
+    triangle_filter = vtkTriangleFilter()
+    triangle_filter.SetInputConnection(geometry_filter.GetOutputPort())
+    triangle_filter.PassVertsOff()
+    triangle_filter.PassLinesOff()
+
+    decimation = vtkQuadricDecimation()
+    decimation.SetInputConnection(triangle_filter.GetOutputPort())
+    decimation.SetTargetReduction(target_reduction)
+    decimation.VolumePreservationOn()
+    decimation.Update()
+
+    proxy = vtkPolyData()
+    proxy.DeepCopy(decimation.GetOutput())
+
+    # the decimated points are moved, so snap them back onto the grid
+    xyz = vtk_to_numpy(skin_grid.GetPoints().GetData())
+    proxy_xyz = vtk_to_numpy(proxy.GetPoints().GetData())
+    tree = KDTree(xyz)
+    unused_dist, proxy_point_map = tree.query(proxy_xyz)
+    proxy.SetPoints(numpy_to_vtk_points(xyz[proxy_point_map]))
+
+    # map each proxy triangle to the skin cell with the closest centroid
+    tri_skin = vtk_to_numpy(
+        triangle_filter.GetOutput().GetCellData().GetArray('skin_cell_ids'))
+    tri_centroid = _get_triangle_centroids(triangle_filter.GetOutput())
+    proxy_centroid = _get_triangle_centroids(proxy)
+    unused_dist, itri = KDTree(tri_centroid).query(proxy_centroid)
+    proxy_cell_map = skin_cell_map[tri_skin[itri]]
+
+    proxy.GetPointData().Initialize()
+    proxy.GetCellData().Initialize()
+    return proxy, proxy_point_map, proxy_cell_map
+
+
+def _get_triangle_centroids(poly_data: vtkPolyData) -> np.ndarray:
+    """gets the centroids of a triangulated vtkPolyData"""
+    xyz = vtk_to_numpy(poly_data.GetPoints().GetData())
+    polys = poly_data.GetPolys()
+    connectivity = vtk_to_numpy(polys.GetConnectivityArray()).reshape(-1, 3)
+    return xyz[connectivity].mean(axis=1)
+
+
+class FrameTimes:
+    """stores the render times of the interactive/still frames"""
+    def __init__(self):
+        self.times: dict[str, list[float]] = {
+            'interactive': [],
+            'still': [],
+        }
+
+    def add(self, mode: str, dt: float) -> None:
+        self.times[mode].append(dt)
+
+    def clear(self) -> None:
+        for times in self.times.values():
+            times.clear()
+
+    def get_stats(self) -> str:
+        """gets the number of frames, the mean/max times, and the frame rate"""
+        msgs = []
+        for mode, times in self.times.items():
+            if len(times) == 0:
+                continue
+            dt = np.array(times)
+            mean = dt.mean()
+            fps = 1. / mean if mean > 0. else np.inf
+            msgs.append(f'{mode}: nframes={len(dt)} mean={mean*1000:.1f} ms '
+                        f'max={dt.max()*1000:.1f} ms ({fps:.1f} fps)')
+        return '; '.join(msgs)
+
+
+class LodInteractor:
+    """
+    Swaps the mapper input to the decimated proxy when the camera starts
+    moving and restores the full resolution (or skin) when it stops.
+    """
+    def __init__(self, mapper: vtkDataSetMapper,
+                 renderer: vtkRenderer,
+                 interactor: vtkRenderWindowInteractor,
+                 lod: LodGeometry,
+                 skin_only: bool=True,
+                 log: Optional[SimpleLogger]=None):
+        """
+        Parameters
+        ----------
+        mapper : vtkDataSetMapper
+            the mapper of the model (e.g., gui.grid_mapper)
+        renderer : vtkRenderer
+            the renderer, which is used to get the frame times
+        interactor : vtkRenderWindowInteractor
+            the interactor, which fires the Start/EndInteractionEvent
+        lod : LodGeometry
+            the skin/proxy geometry
+        skin_only : bool; default=True
+            show the skin instead of the full grid when the camera stops
+        log : SimpleLogger; default=None
+            logs the frame times when the camera stops
+
+        """
+        self.mapper = mapper
+        self.renderer = renderer
+        self.interactor = interactor
+        self.lod = lod
+        self.skin_only = skin_only
+        self.log = log
+        self.frame_times = FrameTimes()
+        self.is_interacting = False
+        self.full_input = mapper.GetInput()
+        self._observers = [
+            interactor.AddObserver('StartInteractionEvent', self.on_start_interaction),
+            interactor.AddObserver('EndInteractionEvent', self.on_end_interaction),
+            renderer.AddObserver('EndEvent', self.on_end_render),
+        ]
+        self.set_still_input()
+
+    def set_still_input(self) -> None:
+        """sets the geometry that is drawn when the camera is not moving"""
+        if self.skin_only:
+            self.mapper.SetInputData(self.lod.skin_grid)
+        else:
+            self.mapper.SetInputData(self.full_input)
+
+    def on_start_interaction(self, unused_obj, unused_event) -> None:
+        self.is_interacting = True
+        if self.lod.proxy is not None:
+            self.mapper.SetInputData(self.lod.proxy)
+
+    def on_end_interaction(self, unused_obj, unused_event) -> None:
+        self.is_interacting = False
+        self.set_still_input()
+        self.interactor.GetRenderWindow().Render()
+        if self.log is not None:
+            self.log.debug(f'LOD frame times; {self.frame_times.get_stats()}')
+
+    def on_end_render(self, unused_obj, unused_event) -> None:
+        mode = 'interactive' if self.is_interacting else 'still'
+        self.frame_times.add(mode, self.renderer.GetLastRenderTimeInSeconds())
+
+    def remove(self) -> None:
+        """removes the observers and restores the full grid"""
+        self.interactor.RemoveObserver(self._observers[0])
+        self.interactor.RemoveObserver(self._observers[1])
+        self.renderer.RemoveObserver(self._observers[2])
+        self.mapper.SetInputData(self.full_input)
@@ -1,10 +1,13 @@
 """
 Defines:
  - data_in_material_coord(bdf, op2, in_place=False)
+ - ShellOrientationTable
+ - table = get_shell_orientation_table(bdf)
 
 """
 from __future__ import annotations
 import copy
+import weakref
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -27,6 +30,11 @@ stress_vectors = ['cquad4_stress', 'cquad8_stress', 'cquadr_stress',
                   'ctria3_stress', 'ctria6_stress', 'ctriar_stress']
 strain_vectors = ['cquad4_strain', 'cquad8_strain', 'cquadr_strain',
                   'ctria3_strain', 'ctria6_strain', 'ctriar_strain']
+QUAD_TYPES = {'CQUAD4', 'CQUAD8', 'CQUADR'}
+TRI_TYPES = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+
+# the orientation table of each BDF; see get_shell_orientation_table
+_ORIENTATION_CACHE = weakref.WeakKeyDictionary()
 
 def transf_Mohr(Sxx: np.ndarray,
                 Syy: np.ndarray,
@@ -201,21 +209,7 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
 
     """
     log = bdf.log
-
-    #eid_to_theta_rad = get_eid_to_theta_rad(bdf, debug)
-    eid_to_theta_rad = get_eid_to_theta_rad2(bdf, debug)
-    #assert len(eid_to_theta_rad) == len(eid_to_theta_rad2)
-    #is_failed = False
-    #for eid, theta1 in eid_to_theta_rad.items():
-        #theta2 = eid_to_theta_rad2[eid]
-        #theta1_deg = np.degrees(theta1)
-        #theta2_deg = np.degrees(theta2)
-        #if not np.allclose(theta1_deg, theta2_deg):
-            #elem = bdf.elements[eid]
-            #log.warning(f'eid={eid} {elem.type} theta/mcid={elem.theta_mcid} theta1={theta1_deg} theta2={theta2_deg}')
-            #is_failed = True
-    #if is_failed:
-        #x = 1
+    orientation_table = get_shell_orientation_table(bdf, debug=debug)
 
     if in_place:
         op2_new = op2
@@ -223,41 +217,23 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
         op2_new = copy.deepcopy(op2)
         op2_new.log = log
 
-    for vec_name in force_vectors:
-        op2_vectors = getattr(op2.op2_results.force, vec_name)
-        new_vectors = getattr(op2_new.op2_results.force, vec_name)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            _transform_shell_force(
-                vec_name,
-                vector, new_vector,
-                eid_to_theta_rad, log)
-            if new_vector.data_frame is not None:
-                new_vector.build_dataframe()
-
-    for vec_name in stress_vectors:
-        op2_vectors = getattr(op2.op2_results.stress, vec_name)
-        new_vectors = getattr(op2_new.op2_results.stress, vec_name)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            _transform_shell_stress(
-                vec_name,
-                vector, new_vector,
-                eid_to_theta_rad, log)
-            if new_vector.data_frame is not None:
-                new_vector.build_dataframe()
-
-    for vec_name in strain_vectors:
-        op2_vectors = getattr(op2.op2_results.strain, vec_name)
-        new_vectors = getattr(op2_new.op2_results.strain, vec_name)
-        for subcase, vector in op2_vectors.items():
-            new_vector = new_vectors[subcase]
-            _transform_shell_strain(
-                vec_name,
-                vector, new_vector,
-                eid_to_theta_rad, log)
-            if new_vector.data_frame is not None:
-                new_vector.build_dataframe()
+    vectors_transforms = [
+        (op2.op2_results.force, op2_new.op2_results.force, force_vectors, _transform_shell_force),
+        (op2.op2_results.stress, op2_new.op2_results.stress, stress_vectors, _transform_shell_stress),
+        (op2.op2_results.strain, op2_new.op2_results.strain, strain_vectors, _transform_shell_strain),
+    ]
+    for results, new_results, vec_names, transform_func in vectors_transforms:
+        for vec_name in vec_names:
+            op2_vectors = getattr(results, vec_name)
+            new_vectors = getattr(new_results, vec_name)
+            for subcase, vector in op2_vectors.items():
+                new_vector = new_vectors[subcase]
+                transform_func(
+                    vec_name,
+                    vector, new_vector,
+                    orientation_table, log)
+                if new_vector.data_frame is not None:
+                    new_vector.build_dataframe()
     return op2_new
 
 def get_eid_to_theta_rad(bdf: BDF, debug: bool) -> dict[int, float]:
@@ -363,165 +339,165 @@ def get_eid_to_theta_rad(bdf: BDF, debug: bool) -> dict[int, float]:
     eid_to_theta_rad = dict([[eid, theta] for eid, theta in zip(eids, theta_rad)])
     return eid_to_theta_rad
 
-def _get_tri_nodes(nids: np.ndarray,
-                   xyz_cid0: np.ndarray,
-                   element_nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    inode = np.searchsorted(nids, element_nodes)
-    g1 = xyz_cid0[inode[:, 0], :]
-    g2 = xyz_cid0[inode[:, 1], :]
-    g3 = xyz_cid0[inode[:, 2], :]
-    return g1, g2, g3
-
-def _get_quad_nodes(nids: np.ndarray,
-                    xyz_cid0: np.ndarray,
-                    element_nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    inode = np.searchsorted(nids, element_nodes)
-    g1 = xyz_cid0[inode[:, 0], :]
-    g2 = xyz_cid0[inode[:, 1], :]
-    g3 = xyz_cid0[inode[:, 2], :]
-    g4 = xyz_cid0[inode[:, 3], :]
-    return g1, g2, g3, g4
 
 def get_eid_to_theta_rad2(model: BDF, debug: bool) -> dict[int, float]:
-    coords = model.coords
-    nid_cp_cd, xyz_cid0, *unused = model.get_xyz_in_coord_array(
-        cid=0, fdtype='float64', idtype='int32')
-    nids = nid_cp_cd[:, 0]
-    #eids = []
-    #theta_deg = []
+    """gets the material angle of the shells; see ``build_shell_orientation_table``"""
+    orientation_table = build_shell_orientation_table(model, debug=debug)
+    return orientation_table.to_dict()
 
-    #eid_theta_ = []
-    #val_theta_ = []
-    eid_tri_mcid_ = []
-    val_tri_mcid_ = []
-    eid_quad_mcid_ = []
-    val_quad_mcid_ = []
 
-    eid_tri_theta_ = []
-    val_tri_theta_ = []
-    eid_quad_theta_ = []
-    val_quad_theta_ = []
-
-    eid_to_theta_rad = {}
-    #etype_to_mcid = {}
+class ShellOrientationTable:
+    """
+    The material angle (theta) of the shell elements of a BDF, which
+    rotates the element results into the material coordinate system.
+    """
+    def __init__(self, eids: np.ndarray, theta_rad: np.ndarray):
+        """
+        Parameters
+        ----------
+        eids : (nelements, ) int ndarray
+            the shell element ids
+        theta_rad : (nelements, ) float ndarray
+            the material angle relative to the element x-axis (radians)
+
+        """
+        isort = np.argsort(eids)
+        self.eids = np.asarray(eids)[isort]
+        self.theta_rad = np.asarray(theta_rad)[isort]
+
+    def get_theta_rad(self, eids: np.ndarray) -> np.ndarray:
+        """
+        Gets the material angles of a set of elements; elements that
+        aren't in the table have theta=0
+        """
+        eids = np.asarray(eids)
+        theta_rad = np.zeros(eids.shape, dtype='float64')
+        neids = len(self.eids)
+        if neids == 0:
+            return theta_rad
+        ieid = np.searchsorted(self.eids, eids).clip(max=neids - 1)
+        is_found = self.eids[ieid] == eids
+        theta_rad[is_found] = self.theta_rad[ieid[is_found]]
+        return theta_rad
+
+    def to_dict(self) -> dict[int, float]:
+        return {eid: theta for eid, theta in zip(self.eids, self.theta_rad)}
+
+    def __repr__(self) -> str:
+        return f'ShellOrientationTable(nelements={len(self.eids)})'
+
+
+def get_shell_orientation_table(model: BDF, debug: bool=False,
+                                use_cache: bool=True) -> ShellOrientationTable:
+    """
+    Gets the material angles of the shells of a BDF, which are cached
+    per BDF, so transforming many OP2s of the same model only builds the
+    table once.  The table is rebuilt if the number of elements, nodes or
+    coordinate systems changes; use ``use_cache=False`` after moving
+    nodes or changing a THETA/MCID.
+    """
+    key = (len(model.elements), len(model.nodes), len(model.coords))
+    if use_cache:
+        cached = _ORIENTATION_CACHE.get(model)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    orientation_table = build_shell_orientation_table(model, debug=debug)
+    _ORIENTATION_CACHE[model] = (key, orientation_table)
+    return orientation_table
 
-    node_tri_mcid_ = []
-    node_quad_mcid_ = []
 
-    node_tri_theta_ = []
-    node_quad_theta_ = []
+def build_shell_orientation_table(model: BDF, debug: bool=False) -> ShellOrientationTable:
+    """
+    Calculates the material angles of the CQUAD4, CQUAD8, CQUADR, CTRIA3,
+    CTRIA6 and CTRIAR elements.  The element objects are only looped over
+    once to get the THETA/MCID and nodes; the geometry is vectorized.
+
+     - THETA : the triangle theta is defined from the line G1-G2; the
+       quad theta is shifted by the angle of the bisector of the diagonals
+       (the element x-axis)
+     - MCID : the angle from the G1-G2 line to the projection of the
+       x-axis of the MCID coordinate system onto the element (also shifted
+       for the quads)
+    """
+    log = model.log
+    nid_cp_cd, xyz_cid0, *unused = model.get_xyz_in_coord_array(
+        cid=0, fdtype='float64', idtype='int32')
+    nids = nid_cp_cd[:, 0]
+    isort = np.argsort(nids)
+    nids = nids[isort]
+    xyz_cid0 = xyz_cid0[isort, :]
+
+    eids_list = []
+    is_quad_list = []
+    theta_mcid_list = []
+    nodes_list = []
     for eid, elem in model.elements.items():
         etype = elem.type
-        if etype in {'CQUAD4', 'CQUAD8', 'CQUADR'}:
-            theta_mcid = elem.theta_mcid
-            if isinstance(theta_mcid, float):
-                #eids.append(eid)
-                #theta_deg.append(theta_mcid)
-                eid_quad_theta_.append(eid)
-                val_quad_theta_.append(theta_mcid)
-                node_quad_theta_.append(elem.nodes[:4])
-                continue
-            eid_quad_mcid_.append(eid)
-            val_quad_mcid_.append(theta_mcid)
-            node_quad_mcid_.append(elem.nodes[:4])
-        elif etype in {'CTRIA3', 'CTRIA6', 'CTRIAR'}:
-            theta_mcid = elem.theta_mcid
-            if isinstance(theta_mcid, float):
-                #eids.append(eid)
-                #theta_deg.append(theta_mcid)
-                eid_tri_theta_.append(eid)
-                val_tri_theta_.append(theta_mcid)
-                node_tri_theta_.append(elem.nodes[:3])
-                continue
-            eid_tri_mcid_.append(eid)
-            val_tri_mcid_.append(theta_mcid)
-            node_tri_mcid_.append(elem.nodes[:3])
-        continue
-    #theta_rad = np.radians(theta_deg)
-
-    # put in dictionary form- maybe change later
-    #eid_to_theta_rad = {eid: theta for eid, theta in zip(eids, theta_rad)}
-
-
-    if len(eid_tri_theta_):
-        # the triangle theta is defined from the line g1-g2
-        eid_tri_theta = np.array(eid_tri_theta_, dtype='int32')
-        val_tri_theta_deg = np.array(val_tri_theta_, dtype='float64')
-        #node_tri_theta = np.array(node_tri_theta_, dtype='int32')
-        tri_theta_rad = np.radians(val_tri_theta_deg)
-
-        for eid, theta in zip(eid_tri_theta, tri_theta_rad):
-            eid_to_theta_rad[eid] = theta
-
-    if len(eid_quad_theta_):
-        # the quad theta hs
-        # For CQUAD4 elements which are not p-elements and not hyperelastic,
-        # the reference coordinate system is the default for output is the
-        # element coordinate system.
-        eid_quad_theta = np.array(eid_quad_theta_, dtype='int32')
-        val_quad_theta_deg = np.array(val_quad_theta_, dtype='float64')
-        node_quad_theta = np.array(node_quad_theta_, dtype='int32')
-        quad_theta_rad = np.radians(val_quad_theta_deg)
-
-        g1, g2, g3, g4 = _get_quad_nodes(nids, xyz_cid0, node_quad_theta)
-        g21 = g2 - g1
-        g12 = -g21
-
-        beta_rad = angle2vec(g3 - g1, g21)
-        gamma_rad = angle2vec(g4 - g2, g12)
-        alpha_rad = (beta_rad + gamma_rad) / 2.
-        theta_radi = alpha_rad - beta_rad
-        for eid, theta in zip(eid_quad_theta, quad_theta_rad+theta_radi):
-            eid_to_theta_rad[eid] = theta
-
-
-    if len(eid_quad_mcid_):
-        eid_quad_mcid = np.array(eid_quad_mcid_, dtype='int32')
-        val_quad_mcid = np.array(val_quad_mcid_, dtype='int32')
-        node_quad_mcid = np.array(node_quad_mcid_, dtype='int32')
-
-        g1, g2, g3, g4 = _get_quad_nodes(nids, xyz_cid0, node_quad_mcid)
-        g42 = g4 - g2
-        g31 = g3 - g1
-        g21 = g2 - g1
-        g12 = -g21
-        normals = _get_normal(g31, g42)
+        if etype in QUAD_TYPES:
+            is_quad_list.append(True)
+            nodes_list.append(elem.nodes[:4])
+        elif etype in TRI_TYPES:
+            # G4 isn't used
+            is_quad_list.append(False)
+            nodes_list.append(elem.nodes[:3] + elem.nodes[:1])
+        else:
+            continue
+        eids_list.append(eid)
+        theta_mcid_list.append(elem.theta_mcid)
+
+    nelements = len(eids_list)
+    if nelements == 0:
+        return ShellOrientationTable(np.zeros(0, dtype='int32'),
+                                     np.zeros(0, dtype='float64'))
+    eids = np.array(eids_list, dtype='int32')
+    is_quad = np.array(is_quad_list, dtype='bool')
+    is_mcid = np.array([isinstance(theta_mcid, integer_types)
+                        for theta_mcid in theta_mcid_list], dtype='bool')
+    theta_mcid = np.array(theta_mcid_list, dtype='float64')
+    element_nodes = np.array(nodes_list, dtype='int32')
 
-        csysi = np.array([coords[mcid].i for mcid in val_quad_mcid])
+    inode = np.searchsorted(nids, element_nodes)
+    g1 = xyz_cid0[inode[:, 0], :]
+    g2 = xyz_cid0[inode[:, 1], :]
+    g3 = xyz_cid0[inode[:, 2], :]
+    g4 = xyz_cid0[inode[:, 3], :]
+    g21 = g2 - g1
+    g31 = g3 - g1
+    g42 = g4 - g2
+
+    theta_rad = np.radians(theta_mcid)
+    if is_mcid.any():
+        is_quad_mcid = is_quad[is_mcid]
+        g21_mcid = g21[is_mcid, :]
+        g31_mcid = g31[is_mcid, :]
+        normals = np.where(is_quad_mcid[:, np.newaxis],
+                           _get_normal(g31_mcid, g42[is_mcid, :]),
+                           _get_normal(g21_mcid, g31_mcid))
+
+        # each coordinate system is only looked up once
+        mcids, imcid = np.unique(theta_mcid[is_mcid].astype('int32'), return_inverse=True)
+        coords_i = np.array([model.coords[mcid].i for mcid in mcids])
+        csysi = coords_i[imcid, :]
         imat = calc_imat(normals, csysi)
 
-        theta_radi = angle2vec(g21, imat)
+        theta_radi = angle2vec(g21_mcid, imat)
         # getting sign of THETA
-        check_normal = np.cross(g21, imat)
+        check_normal = np.cross(g21_mcid, imat)
         theta_radi *= np.sign((check_normal * normals).sum(axis=1))
-        beta_rad = angle2vec(g31, g21)
-        gamma_rad = angle2vec(g42, g12)
-        alpha_rad = (beta_rad + gamma_rad) / 2.
-        theta_radi += alpha_rad - beta_rad
-        for eid, theta in zip(eid_quad_mcid, theta_radi):
-            eid_to_theta_rad[eid] = theta
-
-    if len(eid_tri_mcid_):
-        eid_tri_mcid = np.array(eid_tri_mcid_, dtype='int32')
-        val_tri_mcid = np.array(val_tri_mcid_, dtype='int32')
-        node_tri_mcid = np.array(node_tri_mcid_, dtype='int32')
-        #eids.append(eid_tri_mcid)
-
-        g1, g2, g3 = _get_tri_nodes(nids, xyz_cid0, node_tri_mcid)
-        g21 = g2 - g1
-        normals = _get_normal(g21, g3 - g1)
-
-        csysi = np.array([coords[mcid].i for mcid in val_tri_mcid])
-        imat = calc_imat(normals, csysi)
+        theta_rad[is_mcid] = theta_radi
 
-        theta_radi = angle2vec(g21, imat)
-        # getting sign of THETA
-        check_normal = np.cross(g21, imat)
-        theta_radi *= np.sign((check_normal * normals).sum(axis=1))
-        for eid, theta in zip(eid_tri_mcid, theta_radi):
-            eid_to_theta_rad[eid] = theta
-    return eid_to_theta_rad
+    if is_quad.any():
+        g21_quad = g21[is_quad, :]
+        beta_rad = angle2vec(g31[is_quad, :], g21_quad)
+        gamma_rad = angle2vec(g42[is_quad, :], -g21_quad)
+        alpha_rad = (beta_rad + gamma_rad) / 2.
+        theta_rad[is_quad] += alpha_rad - beta_rad
 
+    if debug:
+        log.debug(f'eids = {eids}')
+        log.debug(f'is_mcid = {is_mcid}')
+        log.debug(f'theta_deg = {np.degrees(theta_rad)}')
+    return ShellOrientationTable(eids, theta_rad)
 
 
 def _get_normal(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
@@ -530,88 +506,48 @@ def _get_normal(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
     normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
     return normals
 
+
 def _transform_shell_force(vec_name: str,
                            vector:     RealPlateForceArray | RealPlateBilinearForceArray,
                            new_vector: RealPlateForceArray | RealPlateBilinearForceArray,
-                           eid_to_theta_rad: dict[int, float],
+                           orientation_table: ShellOrientationTable,
                            log: SimpleLogger):
     vec_eids = get_eids_from_op2_vector(vector)
     #NOTE assuming thetarad=0 for elements that exist in the op2 but
     #     not in the supplied bdf file
-    vec_theta_rad = np.array([eid_to_theta_rad.get(eid, 0.0) for eid in vec_eids])
+    vec_theta_rad = orientation_table.get_theta_rad(vec_eids)
 
-    if vec_eids.shape[0] == vector.data.shape[1] // 5:
+    data = vector.data
+    if vec_eids.shape[0] == data.shape[1] // 5:
+        # bilinear: the centroid and the 4 corners of each element
         #log.debug(f'A: vec_eids.shape={vec_eids.shape} vector.data.shape={vector.data.shape}')
-        steps = [5, 5, 5, 5, 5]
-    else: # assuming  always that veceids.shape[0] == vector.data.shape[1]
-        #log.debug(f'B: vec_eids.shape={vec_eids.shape} vector.data.shape={vector.data.shape}')
-        steps = [1]
-
-    for start, step in enumerate(steps):
-        slicei = slice(start, vector.data.shape[1], step)
-        # membrane terms
-        Sxx = vector.data[:, slicei, 0]
-        Syy = vector.data[:, slicei, 1]
-        Sxy = vector.data[:, slicei, 2]
-        if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-            Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                Sxx.real, Syy.real, Sxy.real, vec_theta_rad)
-            new_vector.data[:, slicei, 0].real = Sxx_theta_real
-            new_vector.data[:, slicei, 1].real = Syy_theta_real
-            new_vector.data[:, slicei, 2].real = Sxy_theta_real
-            Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                Sxx.imag, Syy.imag, Sxy.imag, vec_theta_rad)
-            new_vector.data[:, slicei, 0].imag = Sxx_theta_imag
-            new_vector.data[:, slicei, 1].imag = Syy_theta_imag
-            new_vector.data[:, slicei, 2].imag = Sxy_theta_imag
-        else:
-            Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vec_theta_rad)
-            new_vector.data[:, slicei, 0] = Sxx_theta
-            new_vector.data[:, slicei, 1] = Syy_theta
-            new_vector.data[:, slicei, 2] = Sxy_theta
-
-        # bending terms
-        Sxx = vector.data[:, slicei, 3]
-        Syy = vector.data[:, slicei, 4]
-        Sxy = vector.data[:, slicei, 5]
-        if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-            Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                Sxx.real, Syy.real, Sxy.real, vec_theta_rad)
-            new_vector.data[:, slicei, 3].real = Sxx_theta_real
-            new_vector.data[:, slicei, 4].real = Syy_theta_real
-            new_vector.data[:, slicei, 5].real = Sxy_theta_real
-            Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                Sxx.imag, Syy.imag, Sxy.imag, vec_theta_rad)
-            new_vector.data[:, slicei, 3].imag = Sxx_theta_imag
-            new_vector.data[:, slicei, 4].imag = Syy_theta_imag
-            new_vector.data[:, slicei, 5].imag = Sxy_theta_imag
-
-        else:
-            Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vec_theta_rad)
-            new_vector.data[:, slicei, 3] = Sxx_theta
-            new_vector.data[:, slicei, 4] = Syy_theta
-            new_vector.data[:, slicei, 5] = Sxy_theta
-
-        # transverse terms
-        Qx = vector.data[:, slicei, 6]
-        Qy = vector.data[:, slicei, 7]
-        cos_theta = cos(vec_theta_rad)
-        sin_theta = sin(vec_theta_rad)
-        if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-            Qx_new_real = cos_theta*Qx.real + sin_theta*Qy.real
-            Qy_new_real = -sin_theta*Qx.real + cos_theta*Qy.real
-            new_vector.data[:, slicei, 6].real = Qx_new_real
-            new_vector.data[:, slicei, 7].real = Qy_new_real
-
-            Qx_new_imag = cos_theta*Qx.imag + sin_theta*Qy.imag
-            Qy_new_imag = -sin_theta*Qx.imag + cos_theta*Qy.imag
-            new_vector.data[:, slicei, 6].imag = Qx_new_imag
-            new_vector.data[:, slicei, 7].imag = Qy_new_imag
-        else:
-            Qx_new = cos_theta*Qx + sin_theta*Qy
-            Qy_new = -sin_theta*Qx + cos_theta*Qy
-            new_vector.data[:, slicei, 6] = Qx_new
-            new_vector.data[:, slicei, 7] = Qy_new
+        vec_theta_rad = np.repeat(vec_theta_rad, 5)
+    # else: assuming always that veceids.shape[0] == vector.data.shape[1]
+
+    # (ntimes, nrows) for all the times at once; the rotation is linear,
+    # so real and complex results are handled the same way
+    cos_theta = cos(vec_theta_rad)[np.newaxis, :]
+    sin_theta = sin(vec_theta_rad)[np.newaxis, :]
+    cos_2theta = cos(2 * vec_theta_rad)[np.newaxis, :]
+    sin_2theta = sin(2 * vec_theta_rad)[np.newaxis, :]
+
+    # membrane terms
+    membrane = _rotate_tensor_2d(data[:, :, 0], data[:, :, 1], data[:, :, 2],
+                                 cos_2theta, sin_2theta)
+    # bending terms
+    bending = _rotate_tensor_2d(data[:, :, 3], data[:, :, 4], data[:, :, 5],
+                                cos_2theta, sin_2theta)
+    # transverse terms
+    Qx = data[:, :, 6]
+    Qy = data[:, :, 7]
+    Qx_new = cos_theta*Qx + sin_theta*Qy
+    Qy_new = -sin_theta*Qx + cos_theta*Qy
+
+    new_data = new_vector.data
+    new_data[:, :, 0], new_data[:, :, 1], new_data[:, :, 2] = membrane
+    new_data[:, :, 3], new_data[:, :, 4], new_data[:, :, 5] = bending
+    new_data[:, :, 6] = Qx_new
+    new_data[:, :, 7] = Qy_new
 
     #TODO implement transformation for corner nodes
     #     for now we just zero the wrong values
@@ -623,101 +559,75 @@ def _transform_shell_stress(
         vec_name: str,
         vector: RealPlateStressArray,
         new_vector: RealPlateStressArray,
-        eid_to_theta_rad: dict[int, float],
+        orientation_table: ShellOrientationTable,
         log: SimpleLogger):
-    vec_eids = get_eids_from_op2_vector(vector)
-    check = (vec_eids != 0)
-    if np.any(~check):
-        log.warning(f'why are there 0 element ids?  vec_eids={vec_eids}')
-    vec_eids = vec_eids[check]
-    #NOTE assuming thetarad=0 for elements that exist in the op2 but
-    #     not in the supplied bdf file
-    vec_theta_rad = np.array([eid_to_theta_rad.get(eid, 0.0) for eid in vec_eids])
-
-    # bottom and top in-plane stresses
-    if vector.data.shape[2] > 3:
-        Sxx = vector.data[:, :, 1][:, check]
-        Syy = vector.data[:, :, 2][:, check]
-        Sxy = vector.data[:, :, 3][:, check]
-    else:
-        Sxx = vector.data[:, :, 0][:, check]
-        Syy = vector.data[:, :, 1][:, check]
-        Sxy = vector.data[:, :, 2][:, check]
-    if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-        Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(Sxx.real, Syy.real, Sxy.real, vec_theta_rad)
-        Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(Sxx.imag, Syy.imag, Sxy.imag, vec_theta_rad)
-        tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-        tmp.real = Sxx_theta_real
-        tmp.imag = Sxx_theta_imag
-        new_vector.data[:, :, 0][:, check] = tmp
-        tmp.real = Syy_theta_real
-        tmp.imag = Syy_theta_imag
-        new_vector.data[:, :, 1][:, check] = tmp
-        tmp.real = Sxy_theta_real
-        tmp.imag = Sxy_theta_imag
-        new_vector.data[:, :, 2][:, check] = tmp
-    else:
-        Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vec_theta_rad)
-        new_vector.data[:, :, 1][:, check] = Sxx_theta
-        new_vector.data[:, :, 2][:, check] = Syy_theta
-        new_vector.data[:, :, 3][:, check] = Sxy_theta
-        theta_deg_new = theta_deg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
-        new_vector.data[:, :, 4][:, check] = theta_deg_new
-
-    #TODO implement transformation for corner nodes
-    #     for now we just zero the wrong values
-    if 'quad8' in vec_name:
-        for i in [2, 3, 4, 5, 6, 7, 8, 9]:
-            new_vector.data[:, i, :] = 0
+    _transform_shell_stress_strain(vec_name, vector, new_vector,
+                                   orientation_table, log, is_stress=True)
 
 def _transform_shell_strain(
         vec_name: str,
         vector: RealPlateStrainArray,
         new_vector: RealPlateStrainArray,
-        eid_to_theta_rad: dict[int, float],
+        orientation_table: ShellOrientationTable,
         log: SimpleLogger):
+    _transform_shell_stress_strain(vec_name, vector, new_vector,
+                                   orientation_table, log, is_stress=False)
+
+def _transform_shell_stress_strain(
+        vec_name: str,
+        vector: RealPlateStressArray | RealPlateStrainArray,
+        new_vector: RealPlateStressArray | RealPlateStrainArray,
+        orientation_table: ShellOrientationTable,
+        log: SimpleLogger,
+        is_stress: bool) -> None:
+    """rotates the bottom and top in-plane stresses/strains for all the times"""
     vec_eids = get_eids_from_op2_vector(vector)
     check = (vec_eids != 0)
     if np.any(~check):
         log.warning(f'why are there 0 element ids?  vec_eids={vec_eids}')
-
     vec_eids = vec_eids[check]
     #NOTE assuming thetarad=0 for elements that exist in the op2 but
     #     not in the supplied bdf file
-    theta_rad = np.array([eid_to_theta_rad.get(eid, 0.0) for eid in vec_eids])
-
-    # bottom and top in-plane strains
-    if vector.data.shape[2] > 3:
-        exx = vector.data[:, :, 1][:, check]
-        eyy = vector.data[:, :, 2][:, check]
-        exy = vector.data[:, :, 3][:, check] / 2.
-    else:
-        exx = vector.data[:, :, 0][:, check]
-        eyy = vector.data[:, :, 1][:, check]
-        exy = vector.data[:, :, 2][:, check] / 2.
-    if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-        exx_theta_real, eyy_theta_real, exy_theta_real = transf_Mohr(exx.real, eyy.real, exy.real, theta_rad)
-        exx_theta_imag, eyy_theta_imag, exy_theta_imag = transf_Mohr(exx.imag, eyy.imag, exy.imag, theta_rad)
-        tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-        tmp.real = exx_theta_real
-        tmp.imag = exx_theta_imag
-        new_vector.data[:, :, 0][:, check] = tmp
-        tmp.real = eyy_theta_real
-        tmp.imag = eyy_theta_imag
-        new_vector.data[:, :, 1][:, check] = tmp
-        tmp.real = exy_theta_real * 2.
-        tmp.imag = exy_theta_imag * 2.
-        new_vector.data[:, :, 2][:, check] = tmp
-    else:
-        exx_theta, eyy_theta, exy_theta = transf_Mohr(exx, eyy, exy, theta_rad)
-        theta_deg_new = theta_deg_to_principal(exx_theta, eyy_theta, exy_theta) # TODO: can we just add dtheta?
-        new_vector.data[:, :, 1][:, check] = exx_theta
-        new_vector.data[:, :, 2][:, check] = eyy_theta
-        new_vector.data[:, :, 3][:, check] = exy_theta * 2.
-        new_vector.data[:, :, 4][:, check] = theta_deg_new
+    vec_theta_rad = orientation_table.get_theta_rad(vec_eids)
+    cos_2theta = cos(2 * vec_theta_rad)[np.newaxis, :]
+    sin_2theta = sin(2 * vec_theta_rad)[np.newaxis, :]
+
+    # [fiber_distance, oxx, oyy, txy, angle, ...] or [oxx, oyy, txy]
+    data = vector.data
+    i0 = 1 if data.shape[2] > 3 else 0
+    Sxx = data[:, check, i0]
+    Syy = data[:, check, i0 + 1]
+    Sxy = data[:, check, i0 + 2]
+    if not is_stress:
+        # engineering -> tensor shear strain
+        Sxy = Sxy / 2.
+    Sxx_theta, Syy_theta, Sxy_theta = _rotate_tensor_2d(
+        Sxx, Syy, Sxy, cos_2theta, sin_2theta)
+
+    new_data = new_vector.data
+    new_data[:, check, i0] = Sxx_theta
+    new_data[:, check, i0 + 1] = Syy_theta
+    new_data[:, check, i0 + 2] = Sxy_theta if is_stress else Sxy_theta * 2.
+    if not np.iscomplexobj(data):
+        theta_deg_new = theta_deg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
+        new_data[:, check, 4] = theta_deg_new
 
     #TODO implement transformation for corner nodes
     #     for now we just zero the wrong values
     if 'quad8' in vec_name:
         for i in [2, 3, 4, 5, 6, 7, 8, 9]:
             new_vector.data[:, i, :] = 0
+
+def _rotate_tensor_2d(Sxx: np.ndarray, Syy: np.ndarray, Sxy: np.ndarray,
+                      cos_2theta: np.ndarray,
+                      sin_2theta: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rotates a plane stress tensor by theta (see ``transf_Mohr``).  The
+    rotation is linear in the stresses, so it works for complex stresses.
+    """
+    Scenter = (Sxx + Syy) / 2.
+    Sdiff = (Sxx - Syy) / 2.
+    Sxx_theta = Scenter + Sdiff * cos_2theta + Sxy * sin_2theta
+    Syy_theta = Scenter - Sdiff * cos_2theta - Sxy * sin_2theta
+    Sxy_theta = -Sdiff * sin_2theta + Sxy * cos_2theta
+    return Sxx_theta, Syy_theta, Sxy_theta
@@ -0,0 +1,83 @@
+"""
+Benchmarks the F06 writer of the large result tables:
+
+ - displacements (RealTableArray; SORT1 and SORT2)
+ - CHEXA stress (RealSolidArray)
+ - CQUAD4 stress (RealPlateArray)
+
+The results are tiled to get a sense of the behavior of a large run::
+
+    python benchmark_f06.py static_solid_shell_bar.op2 --nscale 20000
+
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.op2.op2 import read_op2
+
+OFFSET = 10_000_000
+
+
+def _tile_ids(ids: np.ndarray, nscale: int) -> np.ndarray:
+    """tiles the ids (first column) with an offset, so they're unique"""
+    ids = np.tile(ids, (nscale, 1))
+    ids[:, 0] += np.repeat(np.arange(nscale) * OFFSET, len(ids) // nscale).astype(ids.dtype)
+    return ids
+
+
+def scale_result(obj, nscale: int) -> None:
+    """tiles a result by nscale ids"""
+    obj.data = np.tile(obj.data, (1, nscale, 1))
+    for attr in ['node_gridtype', 'element_node', 'element_cid']:
+        ids = getattr(obj, attr, None)
+        if ids is not None:
+            setattr(obj, attr, _tile_ids(ids, nscale))
+    obj.ntotal = obj.data.shape[1]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('op2_filename')
+    parser.add_argument('--nscale', type=int, default=1, help='the id multiplier')
+    args = parser.parse_args(argv)
+
+    log = SimpleLogger(level='error')
+    model = read_op2(args.op2_filename, log=log)
+    results = []
+    for name, result in [('displacements', model.displacements),
+                         ('chexa_stress', model.op2_results.stress.chexa_stress),
+                         ('cquad4_stress', model.op2_results.stress.cquad4_stress)]:
+        if result:
+            obj = next(iter(result.values()))
+            scale_result(obj, args.nscale)
+            results.append((name, obj))
+
+    f06_filename = os.path.join(tempfile.mkdtemp(), 'benchmark.f06')
+    try:
+        for name, obj in results:
+            cases = [('', True)]
+            if name == 'displacements' and obj.nonlinear_factor not in (None, np.nan):
+                cases.append((' (SORT2)', False))
+            for word, is_sort1 in cases:
+                t0 = time.time()
+                with open(f06_filename, 'w') as f06_file:
+                    obj.write_f06(f06_file, header=['', '', ''], is_sort1=is_sort1)
+                dt = time.time() - t0
+                with open(f06_filename, 'r') as f06_file:
+                    nlines = sum(1 for unused_line in f06_file)
+                mb = os.path.getsize(f06_filename) / 1024 ** 2
+                print(f'{name + word:24s} shape={str(obj.data.shape):18s} {dt:6.2f} s; '
+                      f'{mb / dt:6.1f} MB/s; {nlines / dt / 1e6:5.2f} M lines/s')
+    finally:
+        os.remove(f06_filename)
+        os.rmdir(os.path.dirname(f06_filename))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main(sys.argv[1:])
@@ -0,0 +1,90 @@
+"""
+Benchmarks the OP2 writer of the large result tables:
+
+ - displacements (RealTableArray)
+ - CHEXA stress (RealSolidArray)
+ - CQUAD4 stress (RealPlateArray)
+ - CBAR stress/force (RealBarArray/RealCBarForceArray)
+
+The results are tiled to get a sense of the behavior of a large run::
+
+    python benchmark_op2_writer.py static_solid_shell_bar.op2 --nscale 20000
+
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.op2.op2 import read_op2
+
+
+def scale_result(obj, nscale: int) -> None:
+    """
+    tiles a result by nscale ids
+
+    The ids are offset by the max id, so they're unique and still
+    fit in a 32-bit OP2.
+    """
+    obj.data = np.tile(obj.data, (1, nscale, 1))
+    for attr in ['node_gridtype', 'element_node', 'element_cid', 'element']:
+        ids = getattr(obj, attr, None)
+        if ids is None:
+            continue
+        ids0 = ids if ids.ndim == 1 else ids[:, 0]
+        offset = np.repeat(np.arange(nscale) * ids0.max(), len(ids)).astype(ids.dtype)
+        if ids.ndim == 1:
+            ids2 = np.tile(ids, nscale) + offset
+        else:
+            ids2 = np.tile(ids, (nscale, 1))
+            ids2[:, 0] += offset
+        setattr(obj, attr, ids2)
+    obj.ntotal = obj.data.shape[1]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('op2_filename')
+    parser.add_argument('--nscale', type=int, default=1, help='the id multiplier')
+    parser.add_argument('--size', type=int, default=4, choices=[4, 8],
+                        help='4: 32-bit OP2; 8: 64-bit OP2')
+    args = parser.parse_args(argv)
+
+    log = SimpleLogger(level='error')
+    model = read_op2(args.op2_filename, log=log)
+    results = [
+        ('displacements', 'displacements'),
+        ('chexa_stress', 'stress.chexa_stress'),
+        ('cquad4_stress', 'stress.cquad4_stress'),
+        ('cbar_stress', 'stress.cbar_stress'),
+        ('cbar_force', 'force.cbar_force'),
+    ]
+    for name, table_type in results:
+        result = model.get_result(table_type)
+        if not result:
+            continue
+        obj = next(iter(result.values()))
+        scale_result(obj, args.nscale)
+
+        # write just the one table
+        skips = [table_typei for table_typei in model.get_table_types()
+                 if table_typei != table_type]
+        op2_filename = os.path.join(tempfile.mkdtemp(), 'benchmark.op2')
+        try:
+            t0 = time.time()
+            model.write_op2(op2_filename, skips=skips, size=args.size)
+            dt = time.time() - t0
+            mb = os.path.getsize(op2_filename) / 1024 ** 2
+            print(f'{name:24s} shape={str(obj.data.shape):18s} {dt:6.2f} s; '
+                  f'{mb:8.1f} MB; {mb / dt:7.1f} MB/s')
+        finally:
+            os.remove(op2_filename)
+            os.rmdir(os.path.dirname(op2_filename))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main(sys.argv[1:])
@@ -0,0 +1,133 @@
+"""
+Benchmarks the Parquet export of an OP2 against the pandas path:
+
+ - ``OP2.build_dataframe()`` + ``DataFrame.to_parquet(...)`` per result
+ - ``OP2.export_parquet(...)``
+
+The results may be scaled up (more elements/nodes and times) to get a
+sense of the behavior of a large run::
+
+    python benchmark_parquet.py transient_solid_shell_bar.op2 --nscale 200 --ntimes 10
+
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.op2.op2 import OP2, read_op2
+from pyNastran.op2.op2_interface.parquet_interface import SKIP_RESULTS, _is_exportable
+
+
+def scale_results(model: OP2, nscale: int, ntimes_scale: int) -> None:
+    """tiles the results by nscale ids and ntimes_scale times"""
+    for result_name in model.get_table_types():
+        results = model.get_result(result_name)
+        if result_name in SKIP_RESULTS or not isinstance(results, dict):
+            continue
+        for obj in results.values():
+            if not _is_exportable(obj):
+                continue
+            ntimes = len(obj._times)
+            data = np.tile(obj.data, (ntimes_scale, nscale, 1))
+            for attr in ['node_gridtype', 'element_node', 'element_layer', 'element',
+                         'gridtype_str', 'fiber_distance', 'xxb', 'node_element',
+                         'element_names']:
+                ids = getattr(obj, attr, None)
+                if not isinstance(ids, np.ndarray) or ids.ndim == 0:
+                    continue
+                if ids.shape[0] == ntimes and ids.ndim >= 2 and attr in {'node_element', 'element_names'}:
+                    ids = np.tile(ids, (ntimes_scale, nscale) + (1, ) * (ids.ndim - 2))
+                else:
+                    ids = np.tile(ids, (nscale, ) + (1, ) * (ids.ndim - 1))
+                    if attr in {'node_gridtype', 'element_node', 'element_layer', 'element'}:
+                        # unique ids for the MultiIndex
+                        offset = np.repeat(np.arange(nscale) * 10_000_000, len(ids) // nscale)
+                        if ids.ndim == 1:
+                            ids += offset
+                        else:
+                            ids[:, 0] += offset
+                setattr(obj, attr, ids)
+            obj.data = data
+            # the element/node counters (nelements, nnodes, ntotal, ...)
+            ntotal = obj.data.shape[1] // nscale
+            for attr, value in list(vars(obj).items()):
+                if isinstance(value, int) and not isinstance(value, bool) and value == ntotal and attr != 'ntimes':
+                    setattr(obj, attr, value * nscale)
+            for name in obj.data_code['data_names']:
+                values = getattr(obj, name + 's', None)
+                if values is not None and len(values) == ntimes:
+                    values = np.asarray(values)
+                    if values.dtype.kind in 'iuf':
+                        values = np.hstack([values + i * (values.max() + 1) for i in range(ntimes_scale)])
+                    else:
+                        values = np.tile(values, ntimes_scale)
+                    setattr(obj, name + 's', values)
+            obj._times = getattr(obj, obj.data_code['data_names'][0] + 's', np.tile(obj._times, ntimes_scale))
+            obj.ntimes = len(obj._times)
+
+
+def run_pandas(model: OP2, dirname: str) -> None:
+    """the DataFrame path"""
+    model.build_dataframe()
+    for result_name in model.get_table_types():
+        results = model.get_result(result_name)
+        if result_name in SKIP_RESULTS or not isinstance(results, dict):
+            continue
+        for key, obj in results.items():
+            data_frame = getattr(obj, 'data_frame', None)
+            if data_frame is None:
+                continue
+            data_frame = data_frame.reset_index()
+            # the columns must be unique strings and the mixed int/str
+            # columns (e.g., NodeID, Item) must be cast
+            data_frame.columns = [f'{column}_{i}' for i, column in enumerate(data_frame.columns)]
+            for column, dtype in zip(data_frame.columns, data_frame.dtypes):
+                if dtype == object:
+                    data_frame[column] = data_frame[column].astype(str)
+            parquet_filename = os.path.join(dirname, f'{result_name}_{key}.parquet')
+            data_frame.to_parquet(parquet_filename)
+
+
+def _run(func, *args) -> tuple[float, float]:
+    """gets the time (s) and peak memory (MB)"""
+    tracemalloc.start()
+    t0 = time.time()
+    func(*args)
+    dt = time.time() - t0
+    unused_current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dt, peak / 1024 ** 2
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('op2_filename')
+    parser.add_argument('--nscale', type=int, default=1, help='the id multiplier')
+    parser.add_argument('--ntimes', type=int, default=1, help='the time multiplier')
+    args = parser.parse_args(argv)
+
+    log = SimpleLogger(level='error')
+    dirname = tempfile.mkdtemp()
+    try:
+        model = read_op2(args.op2_filename, log=log)
+        scale_results(model, args.nscale, args.ntimes)
+        dt, peak = _run(model.export_parquet, os.path.join(dirname, 'export'))
+        print(f'export_parquet:                 {dt:.2f} s; peak={peak:.0f} MB')
+
+        pandas_dirname = os.path.join(dirname, 'pandas')
+        os.makedirs(pandas_dirname)
+        dt, peak = _run(run_pandas, model, pandas_dirname)
+        print(f'build_dataframe + to_parquet:   {dt:.2f} s; peak={peak:.0f} MB')
+    finally:
+        shutil.rmtree(dirname)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main(sys.argv[1:])
@@ -0,0 +1,375 @@
+"""
+Factored load combinations and max/min envelopes of static OP2 results.
+
+A combination is a factored sum of subcases:
+
+    combination[i] = sum(factors[i, j] * subcase[j])
+
+which is a matrix product of the (ncombo, nsubcase) factor matrix and the
+stacked (nsubcase, nvalue) subcase data.  The combinations are computed
+in chunks, the derived columns (e.g., principal stresses, von Mises) are
+recomputed from the combined components, and only the running max/min
+(and the governing combination) are kept, so the (ncombo, nvalue)
+combinations are never stored.
+
+defines:
+ - LoadCombinationEnvelope
+ - envelope = combine_results(results, factors, combo_ids=None, itime=0)
+ - envelopes = combine_op2_results(model, subcase_ids, factors,
+                                   combo_ids=None, result_names=None)
+
+"""
+from __future__ import annotations
+import copy
+from typing import Any, Callable, Optional, TYPE_CHECKING
+import numpy as np
+
+from pyNastran.op2.tables.oes_stressStrain.real.oes_plates import RealPlateArray
+from pyNastran.op2.tables.oes_stressStrain.real.oes_solids import RealSolidArray
+from pyNastran.op2.tables.oes_stressStrain.real.oes_bars import RealBarArray
+from pyNastran.op2.tables.oes_stressStrain.real.oes_beams import RealBeamArray
+from pyNastran.op2.tables.oes_stressStrain.real.oes_composite_plates import RealCompositePlateArray
+from pyNastran.op2.tables.oee_energy.oee_objects import RealStrainEnergyArray
+from pyNastran.op2.tables.oes_stressStrain.stress_invariants import (
+    principal_2d, principal_3d, von_mises, max_shear, octahedral_shear)
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+    from pyNastran.op2.op2 import OP2
+
+# the (node/element) id arrays of the result objects
+ID_NAMES = ['node_gridtype', 'node_element', 'element_node', 'element_layer', 'element']
+
+
+class LoadCombinationEnvelope:
+    """
+    The max/min envelope of a set of load combinations
+
+    Attributes
+    ----------
+    result : OP2 result object
+        the first subcase (defines the ids/headers)
+    combo_ids : (ncombo, ) int ndarray
+        the ids of the combinations
+    max / min : (nvalue, ncolumn) float64 ndarray
+        the max/min of each column over the combinations;
+        nan for columns that aren't enveloped (e.g., margins)
+    max_combo_id / min_combo_id : (nvalue, ncolumn) int ndarray
+        the governing combination of max/min; 0 for no combination
+
+    """
+    def __init__(self, result: Any, combo_ids: np.ndarray,
+                 max_values: np.ndarray, min_values: np.ndarray,
+                 max_combo_id: np.ndarray, min_combo_id: np.ndarray):
+        self.result = result
+        self.combo_ids = combo_ids
+        self.max = max_values
+        self.min = min_values
+        self.max_combo_id = max_combo_id
+        self.min_combo_id = min_combo_id
+
+    @property
+    def headers(self) -> list[str]:
+        return self.result.get_headers()
+
+    @property
+    def ncombo(self) -> int:
+        return len(self.combo_ids)
+
+    def get_envelope_result(self, envelope: str='max') -> Any:
+        """
+        Gets an OP2 result object (e.g., for writing an F06) of the envelope
+
+        Parameters
+        ----------
+        envelope : str; default='max'
+            'max', 'min'
+
+        Returns
+        -------
+        result : OP2 result object
+            a single time result with the envelope, so each column
+            may come from a different combination
+
+        """
+        assert envelope in {'max', 'min'}, envelope
+        values = self.max if envelope == 'max' else self.min
+        result = copy.deepcopy(self.result)
+        result.data = values[np.newaxis, :, :].astype(self.result.data.dtype)
+        result.ntimes = 1
+        result._times = np.zeros(1, dtype=self.result._times.dtype)
+        if hasattr(result, 'node_element') and result.node_element.ndim == 3:
+            # grid point forces
+            result.node_element = result.node_element[:1]
+        return result
+
+    def __repr__(self) -> str:
+        return (f'LoadCombinationEnvelope({self.result.__class__.__name__}, '
+                f'ncombo={self.ncombo}, shape={self.max.shape})')
+
+
+def combine_results(results: list[Any],
+                    factors: np.ndarray,
+                    combo_ids: Optional[np.ndarray]=None,
+                    itime: int=0,
+                    max_nbytes: int=256 * 1024 ** 2) -> LoadCombinationEnvelope:
+    """
+    Calculates the max/min envelope of the load combinations of a result
+    (e.g., displacement, cquad4_stress, grid_point_forces)
+
+    Parameters
+    ----------
+    results : list[OP2 result object]
+        the (real) result of each subcase; the results must have the
+        same nodes/elements
+    factors : (ncombo, nsubcase) float ndarray
+        the factor of each subcase in each combination
+    combo_ids : (ncombo, ) int ndarray; default=None -> 1, 2, ...
+        the ids of the combinations
+    itime : int; default=0
+        the time of the results (e.g., the load step)
+    max_nbytes : int; default=256 MB
+        the approximate size of a chunk of combinations
+
+    Returns
+    -------
+    envelope : LoadCombinationEnvelope
+        the max/min envelope and the governing combinations
+
+    Notes
+    -----
+     - the principal/von Mises/max shear columns of the plate, solid,
+       composite, bar and beam stresses/strains are recomputed
+     - the margin of safety columns aren't enveloped (nan)
+     - strain energy can't be combined
+
+    """
+    factors = np.atleast_2d(np.asarray(factors, dtype='float64'))
+    ncombo, nsubcase = factors.shape
+    assert len(results) == nsubcase, f'nresults={len(results)} factors.shape={factors.shape}'
+    if combo_ids is None:
+        combo_ids = np.arange(1, ncombo + 1, dtype='int32')
+    combo_ids = np.asarray(combo_ids)
+    assert len(combo_ids) == ncombo, f'ncombo_ids={len(combo_ids)} factors.shape={factors.shape}'
+
+    result0 = results[0]
+    _check_results(results)
+    headers = result0.get_headers()
+    recompute, constant_columns = _get_recompute(result0)
+    is_margin = np.array([_is_margin(header) for header in headers])
+
+    # (nsubcase, nvalue, ncolumn)
+    stacked = np.stack([result.data[itime, :, :] for result in results]).astype('float64')
+    nvalue, ncolumn = stacked.shape[1:]
+    stacked_2d = stacked.reshape(nsubcase, nvalue * ncolumn)
+
+    max_values = np.full((nvalue, ncolumn), -np.inf)
+    min_values = np.full((nvalue, ncolumn), np.inf)
+    imax = np.full((nvalue, ncolumn), -1, dtype='int64')
+    imin = np.full((nvalue, ncolumn), -1, dtype='int64')
+
+    # ~3 (nchunk, nvalue, ncolumn) float64 arrays
+    nchunk = max(1, max_nbytes // (3 * 8 * nvalue * ncolumn))
+    for icombo0 in range(0, ncombo, nchunk):
+        factors_chunk = factors[icombo0:icombo0 + nchunk, :]
+        combined = (factors_chunk @ stacked_2d).reshape(len(factors_chunk), nvalue, ncolumn)
+        if constant_columns:
+            combined[:, :, constant_columns] = stacked[0, :, constant_columns].T
+        if recompute is not None:
+            recompute(result0, combined)
+        combined[:, :, is_margin] = np.nan
+
+        _update_envelope(combined, icombo0, max_values, imax, is_max=True)
+        _update_envelope(combined, icombo0, min_values, imin, is_max=False)
+
+    max_combo_id = np.where(imax >= 0, combo_ids[imax.clip(min=0)], 0)
+    min_combo_id = np.where(imin >= 0, combo_ids[imin.clip(min=0)], 0)
+    max_values[imax < 0] = np.nan
+    min_values[imin < 0] = np.nan
+    return LoadCombinationEnvelope(result0, combo_ids,
+                                   max_values, min_values,
+                                   max_combo_id, min_combo_id)
+
+
+def combine_op2_results(model: OP2,
+                        subcase_ids: list[Any],
+                        factors: np.ndarray,
+                        combo_ids: Optional[np.ndarray]=None,
+                        result_names: Optional[list[str]]=None,
+                        itime: int=0,
+                        max_nbytes: int=256 * 1024 ** 2,
+                        log: Optional[SimpleLogger]=None) -> dict[str, LoadCombinationEnvelope]:
+    """
+    Calculates the max/min envelopes of the load combinations of the
+    results of an OP2
+
+    Parameters
+    ----------
+    model : OP2
+        the OP2 with the static subcases
+    subcase_ids : list[int/tuple]
+        the keys of the subcases (the columns of factors)
+    factors : (ncombo, nsubcase) float ndarray
+        the factor of each subcase in each combination
+    result_names : list[str]; default=None -> all
+        the results to combine (e.g., 'displacements', 'stress.cquad4_stress')
+    log : SimpleLogger; default=None -> model.log
+        logs the skipped results
+
+    See ``combine_results`` for the other parameters
+
+    Returns
+    -------
+    envelopes : dict[result_name] = LoadCombinationEnvelope
+        the envelope of each result
+
+    """
+    if log is None:
+        log = model.log
+    if result_names is None:
+        result_names = model.get_table_types()
+
+    envelopes = {}
+    for result_name in result_names:
+        try:
+            results_dict = model.get_result(result_name)
+        except AttributeError:
+            continue
+        if not isinstance(results_dict, dict) or len(results_dict) == 0:
+            continue
+        missing_ids = [subcase_id for subcase_id in subcase_ids
+                       if subcase_id not in results_dict]
+        if missing_ids:
+            log.debug(f'skipping {result_name}; missing subcases={missing_ids}')
+            continue
+        results = [results_dict[subcase_id] for subcase_id in subcase_ids]
+        if not _is_combinable(results[0]):
+            log.warning(f'skipping {result_name}; {results[0].__class__.__name__} '
+                        'is not a real result that can be combined')
+            continue
+        envelopes[result_name] = combine_results(
+            results, factors, combo_ids=combo_ids, itime=itime,
+            max_nbytes=max_nbytes)
+    return envelopes
+
+
+def _is_combinable(result: Any) -> bool:
+    """can the result be combined?"""
+    if not hasattr(result, 'data') or not hasattr(result, 'get_headers'):
+        return False
+    if isinstance(result, RealStrainEnergyArray):
+        return False
+    return result.data.ndim == 3 and not np.iscomplexobj(result.data)
+
+
+def _check_results(results: list[Any]) -> None:
+    """verifies that the subcases have the same nodes/elements"""
+    result0 = results[0]
+    assert _is_combinable(result0), f'{result0.__class__.__name__} cannot be combined'
+    for result in results[1:]:
+        assert result.__class__ is result0.__class__, (result0.__class__.__name__, result.__class__.__name__)
+        assert result.data.shape[1:] == result0.data.shape[1:], (result0.data.shape, result.data.shape)
+        for name in ID_NAMES:
+            if hasattr(result0, name):
+                ids0 = getattr(result0, name)
+                ids = getattr(result, name)
+                if name == 'node_element':
+                    # grid point forces
+                    ids0 = ids0[0]
+                    ids = ids[0]
+                assert np.array_equal(ids0, ids), f'the {name} arrays are different'
+
+
+def _is_margin(header: str) -> bool:
+    """is the column a margin of safety?"""
+    return header.startswith(('MS_', 'SM')) or header == 'margin'
+
+
+def _update_envelope(combined: np.ndarray, icombo0: int,
+                     values: np.ndarray, icombo: np.ndarray,
+                     is_max: bool) -> None:
+    """updates the running max/min with a chunk of combinations"""
+    fill_value = -np.inf if is_max else np.inf
+    combinedi = np.where(np.isnan(combined), fill_value, combined)
+    if is_max:
+        ichunk = combinedi.argmax(axis=0)
+    else:
+        ichunk = combinedi.argmin(axis=0)
+    chunk_values = np.take_along_axis(combinedi, ichunk[np.newaxis, :, :], axis=0)[0]
+    is_new = chunk_values > values if is_max else chunk_values < values
+    values[is_new] = chunk_values[is_new]
+    icombo[is_new] = icombo0 + ichunk[is_new]
+
+
+def _get_recompute(result: Any) -> tuple[Optional[Callable[[Any, np.ndarray], None]], list[int]]:
+    """
+    Gets the function that recomputes the nonlinear columns of a result
+    and the columns that aren't combined (e.g., the plate fiber distance)
+    """
+    if isinstance(result, RealPlateArray):
+        return _recompute_plate, [0]
+    elif isinstance(result, RealSolidArray):
+        return _recompute_solid, []
+    elif isinstance(result, RealCompositePlateArray):
+        return _recompute_composite_plate, []
+    elif isinstance(result, RealBarArray):
+        return _recompute_bar, []
+    elif isinstance(result, RealBeamArray):
+        return _recompute_beam, []
+    return None, []
+
+
+def _recompute_plate(result: RealPlateArray, data: np.ndarray) -> None:
+    """[fiber_distance, oxx, oyy, txy, angle, omax, omin, ovm]"""
+    is_stress = result.is_stress
+    oxx, oyy, txy = data[:, :, 1], data[:, :, 2], data[:, :, 3]
+    angle, omax, omin = principal_2d(oxx, oyy, txy, is_stress=is_stress)
+    data[:, :, 4] = angle
+    data[:, :, 5] = omax
+    data[:, :, 6] = omin
+    if result.is_von_mises:
+        von_mises(oxx, oyy, txy=txy, is_stress=is_stress, out=data[:, :, 7])
+    else:
+        max_shear(omax, omin, is_stress=is_stress, out=data[:, :, 7])
+
+
+def _recompute_composite_plate(result: RealCompositePlateArray, data: np.ndarray) -> None:
+    """[o11, o22, t12, t1z, t2z, angle, major, minor, max_shear]"""
+    is_stress = result.is_stress
+    angle, omax, omin = principal_2d(data[:, :, 0], data[:, :, 1], data[:, :, 2],
+                                     is_stress=is_stress)
+    data[:, :, 5] = angle
+    data[:, :, 6] = omax
+    data[:, :, 7] = omin
+    max_shear(omax, omin, is_stress=is_stress, out=data[:, :, 8])
+
+
+def _recompute_solid(result: RealSolidArray, data: np.ndarray) -> None:
+    """[oxx, oyy, ozz, txy, tyz, txz, omax, omid, omin, ovm/octahedral]"""
+    is_stress = result.is_stress
+    components = [data[:, :, i] for i in range(6)]
+    omax, omid, omin = principal_3d(*components, is_stress=is_stress)
+    data[:, :, 6] = omax
+    data[:, :, 7] = omid
+    data[:, :, 8] = omin
+    if result.is_von_mises:
+        von_mises(*components, is_stress=is_stress, out=data[:, :, 9])
+    else:
+        data[:, :, 9] = octahedral_shear(*components, is_stress=is_stress)
+
+
+def _recompute_bar(result: RealBarArray, data: np.ndarray) -> None:
+    """
+    [s1a, s2a, s3a, s4a, axial, smaxa, smina, MS_tension,
+     s1b, s2b, s3b, s4b,        smaxb, sminb, MS_compression]
+    """
+    axial = data[:, :, 4]
+    data[:, :, 5] = axial + data[:, :, 0:4].max(axis=2)
+    data[:, :, 6] = axial + data[:, :, 0:4].min(axis=2)
+    data[:, :, 12] = axial + data[:, :, 8:12].max(axis=2)
+    data[:, :, 13] = axial + data[:, :, 8:12].min(axis=2)
+
+
+def _recompute_beam(result: RealBeamArray, data: np.ndarray) -> None:
+    """[sxc, sxd, sxe, sxf, smax, smin, MS_tension, MS_compression]"""
+    data[:, :, 4] = data[:, :, 0:4].max(axis=2)
+    data[:, :, 5] = data[:, :, 0:4].min(axis=2)
@@ -9,6 +9,7 @@ Defines the main OP2 class.  Defines:
 
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
+   - export_parquet(dirname, result_names=None, row_group_size=1_000_000)
    - combine_results(combine=True)
    - create_objects_from_matrices()
    - object_attributes(mode='public', keys_to_skip=None, filter_properties=False)
@@ -739,7 +740,8 @@ class OP2(OP2_Scalar, OP2Writer):
                     self.log.error(f'build_dataframe is broken for {class_name}')
                     raise
 
-    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True) -> None:
+    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True,
+                           lazy: bool=False) -> None:
         """
         Loads an h5 file into an OP2 object
 
@@ -749,6 +751,10 @@ class OP2(OP2_Scalar, OP2Writer):
             the path to the an hdf5 file
         combine : bool; default=True
             runs the combine routine
+        lazy : bool; default=False
+            keeps the file open (as self.h5_file) and loads the result
+            data as h5py Datasets, so ``obj.data[itime, ielement, :]``
+            only reads the chunks that are needed.  The data is read-only.
 
         """
         check_path(hdf5_filename, 'hdf5_filename')
@@ -758,11 +764,17 @@ class OP2(OP2_Scalar, OP2Writer):
 
         self.log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
         debug = False
-        with h5py.File(hdf5_filename, 'r') as h5_file:
-            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        if lazy:
+            # closed by __del__
+            self.h5_file = h5py.File(hdf5_filename, 'r')
+            load_op2_from_hdf5_file(self, self.h5_file, self.log, debug=debug, lazy=True)
+        else:
+            with h5py.File(hdf5_filename, 'r') as h5_file:
+                load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
         self.combine_results(combine=combine)
 
-    def load_hdf5_file(self, h5_file: H5File, combine: bool=True) -> None:
+    def load_hdf5_file(self, h5_file: H5File, combine: bool=True,
+                       lazy: bool=False) -> None:
         """
         Loads an h5 file object into an OP2 object
 
@@ -772,25 +784,37 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py file object
         combine : bool; default=True
             runs the combine routine
+        lazy : bool; default=False
+            loads the result data as h5py Datasets, so h5_file must
+            stay open
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_file
         #self.op2_filename = hdf5_filename
         #self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
-        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug, lazy=lazy)
         self.combine_results(combine=combine)
 
-    def export_hdf5_filename(self, hdf5_filename: str) -> None:
+    def export_hdf5_filename(self, hdf5_filename: str, exporter=None) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
+        Parameters
+        ----------
+        hdf5_filename : str
+            the path to the hdf5 file
+        exporter : HDF5Exporter; default=None
+            None : contiguous datasets
+            HDF5Exporter : chunked/compressed datasets, which may be
+            compressed in parallel (e.g., HDF5Exporter(compression='gzip', nthreads=4))
+
         TODO: doesn't support:
           - BucklingEigenvalues
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_filename
-        export_op2_to_hdf5_filename(hdf5_filename, self)
+        export_op2_to_hdf5_filename(hdf5_filename, self, exporter=exporter)
 
     def export_hdf5_file(self, hdf5_file: H5File, exporter=None) -> None:
         """
@@ -801,7 +825,8 @@ class OP2(OP2_Scalar, OP2Writer):
         hdf5_file : H5File()
             an h5py object
         exporter : HDF5Exporter; default=None
-            unused
+            None : contiguous datasets
+            HDF5Exporter : chunked/compressed datasets
 
         TODO: doesn't support:
           - BucklingEigenvalues
@@ -809,7 +834,21 @@ class OP2(OP2_Scalar, OP2Writer):
         """
         ## type (file, Any) -> None
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_file
-        export_op2_to_hdf5_file(hdf5_file, self)
+        export_op2_to_hdf5_file(hdf5_file, self, exporter=exporter)
+
+    def export_parquet(self, dirname: str,
+                       result_names: Optional[list[str]]=None,
+                       row_group_size: int=1_000_000,
+                       compression: str='snappy') -> list[str]:
+        """
+        Exports the results to a partitioned (result_type/element_type/subcase)
+        Parquet dataset without building DataFrames; requires pyarrow.
+
+        See ``pyNastran.op2.op2_interface.parquet_interface.export_op2_to_parquet``
+        """
+        from pyNastran.op2.op2_interface.parquet_interface import export_op2_to_parquet
+        return export_op2_to_parquet(dirname, self, result_names=result_names,
+                                     row_group_size=row_group_size, compression=compression)
 
     def combine_results(self, combine: bool=True) -> None:
         """
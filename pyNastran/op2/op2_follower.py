@@ -0,0 +1,571 @@
+"""
+Follows (tails) an OP2 that is still being written by Nastran.
+
+A long nonlinear/transient run (e.g., SOL 400) writes the OP2 as it
+goes, but the OP2 reader requires a finished file.  OP2Follower reopens
+the file, scans the Fortran markers from the last decoded offset and
+decodes only the new data:
+
+ - a table is decoded once its closing marker has been written
+ - a result table (e.g., OUGV1, OES1X1) is also decoded as its
+   subtables (a time step/element type) are completed, so the results
+   of a 20-hour run are available before the table is closed
+
+The scan only reads the record markers, so the file is never reread.
+The new records are decoded by the standard OP2 reader from a view of
+the file that has the OP2 header, the new records and the closing
+markers, so each update is a regular OP2 model with just the new
+results.
+
+defines:
+ - OP2Follower
+
+"""
+from __future__ import annotations
+import io
+import os
+import time
+from bisect import bisect_right
+from struct import Struct, unpack
+from typing import Iterator, Optional, BinaryIO, Any
+
+from cpylog import get_logger2
+
+from pyNastran.op2.errors import FortranMarkerError
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.op2_scalar import RESULT_TABLES, MATRIX_TABLES, GEOM_TABLES
+
+Segment = tuple[int, int] | bytes
+
+
+class OP2Follower:
+    """
+    Follows an OP2 that is being written and decodes the new results
+    as they appear.
+
+    Attributes
+    ----------
+    op2_filename : str
+        the OP2 that is being followed
+    n : int
+        the offset of the next table to scan; tables before this
+        offset are complete
+    is_finished : bool
+        the closing marker of the OP2 has been found
+    size : int
+        4 : 32-bit OP2
+        8 : 64-bit OP2
+
+    Example
+    -------
+    >>> follower = OP2Follower('nonlinear.op2')
+    >>> for model in follower.follow(interval=5.0, timeout=3600.):
+    ...     for isubcase, stress in model.op2_results.stress.chexa_stress.items():
+    ...         print(isubcase, stress._times, stress.data[:, :, -1].max())
+
+    """
+    def __init__(self, op2_filename: str,
+                 combine: bool=True,
+                 subcases: Optional[list[int]]=None,
+                 exclude_results: Optional[list[str]]=None,
+                 include_results: Optional[list[str]]=None,
+                 mode: Optional[str]=None,
+                 log: Any=None,
+                 debug: Optional[bool]=False):
+        """
+        Creates an OP2Follower
+
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 to follow; it doesn't need to exist yet
+        combine : bool; default=True
+            True : objects are isubcase based
+            False : objects are (isubcase, subtitle) based
+        subcases : list[int, ...] / int; default=None->all subcases
+            list of [subcase1_ID,subcase2_ID]
+        exclude_results / include_results : list[str] / str; default=None
+            a list of result types to exclude/include
+            one of these must be None
+        mode : str; default=None -> 'msc'
+            the version of the Nastran you're using
+            {nx, msc, autodesk, optistruct, nasa95}
+        log : Log(); default=None
+            a logging object to write debug messages to
+        debug : bool/None; default=False
+            used to set the logger if no logger is passed in
+
+        """
+        self.op2_filename = str(op2_filename)
+        self.combine = combine
+        self.subcases = subcases
+        self.exclude_results = exclude_results
+        self.include_results = include_results
+        self.mode = mode
+        self.log = get_logger2(log, debug=debug)
+
+        # result tables are read in (table3, table4) pairs, so they
+        # may be decoded before the table is closed
+        mapped_tables = OP2(log=self.log).op2_reader.mapped_tables
+        self._partial_tables = (
+            set(RESULT_TABLES) - set(mapped_tables) - set(MATRIX_TABLES) - set(GEOM_TABLES))
+        self.reset()
+
+    def reset(self) -> None:
+        """restarts following the OP2 from the beginning of the file"""
+        self.size = 4
+        self.endian = b'<'
+        self.is_finished = False
+        self.n = 0
+        # the number of bytes in the OP2 header; None if incomplete
+        self._nheader: Optional[int] = None
+        # the tables that were closed since the last update
+        self._tables: list[_OP2Table] = []
+        # the table that is being written
+        self._table: Optional[_OP2Table] = None
+
+    def poll(self) -> Optional[OP2]:
+        """
+        Decodes the tables/time steps that were completed since the
+        last poll.
+
+        Returns
+        -------
+        model : OP2 / None
+            an OP2 with the new results; None if there is no new data
+
+        """
+        if not os.path.exists(self.op2_filename):
+            return None
+        with open(self.op2_filename, 'rb') as op2_file:
+            nbytes = os.fstat(op2_file.fileno()).st_size
+            if nbytes < max(self.n, self._nheader or 0):
+                self.log.warning(f'{self.op2_filename} was truncated; restarting')
+                self.reset()
+            if self._nheader is None:
+                self._nheader = _scan_op2_header(op2_file, self)
+                if self._nheader is None:
+                    return None
+                self.n = self._nheader
+            self._scan_tables(op2_file)
+
+        segments, ndecode = self._get_segments()
+        if not segments:
+            return None
+        model = _WindowOP2(segments, log=self.log, mode=self.mode)
+        model.set_subcases(self.subcases)
+        model.include_exclude_results(exclude_results=self.exclude_results,
+                                      include_results=self.include_results)
+        model.read_op2(self.op2_filename, combine=self.combine)
+
+        self._tables = []
+        if self._table is not None:
+            self._table.ndecoded = ndecode
+        return model
+
+    def follow(self, interval: float=1.0,
+               timeout: Optional[float]=None) -> Iterator[OP2]:
+        """
+        Yields the new results until the OP2 is finished.
+
+        Parameters
+        ----------
+        interval : float; default=1.0
+            the time between polls in seconds
+        timeout : float; default=None
+            stop if there is no new data for timeout seconds;
+            None : wait until the OP2 is finished
+
+        Yields
+        ------
+        model : OP2
+            an OP2 with the new results
+
+        """
+        t0 = time.time()
+        while True:
+            model = self.poll()
+            if model is not None:
+                t0 = time.time()
+                yield model
+            if self.is_finished:
+                break
+            if timeout is not None and time.time() - t0 >= timeout:
+                self.log.warning(f'no new data in {self.op2_filename} after {timeout} sec')
+                break
+            time.sleep(interval)
+
+    def _scan_tables(self, op2_file: BinaryIO) -> None:
+        """scans the tables that were written since the last scan"""
+        while not self.is_finished:
+            if self._table is None:
+                self._table = _scan_table_header(op2_file, self)
+                if self._table is None:
+                    break
+            if not _scan_subtables(op2_file, self._table, self.size, self.endian):
+                break
+            self._tables.append(self._table)
+            self.n = self._table.n
+            self._table = None
+
+    def _get_segments(self) -> tuple[list[Segment], int]:
+        """
+        Gets the parts of the OP2 to decode
+
+        Returns
+        -------
+        segments : list[(n0, nbytes) / bytes]
+            the (offset, nbytes) of the OP2 or the bytes to decode
+            (e.g., the renumbered subtable markers); [] if there is
+            no new data
+        ndecode : int
+            the number of decoded records of the table that is being
+            written
+
+        """
+        tables = list(self._tables)
+        ndecode = 0
+        if self._table is not None:
+            table = self._table
+            ndecode = table.ndecoded
+            if table.name in self._partial_tables:
+                # decode complete (table3, table4) pairs
+                ndecode = max(len(table.records) // 2 * 2, table.ndecoded)
+            if ndecode > table.ndecoded:
+                tables.append(table)
+
+        segments: list[Segment] = []
+        for table in tables:
+            if table.is_closed and table.ndecoded == 0:
+                segments.append((table.n0, table.n - table.n0))
+                continue
+
+            # resume a partially decoded table with renumbered subtables
+            irecord1 = len(table.records) if table.is_closed else ndecode
+            if irecord1 == table.ndecoded:
+                continue
+            segments.append((table.n0, table.nprefix - table.n0))
+            isubtable = -3
+            for n0, n1 in table.records[table.ndecoded:irecord1]:
+                segments.append(_pack_markers([isubtable, 1, 0], self.size, self.endian))
+                if n1 > n0:
+                    segments.append((n0, n1 - n0))
+                isubtable -= 1
+            segments.append(_pack_markers([isubtable, 1, 0, 0], self.size, self.endian))
+
+        if segments:
+            segments.insert(0, (0, self._nheader))
+            segments.append(_pack_markers([0], self.size, self.endian))
+        return segments, ndecode
+
+
+class _OP2Table:
+    """the scan state of an OP2 table"""
+    def __init__(self, name: bytes, n0: int, nprefix: int):
+        self.name = name
+        #: the offset of the table name
+        self.n0 = n0
+        #: the offset of the first subtable (after the -1/-2 records)
+        self.nprefix = nprefix
+        #: the offset after the last complete subtable (or the table)
+        self.n = nprefix
+        #: the (start, end) offsets of the subtable records
+        self.records: list[tuple[int, int]] = []
+        #: the number of records that have been decoded
+        self.ndecoded = 0
+        self.isubtable = -3
+        self.is_closed = False
+
+
+class _OP2Window(io.RawIOBase):
+    """
+    A read-only file that is built from a series of segments, which are
+    an (offset, nbytes) of the OP2 or bytes.
+    """
+    def __init__(self, op2_filename: str, segments: list[Segment]):
+        super().__init__()
+        self._op2_file = open(op2_filename, 'rb')
+        self._segments = segments
+        self._starts = [0]
+        for segment in segments:
+            nbytes = segment[1] if isinstance(segment, tuple) else len(segment)
+            self._starts.append(self._starts[-1] + nbytes)
+        self.nbytes = self._starts[-1]
+        self._n = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._n
+
+    def seek(self, offset: int, whence: int=io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._n
+        elif whence == io.SEEK_END:
+            offset += self.nbytes
+        assert offset >= 0, offset
+        self._n = offset
+        return self._n
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast('B')
+        nread = 0
+        while nread < len(view) and self._n < self.nbytes:
+            isegment = bisect_right(self._starts, self._n) - 1
+            segment = self._segments[isegment]
+            offset = self._n - self._starts[isegment]
+            nbytes = min(len(view) - nread, self._starts[isegment + 1] - self._n)
+            if isinstance(segment, bytes):
+                view[nread:nread + nbytes] = segment[offset:offset + nbytes]
+            else:
+                self._op2_file.seek(segment[0] + offset)
+                nbytes = self._op2_file.readinto(view[nread:nread + nbytes])
+                if nbytes == 0:  # pragma: no cover
+                    break
+            nread += nbytes
+            self._n += nbytes
+        return nread
+
+    def close(self) -> None:
+        if not self.closed:
+            self._op2_file.close()
+        super().close()
+
+
+class _WindowOP2(OP2):
+    """an OP2 that reads a series of segments of the OP2 file"""
+    def __init__(self, segments: list[Segment], log: Any=None,
+                 mode: Optional[str]=None):
+        self._segments = segments
+        OP2.__init__(self, log=log, mode=mode)
+
+    def _open_op2_file(self, op2_filename: str) -> BinaryIO:
+        return io.BufferedReader(_OP2Window(op2_filename, self._segments))
+
+
+def _pack_markers(markers: list[int], size: int, endian: bytes) -> bytes:
+    """packs a set of markers (e.g., [-3, 1, 0]) like ``write_markers``"""
+    word = b'q' if size == 8 else b'i'
+    data = []
+    for marker in markers:
+        data += [size, marker, size]
+    return Struct(endian + (b'i' + word + b'i') * len(markers)).pack(*data)
+
+
+def _read_marker(op2_file: BinaryIO, size: int, endian: bytes) -> Optional[int]:
+    """reads a [size, marker, size] marker; None if it's incomplete"""
+    data = op2_file.read(size + 8)
+    if len(data) < size + 8:
+        return None
+    nbytes1, marker, nbytes2 = unpack(endian + (b'iqi' if size == 8 else b'3i'), data)
+    if not nbytes1 == nbytes2 == size:
+        raise FortranMarkerError(f'n={op2_file.tell() - len(data)} '
+                                 f'marker=[{nbytes1}, {marker}, {nbytes2}]')
+    return marker
+
+
+def _read_markers(op2_file: BinaryIO, markers: list[int],
+                  size: int, endian: bytes) -> bool:
+    """reads an expected set of markers; False if they're incomplete"""
+    for expected_marker in markers:
+        marker = _read_marker(op2_file, size, endian)
+        if marker is None:
+            return False
+        if marker != expected_marker:
+            raise FortranMarkerError(f'n={op2_file.tell() - size - 8} marker={marker}; '
+                                     f'expected={markers}')
+    return True
+
+
+def _peek_marker(op2_file: BinaryIO, size: int, endian: bytes) -> Optional[int]:
+    """reads a marker and rewinds"""
+    n = op2_file.tell()
+    marker = _read_marker(op2_file, size, endian)
+    op2_file.seek(n)
+    return marker
+
+
+def _read_block(op2_file: BinaryIO, endian: bytes, skip: bool=True) -> Optional[bytes]:
+    """
+    reads/skips an [nbytes, data, nbytes] block
+
+    Returns
+    -------
+    data : bytes / None
+        the data (b'' if skip=True); None if the block is incomplete
+
+    """
+    n = op2_file.tell()
+    data = op2_file.read(4)
+    if len(data) < 4:
+        return None
+    nbytes, = unpack(endian + b'i', data)
+    if skip:
+        op2_file.seek(n + 4 + nbytes)
+        data = b''
+    else:
+        data = op2_file.read(nbytes)
+    nbytes_end = op2_file.read(4)
+    if len(nbytes_end) < 4:
+        return None
+    if unpack(endian + b'i', nbytes_end)[0] != nbytes:
+        raise FortranMarkerError(f'n={n} block nbytes={nbytes}; '
+                                 f'end={unpack(endian + b"i", nbytes_end)[0]}')
+    return data
+
+
+def _read_record(op2_file: BinaryIO, size: int, endian: bytes,
+                 skip: bool=True) -> Optional[bytes]:
+    """
+    reads/skips a record, which is a marker and a block followed by
+    any continuation blocks
+
+    Returns
+    -------
+    data : bytes / None
+        the data (b'' if skip=True); None if the record is incomplete
+
+    """
+    record = b''
+    marker = _read_marker(op2_file, size, endian)
+    while True:
+        if marker is None:
+            return None
+        assert marker > 0, marker
+        data = _read_block(op2_file, endian, skip=skip)
+        if data is None:
+            return None
+        record += data
+
+        # the record is done once we find a non-continuation marker
+        marker = _peek_marker(op2_file, size, endian)
+        if marker is None:
+            return None
+        if marker <= 0:
+            return record
+        marker = _read_marker(op2_file, size, endian)
+
+
+def _scan_op2_header(op2_file: BinaryIO, follower: OP2Follower) -> Optional[int]:
+    """
+    Finds the endian/size and skips the OP2 header
+    (e.g., the date, 'NASTRAN FORT TAPE ID CODE - ' and version).
+
+    Returns
+    -------
+    nheader : int / None
+        the number of bytes in the header; None if it's incomplete
+
+    """
+    op2_file.seek(0)
+    data = op2_file.read(4)
+    if len(data) < 4:
+        return None
+    for endian in (b'>', b'<'):
+        size, = unpack(endian + b'i', data)
+        if size in (4, 8):
+            break
+    else:
+        raise FortranMarkerError(f'cannot determine the endian of {follower.op2_filename}')
+    follower.size = size
+    follower.endian = endian
+
+    op2_file.seek(0)
+    marker = _peek_marker(op2_file, size, endian)
+    if marker is None:
+        return None
+    if marker == 2:
+        # PARAM,POST,-2 has no header
+        return 0
+
+    # [3] date; [7] 'NASTRAN FORT TAPE ID CODE - '; [2] version; [-1, 0]
+    for expected_marker in (3, 7):
+        if not _read_markers(op2_file, [expected_marker], size, endian):
+            return None
+        if _read_block(op2_file, endian) is None:
+            return None
+    if _read_record(op2_file, size, endian) is None:
+        return None
+    if not _read_markers(op2_file, [-1, 0], size, endian):
+        return None
+    return op2_file.tell()
+
+
+def _scan_table_header(op2_file: BinaryIO, follower: OP2Follower) -> Optional[_OP2Table]:
+    """
+    Scans the table name and the -1/-2 records of the next table.
+
+    Returns
+    -------
+    table : _OP2Table / None
+        the table; None if the table header is incomplete or the
+        OP2 is finished
+
+    """
+    size = follower.size
+    endian = follower.endian
+    n0 = follower.n
+    op2_file.seek(n0)
+    marker = _peek_marker(op2_file, size, endian)
+    if marker is None:
+        return None
+    if marker == 0:
+        # the closing marker of the OP2
+        follower.is_finished = True
+        return None
+
+    data = _read_record(op2_file, size, endian, skip=False)
+    if data is None:
+        return None
+    if size == 8 and data[4:8] == b'    ':
+        # interlaced: b'OUGV    1       '
+        data = data[:4] + data[8:12]
+    name = data[:8].strip()
+
+    # [-1] header; [-2, 1, 0] subtable name/date
+    if not _read_markers(op2_file, [-1], size, endian):
+        return None
+    if _read_record(op2_file, size, endian) is None:
+        return None
+    if not _read_markers(op2_file, [-2, 1, 0], size, endian):
+        return None
+    if _read_record(op2_file, size, endian) is None:
+        return None
+    return _OP2Table(name, n0, op2_file.tell())
+
+
+def _scan_subtables(op2_file: BinaryIO, table: _OP2Table,
+                    size: int, endian: bytes) -> bool:
+    """
+    Scans the subtables that were written since the last scan.
+
+    Returns
+    -------
+    is_closed : bool
+        the table is complete
+
+    """
+    while True:
+        op2_file.seek(table.n)
+        if not _read_markers(op2_file, [table.isubtable, 1, 0], size, endian):
+            return False
+        marker = _peek_marker(op2_file, size, endian)
+        if marker is None:
+            return False
+        if marker == 0:
+            _read_marker(op2_file, size, endian)
+            table.n = op2_file.tell()
+            table.is_closed = True
+            return True
+
+        # a negative marker is an empty subtable (e.g., PCOMPTS)
+        n0 = op2_file.tell()
+        if marker > 0 and _read_record(op2_file, size, endian) is None:
+            return False
+        table.records.append((n0, op2_file.tell()))
+        table.isubtable -= 1
+        table.n = op2_file.tell()
@@ -3,6 +3,7 @@
 defines:
  model = load_op2_from_h5(h5_filename, log=None)
  export_op2_to_hdf5(hdf5_filename, op2_model)
+ exporter = HDF5Exporter(compression='gzip', nthreads=4)
 
  model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None)
  model = load_op2_from_hdf5_file(model, h5_file, log, debug=False)
@@ -10,9 +11,17 @@ defines:
  export_op2_to_hdf5_file(hdf5_file, op2_model)
 
 """
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 import numpy as np
 import h5py
+try:
+    # registers the Blosc filter
+    import hdf5plugin
+    IS_HDF5PLUGIN = True
+except ModuleNotFoundError:  # pragma: no cover
+    IS_HDF5PLUGIN = False
 
 from cpylog import SimpleLogger
 import pyNastran
@@ -1217,7 +1226,7 @@ def _load_eigenvalue(h5_result, encoding: str,
     return obj
 
 def _load_table(result_name, h5_result, objs: tuple[Any], encoding: str,
-                log: SimpleLogger, debug: bool=False):# real_obj, complex_obj
+                log: SimpleLogger, debug: bool=False, lazy: bool=False):# real_obj, complex_obj
     """loads a RealEigenvectorArray/ComplexEigenvectorArray"""
     is_real = _cast(h5_result.get('is_real'))
     #is_complex = _cast(h5_result.get('is_complex'))
@@ -1245,6 +1254,7 @@ def _load_table(result_name, h5_result, objs: tuple[Any], encoding: str,
         'acoustic_flag' : _cast(h5_result.get('acoustic_flag')),
         'stress_bits' : _cast(h5_result.get('stress_bits')),
         's_code' : _cast(h5_result.get('s_code')),
+        'random_code' : _cast(h5_result.get('random_code')),
         'data_names' : data_names,
         'name' : data_names[0],
         'table_name' : _cast_str(h5_result.get('table_name'), encoding),
@@ -1255,7 +1265,7 @@ def _load_table(result_name, h5_result, objs: tuple[Any], encoding: str,
         elif value in (None, np.nan):
             if key in ['nonlinear_factor']:
                 pass
-            elif key in ['acoustic_flag', 'stress_bits', 's_code', 'thermal']:
+            elif key in ['acoustic_flag', 'stress_bits', 's_code', 'thermal', 'random_code']:
                 del data_code[key]
             else:
                 log.warning(f'{key} {value}')
@@ -1280,13 +1290,18 @@ def _load_table(result_name, h5_result, objs: tuple[Any], encoding: str,
         msg = 'class_name=%r selected; should be %r' % (obj.class_name, class_name)
         raise RuntimeError(msg)
     _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     encoding, debug=debug)
+                                     encoding, debug=debug, lazy=lazy)
     return obj
 
 
 def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     encoding: str, debug: bool=False):
-    """helper method for ``_load_table``"""
+                                     encoding: str, debug: bool=False, lazy: bool=False):
+    """
+    helper method for ``_load_table``
+
+    lazy : bool; default=False
+        the data is an h5py Dataset, which is read as it's sliced
+    """
     keys_to_skip = [
         'class_name', 'headers', 'is_real', 'is_complex',
         'is_sort1', 'is_sort2', 'table_name_str',
@@ -1298,7 +1313,10 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
     #if result_name == 'eigenvectors':
         #debug = True
     for key in h5_result.keys():
-        if key not in filtered_attrs:
+        if key not in filtered_attrs and (key in keys_to_skip or hasattr(type(obj), key)):
+            # the id arrays (e.g., element_node) are created by build(),
+            # so they're not attributes of a new object, but properties
+            # (e.g., nnodes_per_element) can't be set
             continue
         elif result_name == 'grid_point_forces' and key in ['element_name']:
             pass
@@ -1308,6 +1326,8 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
             datai = _cast_str(h5_result.get(key), encoding)
             setattr(obj, key, datai)
             setattr(obj, '_times', datai)
+        elif lazy and key == 'data':
+            setattr(obj, key, h5_result.get(key))
         elif key not in data_code:
             datai = _cast(h5_result.get(key))
             if debug:  # pragma: no cover
@@ -1315,7 +1335,8 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
                 if key not in ['data']:
                     print(datai)
 
-            if key in STRING_KEYS and isinstance(datai, bytes):
+            is_string_key = key in STRING_KEYS or key not in filtered_attrs
+            if is_string_key and isinstance(datai, bytes):
                 datai = datai.decode('latin1')
 
             try:
@@ -1399,23 +1420,199 @@ def _get_obj_class(objs: tuple[Any],
             #obj_class = complex_obj
     return obj_class
 
-def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2) -> None:
+class HDF5Exporter:
+    """
+    Creates the (big) datasets of the HDF5 export as chunked, compressed
+    datasets:
+
+     - the chunks of the (ntimes, ntotal, ncolumns) data arrays are
+       balanced, so reading one time (all elements) and reading one
+       element (all times) both decompress a modest part of the array
+     - 'gzip' (with the shuffle filter) is compressed in a pool of
+       threads (zlib releases the GIL) and the compressed chunks are
+       written directly, so the independent results are compressed in
+       parallel
+     - 'lzf' and 'blosc' (requires hdf5plugin) use the h5py filters, which
+       are serial (Blosc is multithreaded internally)
+
+    Example
+    -------
+    >>> exporter = HDF5Exporter(compression='gzip', nthreads=4)
+    >>> model.export_hdf5_filename('model.h5', exporter=exporter)
+
+    """
+    def __init__(self, compression: Optional[str]=None,
+                 compression_opts: Optional[int]=None,
+                 shuffle: bool=True,
+                 chunk_nbytes: int=1024**2,
+                 min_nbytes: int=64 * 1024,
+                 nthreads: int=1):
+        """
+        Parameters
+        ----------
+        compression : str; default=None
+            None : chunked, but not compressed
+            'gzip', 'lzf', 'blosc'
+        compression_opts : int; default=None
+            the gzip level (default=4) or the blosc clevel (default=5)
+        shuffle : bool; default=True
+            use the byte shuffle filter, which helps with the float data
+        chunk_nbytes : int; default=1 MB
+            the target size of a chunk
+        min_nbytes : int; default=64 KB
+            smaller arrays are written as contiguous datasets
+        nthreads : int; default=1
+            the number of threads that compress the gzip chunks
+
+        """
+        assert compression in (None, 'gzip', 'lzf', 'blosc'), compression
+        if compression == 'blosc':
+            assert IS_HDF5PLUGIN, 'hdf5plugin is required for blosc compression'
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.shuffle = shuffle
+        self.chunk_nbytes = chunk_nbytes
+        self.min_nbytes = min_nbytes
+        self.nthreads = nthreads
+
+        # the (dataset, array) pairs that are compressed by flush
+        self._direct_writes = []
+
+    @property
+    def is_direct_write(self) -> bool:
+        """are the chunks compressed outside of h5py?"""
+        return self.compression == 'gzip' and self.nthreads > 1
+
+    def create_dataset(self, group, name: str, value: Any) -> None:
+        """creates a dataset, which may be written during ``flush``"""
+        if not isinstance(value, np.ndarray) or value.nbytes < self.min_nbytes or value.dtype.kind in 'OSU':
+            group.create_dataset(name, data=value)
+            return
+
+        chunks = get_chunk_shape(value.shape, value.dtype.itemsize, self.chunk_nbytes)
+        kwargs = self._get_filter_kwargs()
+        if self.is_direct_write:
+            dataset = group.create_dataset(name, shape=value.shape, dtype=value.dtype,
+                                           chunks=chunks, **kwargs)
+            self._direct_writes.append((dataset, value))
+        else:
+            group.create_dataset(name, data=value, chunks=chunks, **kwargs)
+
+    def _get_filter_kwargs(self) -> dict[str, Any]:
+        """gets the h5py filter keywords"""
+        if self.compression is None:
+            return {}
+        if self.compression == 'blosc':
+            shuffle = hdf5plugin.Blosc.SHUFFLE if self.shuffle else hdf5plugin.Blosc.NOSHUFFLE
+            clevel = 5 if self.compression_opts is None else self.compression_opts
+            return dict(hdf5plugin.Blosc(cname='lz4', clevel=clevel, shuffle=shuffle))
+        kwargs = {'compression': self.compression, 'shuffle': self.shuffle}
+        if self.compression == 'gzip':
+            kwargs['compression_opts'] = 4 if self.compression_opts is None else self.compression_opts
+        return kwargs
+
+    def flush(self) -> None:
+        """compresses and writes the queued gzip chunks"""
+        if not self._direct_writes:
+            return
+        level = 4 if self.compression_opts is None else self.compression_opts
+        with ThreadPoolExecutor(max_workers=self.nthreads) as executor:
+            for dataset, value in self._direct_writes:
+                offsets = _get_chunk_offsets(value.shape, dataset.chunks)
+                # the chunks are compressed in batches to bound the memory
+                nbatch = 4 * self.nthreads
+                for i in range(0, len(offsets), nbatch):
+                    offsetsi = offsets[i:i+nbatch]
+                    compressed_chunks = executor.map(
+                        lambda offset: _compress_chunk(value, dataset.chunks, offset,
+                                                       level, self.shuffle),
+                        offsetsi)
+                    for offset, compressed_chunk in zip(offsetsi, compressed_chunks):
+                        dataset.id.write_direct_chunk(offset, compressed_chunk)
+        self._direct_writes = []
+
+
+def get_chunk_shape(shape: tuple[int, ...], itemsize: int,
+                    chunk_nbytes: int=1024**2) -> tuple[int, ...]:
+    """
+    Gets a chunk shape of about chunk_nbytes for element/time slicing.
+
+    The last axis of a 3D (ntimes, ntotal, ncolumns) array isn't split.
+    The time/element axis that the chunk covers the larger fraction of
+    is halved until the chunk is small enough, so reading one time and
+    reading one element decompress about the same amount of data.
+    """
+    if len(shape) == 0 or 0 in shape:
+        return None
+    chunks = list(shape)
+    nsplit = 2 if len(shape) == 3 else len(shape)
+    while np.prod(chunks) * itemsize > chunk_nbytes:
+        fractions = [chunk / n if chunk > 1 else 0. for chunk, n in zip(chunks[:nsplit], shape)]
+        iaxis = int(np.argmax(fractions))
+        if fractions[iaxis] == 0.:
+            break
+        chunks[iaxis] = (chunks[iaxis] + 1) // 2
+    return tuple(chunks)
+
+
+def _get_chunk_offsets(shape: tuple[int, ...],
+                       chunks: tuple[int, ...]) -> list[tuple[int, ...]]:
+    """gets the offsets of all the chunks of a dataset"""
+    ranges = [range(0, n, chunk) for n, chunk in zip(shape, chunks)]
+    grid = np.meshgrid(*[np.array(rangei) for rangei in ranges], indexing='ij')
+    return [tuple(int(i) for i in offset)
+            for offset in np.column_stack([gridi.ravel() for gridi in grid])]
+
+
+def _compress_chunk(value: np.ndarray, chunks: tuple[int, ...],
+                    offset: tuple[int, ...], level: int, shuffle: bool) -> bytes:
+    """
+    Applies the HDF5 shuffle and deflate filters to a chunk.  The edge
+    chunks are zero padded to the full chunk size like HDF5 does.
+    """
+    slices = tuple(slice(i0, i0 + chunk) for i0, chunk in zip(offset, chunks))
+    chunk = value[slices]
+    if chunk.shape != chunks:
+        padded_chunk = np.zeros(chunks, dtype=value.dtype)
+        padded_chunk[tuple(slice(0, n) for n in chunk.shape)] = chunk
+        chunk = padded_chunk
+    chunk = np.ascontiguousarray(chunk)
+    if shuffle:
+        itemsize = chunk.dtype.itemsize
+        chunk = chunk.view('uint8').reshape(-1, itemsize).T
+    return zlib.compress(np.ascontiguousarray(chunk).tobytes(), level)
+
+
+def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2,
+                                exporter: Optional[HDF5Exporter]=None) -> None:
     """exports an OP2 object to an HDF5 file"""
     #no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
     try:
         with h5py.File(hdf5_filename, 'w') as hdf5_file:
             op2_model.log.info(f'starting export_op2_to_hdf5_file of {hdf5_filename!r}')
-            export_op2_to_hdf5_file(hdf5_file, op2_model)
+            export_op2_to_hdf5_file(hdf5_file, op2_model, exporter=exporter)
     except OSError:
         op2_model.log.error(f'failed to export {hdf5_filename!r}')
         raise
 
-def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2) -> None:
-    """exports an OP2 object to an HDF5 file object"""
+def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2,
+                            exporter: Optional[HDF5Exporter]=None) -> None:
+    """
+    exports an OP2 object to an HDF5 file object
+
+    Parameters
+    ----------
+    exporter : HDF5Exporter; default=None
+        None : contiguous datasets
+        HDF5Exporter : chunked/compressed datasets
+
+    """
     assert not isinstance(hdf5_file, str), hdf5_file
     create_info_group(hdf5_file, op2_model)
     export_matrices(hdf5_file, op2_model)
-    _export_subcases(hdf5_file, op2_model)
+    _export_subcases(hdf5_file, op2_model, exporter=exporter)
+    if exporter is not None:
+        exporter.flush()
 
 def create_info_group(hdf5_file, op2_model: OP2) -> None:
     """creates the info HDF5 group"""
@@ -1440,7 +1637,7 @@ def export_matrices(hdf5_file, op2_model: OP2) -> None:
                 raise NotImplementedError(msg)
                 #continue
 
-def _export_subcases(hdf5_file, op2_model):
+def _export_subcases(hdf5_file, op2_model, exporter=None):
     """exports the subcases to HDF5"""
     subcase_groups = {}
     result_types = op2_model.get_table_types()
@@ -1478,28 +1675,35 @@ def _export_subcases(hdf5_file, op2_model):
             #result_name = result_type + ':' + class_name
             result_name = result_type
             result_group = subcase_group.create_group(result_name)
-            obj.export_to_hdf5(result_group, op2_model.log)
+            obj.export_to_hdf5(result_group, op2_model.log, exporter=exporter)
 
-def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
-    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log)
+def load_op2_from_hdf5(hdf5_filename, combine=True, log=None, lazy: bool=False):
+    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log, lazy=lazy)
 
 def load_op2_from_hdf5_filename(hdf5_filename: str, combine: bool=True,
-                                log: Optional[SimpleLogger]=None):
-    """loads an hdf5 file into an OP2 object"""
+                                log: Optional[SimpleLogger]=None,
+                                lazy: bool=False):
+    """
+    loads an hdf5 file into an OP2 object
+
+    lazy : bool; default=False
+        keep the file open and load the result data as h5py Datasets,
+        which are read as they are sliced; see ``OP2.load_hdf5_filename``
+    """
     check_path(hdf5_filename, 'hdf5_filename')
     model = OP2(log=log)
-    model.op2_filename = hdf5_filename
-
-    log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
-    debug = False
-    with h5py.File(hdf5_filename, 'r') as h5_file:
-        load_op2_from_hdf5_file(model, h5_file, log, debug=debug)
-    model.combine_results(combine=combine)
+    model.load_hdf5_filename(hdf5_filename, combine=combine, lazy=lazy)
     return model
 
 def load_op2_from_hdf5_file(model: OP2, h5_file,
-                            log: SimpleLogger, debug=False):
-    """loads an h5 file object into an OP2 object"""
+                            log: SimpleLogger, debug=False,
+                            lazy: bool=False):
+    """
+    loads an h5 file object into an OP2 object
+
+    lazy : bool; default=False
+        the result data are h5py Datasets, so h5_file must stay open
+    """
     encoding = 'latin1'
     for key in h5_file.keys():
         if key.startswith('Subcase'):
@@ -1536,7 +1740,7 @@ def load_op2_from_hdf5_file(model: OP2, h5_file,
                         continue
                     assert isinstance(objs, tuple), f'check that {result_name!r} is tuple in the above dictionary'
                     obj = _load_table(result_name, h5_result, objs,
-                                      encoding, log=log, debug=debug)
+                                      encoding, log=log, debug=debug, lazy=lazy)
                     if obj is None:
                         continue
 
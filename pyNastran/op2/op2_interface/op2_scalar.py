@@ -44,7 +44,7 @@ Defines the sub-OP2 class.  This should never be called outside of the OP2 class
 import os
 from struct import Struct, unpack
 from collections import defaultdict
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, BinaryIO
 
 from numpy import array
 import numpy as np
@@ -2084,7 +2084,7 @@ class OP2_Scalar(OP2Common, FortranFormat):
         if not hasattr(self, 'f') or self.f is None:
             #: the OP2 file object
             op2_filename = self.op2_filename
-            self.f = open(op2_filename, 'rb')
+            self.f = self._open_op2_file(op2_filename)
             #: the endian in bytes
             self._endian = None
             #: the endian in unicode
@@ -2124,6 +2124,10 @@ class OP2_Scalar(OP2Common, FortranFormat):
         if self.read_mode == 1:
             self._set_structs(size)
 
+    def _open_op2_file(self, op2_filename: str) -> BinaryIO:
+        """opens the OP2 for reading"""
+        return open(op2_filename, 'rb')
+
     def _make_tables(self):
         return
         #global RESULT_TABLES, NX_RESULT_TABLES, MSC_RESULT_TABLES
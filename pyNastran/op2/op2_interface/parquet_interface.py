@@ -0,0 +1,357 @@
+"""
+Exports the OP2 results to a Hive-partitioned Parquet dataset, which
+may be queried directly by DuckDB/Polars/Spark/pyarrow.
+
+Unlike ``OP2.build_dataframe``, no pandas DataFrames are built; the
+columns are streamed from the result arrays one row group at a time, so
+the memory use is bounded by the row group size.  Both SORT1 and SORT2
+results are supported because the reader stores both as
+(ntimes, ntotal, ncolumns).
+
+The layout is::
+
+    dirname/
+      result_type=stress/
+        element_type=cquad4/
+          subcase=1/
+            part-0.parquet
+      result_type=displacements/
+        element_type=node/
+          subcase=1/
+            part-0.parquet
+
+The columns vary by result/element type, so a dataset is a
+``result_type=*/element_type=*`` directory.  Each file has the columns:
+ - the time/mode/frequency/load step (e.g., 'mode', 'eigr', 'freq', 'dt')
+ - the ids (e.g., 'node_id', 'grid_type', 'element_id', 'layer')
+ - the result (e.g., 'oxx', 'von_mises'); complex results are split
+   into '<header>_real' and '<header>_imag' columns
+
+defines:
+ - export_op2_to_parquet(dirname, op2_model, ...)
+ - get_partition(result_name, key, obj)
+ - iter_result_tables(obj, row_group_size=1_000_000)
+
+"""
+from __future__ import annotations
+import os
+from typing import Iterator, Optional, TYPE_CHECKING
+
+import numpy as np
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    IS_PYARROW = True
+except ModuleNotFoundError:  # pragma: no cover
+    IS_PYARROW = False
+
+import pyNastran
+from pyNastran.utils.numpy_utils import integer_types
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+# same as the HDF5 exporter
+SKIP_RESULTS = ('params', 'gpdt', 'bgpdt', 'eqexin', 'psds', 'cstm', 'trmbu', 'trmbd')
+
+# the id arrays of the result objects -> the column names
+#  - the first match of a column name wins (e.g., the CBEAM force has
+#    both element and element_node)
+#  - arrays may be (ntotal, ...) or per time (ntimes, ntotal, ...)
+ID_ARRAYS = [
+    ('node_gridtype', ('node_id', 'grid_type')),
+    ('node_element', ('node_id', 'element_id')),
+    ('element_node', ('element_id', 'node_id', 'node_id2')),
+    ('element_layer', ('element_id', 'layer')),
+    ('element', ('element_id',)),
+    ('element_names', ('element_name',)),
+    ('element_type', ('element_name',)),
+    ('element_data_type', ('element_data_type',)),
+    ('gridtype_str', ('grid_type_str',)),
+    ('fiber_distance', ('fiber_distance',)),
+    ('xxb', ('station',)),
+    ('sd', ('station',)),
+]
+
+
+def export_op2_to_parquet(dirname: str, op2_model: OP2,
+                          result_names: Optional[list[str]]=None,
+                          row_group_size: int=1_000_000,
+                          compression: str='snappy') -> list[str]:
+    """
+    Exports the OP2 results to a partitioned Parquet dataset
+
+    Parameters
+    ----------
+    dirname : str
+        the root directory of the dataset
+    op2_model : OP2
+        the model
+    result_names : list[str]; default=None -> all
+        the results to export (e.g., ['displacements', 'stress.cquad4_stress'])
+    row_group_size : int; default=1_000_000
+        the approximate number of rows per row group, which sets the
+        peak memory use
+    compression : str; default='snappy'
+        the Parquet compression ('snappy', 'zstd', 'gzip', 'none')
+
+    Returns
+    -------
+    parquet_filenames : list[str]
+        the files that were written
+
+    Example
+    -------
+    >>> export_op2_to_parquet('model_parquet', model)
+    >>> import duckdb
+    >>> duckdb.sql("SELECT element_id, max(von_mises) FROM "
+    ...            "read_parquet('model_parquet/result_type=stress/element_type=cquad4/*/*.parquet', "
+    ...            "hive_partitioning=true) GROUP BY element_id")
+
+    """
+    assert IS_PYARROW, 'pyarrow is required to export to Parquet'
+    log = op2_model.log
+    if result_names is None:
+        result_names = op2_model.get_table_types()
+
+    parquet_filenames = []
+    nfiles_per_partition = {}
+    for result_name in result_names:
+        if result_name in SKIP_RESULTS or result_name.startswith('responses.'):
+            continue
+        results = op2_model.get_result(result_name)
+        if not isinstance(results, dict):
+            continue
+        for key, obj in results.items():
+            if not _is_exportable(obj):
+                log.debug(f'Parquet: skipping {result_name} key={key} ({obj.__class__.__name__})')
+                continue
+
+            result_type, element_type, subcase = get_partition(result_name, key, obj)
+            partition_dirname = os.path.join(
+                dirname,
+                f'result_type={result_type}',
+                f'element_type={element_type}',
+                f'subcase={subcase}')
+            ifile = nfiles_per_partition.get(partition_dirname, 0)
+            nfiles_per_partition[partition_dirname] = ifile + 1
+            os.makedirs(partition_dirname, exist_ok=True)
+            parquet_filename = os.path.join(partition_dirname, f'part-{ifile}.parquet')
+            _write_result(parquet_filename, result_name, key, obj,
+                          row_group_size, compression)
+            parquet_filenames.append(parquet_filename)
+    log.info(f'exported {len(parquet_filenames)} Parquet files to {dirname!r}')
+    return parquet_filenames
+
+
+def get_partition(result_name: str, key, obj) -> tuple[str, str, str]:
+    """
+    Gets the partition values of a result
+
+    Parameters
+    ----------
+    result_name : str
+        the result name (e.g., 'stress.cquad4_stress', 'displacements')
+    key : int / tuple
+        the key of the result dictionary; the subcase id is used for
+        tuple keys (e.g., superelements)
+
+    Returns
+    -------
+    result_type : str
+        'stress', 'displacements'
+    element_type : str
+        'cquad4', 'cquad4_composite', 'node' (for nodal results)
+    subcase : str
+        '1'
+
+    """
+    if '.' in result_name:
+        result_type, table_name = result_name.split('.', 1)
+        suffix = '_' + result_type
+        if table_name.endswith(suffix):
+            table_name = table_name[:-len(suffix)]
+        element_type = table_name
+    elif hasattr(obj, 'node_gridtype'):
+        result_type = result_name
+        element_type = 'node'
+    else:
+        # grid_point_forces
+        result_type = result_name
+        element_type = 'all'
+
+    if isinstance(key, integer_types):
+        subcase = str(key)
+    else:
+        subcase = str(obj.isubcase)
+    return result_type, element_type, subcase
+
+
+def _is_exportable(obj) -> bool:
+    """only the (ntimes, ntotal, ncolumns) results may be exported"""
+    data = getattr(obj, 'data', None)
+    return (
+        data is not None and hasattr(data, 'shape') and len(data.shape) == 3 and
+        hasattr(obj, '_times') and obj._times is not None and
+        len(obj._times) == data.shape[0] and hasattr(obj, 'get_headers'))
+
+
+def iter_result_tables(obj, row_group_size: int=1_000_000) -> Iterator[pa.Table]:
+    """
+    Streams a result object as pyarrow Tables of about row_group_size rows
+
+    The time/id columns are tiled/repeated for only one block at a time,
+    so a 10 GB result doesn't need a 30 GB DataFrame.
+    """
+    data = obj.data
+    ntimes, ntotal, ncolumns = data.shape
+    headers = _get_unique_headers(obj, ncolumns)
+    time_columns = _get_time_columns(obj, ntimes)
+    used_names = set(headers) | {name for name, unused_times in time_columns}
+    id_columns = _get_id_columns(obj, ntimes, ntotal, used_names)
+    is_complex = np.iscomplexobj(data[:0])
+
+    for itime0, itime1, irow0, irow1 in _get_blocks(ntimes, ntotal, row_group_size):
+        ntimesi = itime1 - itime0
+        nrows = irow1 - irow0
+        names = []
+        arrays = []
+        for name, times in time_columns:
+            names.append(name)
+            arrays.append(np.repeat(times[itime0:itime1], nrows))
+
+        for name, ids, is_per_time in id_columns:
+            names.append(name)
+            if is_per_time:
+                arrays.append(ids[itime0:itime1, irow0:irow1].ravel())
+            else:
+                arrays.append(np.tile(ids[irow0:irow1], ntimesi))
+
+        datai = np.asarray(data[itime0:itime1, irow0:irow1, :]).reshape(ntimesi * nrows, ncolumns)
+        for icolumn, header in enumerate(headers):
+            column = datai[:, icolumn]
+            if is_complex:
+                names.extend([f'{header}_real', f'{header}_imag'])
+                arrays.extend([column.real, column.imag])
+            else:
+                names.append(header)
+                arrays.append(column)
+        yield pa.Table.from_arrays([pa.array(array) for array in arrays], names=names)
+
+
+def _write_result(parquet_filename: str, result_name: str, key, obj,
+                  row_group_size: int, compression: str) -> None:
+    """writes one result object to a Parquet file"""
+    metadata = {
+        'pyNastran_version': pyNastran.__version__,
+        'result_name': result_name,
+        'key': str(key),
+        'class_name': obj.__class__.__name__,
+        'table_name': str(getattr(obj, 'table_name_str', getattr(obj, 'table_name', ''))),
+        'is_sort1': str(getattr(obj, 'is_sort1', True)),
+        'title': str(getattr(obj, 'title', '')),
+        'subtitle': str(getattr(obj, 'subtitle', '')),
+        'label': str(getattr(obj, 'label', '')),
+    }
+    writer = None
+    try:
+        for table in iter_result_tables(obj, row_group_size=row_group_size):
+            if writer is None:
+                schema = table.schema.with_metadata(metadata)
+                writer = pq.ParquetWriter(parquet_filename, schema, compression=compression)
+            writer.write_table(table.replace_schema_metadata(metadata),
+                               row_group_size=row_group_size)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _get_blocks(ntimes: int, ntotal: int,
+                row_group_size: int) -> Iterator[tuple[int, int, int, int]]:
+    """
+    Gets the (itime0, itime1, irow0, irow1) blocks of the row groups;
+    many times per block for small results, part of a time for big ones
+    """
+    if ntotal == 0:
+        return
+    if ntotal <= row_group_size:
+        ntimes_per_block = max(1, row_group_size // ntotal)
+        for itime0 in range(0, ntimes, ntimes_per_block):
+            yield itime0, min(itime0 + ntimes_per_block, ntimes), 0, ntotal
+    else:
+        for itime in range(ntimes):
+            for irow0 in range(0, ntotal, row_group_size):
+                yield itime, itime + 1, irow0, min(irow0 + row_group_size, ntotal)
+
+
+def _get_unique_headers(obj, ncolumns: int) -> list[str]:
+    """the column names must be unique (e.g., 'eff_plastic_strain' is duplicated)"""
+    headers = [str(header) for header in obj.get_headers()]
+    if len(headers) != ncolumns:
+        return [f'column{i}' for i in range(ncolumns)]
+
+    unique_headers = []
+    for header in headers:
+        unique_header = header
+        i = 2
+        while unique_header in unique_headers:
+            unique_header = f'{header}_{i}'
+            i += 1
+        unique_headers.append(unique_header)
+    return unique_headers
+
+
+def _get_time_columns(obj, ntimes: int) -> list[tuple[str, np.ndarray]]:
+    """
+    Gets the time/mode/frequency columns (e.g., 'mode', 'eigr', 'mode_cycle'
+    for a modal result)
+    """
+    time_columns = []
+    data_code = getattr(obj, 'data_code', {})
+    for name in data_code.get('data_names', []):
+        values = getattr(obj, name + 's', None)
+        if values is None:
+            continue
+        values = np.asarray(values)
+        if values.shape == (ntimes, ):
+            time_columns.append((name, values))
+    if len(time_columns) == 0:
+        time_columns.append(('time', np.asarray(obj._times)))
+    return time_columns
+
+
+def _get_id_columns(obj, ntimes: int, ntotal: int,
+                    used_names: set[str]) -> list[tuple[str, np.ndarray, bool]]:
+    """
+    Gets the id columns of a result, which aren't in used_names
+
+    Returns
+    -------
+    id_columns : list[(name, ids, is_per_time)]
+        ids : (ntotal, ) or (ntimes, ntotal) ndarray
+
+    """
+    id_columns = []
+    for attr, column_names in ID_ARRAYS:
+        ids = getattr(obj, attr, None)
+        if not isinstance(ids, np.ndarray) or ids.ndim == 0:
+            continue
+
+        # element is (ntotal, ), element_node is (ntotal, 2) and
+        # the per time arrays have an extra leading dimension
+        ndim = 1 if len(column_names) == 1 else 2
+        if ids.ndim == ndim and ids.shape[0] == ntotal:
+            is_per_time = False
+        elif ids.ndim == ndim + 1 and ids.shape[:2] == (ntimes, ntotal):
+            is_per_time = True
+        else:
+            continue
+
+        ncolumns = 1 if ndim == 1 else ids.shape[-1]
+        for icolumn in range(ncolumns):
+            name = column_names[icolumn] if icolumn < len(column_names) else f'{attr}{icolumn}'
+            if name in used_names:
+                continue
+            used_names.add(name)
+            idsi = ids if ndim == 1 else ids[..., icolumn]
+            id_columns.append((name, idsi, is_per_time))
+    return id_columns
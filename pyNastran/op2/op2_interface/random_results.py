@@ -1,10 +1,6 @@
 from typing import Any
 import numpy as np
-import scipy  # prevents confusing import error
-try:
-    from scipy.integrate import trapezoid
-except ImportError:  # pragma: no cover
-    from scipy.integrate import trapz as trapezoid
+from pyNastran.op2.random_response import rms_response, zero_crossing_rate
 
 class RandomObjects:
     prefix = ''
@@ -287,14 +283,11 @@ class PSDObjects:
                 # If you want the RMS value, this is computed as RMS = SQRT(SUM(PSD*DF)) and,
                 # where DF is the spectral resolution, where you integarate from Fmin to Fmax,
                 # i.e. your lowest and highest analysis frequency of interest, respectively.
-                psd_f = trapezoid(psd, freqs)
-                rms = psd_f ** 0.5
-                if psd_f == 0.0:
-                    # really this is nan, but that's Nastran for you
-                    no_crossings = 0.0
-                else:
-                    f2_psd_f = trapezoid(freqs**2 * psd, freqs)
-                    no_crossings = (f2_psd_f / psd_f) ** 0.5  # Hz
+                #
+                # the number of crossings is 0.0 for no response; really this is nan,
+                # but that's Nastran for you
+                rms = rms_response(psd, freqs)
+                no_crossings = zero_crossing_rate(psd, freqs)  # Hz
 
                 #print('ymin=%s ymax=%s xmin=%s xmax=%s fmin=%s fmax=%s' % (ymin, ymax, xmin, xmax, fmin, fmax))
                 #'0                             X Y - O U T P U T  S U M M A R Y  ( A U T O  O R  P S D F )'
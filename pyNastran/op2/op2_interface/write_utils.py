@@ -124,8 +124,17 @@ def view_dtype(array_obj: np.ndarray, dtype) -> np.ndarray:
         return array_obj.view(dtype)
     return array_obj.astype(dtype)
 
-def export_to_hdf5(self, group, log):
-    """exports the object to HDF5 format"""
+def export_to_hdf5(self, group, log, exporter=None):
+    """
+    exports the object to HDF5 format
+
+    Parameters
+    ----------
+    exporter : HDF5Exporter; default=None
+        None : contiguous datasets
+        HDF5Exporter : creates the datasets (e.g., chunked/compressed)
+
+    """
     #headers = self.get_headers()
 
     # for some reason we can't just not write the properties...
@@ -194,7 +203,10 @@ def export_to_hdf5(self, group, log):
             value = np.asarray(value, dtype='|S'+n)
 
         try:
-            group.create_dataset(name, data=value)
+            if exporter is None:
+                group.create_dataset(name, data=value)
+            else:
+                exporter.create_dataset(group, name, value)
         except TypeError:
             print('name = %r; type=%s' % (name, type(value)))
             print(value)
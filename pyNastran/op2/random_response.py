@@ -0,0 +1,419 @@
+"""
+Random (PSD) response of frequency response (SOL 111) OP2 results.
+
+The complex result of each excited subcase j is a transfer function
+H_j(f) of every node/element and column.  For the (nfreq, nload, nload)
+cross-spectral density matrix of the loads S_jk(f) (RANDPS/TABRND1),
+the response PSD is:
+
+    S(f) = sum_j sum_k H_j(f) S_jk(f) conj(H_k(f))
+
+which is calculated for every node/element, column and frequency at
+once, so a new input PSD doesn't need a new Nastran run.  Like Nastran,
+the PSD is piecewise linear in frequency, so:
+
+    rms = sqrt(m0)
+    zero_crossing_rate = sqrt(m2 / m0)  (the NO. POSITIVE CROSSINGS)
+
+where mn = integral(f^n * S(f), df) are the spectral moments.
+
+defines:
+ - RandomResponse
+ - s_in = get_input_psd(model, random_id, subcase_ids, freqs)
+ - psd = psd_response(transfer_functions, s_in)
+ - moments = spectral_moments(psd, freqs, orders=(0, 2))
+ - rms = rms_response(psd, freqs)
+ - n0 = zero_crossing_rate(psd, freqs)
+ - grms = miles_rms(fn, q, asd)
+ - response = random_results(results, s_in)
+ - responses = random_op2_results(model, bdf_model, random_id, subcase_ids,
+                                  result_names=None)
+
+"""
+from __future__ import annotations
+from typing import Any, Optional, TYPE_CHECKING
+import numpy as np
+
+from pyNastran.bdf.cards.bdf_tables import TABRND1
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+    from pyNastran.bdf.bdf import BDF
+    from pyNastran.op2.op2 import OP2
+
+
+class RandomResponse:
+    """
+    The random response of a frequency response result
+
+    Attributes
+    ----------
+    result : OP2 result object
+        the (complex) result of the first subcase (defines the ids/headers)
+    freqs : (nfreq, ) float64 ndarray
+        the frequencies
+    psd : (nfreq, nvalue, ncolumn) float64 ndarray
+        the response PSD; None if it wasn't saved
+    rms : (nvalue, ncolumn) float64 ndarray
+        the RMS of the response
+    zero_crossing_rate : (nvalue, ncolumn) float64 ndarray
+        the rate of positive zero crossings (Hz); 0 for no response
+
+    """
+    def __init__(self, result: Any, freqs: np.ndarray,
+                 psd: Optional[np.ndarray],
+                 rms: np.ndarray, zero_crossing_rate: np.ndarray):
+        self.result = result
+        self.freqs = freqs
+        self.psd = psd
+        self.rms = rms
+        self.zero_crossing_rate = zero_crossing_rate
+
+    @property
+    def headers(self) -> list[str]:
+        return self.result.get_headers()
+
+    @property
+    def nfreq(self) -> int:
+        return len(self.freqs)
+
+    def __repr__(self) -> str:
+        return (f'RandomResponse({self.result.__class__.__name__}, '
+                f'nfreq={self.nfreq}, shape={self.rms.shape})')
+
+
+def get_input_psd(model: BDF, random_id: int,
+                  subcase_ids: list[int],
+                  freqs: np.ndarray) -> np.ndarray:
+    """
+    Gets the cross-spectral density matrix of the loads from the RANDPS
+    cards of a RANDOM set:
+
+        S_jk(f) = (X + iY) G(f)
+
+    Parameters
+    ----------
+    model : BDF
+        the model with the RANDPS/TABRND1 cards
+    random_id : int
+        the RANDPS set id (the RANDOM case control value)
+    subcase_ids : list[int]
+        the excited subcases (the j/k of the RANDPS cards)
+    freqs : (nfreq, ) float ndarray
+        the frequencies
+
+    Returns
+    -------
+    s_in : (nfreq, nload, nload) complex128 ndarray
+        the Hermitian input PSD matrix; nload=len(subcase_ids)
+
+    """
+    randps_list = [load for load in model.dload_entries.get(random_id, [])
+                   if load.type == 'RANDPS']
+    if len(randps_list) == 0:
+        raise KeyError(f'random_id={random_id} does not have any RANDPS cards')
+
+    freqs = np.asarray(freqs, dtype='float64')
+    iload_map = {subcase_id: iload for iload, subcase_id in enumerate(subcase_ids)}
+    nload = len(subcase_ids)
+    s_in = np.zeros((len(freqs), nload, nload), dtype='complex128')
+    for randps in randps_list:
+        try:
+            j = iload_map[randps.j]
+            k = iload_map[randps.k]
+        except KeyError:
+            raise KeyError(f'RANDPS j={randps.j} k={randps.k} is not in '
+                           f'subcase_ids={subcase_ids}')
+
+        table_id = randps.Tid()
+        if table_id is None:
+            gf = np.ones(len(freqs))
+        else:
+            table = model.RandomTable(table_id, msg=f', which is required by RANDPS sid={random_id}')
+            if not isinstance(table, TABRND1):
+                raise NotImplementedError(f'{table.type} is not supported\n{table}')
+            gf = table.interpolate(freqs)
+
+        sjk = complex(randps.x, randps.y) * gf
+        if j == k:
+            s_in[:, j, j] += sjk
+        else:
+            s_in[:, j, k] += sjk
+            s_in[:, k, j] += np.conj(sjk)
+    return s_in
+
+
+def psd_response(transfer_functions: np.ndarray,
+                 s_in: np.ndarray) -> np.ndarray:
+    """
+    Calculates the response PSD of correlated loads
+
+    Parameters
+    ----------
+    transfer_functions : (nload, nfreq, ...) complex ndarray
+        the response to each (unit) load
+    s_in : (nfreq, nload, nload) complex ndarray
+        the Hermitian input PSD matrix
+
+    Returns
+    -------
+    psd : (nfreq, ...) float64 ndarray
+        the response PSD
+
+    """
+    h = transfer_functions
+    nload, nfreq = h.shape[:2]
+    assert s_in.shape == (nfreq, nload, nload), f's_in.shape={s_in.shape}; expected={(nfreq, nload, nload)}'
+
+    # broadcast the input over the response axes
+    shape = (nfreq, ) + (1, ) * (h.ndim - 2)
+    psd = np.zeros(h.shape[1:], dtype='float64')
+    for j in range(nload):
+        hj = h[j].astype('complex128')
+        sjj = s_in[:, j, j].real.reshape(shape)
+        psd += sjj * (hj.real ** 2 + hj.imag ** 2)
+
+        # the jk and kj terms are complex conjugates
+        for k in range(j + 1, nload):
+            sjk = s_in[:, j, k].reshape(shape)
+            if not np.any(sjk):
+                continue
+            psd += 2. * np.real(hj * np.conj(h[k].astype('complex128')) * sjk)
+    return psd
+
+
+def _get_moment_weights(freqs: np.ndarray, order: int) -> np.ndarray:
+    """
+    Gets the weights of the PSD values, so integral(f^n * S(f), df) of
+    the piecewise linear S(f) is exact
+    """
+    freqs = np.asarray(freqs, dtype='float64')
+    df = np.diff(freqs)
+    assert np.all(df >= 0.), 'the frequencies must be sorted'
+
+    # Gauss-Legendre is exact for the f^n * linear polynomial
+    tq, wq = np.polynomial.legendre.leggauss((order + 3) // 2)
+    tq = (tq + 1.) / 2.
+    wq = wq / 2.
+
+    # (nsegment, nquad)
+    fq = freqs[:-1, np.newaxis] + tq[np.newaxis, :] * df[:, np.newaxis]
+    fn_wq = fq ** order * wq * df[:, np.newaxis]
+    weights = np.zeros(len(freqs), dtype='float64')
+    weights[:-1] += fn_wq @ (1. - tq)
+    weights[1:] += fn_wq @ tq
+    return weights
+
+
+def spectral_moments(psd: np.ndarray, freqs: np.ndarray,
+                     orders: tuple[int, ...]=(0, 2)) -> list[np.ndarray]:
+    """
+    Calculates the spectral moments of a piecewise linear PSD
+
+    Parameters
+    ----------
+    psd : (nfreq, ...) float ndarray
+        the PSD
+    freqs : (nfreq, ) float ndarray
+        the sorted frequencies
+    orders : tuple[int]; default=(0, 2)
+        the moments to calculate
+
+    Returns
+    -------
+    moments : list[(...) float64 ndarray]
+        integral(f^n * S(f), df) for each order
+
+    """
+    moments = [np.tensordot(_get_moment_weights(freqs, order), psd, axes=(0, 0))
+               for order in orders]
+    return moments
+
+
+def rms_response(psd: np.ndarray, freqs: np.ndarray) -> np.ndarray:
+    """Calculates the RMS of a PSD"""
+    m0, = spectral_moments(psd, freqs, orders=(0, ))
+    return np.sqrt(np.abs(m0))
+
+
+def zero_crossing_rate(psd: np.ndarray, freqs: np.ndarray) -> np.ndarray:
+    """
+    Calculates the rate of positive zero crossings (Hz) of a PSD;
+    0 for no response (like Nastran)
+    """
+    m0, m2 = spectral_moments(psd, freqs, orders=(0, 2))
+    return _zero_crossing_rate(m0, m2)
+
+
+def _zero_crossing_rate(m0: np.ndarray, m2: np.ndarray) -> np.ndarray:
+    """sqrt(m2 / m0)"""
+    is_response = m0 > 0.
+    rate = np.zeros(np.shape(m0), dtype='float64')
+    rate[is_response] = np.sqrt(np.abs(m2[is_response] / m0[is_response]))
+    return rate
+
+
+def miles_rms(fn: np.ndarray, q: np.ndarray, asd: np.ndarray) -> np.ndarray:
+    """
+    Calculates the RMS response of a single degree of freedom system
+    to a flat base excitation PSD (Miles' equation):
+
+        grms = sqrt(pi / 2 * fn * Q * ASD(fn))
+
+    Parameters
+    ----------
+    fn : (...) float ndarray
+        the natural frequencies (Hz)
+    q : (...) float ndarray
+        the amplification factor; Q = 1 / (2 * zeta)
+    asd : (...) float ndarray
+        the input PSD at fn (e.g., from TABRND1.interpolate(fn))
+
+    Returns
+    -------
+    grms : (...) float ndarray
+        the RMS response
+
+    """
+    return np.sqrt(np.pi / 2. * np.asarray(fn) * q * asd)
+
+
+def random_results(results: list[Any],
+                   s_in: np.ndarray,
+                   save_psd: bool=True,
+                   max_nbytes: int=256 * 1024 ** 2) -> RandomResponse:
+    """
+    Calculates the random response of a result
+    (e.g., displacement, cquad4_stress)
+
+    Parameters
+    ----------
+    results : list[OP2 result object]
+        the complex result of each excited subcase; the results must
+        have the same frequencies and nodes/elements
+    s_in : (nfreq, nload, nload) complex ndarray
+        the input PSD matrix (see ``get_input_psd``)
+    save_psd : bool; default=True
+        save the (nfreq, nvalue, ncolumn) response PSD
+    max_nbytes : int; default=256 MB
+        the approximate size of a chunk of nodes/elements
+
+    Returns
+    -------
+    response : RandomResponse
+        the PSD, RMS and zero crossing rate
+
+    """
+    result0 = results[0]
+    _check_results(results)
+    nload = len(results)
+    freqs = np.asarray(result0._times, dtype='float64')
+    nfreq, nvalue, ncolumn = result0.data.shape
+
+    psd = np.zeros((nfreq, nvalue, ncolumn), dtype='float64') if save_psd else None
+    rms = np.zeros((nvalue, ncolumn), dtype='float64')
+    rate = np.zeros((nvalue, ncolumn), dtype='float64')
+    weights0 = _get_moment_weights(freqs, 0)
+    weights2 = _get_moment_weights(freqs, 2)
+
+    # ~(nload + 4) (nfreq, nchunk, ncolumn) complex128 arrays
+    nchunk = max(1, max_nbytes // ((nload + 4) * 16 * nfreq * ncolumn))
+    for i0 in range(0, nvalue, nchunk):
+        i1 = min(i0 + nchunk, nvalue)
+        transfer_functions = np.stack([result.data[:, i0:i1, :] for result in results])
+        psdi = psd_response(transfer_functions, s_in)
+        m0 = np.tensordot(weights0, psdi, axes=(0, 0))
+        m2 = np.tensordot(weights2, psdi, axes=(0, 0))
+        rms[i0:i1] = np.sqrt(np.abs(m0))
+        rate[i0:i1] = _zero_crossing_rate(m0, m2)
+        if save_psd:
+            psd[:, i0:i1, :] = psdi
+    return RandomResponse(result0, freqs, psd, rms, rate)
+
+
+def random_op2_results(model: OP2,
+                       bdf_model: BDF,
+                       random_id: int,
+                       subcase_ids: list[int],
+                       result_names: Optional[list[str]]=None,
+                       save_psd: bool=True,
+                       max_nbytes: int=256 * 1024 ** 2,
+                       log: Optional[SimpleLogger]=None) -> dict[str, RandomResponse]:
+    """
+    Calculates the random responses of the frequency response results
+    of an OP2
+
+    Parameters
+    ----------
+    model : OP2
+        the OP2 with the frequency response subcases
+    bdf_model : BDF
+        the model with the RANDPS/TABRND1 cards
+    random_id : int
+        the RANDPS set id
+    subcase_ids : list[int]
+        the excited subcases (the keys of the results and the j/k of
+        the RANDPS cards)
+    result_names : list[str]; default=None -> all
+        the results (e.g., 'displacements', 'stress.cquad4_stress')
+    log : SimpleLogger; default=None -> model.log
+        logs the skipped results
+
+    See ``random_results`` for the other parameters
+
+    Returns
+    -------
+    responses : dict[result_name] = RandomResponse
+        the random response of each result
+
+    """
+    if log is None:
+        log = model.log
+    if result_names is None:
+        result_names = model.get_table_types()
+
+    s_in_cache = {}
+    responses = {}
+    for result_name in result_names:
+        try:
+            results_dict = model.get_result(result_name)
+        except AttributeError:
+            continue
+        if not isinstance(results_dict, dict) or len(results_dict) == 0:
+            continue
+        missing_ids = [subcase_id for subcase_id in subcase_ids
+                       if subcase_id not in results_dict]
+        if missing_ids:
+            log.debug(f'skipping {result_name}; missing subcases={missing_ids}')
+            continue
+        results = [results_dict[subcase_id] for subcase_id in subcase_ids]
+        if not _is_complex(results[0]):
+            log.warning(f'skipping {result_name}; {results[0].__class__.__name__} '
+                        'is not a complex frequency response result')
+            continue
+
+        freqs = np.asarray(results[0]._times, dtype='float64')
+        key = freqs.tobytes()
+        if key not in s_in_cache:
+            s_in_cache[key] = get_input_psd(bdf_model, random_id, subcase_ids, freqs)
+        responses[result_name] = random_results(
+            results, s_in_cache[key], save_psd=save_psd, max_nbytes=max_nbytes)
+    return responses
+
+
+def _is_complex(result: Any) -> bool:
+    """is the result a complex (nfreq, nvalue, ncolumn) result?"""
+    if not hasattr(result, 'data') or not hasattr(result, 'get_headers'):
+        return False
+    data = result.data
+    return isinstance(data, np.ndarray) and data.ndim == 3 and data.dtype.kind == 'c'
+
+
+def _check_results(results: list[Any]) -> None:
+    """the subcases must have the same frequencies and nodes/elements"""
+    result0 = results[0]
+    for result in results[1:]:
+        if result.data.shape != result0.data.shape:
+            raise ValueError(f'{result0.class_name}: shape={result.data.shape} '
+                             f'is not {result0.data.shape}')
+        if not np.allclose(result._times, result0._times):
+            raise ValueError(f'{result0.class_name}: the frequencies are not the same')
@@ -19,7 +19,7 @@ class CampbellData:
     def is_complex(self) -> bool:
         return True
 
-    def export_to_hdf5(self, result_group, log: SimpleLogger):
+    def export_to_hdf5(self, result_group, log: SimpleLogger, exporter=None):
         pass
 
     def write_f06(self, f06_file: TextIO):
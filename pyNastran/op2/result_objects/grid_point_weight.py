@@ -113,9 +113,9 @@ class GridPointWeight:
         self.approach_code = approach_code
         self.table_code = table_code
 
-    def export_to_hdf5(self, group, log) -> None:
+    def export_to_hdf5(self, group, log, exporter=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, exporter=exporter)
 
     def object_attributes(self, mode: str='public', keys_to_skip=None,
                           filter_properties: bool=False) -> list[str]:
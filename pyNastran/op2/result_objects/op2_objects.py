@@ -3,18 +3,21 @@ from __future__ import annotations
 import copy
 import warnings
 from itertools import count
-from struct import pack
+from struct import calcsize
 from typing import TYPE_CHECKING
 import numpy as np
 
 from cpylog import SimpleLogger
 from pyNastran import is_release
+from pyNastran.bdf import MAX_32_BIT_INT
 from pyNastran.utils import object_attributes, object_methods, object_stats, simplify_object_keys
 from pyNastran.utils.numpy_utils import integer_types
 
-from pyNastran.op2.errors import OverwriteTableError
+from pyNastran.op2.errors import OverwriteTableError, SixtyFourBitError
 from pyNastran.op2.op2_interface.op2_codes import Op2Codes, get_sort_method_from_table_name
 from pyNastran.op2.op2_interface.write_utils import write_table_header, export_to_hdf5
+from pyNastran.op2.writer.utils import (
+    write_markers, pack_record, get_table4_record, write_table4)
 if TYPE_CHECKING:  # pragma: no cover
     import pandas as pd
 Date = tuple[int, int, int]
@@ -225,9 +228,9 @@ class BaseScalarObject(Op2Codes):
         """creates a pandas dataframe"""
         print('build_dataframe is not implemented in %s' % self.__class__.__name__)
 
-    def export_to_hdf5(self, group, log: SimpleLogger) -> None:
+    def export_to_hdf5(self, group, log: SimpleLogger, exporter=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, exporter=exporter)
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
                   page_num=1, is_mag_phase=False, is_sort1=True) -> int:
@@ -587,6 +590,23 @@ class ScalarObject(BaseScalarObject):
             raise RuntimeError(f'grid_type={grid_type!r}')
         return grid_type_str
 
+    def recast_gridtypes_as_strings(self, grid_types: np.ndarray) -> tuple[list[str], np.ndarray]:
+        """
+        Vectorized version of ``recast_gridtype_as_string``
+
+        Returns
+        -------
+        grid_types_str : list[str]
+            the unique grid_types as strings
+        igrid_types : (n, ) int ndarray
+            the index into grid_types_str
+
+        """
+        ugrid_types, igrid_types = np.unique(grid_types, return_inverse=True)
+        grid_types_str = [self.recast_gridtype_as_string(grid_type)
+                          for grid_type in ugrid_types.tolist()]
+        return grid_types_str, igrid_types
+
     def cast_grid_type(self, grid_type_str):
         """converts a grid_type string to an integer"""
         try:
@@ -724,7 +744,8 @@ class ScalarObject(BaseScalarObject):
     def _write_table_header(self, op2_file, fascii,
                             date: tuple[int, int, int],
                             include_date: bool=True,
-                            subtable_name_default: bytes=b'OUG1    ') -> None:
+                            subtable_name_default: bytes=b'OUG1    ',
+                            size: int=4, endian: bytes=b'<') -> None:
         try:
             subtable_name = self.subtable_name
         except AttributeError:
@@ -733,21 +754,31 @@ class ScalarObject(BaseScalarObject):
             #raise
             pass
         _write_table_header(op2_file, fascii, date, self.table_name, subtable_name,
-                            include_date=include_date)
+                            include_date=include_date, size=size, endian=endian)
 
 def _write_table_header(op2_file, fascii,
                         date: Date,
                         table_name: str,
                         subtable_name: bytes,
-                        include_date: bool=True) -> None:
-    endian = b'<'
+                        include_date: bool=True,
+                        size: int=4, endian: bytes=b'<') -> None:
+    """
+    Writes the table name, the header (record -1) and the
+    subtable name/date (record -2) of a result table.
+
+    A 64-bit (size=8) table is written with interlaced strings.
+    """
     table_name = '%-8s' % table_name # 'BOUGV1  '
     fascii.write(f'{table_name}._write_table_header\n')
     #get_nmarkers- [4, 0, 4]
     #marker = [4, 2, 4]
     #table_header = [8, 'BOUGV1  ', 8]
-    write_table_header(op2_file, fascii, table_name)
-
+    if size == 4:
+        write_table_header(op2_file, fascii, table_name)
+    else:
+        write_markers(op2_file, [2], size=size, endian=endian)
+        op2_file.write(pack_record(b'8s', [table_name.encode('ascii')], size=size, endian=endian))
+        fascii.write('write_table_header: %s\n' % table_name)
 
     #read_markers -> [4, -1, 4]
     #get_nmarkers- [4, 0, 4]
@@ -755,72 +786,45 @@ def _write_table_header(op2_file, fascii,
     #read_record - record = [28, recordi, 28]
 
     #write_markers(op2_file, fascii, '  %s header1a' % table_name, [-1, 0, 7])
-    data_a = [4, -1, 4,]
-    #data_a = []
-    #data_b = [4, -1, 4,]
-    data_c = [4, 7, 4,]
-    fmt_header = endian + b'6i'
-    data = data_a + data_c
-    op2_file.write(pack(fmt_header, *data))
+    data_a = [-1]
+    data_c = [7]
+    write_markers(op2_file, data_a + data_c, size=size, endian=endian)
 
     #-----------------
-    table1_fmt = endian + b'9i'
-    table1 = [
-        28,
-        102, 0, 0, 0, 512, 0, 0,
-        28,
-    ]
+    table1 = [102, 0, 0, 0, 512, 0, 0]
 
     blank = ' ' * len(table_name)
     fascii.write(f'{table_name} header1a_i = {data_a}\n')
     #fascii.write(f'{blank}            = {data_b}\n')
     fascii.write(f'{blank}            = {data_c}\n')
-
     fascii.write(f'{table_name} header1b = {table1}\n')
-    op2_file.write(pack(table1_fmt, *table1))
+    op2_file.write(pack_record(b'7i', table1, size=size, endian=endian))
 
     #recordi = [subtable_name, month, day, year, 0, 1]
 
-    data = [
-        4, -2, 4,
-        4, 1, 4,
-        4, 0, 4,
-    ]
+    data = [-2, 1, 0]
     fascii.write('%s header2a = %s\n' % (table_name, data))
-    op2_file.write(pack(endian + b'9i', *data))
+    write_markers(op2_file, data, size=size, endian=endian)
 
     month, day, year = date
     dyear = year - 2000
     if subtable_name and include_date:
-        table2 = [
-            4, 7, 4,
-            28,  # 4i -> 13i
-            # subtable,todays date 3/6/2014, 0, 1  ( year=year-2000)
-            b'%-8s' % subtable_name, month, day, dyear, 0, 1,
-            28,
-        ]
-        table2_format = '4i 8s 6i'
+        # subtable,todays date 3/6/2014, 0, 1  ( year=year-2000)
+        table2 = [b'%-8s' % subtable_name, month, day, dyear, 0, 1]
+        table2_format = b'8s 5i'
     elif subtable_name:
-        table2 = [
-            4, 2, 4,
-            8,
-            b'%-8s' % subtable_name,
-            8,
-        ]
-        table2_format = '4i 8s i'
+        table2 = [b'%-8s' % subtable_name]
+        table2_format = b'8s'
     else:
         assert include_date is True, include_date
-        table2 = [
-            4, 7, 4,
-            28,  # 4i -> 13i
-            # todays date 3/6/2014, 0, 1  ( year=year-2000)
-            month, day, dyear, 0, 1,
-            28,
-        ]
-        table2_format = '4i 6i'
+        # todays date 3/6/2014, 0, 1  ( year=year-2000)
+        table2 = [month, day, dyear, 0, 1]
+        table2_format = b'5i'
 
     fascii.write('%s header2b = %s\n' % (table_name, table2))
-    op2_file.write(pack(table2_format, *table2))
+    nwords = calcsize(table2_format) // 4
+    write_markers(op2_file, [nwords], size=size, endian=endian)
+    op2_file.write(pack_record(table2_format, table2, size=size, endian=endian))
 
 def get_sort_element_sizes(self, debug: bool=False) -> tuple[int, int, int]:
     if self.is_sort1:
@@ -897,6 +901,43 @@ class BaseElement(ScalarObject):
         _check_element(self, table, log)
         _check_element_node(self, table, log)
 
+    def _write_op2_element_table(self, op2_file, op2_ascii, itable: int, new_result: bool,
+                                 date, endian: bytes=b'<', size: int=4) -> int:
+        """
+        Writes a SORT1 result with one [eid_device, data...] row per element
+        (e.g., CROD stress: [eid_device, axial, SMa, torsion, SMt]).
+
+        Each time is written as a single record, so an HDF5-backed
+        (lazy) result only loads one time at a time.
+        """
+        if itable == -1:
+            self._write_table_header(op2_file, op2_ascii, date, size=size, endian=endian)
+            itable = -3
+
+        if not self.is_sort1:
+            raise NotImplementedError('SORT2')
+
+        eids_device = self.element.astype('int64') * 10 + self.device_code
+        nelements = len(eids_device)
+        if size == 4 and nelements and eids_device.max() > MAX_32_BIT_INT:
+            raise SixtyFourBitError(f'64-bit OP2 writing is required (size=8); '
+                                    f'max id={self.element.max()}')
+
+        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
+        op2_ascii.write(f'nelements={nelements:d}\n')
+        for itime in range(self.ntimes):
+            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime,
+                                size=size, endian=endian)
+
+            record = get_table4_record([eids_device, self.data[itime, :, :]],
+                                       size=size, endian=endian)
+            assert record.nbytes == size * self.num_wide * nelements, (
+                f'{self.class_name}: num_wide={self.num_wide} nbytes={record.nbytes}')
+            itable = write_table4(op2_file, op2_ascii, itable, record,
+                                  size=size, endian=endian)
+            new_result = False
+        return itable
+
     def _build_pandas_transient_elements(self, column_values: np.ndarray, column_names: list[str],
                                          headers: list[str],
                                          element: np.ndarray, data: np.ndarray):
@@ -24,10 +24,9 @@ these are used by:
 """
 from __future__ import annotations
 import copy
-from struct import Struct, pack
 from itertools import count
 import warnings
-from typing import TextIO
+from typing import TextIO, Optional
 
 import numpy as np
 
@@ -38,11 +37,14 @@ from pyNastran.op2.result_objects.op2_objects import (
 
 from pyNastran.f06.f06_formatting import (
     write_floats_13e, write_floats_13e_long,
-    write_imag_floats_13e, write_float_12e)
+    write_imag_floats_13e, write_float_12e,
+    text_field, texts_field, int_field, float_13e_field,
+    format_f06_block, write_f06_block)
 from pyNastran.op2.errors import SixtyFourBitError
-from pyNastran.op2.op2_interface.write_utils import set_table3_field, view_dtype, view_idtype_as_fdtype
+from pyNastran.op2.op2_interface.write_utils import set_table3_field
 from pyNastran.utils.numpy_utils import integer_types, float_types
-from pyNastran.op2.writer.utils import fix_table3_types
+from pyNastran.op2.writer.utils import (
+    fix_table3_types, write_markers, pack_record, get_table4_record, write_table4)
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     set_static_case, set_modal_case, set_transient_case,
     set_freq_case, set_complex_modes_case)
@@ -710,24 +712,28 @@ class TableArray(ScalarObject):  # displacement style table
         self.itotal += 1
         #self.itime += 1
 
-    def _write_table_3(self, op2_file, fascii, new_result, itable=-3, itime=0):
+    def _get_op2_node_device(self, size: int) -> tuple[np.ndarray, np.ndarray]:
+        """gets the node_id*10+device_code and the gridtype for the OP2 writer"""
+        node = self.node_gridtype[:, 0].astype('int64')
+        gridtype = self.node_gridtype[:, 1]
+        nnodes_device = node * 10 + self.device_code
+        max_id = nnodes_device.max()
+        if size == 4 and max_id > MAX_32_BIT_INT:
+            raise SixtyFourBitError(f'64-bit OP2 writing is required (size=8); max id={node.max()}')
+        return nnodes_device, gridtype
+
+    def _write_table_3(self, op2_file, fascii, new_result, itable=-3, itime=0,
+                       size: int=4, endian: bytes=b'<'):
         import inspect
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
 
         if new_result and itable != -3:
-            header = [
-                4, 146, 4,
-            ]
+            header = [146]
         else:
-            header = [
-                4, itable, 4,
-                4, 1, 4,
-                4, 0, 4,
-                4, 146, 4,
-            ]
-        op2_file.write(pack(b'%ii' % len(header), *header))
+            header = [itable, 1, 0, 146]
+        write_markers(op2_file, header, size=size, endian=endian)
         fascii.write('table_3_header = %s\n' % header)
         #op2_file.write(pack('12i', *[4, itable, 4,
                               #4, 1, 4,
@@ -852,7 +858,6 @@ class TableArray(ScalarObject):  # displacement style table
                 n += len(val)
         assert n == 584, n
         data = [584] + table3 + [584]
-        fmt = b'i' + ftable3 + b'i'
 
         #op2_file.write(pack(fascii, '%s header 3c' % self.table_name, fmt, data))
         fascii.write('%s header 3c = %s\n' % (self.table_name, data))
@@ -861,7 +866,7 @@ class TableArray(ScalarObject):  # displacement style table
         #print(ftable3[:j])
         #print(table3[:j])
         #pack(ftable3[:j], *table3[:j])
-        op2_file.write(pack(fmt, *data))
+        op2_file.write(pack_record(ftable3, table3, size=size, endian=endian))
 
 
 class RealTableArray(TableArray):
@@ -1060,8 +1065,21 @@ class RealTableArray(TableArray):
         return 'float32'
 
     def write_op2(self, op2_file, fascii, itable: int, new_result,
-                  date, is_mag_phase: bool=False, endian: str='>'):
-        """writes an OP2"""
+                  date, is_mag_phase: bool=False, endian: bytes=b'<',
+                  size: int=4):
+        """
+        Writes an OP2
+
+        Each time step is written as a structured record, so a lazy
+        (HDF5) result is read a time step at a time.
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+
+        """
         import inspect
         allowed_tables = [
             'OUGV1', 'BOUGV1',
@@ -1091,78 +1109,27 @@ class RealTableArray(TableArray):
         fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
 
         if itable == -1:
-            self._write_table_header(op2_file, fascii, date)
+            self._write_table_header(op2_file, fascii, date, size=size, endian=endian)
             itable = -3
 
         #print('nonlinear_factor =', self.nonlinear_factor)
         if not self.is_sort1:
             raise NotImplementedError('SORT2')
-        #op2_format = endian + b'2i6f'
-
-        node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        nnodes = self.data.shape[1]
-        nnodes_device = self.node_gridtype[:, 0] * 10 + self.device_code
-
-        nnodes = len(node)
-        max_id = node.max()
-        if max_id > MAX_32_BIT_INT:
-            raise SixtyFourBitError(f'64-bit OP2 writing is not supported; max id={max_id}')
-
-        fdtype = self.data.dtype
-        if self.size == fdtype.itemsize:
-            pass
-        else:
-            warnings.warn(f'downcasting {self.class_name}...this is buggy')
-            #idtype = np.int32(1)
-            fdtype = np.float32(1.0)
 
-        nodedevice_gridtype = np.column_stack([nnodes_device, gridtype])
-        node_gridtype_floats = view_idtype_as_fdtype(nodedevice_gridtype, fdtype)
+        nnodes_device, gridtype = self._get_op2_node_device(size)
+        assert len(nnodes_device) > 0, len(nnodes_device)
 
-        #print(node_gridtype_floats)
-        #node_gridtype_floats = nodedevice_gridtype.view(fdtype) # .reshape(nnodes, 2)
-
-        #(2+6) => (node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i)
-        ntotal = nnodes * (2 + 6)
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert nnodes > 1, nnodes
-        assert ntotal > 1, ntotal
-
-        unused_device_code = self.device_code
         fascii.write('  ntimes = %s\n' % self.ntimes)
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
         for itime in range(self.ntimes):
-            self._write_table_3(op2_file, fascii, new_result, itable, itime)
-
-            # record 4
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4*ntotal]
-            op2_file.write(pack(b'%ii' % len(header), *header))
-            fascii.write('r4 [4, 0, 4]\n')
-            fascii.write(f'r4 [4, {itable}, 4]\n')
-            fascii.write(f'r4 [4, {4*ntotal:d}, 4]\n')
-
-            datai = view_dtype(self.data[itime, :, :], fdtype)
-            node_gridtype_data = np.hstack([node_gridtype_floats, datai])
-            op2_file.write(node_gridtype_data)
-            assert ntotal == node_gridtype_data.size
-            #print(self.data.shape, ntotal)
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack(b'i', *header))
-            fascii.write('footer = %s\n' % header)
+            self._write_table_3(op2_file, fascii, new_result, itable, itime,
+                                size=size, endian=endian)
+
+            # record 4: (node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i)
+            record = get_table4_record(
+                [nnodes_device, gridtype, self.data[itime, :, :]],
+                size=size, endian=endian)
+            itable = write_table4(op2_file, fascii, itable, record,
+                                  size=size, endian=endian)
             new_result = False
         return itable
 
@@ -1530,85 +1497,99 @@ class RealTableArray(TableArray):
         f06_file.write(''.join(header + words))
 
         node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
-        t1 = self.data[0, :, 0]
-        t2 = self.data[0, :, 1]
-        t3 = self.data[0, :, 2]
-        r1 = self.data[0, :, 3]
-        r2 = self.data[0, :, 4]
-        r3 = self.data[0, :, 5]
-        for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(node, gridtype, t1, t2, t3, r1, r2, r3):
-            sgridtype = self.recast_gridtype_as_string(gridtypei)
-            vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-            vals2 = write_floats_13e(vals)
-            (dx, dy, dz, rx, ry, rz) = vals2
-            f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                node_id, sgridtype, dx, dy, dz, rx, ry, rz))
+        sgridtypes, igridtypes = self.recast_gridtypes_as_strings(self.node_gridtype[:, 1])
+        data = self.data[0, :, :6]
+        write_f06_block(
+            f06_file,
+            lambda i0, i1: _get_real_table_f06_fields(
+                int_field(node[i0:i1], 14), sgridtypes, igridtypes[i0:i1], data[i0:i1, :]),
+            len(node))
         f06_file.write(page_stamp % page_num)
         return page_num
 
+    def _get_f06_is_scalar(self, sgridtypes: list[str], igridtypes: np.ndarray,
+                           vals: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Gets the SPOINT rows, which only have T1.  The GRID rows are None
+        if there are no SPOINTs.
+        """
+        is_scalar_types = np.array([sgridtype in ['S', 'M', 'E'] for sgridtype in sgridtypes])
+        is_grid_types = np.array([sgridtype in ['G', 'H', 'L'] for sgridtype in sgridtypes])
+        is_valid = (is_scalar_types | is_grid_types)[igridtypes]
+        if not is_valid.all():  # pragma: no cover
+            inode = np.where(~is_valid)[0][0]
+            node_id = self.node_gridtype[inode, 0]
+            sgridtype = sgridtypes[igridtypes[inode]]
+            vals2 = write_floats_13e(vals[0, inode, :6].tolist())
+            raise NotImplementedError(f'node_id={node_id} sgridtype={sgridtype} vals={vals2}')
+        if not is_scalar_types.any():
+            return None
+        return is_scalar_types[igridtypes]
+
     def _write_sort1_as_sort2(self, f06_file: TextIO, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
-        gridtypes = self.node_gridtype[:, 1]
+        sgridtypes, igridtypes = self.recast_gridtypes_as_strings(self.node_gridtype[:, 1])
         times = self._times
-
-        for inode, (node_id, gridtypei) in enumerate(zip(nodes, gridtypes)):
-            t1 = self.data[:, inode, 0].ravel()
-            t2 = self.data[:, inode, 1].ravel()
-            t3 = self.data[:, inode, 2].ravel()
-            r1 = self.data[:, inode, 3].ravel()
-            r2 = self.data[:, inode, 4].ravel()
-            r3 = self.data[:, inode, 5].ravel()
-
-            header[1] = ' POINT-ID = %10i\n' % node_id
-            f06_file.write(''.join(header + words))
-            for dt, t1i, t2i, t3i, r1i, r2i, r3i in zip(times, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        write_float_12e(dt), sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('%14s %6s     %s\n' % (node_id, sgridtype, dx))
-                else:  # pragma: no cover
-                    raise NotImplementedError(sgridtype)
-            f06_file.write(page_stamp % page_num)
-            page_num += 1
+        ntimes = len(times)
+        is_scalar = self._get_f06_is_scalar(sgridtypes, igridtypes, self.data)
+        if is_scalar is None:
+            is_scalar = np.zeros(len(nodes), dtype='bool')
+        dts = ['%14s' % write_float_12e(dt) for dt in times]
+        itimes = np.arange(ntimes)
+
+        # the lines of many nodes are formatted at once and then split
+        # into pages
+        nnodes_per_write = max(10_000 // max(ntimes, 1), 1)
+        for inode0 in range(0, len(nodes), nnodes_per_write):
+            inode1 = min(inode0 + nnodes_per_write, len(nodes))
+            nodesi = nodes[inode0:inode1]
+            nnodesi = len(nodesi)
+
+            lines = []
+            if ntimes:
+                # the GRID rows start with the time and the SPOINT rows with the node
+                is_scalari = np.repeat(is_scalar[inode0:inode1], ntimes)
+                first_column = np.hstack([
+                    texts_field(dts, np.tile(itimes, nnodesi), is_skipped=is_scalari),
+                    int_field(np.repeat(nodesi, ntimes), 14, is_skipped=~is_scalari),
+                ])
+
+                # (ntimes, nnodes, 6) -> (nnodes * ntimes, 6)
+                data = self.data[:, inode0:inode1, :6].transpose(1, 0, 2).reshape(nnodesi * ntimes, 6)
+                msg = format_f06_block(_get_real_table_f06_fields(
+                    first_column, sgridtypes, np.repeat(igridtypes[inode0:inode1], ntimes), data,
+                    is_scalari))
+                lines = msg.splitlines(keepends=True)
+
+            pages = []
+            for i, node_id in enumerate(nodesi.tolist()):
+                header[1] = ' POINT-ID = %10i\n' % node_id
+                pages.append(''.join(header + words + lines[i*ntimes:(i+1)*ntimes]))
+                pages.append(page_stamp % page_num)
+                page_num += 1
+            f06_file.write(''.join(pages))
         return page_num
 
     def _write_sort1_as_sort1(self, f06_file: TextIO, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
-        gridtypes = self.node_gridtype[:, 1]
-        unused_times = self._times
+        sgridtypes, igridtypes = self.recast_gridtypes_as_strings(self.node_gridtype[:, 1])
+        is_scalar = self._get_f06_is_scalar(sgridtypes, igridtypes, self.data)
 
         for itime in range(self.ntimes):
             dt = self._times[itime]
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
+            data = self.data[itime, :, :6]
 
             if isinstance(dt, float_types):
                 header[1] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
             else:
                 header[1] = ' %s = %10i\n' % (self.data_code['name'], dt)
             f06_file.write(''.join(header + words))
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nodes, gridtypes, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        node_id, sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('%14i %6s     %s\n' % (node_id, sgridtype, dx))
-                else:  # pragma: no cover
-                    raise NotImplementedError(f'node_id={node_id} sgridtype={sgridtype} vals={vals2}')
+            write_f06_block(
+                f06_file,
+                lambda i0, i1: _get_real_table_f06_fields(
+                    int_field(nodes[i0:i1], 14), sgridtypes, igridtypes[i0:i1], data[i0:i1, :],
+                    None if is_scalar is None else is_scalar[i0:i1]),
+                len(nodes))
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
@@ -1673,6 +1654,30 @@ class RealTableArray(TableArray):
         assert all(nids[inids] == node_ids), 'nids=%s expected=%s; all=%s'  % (nids[inids], node_ids, nids)
         return self.data[:, inids, i]
 
+def _get_real_table_f06_fields(first_column: np.ndarray, sgridtypes: list[str],
+                               igridtypes: np.ndarray, data: np.ndarray,
+                               is_scalar: Optional[np.ndarray]=None) -> list:
+    """
+    Gets the fields of the real F06 lines:
+     - GRID:   '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\\n'
+     - SPOINT: '%14i %6s     %s\\n'
+    """
+    t1, t2, t3, r1, r2, r3 = data.T
+    is_grid = None if is_scalar is None else ~is_scalar
+    fields = [
+        first_column, ' ',
+        texts_field(['%6s' % sgridtype for sgridtype in sgridtypes], igridtypes), '     ',
+        float_13e_field(t1, is_padded=True if is_scalar is None else is_grid),
+    ]
+    for value in [t2, t3, r1, r2]:
+        fields.extend([text_field('  ', len(t1), is_skipped=is_scalar),
+                       float_13e_field(value, is_skipped=is_scalar)])
+    fields.extend([text_field('  ', len(t1), is_skipped=is_scalar),
+                   float_13e_field(r3, is_padded=False, is_skipped=is_scalar),
+                   '\n'])
+    return fields
+
+
 def set_real_table(cls, data_code, is_sort1, isubcase,
                    node_gridtype, data, times):
 #def set_real_table(cls, data_code, is_sort1, isubcase, times,
@@ -1968,8 +1973,17 @@ class ComplexTableArray(TableArray):
         #return page_num
 
     def write_op2(self, op2_file, fascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian: bytes=b'<', size: int=4):
+        """
+        Writes an OP2 in real/imaginary form
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+
+        """
         import inspect
         allowed_tables = [
             'OUGV1', 'BOUGV1',
@@ -1988,99 +2002,29 @@ class ComplexTableArray(TableArray):
         fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
 
         if itable == -1:
-            self._write_table_header(op2_file, fascii, date)
+            self._write_table_header(op2_file, fascii, date, size=size, endian=endian)
             itable = -3
 
         #print('nonlinear_factor =', self.nonlinear_factor)
-        if self.is_sort1:
-            op2_format = endian + b'2i 12f'
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
-        s = Struct(op2_format)
-
-        node = self.node_gridtype[:, 0]
-        max_id = node.max()
-        if max_id > 99999999:
-            raise SixtyFourBitError(f'64-bit OP2 writing is not supported; max id={max_id}')
-
-        gridtype = self.node_gridtype[:, 1]
-        #format_table4_1 = Struct(self._endian + b'15i')
-        #format_table4_2 = Struct(self._endian + b'3i')
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        nnodes = self.data.shape[1]
-        nnodes_device = self.node_gridtype[:, 0] * 10 + self.device_code
-
-        #fdtype = self.data.real.dtype
-        #fdtype = 'float32'  # we don't support complex data yet
-        #nodedevice_gridtype = np.column_stack([nnodes_device, gridtype])
-        #node_gridtype_bytes = nodedevice_gridtype.tobytes()
-        #node_gridtype_floats = np.frombuffer(node_gridtype_bytes,
-                                             #dtype=fdtype).reshape(nnodes, 2)
 
-        #(2+6) => (node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i)
-        ntotal = nnodes * (2 + 12)
+        nnodes_device, gridtype = self._get_op2_node_device(size)
+        assert len(nnodes_device) >= 1, len(nnodes_device)
 
-        #print('shape = %s' % str(self.data.shape))
-        assert nnodes >= 1, nnodes
-        assert ntotal > 1, ntotal
-
-        unused_device_code = self.device_code
         fascii.write('  ntimes = %s\n' % self.ntimes)
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
         for itime in range(self.ntimes):
-            self._write_table_3(op2_file, fascii, new_result, itable, itime)
-
-            # record 4
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4*ntotal]
-            op2_file.write(pack(b'%ii' % len(header), *header))
-            fascii.write('r4 [4, 0, 4]\n')
-            fascii.write(f'r4 [4, {itable}, 4]\n')
-            fascii.write(f'r4 [4, {4*ntotal:d}, 4]\n')
-
-            #datai = self.data[itime, :, :]
-            #node_gridtype_data = np.hstack([
-                #node_gridtype_floats,
-                #datai.real.astype('float32'),
-                #datai.imag.astype('float32'),
-            #])
-            #node_gridtype_data_bytes = node_gridtype_data.tobytes()
-            #op2_file.write(node_gridtype_data_bytes)
-
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nnodes_device, gridtype, t1, t2, t3, r1, r2, r3):
-                data = [node_id, gridtypei,
-                        t1i.real, t2i.real, t3i.real, r1i.real, r2i.real, r3i.real,
-                        t1i.imag, t2i.imag, t3i.imag, r1i.imag, r2i.imag, r3i.imag]
-                fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
-                op2_file.write(s.pack(*data))
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack(b'i', *header))
-            fascii.write('footer = %s\n' % header)
+            self._write_table_3(op2_file, fascii, new_result, itable, itime,
+                                size=size, endian=endian)
+
+            # record 4: (node_id, gridtypei, t1r, ..., r3r, t1i, ..., r3i)
+            datai = self.data[itime, :, :]
+            record = get_table4_record(
+                [nnodes_device, gridtype, datai.real, datai.imag],
+                size=size, endian=endian)
+            itable = write_table4(op2_file, fascii, itable, record,
+                                  size=size, endian=endian)
             new_result = False
-            #header = [
-                #4, itable, 4,
-                #4, 1, 4,
-                #4, 0, 4,
-            #]
-            #op2_file.write(pack(b'%ii' % len(header), *header))
-            #fascii.write('footer2 = %s\n' % header)
         return itable
 
     #def write_sort2_as_sort2(self, f06_file, page_num, page_stamp, header, words, is_mag_phase):
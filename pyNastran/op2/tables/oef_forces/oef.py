@@ -2308,18 +2308,18 @@ class OEF:
 
         n = 0
         if op2.format_code == 1 and op2.num_wide == 17:  # real
-            ntotal = 68  # 17*4
+            ntotal = 68 * self.factor  # 17*4
             nelements = ndata // ntotal
 
             obj_real = RealCShearForceArray
             auto_return, is_vectorized = self._create_oes_object4(
                 nelements, result_name, slot, obj_real)
             if auto_return:
-                return nelements * op2.num_wide * 4, None, None
+                return nelements * ntotal, None, None
 
             obj = op2.obj
             if op2.use_vector and is_vectorized and op2.sort_method == 1:
-                n = nelements * 4 * op2.num_wide
+                n = nelements * ntotal
                 itotal = obj.ielement
                 ielement2 = obj.itotal + nelements
                 itotal2 = ielement2
@@ -24,7 +24,7 @@ from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     set_element_case, set_element_node_xxb_case,
     set_static_case, set_modal_case, set_transient_case,
     set_post_buckling_case)
-from pyNastran.op2.writer.utils import fix_table3_types
+from pyNastran.op2.writer.utils import fix_table3_types, write_markers, pack_record
 
 
 TABLE_NAME_TO_TABLE_CODE = {
@@ -181,26 +181,19 @@ class ForceObject(BaseElement):
         #ind.sort()
         return ind
 
-    def _write_table_3(self, op2_file, op2_ascii, new_result, itable, itime): #itable=-3, itime=0):
+    def _write_table_3(self, op2_file, op2_ascii, new_result, itable, itime,
+                       size: int=4, endian: bytes=b'<'):
         import inspect
-        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
 
         #print('new_result=%s itable=%s' % (new_result, itable))
         if new_result and itable != -3:
-            header = [
-                4, 146, 4,
-            ]
+            header = [146]
         else:
-            header = [
-                4, itable, 4,
-                4, 1, 4,
-                4, 0, 4,
-                4, 146, 4,
-            ]
-        op2_file.write(pack(b'%ii' % len(header), *header))
+            header = [itable, 1, 0, 146]
+        write_markers(op2_file, header, size=size, endian=endian)
         op2_ascii.write('table_3_header = %s\n' % header)
 
         approach_code = self.approach_code
@@ -311,14 +304,13 @@ class ForceObject(BaseElement):
         ]
         assert table3[22] == thermal
 
-        table3 = fix_table3_types(table3, size=4)
+        table3 = fix_table3_types(table3, size=size)
         data = [584] + table3 + [584]
-        fmt = b'i' + ftable3 + b'i'
         #print(fmt)
         #print(data)
         #f.write(pack(fascii, '%s header 3c' % self.table_name, fmt, data))
         op2_ascii.write('%s header 3c = %s\n' % (self.table_name, data))
-        op2_file.write(pack(fmt, *data))
+        op2_file.write(pack_record(ftable3, table3, size=size, endian=endian))
 
 
 class RealForceObject(ForceObject):
@@ -897,76 +889,24 @@ class RealSpringDamperForceArray(RealForceObject):
         return page_num - 1
 
     def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian=b'<', size: int=4):
+        """
+        writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+        """
         import inspect
-        from struct import Struct, pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
-        if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
-            itable = -3
-
-        #eids = self.element
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        #nnodes = self.data.shape[1]
-        nelements = self.data.shape[1]
-
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert self.ntimes == 1, self.ntimes
-
-        #device_code = self.device_code
-        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-
-        eids_device = self.element * 10 + self.device_code
-
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        if self.is_sort1:
-            struct1 = Struct(endian + b'if')
-        else:
-            raise NotImplementedError('SORT2')
-
-        op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            force = self.data[itime, :, 0]
-
-            for eid, forcei in zip(eids_device, force):
-                data = [eid, forcei]
-                op2_ascii.write('  eid=%s force=%s\n' % tuple(data))
-                op2_file.write(struct1.pack(*data))
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
+        # [eid_device, force]
+        return self._write_op2_element_table(
+            op2_file, op2_ascii, itable, new_result, date, endian=endian, size=size)
 
 
 class RealSpringForceArray(RealSpringDamperForceArray):
@@ -1379,85 +1319,24 @@ class RealRodForceArray(RealForceObject):
         return True
 
     def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian=b'<', size: int=4):
+        """
+        writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+        """
+        import inspect
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
-        if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
-            itable = -3
-
-        #if isinstance(self.nonlinear_factor, float):
-            #op2_format = '%sif' % (7 * self.ntimes)
-            #raise NotImplementedError()
-        #else:
-            #op2_format = 'i21f'
-        #s = Struct(op2_format)
-
-        #eids = self.element
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        #nnodes = self.data.shape[1]
-        nelements = self.data.shape[1]
-
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert self.ntimes == 1, self.ntimes
-
-        #device_code = self.device_code
-        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-
-        eids_device = self.element * 10 + self.device_code
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
-            raise NotImplementedError('SORT2')
-
-        op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            #print('stress itable = %s' % itable)
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            axial = self.data[itime, :, 0]
-            torsion = self.data[itime, :, 1]
-
-            #print('eids3', eids3)
-            for eid, axiali, torsioni in zip(eids_device, axial, torsion):
-                data = [eid, axiali, torsioni]
-                op2_ascii.write('  eid=%s axial=%s torsion=%s\n' % tuple(data))
-                op2_file.write(struct1.pack(*data))
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
+        # [eid_device, axial, torsion]
+        return self._write_op2_element_table(
+            op2_file, op2_ascii, itable, new_result, date, endian=endian, size=size)
 
 
 class RealCBeamForceArray(RealForceObject):
@@ -2409,123 +2288,26 @@ class RealCShearForceArray(RealForceObject):
             page_num += 1
         return page_num - 1
 
-    def write_op2(self, op2_file, op2_ascii, itable, new_result, date,
-                  is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+    def write_op2(self, op2_file, op2_ascii, itable, new_result,
+                  date, is_mag_phase=False, endian=b'<', size: int=4):
+        """
+        writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+        """
+        import inspect
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
-        if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
-            itable = -3
-
-        #if isinstance(self.nonlinear_factor, float):
-            #op2_format = '%sif' % (7 * self.ntimes)
-            #raise NotImplementedError()
-        #else:
-            #op2_format = 'i21f'
-        #s = Struct(op2_format)
-
-        unused_eids = self.element
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        #nnodes = self.data.shape[1]
-        nelements = self.data.shape[1]
-
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert self.ntimes == 1, self.ntimes
-
-        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-
-        eids = self.element
-        eids_device = self.element * 10 + self.device_code
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 16f')
-        else:
-            raise NotImplementedError('SORT2')
-
-        op2_ascii.write(f'nelements={nelements:d}\n')
-
-        for itime in range(self.ntimes):
-            #print('3, %s' % itable)
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            #print('stress itable = %s' % itable)
-            itable -= 1
-            #print('4, %s' % itable)
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            f14 = self.data[itime, :, 0]
-            f12 = self.data[itime, :, 1]
-            f21 = self.data[itime, :, 2]
-            f23 = self.data[itime, :, 3]
-            f32 = self.data[itime, :, 4]
-            f34 = self.data[itime, :, 5]
-            f43 = self.data[itime, :, 6]
-            f41 = self.data[itime, :, 7]
-
-            kick1 = self.data[itime, :, 8]
-            tau12 = self.data[itime, :, 9]
-            kick2 = self.data[itime, :, 10]
-            tau23 = self.data[itime, :, 11]
-            kick3 = self.data[itime, :, 12]
-            tau34 = self.data[itime, :, 13]
-            kick4 = self.data[itime, :, 14]
-            tau41 = self.data[itime, :, 15]
-
-            for (eid, eid_device, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                 kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i) in zip(
-                    eids, eids_device, f14, f12, f21, f23, f32, f34, f43, f41,
-                    kick1, tau12, kick2, tau23, kick3, tau34, kick4, tau41):
-                op2_file.write(struct1.pack(
-                            eid_device, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                            kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i))
-
-                vals2 = write_floats_12e([
-                    f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                    kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i])
-                [
-                    f14i, f12i,
-                    f21i, f23i,
-                    f32i, f34i,
-                    f43i, f41i,
-                    kick1i, tau12i, kick2i, tau23i,
-                    kick3i, tau34i, kick4i, tau41i
-                ] = vals2
-                op2_ascii.write(
-                    '0%13i%-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n'
-                    '                     %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            eid, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                            kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i))
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
+        # [eid_device, f14, f12, f21, f23, f32, f34, f43, f41,
+        #              kick1, tau12, kick2, tau23, kick3, tau34, kick4, tau41]
+        return self._write_op2_element_table(
+            op2_file, op2_ascii, itable, new_result, date, endian=endian, size=size)
 
 
 class RealViscForceArray(RealForceObject):  # 24-CVISC
@@ -3160,117 +2942,32 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         return page_num - 1
 
     def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian=b'<', size: int=4):
+        """
+        writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+        """
+        import inspect
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
-        if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
-            itable = -3
+        # [eid_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        return self._write_op2_element_table(
+            op2_file, op2_ascii, itable, new_result, date, endian=endian, size=size)
 
-        #if 'CTRIA3' in self.element_name:
-            #nnodes = 3
-        #elif 'CQUAD4' in self.element_name:
-            #nnodes = 4
-        #elif 'CTRIAR' in self.element_name:
-            #nnodes = 4 # ???
-        #elif 'CQUADR' in self.element_name:
-            #nnodes = 5 # ???
-        #else:  # pragma: no cover
-            #raise NotImplementedError(self.code_information())
 
-        #print("nnodes_all =", nnodes_all)
-        #cen_word_ascii = 'CEN/%i' % nnodes
-        #cen_word = b'CEN/%i' % nnodes
+class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
+    def __init__(self, data_code, is_sort1, isubcase, dt):
+        RealForceObject.__init__(self, data_code, isubcase)
 
-        eids = self.element
-        #cen_word = 'CEN/%i' % nnodes
-
-        #msg.append(f'  element_node.shape = {self.element_node.shape}\n')
-        #msg.append(f'  data.shape={self.data.shape}\n')
-
-        eids = self.element
-        eids_device = eids * 10 + self.device_code
-
-        nelements = len(eids)
-        assert nelements > 0, eids
-        #print('nelements =', nelements)
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert nnodes > 1, nnodes
-        #assert self.ntimes == 1, self.ntimes
-
-        #device_code = self.device_code
-        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-
-        if self.is_sort1:
-            structi = Struct(endian + b'i 8f')
-        else:
-            raise NotImplementedError('SORT2')
-
-        op2_ascii.write(f'nelements={nelements:d}\n')
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            #print('stress itable = %s' % itable)
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
-            nwide = 0
-            for eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                data = [eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi]
-                #[mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                #    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                op2_file.write(structi.pack(*data))
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data[1:])))
-                nwide += len(data)
-
-            assert nwide == ntotal, f'nwide={nwide} ntotal={ntotal}'
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
-
-
-class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
-    def __init__(self, data_code, is_sort1, isubcase, dt):
-        RealForceObject.__init__(self, data_code, isubcase)
-
-        self.dt = dt
-        self.nelements = 0
+        self.dt = dt
+        self.nelements = 0
 
         #if is_sort1:
             #if dt is not None:
@@ -4006,89 +3703,24 @@ class RealCBarFastForceArray(RealForceObject):
         return True
 
     def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian=b'<', size: int=4):
+        """
+        writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+        """
+        import inspect
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
-        if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
-            itable = -3
-
-        #if isinstance(self.nonlinear_factor, float):
-            #op2_format = '%sif' % (7 * self.ntimes)
-            #raise NotImplementedError()
-        #else:
-            #op2_format = 'i21f'
-        #s = Struct(op2_format)
-
-        eids = self.element
-        eids_device = eids * 10 + self.device_code
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        #nnodes = self.data.shape[1]
-        nelements = self.data.shape[1]
-
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert self.ntimes == 1, self.ntimes
-
-        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 8f')
-        else:
-            raise NotImplementedError('SORT2')
-
-        op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            #print('stress itable = %s' % itable)
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            bm1a = self.data[itime, :, 0]
-            bm2a = self.data[itime, :, 1]
-            bm1b = self.data[itime, :, 2]
-            bm2b = self.data[itime, :, 3]
-            ts1 = self.data[itime, :, 4]
-            ts2 = self.data[itime, :, 5]
-            af = self.data[itime, :, 6]
-            trq = self.data[itime, :, 7]
-            for eid_device, bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi in zip(
-                    eids_device, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq):
-
-                data = [eid_device, bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2_file.write(struct1.pack(*data))
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
+        # [eid_device, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+        return self._write_op2_element_table(
+            op2_file, op2_ascii, itable, new_result, date, endian=endian, size=size)
 
     @abstractmethod
     def _words(self) -> list[str]:
@@ -4565,99 +4197,24 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         return page_num
 
     def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian=b'<', size: int=4):
+        """
+        writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+        """
+        import inspect
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
-        if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
-            itable = -3
-
-        #if isinstance(self.nonlinear_factor, float):
-            #op2_format = '%sif' % (7 * self.ntimes)
-            #raise NotImplementedError()
-        #else:
-            #op2_format = 'i21f'
-        #s = Struct(op2_format)
-
-        eids = self.element
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        #nnodes = self.data.shape[1]
-        nelements = self.data.shape[1]
-
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert self.ntimes == 1, self.ntimes
-
-        #device_code = self.device_code
-        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-
-        eids_device = self.element * 10 + self.device_code
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
-            raise NotImplementedError('SORT2')
-
-        op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
-        eids = self.element
-        #f.write(''.join(words))
-
-        #ntimes = self.data.shape[0]
-        struct1 = Struct(endian + b'i7f')
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            #print('stress itable = %s' % itable)
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            # sd, bm1, bm2, ts1, ts2, af, trq
-            sd = self.data[itime, :, 0]
-            bm1 = self.data[itime, :, 1]
-            bm2 = self.data[itime, :, 2]
-            ts1 = self.data[itime, :, 3]
-            ts2 = self.data[itime, :, 4]
-            af = self.data[itime, :, 5]
-            trq = self.data[itime, :, 6]
-            for eid, eid_device, sdi, bm1i, bm2i, ts1i, ts2i, afi, trqi in zip(
-                    eids, eids_device, sd, bm1, bm2, ts1, ts2, af, trq):
-                [sbm1i, sbm2i, sts1i, sts2i, safi, strqi] = write_floats_13e([
-                    bm1i, bm2i, ts1i, ts2i, afi, trqi])
-                op2_ascii.write(
-                    '     %8i   %4.3f  %-13s  %-13s     %-13s  %-13s         %-13s      %s\n' % (
-                        eid, sdi, sbm1i, sbm2i, sts1i, sts2i, safi, strqi))
-                data = [eid_device, sdi, bm1i, bm2i, ts1i, ts2i, afi, trqi]
-                op2_file.write(struct1.pack(*data))
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
+        # [eid_device, sd, bm1, bm2, ts1, ts2, af, trq]
+        return self._write_op2_element_table(
+            op2_file, op2_ascii, itable, new_result, date, endian=endian, size=size)
 
     def __eq__(self, table):  # pragma: no cover
         self._eq_header(table)
@@ -5617,87 +5174,24 @@ class RealForceMomentArray(RealForceObject):
         return page_num - 1
 
     def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian=b'<', size: int=4):
+        """
+        writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+        """
+        import inspect
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
-        if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
-            itable = -3
-
-        #if isinstance(self.nonlinear_factor, float):
-            #op2_format = '%sif' % (7 * self.ntimes)
-            #raise NotImplementedError()
-        #else:
-            #op2_format = 'i21f'
-        #s = Struct(op2_format)
-
-        #eids = self.element
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        #nnodes = self.data.shape[1]
-        nelements = self.data.shape[1]
-
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert self.ntimes == 1, self.ntimes
-
-        #device_code = self.device_code
-        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-
-        eids_device = self.element * 10 + self.device_code
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i6f')
-        else:
-            raise NotImplementedError('SORT2')
-
-        op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            fx = self.data[itime, :, 0]
-            fy = self.data[itime, :, 1]
-            fz = self.data[itime, :, 2]
-            mx = self.data[itime, :, 3]
-            my = self.data[itime, :, 4]
-            mz = self.data[itime, :, 5]
-
-            for eid, fxi, fyi, fzi, mxi, myi, mzi in zip(eids_device, fx, fy, fz, mx, my, mz):
-                data = [eid, fxi, fyi, fzi, mxi, myi, mzi]
-                op2_ascii.write('  eid=%s data=%s\n' % (eid, str(data[1:])))
-                op2_file.write(struct1.pack(*data))
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
+        # [eid_device, fx, fy, fz, mx, my, mz]
+        return self._write_op2_element_table(
+            op2_file, op2_ascii, itable, new_result, date, endian=endian, size=size)
 
 
 
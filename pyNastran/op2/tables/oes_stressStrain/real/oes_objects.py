@@ -2,7 +2,7 @@ from typing import Any
 import numpy as np
 from pyNastran.op2.result_objects.op2_objects import BaseElement, set_as_sort1
 from pyNastran.op2.op2_interface.write_utils import set_table3_field
-from pyNastran.op2.writer.utils import fix_table3_types
+from pyNastran.op2.writer.utils import fix_table3_types, write_markers, pack_record
 
 TABLE_NAME_TO_TABLE_CODE = {
     # stress
@@ -95,9 +95,9 @@ class OES_Object(BaseElement):
     def is_stress(self):
         raise NotImplementedError(f'overwrite this in {self.class_name}')
 
-    def _write_table_3(self, op2_file, op2_ascii, new_result, itable, itime): #, itable=-3, itime=0):
+    def _write_table_3(self, op2_file, op2_ascii, new_result, itable, itime,
+                       size: int=4, endian: bytes=b'<'):
         import inspect
-        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -105,17 +105,10 @@ class OES_Object(BaseElement):
         #if itable == -3:
         #print('*writing itable=%s' % itable)
         if new_result and itable != -3:
-            header = [
-                4, 146, 4,
-            ]
+            header = [146]
         else:
-            header = [
-                4, itable, 4,
-                4, 1, 4,
-                4, 0, 4,
-                4, 146, 4,
-            ]
-        op2_file.write(pack(b'%ii' % len(header), *header))
+            header = [itable, 1, 0, 146]
+        write_markers(op2_file, header, size=size, endian=endian)
         op2_ascii.write('table_3_header = %s\n' % header)
         #op2_file.write(pack('12i', *header))
         #else:
@@ -222,14 +215,13 @@ class OES_Object(BaseElement):
         ]
         assert table3[22] == thermal
 
-        table3 = fix_table3_types(table3, size=4)
+        table3 = fix_table3_types(table3, size=size)
         data = [584] + table3 + [584]
-        fmt = b'i' + ftable3 + b'i'
         #print(fmt)
         #print(data)
         #f.write(pack(fascii, '%s header 3c' % self.table_name, fmt, data))
         op2_ascii.write('%s header 3c = %s\n' % (self.table_name, data))
-        op2_file.write(pack(fmt, *data))
+        op2_file.write(pack_record(ftable3, table3, size=size, endian=endian))
 
 
 class StressObject(OES_Object):
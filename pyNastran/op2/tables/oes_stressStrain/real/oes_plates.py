@@ -7,13 +7,16 @@ import numpy as np
 
 from pyNastran.utils.mathematics import get_abs_max
 from pyNastran.utils.numpy_utils import integer_types
-from pyNastran.op2.op2_interface.write_utils import to_column_bytes, view_dtype, view_idtype_as_fdtype
+from pyNastran.op2.writer.utils import get_table4_record, write_table4
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object,
     oes_real_data_code, get_scode,
     set_static_case, set_modal_case, set_transient_case)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
-from pyNastran.f06.f06_formatting import write_floats_13e, write_floats_13e_long, _eigenvalue_header
+from pyNastran.op2.tables.oes_stressStrain.stress_invariants import von_mises, max_shear
+from pyNastran.f06.f06_formatting import (
+    write_floats_13e_long, _eigenvalue_header,
+    text_field, int_field, fixed_field, float_13e_field, write_f06_block)
 from pyNastran.op2.errors import SixtyFourBitError
 
 NUM_WIDE_CENTROID = 17
@@ -199,29 +202,29 @@ class RealPlateArray(OES_Object):
         #print(self.element_node.shape, self.data.shape)
 
     def abs_principal(self) -> np.ndarray:
-        """hasn't been checked for strain; 2d von mises"""
+        """the in-plane principal value with the largest magnitude"""
         omax = self.data[:, :, 5]
         omin = self.data[:, :, 6]
         abs_principal = get_abs_max(omin, omax, dtype=omin.dtype)
         return abs_principal
+
     def von_mises(self) -> np.ndarray:
-        """hasn't been checked for strain; 2d von mises"""
+        """2d von mises stress/strain"""
         if self.is_von_mises:
             return self.data[:, :, -1]
-        σxx = self.data[:, :, 1]
-        σyy = self.data[:, :, 2]
-        τxy = self.data[:, :, 3]
-        ovm = np.sqrt(σxx**2 + σyy**2 - σxx*σyy +3*(τxy**2) )
-        return ovm
+        oxx = self.data[:, :, 1]
+        oyy = self.data[:, :, 2]
+        txy = self.data[:, :, 3]
+        return von_mises(oxx, oyy, txy=txy, is_stress=self.is_stress)
+
     def max_shear(self) -> np.ndarray:
-        """hasn't been checked for strain"""
+        """in-plane max shear stress/strain"""
         if not self.is_von_mises:
             return self.data[:, :, -1]
         #headers = [fiber_dist, 'oxx', 'oyy', 'txy', 'angle', 'omax', 'omin', ovm]
         omax = self.data[:, :, 5]
         omin = self.data[:, :, 6]
-        max_shear = (omax - omin) / 2.
-        return max_shear
+        return max_shear(omax, omin, is_stress=self.is_stress)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -711,49 +714,12 @@ class RealPlateArray(OES_Object):
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg))
 
-            #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
-
             #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-            fiber_dist = self.data[itime, :, 0]
-            oxx = self.data[itime, :, 1]
-            oyy = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            angle = self.data[itime, :, 4]
-            major_principal = self.data[itime, :, 5]
-            minor_principal = self.data[itime, :, 6]
-            ovm = self.data[itime, :, 7]
-
-            is_linear = self.element_type in {33, 74, 227, 228, 83}
-            is_bilinear = self.element_type in {64, 70, 75, 82, 144}
-            for (i, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids, nids, fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm):
-                [fdi, oxxi, oyyi, txyi, major, minor, ovmi] = write_floats_13e(
-                    [fdi, oxxi, oyyi, txyi, major, minor, ovmi])
-                ilayer = i % 2
-                # tria3
-                if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
-                    if ilayer == 0:
-                        f06_file.write('0  %6i   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:
-                        f06_file.write('   %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-
-                elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        f06_file.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            eid, cen_word, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        f06_file.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        f06_file.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
-                            '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                else:  # pragma: no cover
-                    msg = 'element_name=%s self.element_type=%s' % (
-                        self.element_name, self.element_type)
-                    raise NotImplementedError(msg)
+            write_f06_block(
+                f06_file,
+                lambda i0, i1: _get_plate_f06_fields(
+                    self, eids[i0:i1], nids[i0:i1], cen_word, self.data[itime, i0:i1, :]),
+                len(eids))
 
             f06_file.write(page_stamp % page_num)
             page_num += 1
@@ -792,36 +758,27 @@ class RealPlateArray(OES_Object):
         return nnodes, is_bilinear
 
     def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian: bytes=b'<', size: int=4):
+        """
+        Writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+
+        """
         import inspect
-        from struct import Struct
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, size=size, endian=endian)
             itable = -3
 
-        nnodes, is_bilinear = self.get_nnodes_bilinear()
-        if is_bilinear:
-            nnodes_all = nnodes + 1
-            ntotal = 2 + 17 * nnodes_all
-        else:
-            nnodes_all = nnodes
-        #print("nnodes_all =", nnodes_all)
-        #cen_word_ascii = f'CEN/{nnodes:d}'
-        cen_word_bytes = b'CEN/'
-        idtype = self.element_node.dtype
-        fdtype = self.data.dtype
-        if self.size == fdtype.itemsize:
-            pass
-        else:
-            print(f'downcasting {self.class_name}...')
-            #cen_word_bytes = b'CEN/    '
-            idtype = np.int32(1)
-            fdtype = np.float32(1.0)
+        nnodes, unused_is_bilinear = self.get_nnodes_bilinear()
 
         #msg.append(f'  element_node.shape = {self.element_node.shape}\n')
         #msg.append(f'  data.shape={self.data.shape}\n')
@@ -829,10 +786,10 @@ class RealPlateArray(OES_Object):
         eids = self.element_node[:, 0]
         nids = self.element_node[:, 1]
         max_id = self.element_node.max()
-        if max_id > 99999999:
-            raise SixtyFourBitError(f'64-bit OP2 writing is not supported; max id={max_id}')
+        if size == 4 and max_id > 99999999:
+            raise SixtyFourBitError(f'64-bit OP2 writing is required (size=8); max id={max_id}')
 
-        eids_device = eids * 10 + self.device_code
+        eids_device = eids.astype('int64') * 10 + self.device_code
 
         nelements = len(np.unique(eids))
         nlayers = len(eids)
@@ -841,11 +798,6 @@ class RealPlateArray(OES_Object):
         #print('nlayers =', nlayers)
         nnodes_per_element = nlayers // nelements // 2
         assert nnodes_per_element in [1, 4, 5], nnodes_per_element
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
         assert nnodes > 1, nnodes
 
         op2_ascii.write(f'  ntimes = {self.ntimes}\n')
@@ -868,75 +820,44 @@ class RealPlateArray(OES_Object):
         if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
-        #struct_isi8f = Struct('i 4s i 8f')
-        #struct_i8f = Struct(endian + b'i8f')
-        #struct_8f = Struct(endian + b'8f')
-
-        nelements_nnodes = len(nids) // 2
         is_centroid = self.element_type in [33, 74, 227, 228]
         is_nodes = self.element_type in [64, 70, 75, 82, 144]
         if is_centroid:
-            eids_device2 = to_column_bytes([eids_device[::2]], idtype).view(fdtype)
+            eids_device2 = eids_device[::2]
             assert len(eids_device2) == nelements
         elif is_nodes:
-            cen_word_array_temp = np.full((nelements, 1), cen_word_bytes)
-            cen_word_array = cen_word_array_temp.view(fdtype)
-            eids_device2 = view_idtype_as_fdtype(eids_device[::2*nnodes_per_element].reshape(nelements, 1),
-                                                 fdtype)
-            nids2 = view_idtype_as_fdtype(nids[::2].reshape(nelements_nnodes, 1),
-                                          fdtype)
-
-        #nheader = 15
-        struct_i = Struct('i')
-        struct_13i = Struct('13i')
+            cen_word_array = np.full(nelements, b'CEN/')
+            eids_device2 = eids_device[::2*nnodes_per_element]
+            nids2 = nids[::2].reshape(nelements, nnodes_per_element)
+        else:  # pragma: no cover
+            msg = f'element_name={self.element_name} element_type={self.element_type}'
+            raise NotImplementedError(msg)
+
         op2_ascii.write(f'nelements={nelements:d}\n')
         for itime in range(self.ntimes):
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            #print('stress itable = %s' % itable)
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(struct_13i.pack(*header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            datai_ = self.data[itime, :, :]
+            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime,
+                                size=size, endian=endian)
+
             # 16 values
             # [eid_device, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
             # [            fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
+            datai = self.data[itime, :, :]
             if is_centroid:
-                datai2_ = datai_.reshape(nelements, 16)
-                datai = view_dtype(datai2_, fdtype)
-                data_out = np.hstack([eids_device2, datai])
-            elif is_nodes:
+                columns = [eids_device2, datai.reshape(nelements, 16)]
+            else:
                 # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
                 # bilinear
-                #16
-                datai2_ = datai_.reshape(nelements*nnodes_per_element, 16)
-                datai = view_dtype(datai2_, fdtype)
-                nids_data = np.hstack([nids2, datai]).reshape(nelements, nnodes_per_element*17)
-                data_out = np.hstack([eids_device2, cen_word_array, nids_data])
-            else:  # pragma: no cover
-                msg = f'element_name={self.element_name} element_type={self.element_type}'
-                raise NotImplementedError(msg)
-            assert data_out.size == ntotal, f'data_out.shape={data_out.shape} size={data_out.size}; ntotal={ntotal}'
-            op2_file.write(data_out)
-
-            itable -= 1
-            header = [4 * ntotal,]
-
-            op2_file.write(struct_i.pack(*header))
-            op2_ascii.write('footer = %s\n' % header)
+                datai = datai.reshape(nelements, nnodes_per_element, 16)
+                columns = [eids_device2, cen_word_array]
+                for inode in range(nnodes_per_element):
+                    columns.extend([nids2[:, inode], datai[:, inode, :]])
+            record = get_table4_record(columns, size=size, endian=endian)
+            assert record.nbytes == size * self.num_wide * nelements, f'record.nbytes={record.nbytes}; num_wide={self.num_wide} nelements={nelements}'
+            itable = write_table4(op2_file, op2_ascii, itable, record,
+                                  size=size, endian=endian)
             new_result = False
         return itable
 
-
 class RealPlateStressArray(RealPlateArray, StressObject):
     def __init__(self, data_code, is_sort1, isubcase, dt):
         RealPlateArray.__init__(self, data_code, is_sort1, isubcase, dt)
@@ -966,6 +887,59 @@ class RealPlateStrainArray(RealPlateArray, StrainObject):
         return headers
 
 
+def _get_plate_f06_fields(self, eids: np.ndarray, nids: np.ndarray, cen_word: str,
+                          data: np.ndarray) -> list:
+    """
+    Gets the fields of the F06 lines, which depend on the layer and the
+    node (center/corner) of the row:
+
+    linear (CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear):
+    0  %6i   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s     (layer 1)
+       %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s     (layer 2)
+
+    bilinear (CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4):
+    0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s         (center, layer 1)
+       %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s         (corner, layer 1)
+       %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\\n       (layer 2)
+    """
+    nrows = len(eids)
+    is_linear = self.element_type in {33, 74, 227, 228, 83}
+    is_bilinear = self.element_type in {64, 70, 75, 82, 144}
+    is_layer2 = np.arange(nrows) % 2 == 1
+    fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm = data.T
+    if is_linear:
+        is_layer1 = ~is_layer2
+        return [
+            text_field('0  ', nrows, is_skipped=is_layer2),
+            int_field(eids, 6, is_skipped=is_layer2),
+            text_field('         ', nrows, is_skipped=is_layer1),
+            '   ', float_13e_field(fiber_dist), '     ', float_13e_field(oxx),
+            '  ', float_13e_field(oyy), '  ', float_13e_field(txy),
+            '   ', fixed_field(angle, 8, 4), '   ', float_13e_field(major_principal),
+            '   ', float_13e_field(minor_principal), '  ', float_13e_field(ovm, is_padded=False),
+            '\n',
+        ]
+    elif is_bilinear:
+        is_center = (nids == 0) & ~is_layer2
+        is_corner = (nids != 0) & ~is_layer2
+        return [
+            text_field('0  ', nrows, is_skipped=~is_center),
+            int_field(eids, 8, is_skipped=~is_center),
+            text_field(' %8s' % cen_word, nrows, is_skipped=~is_center),
+            text_field('            ', nrows, is_skipped=~is_corner),
+            int_field(nids, 8, is_skipped=~is_corner),
+            text_field('                    ', nrows, is_skipped=~is_layer2),
+            '  ', float_13e_field(fiber_dist), '  ', float_13e_field(oxx),
+            ' ', float_13e_field(oyy), ' ', float_13e_field(txy),
+            '   ', fixed_field(angle, 8, 4), '  ', float_13e_field(major_principal),
+            ' ', float_13e_field(minor_principal), ' ', float_13e_field(ovm, is_padded=False),
+            '\n', text_field('\n', nrows, is_skipped=~is_layer2),
+        ]
+    msg = 'element_name=%s self.element_type=%s' % (
+        self.element_name, self.element_type)
+    raise NotImplementedError(msg)
+
+
 def _get_plate_msg(self):
     von_mises = 'VON MISES' if self.is_von_mises else 'MAX SHEAR'
 
@@ -1,8 +1,6 @@
 # pylint: disable=C0301,C0103,R0913,R0914,R0904,C0111,R0201,R0902
-import warnings
 from itertools import count
-from struct import pack
-from typing import TextIO, Any
+from typing import TextIO
 
 import numpy as np
 from numpy import zeros, where, searchsorted
@@ -10,13 +8,16 @@ from numpy.linalg import eigh  # type: ignore
 
 from pyNastran.utils.numpy_utils import float_types
 from pyNastran.f06.f06_formatting import (
-    write_floats_13e, write_floats_13e_long, _eigenvalue_header)
+    write_floats_13e_long, _eigenvalue_header,
+    text_field, int_field, fixed_field, float_13e_field, write_f06_block)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object,
     oes_real_data_code, set_static_case, set_modal_case,
     set_transient_case, set_post_buckling_case)
-from pyNastran.op2.op2_interface.write_utils import to_column_bytes
+from pyNastran.op2.tables.oes_stressStrain.stress_invariants import (
+    principal_3d, von_mises, octahedral_shear)
+from pyNastran.op2.writer.utils import get_table4_record, write_table4
 
 ELEMENT_NAME_TO_ELEMENT_TYPE = {
     'CTETRA' : 39,
@@ -56,38 +57,19 @@ class RealSolidArray(OES_Object):
         self.ielement = 0
 
     def update_data_components(self):
-        ntimes, nelements_nnodes = self.data.shape[:2]
-        # vm
-        oxx = self.data[:, :, 0].reshape(ntimes * nelements_nnodes)
-        oyy = self.data[:, :, 1].reshape(ntimes * nelements_nnodes)
-        ozz = self.data[:, :, 2].reshape(ntimes * nelements_nnodes)
-        txy = self.data[:, :, 3].reshape(ntimes * nelements_nnodes)
-        tyz = self.data[:, :, 4].reshape(ntimes * nelements_nnodes)
-        txz = self.data[:, :, 5].reshape(ntimes * nelements_nnodes)
-
-        #I1 = oxx + oyy + ozz
-        #txyz = txy**2 + tyz**2 + txz ** 2
-        #I2 = oxx * oyy + oyy * ozz + ozz * oxx - txyz
-        #I3 = oxx * oyy * ozz + 2 * txy * tyz * txz + oxx * tyz**2 - oyy * txz**2 - ozz * txy
-
-        # (n_subarrays, nrows, ncols)
-        o1, o2, o3 = calculate_principal_components(
-            ntimes, nelements_nnodes,
-            oxx, oyy, ozz, txy, tyz, txz,
-            self.is_stress)
-        ovm_sheari = calculate_ovm_shear(oxx, oyy, ozz, txy, tyz, txz, o1, o3,
-                                         self.is_von_mises, self.is_stress)
-        ovm_sheari2 = ovm_sheari.reshape(ntimes, nelements_nnodes)
-
-        self.data[:, :, 6] = o1.reshape(ntimes, nelements_nnodes)
-        self.data[:, :, 7] = o2.reshape(ntimes, nelements_nnodes)
-        self.data[:, :, 8] = o3.reshape(ntimes, nelements_nnodes)
-        self.data[:, :, 9] = ovm_sheari2
-
-        #A = [[doxx, dtxy, dtxz],
-             #[dtxy, doyy, dtyz],
-             #[dtxz, dtyz, dozz]]
-        #(_lambda, v) = eigh(A)  # a hermitian matrix is a symmetric-real matrix
+        """recalculates the principal and von mises/octahedral columns"""
+        oxx, oyy, ozz, txy, tyz, txz = (self.data[:, :, i] for i in range(6))
+        o1, o2, o3 = principal_3d(oxx, oyy, ozz, txy, tyz, txz,
+                                  is_stress=self.is_stress)
+        self.data[:, :, 6] = o1
+        self.data[:, :, 7] = o2
+        self.data[:, :, 8] = o3
+        if self.is_von_mises:
+            von_mises(oxx, oyy, ozz, txy, tyz, txz,
+                      is_stress=self.is_stress, out=self.data[:, :, 9])
+        else:
+            self.data[:, :, 9] = octahedral_shear(
+                oxx, oyy, ozz, txy, tyz, txz, is_stress=self.is_stress)
 
     def __iadd__(self, factor):
         """[A] += b"""
@@ -657,7 +639,6 @@ class RealSolidArray(OES_Object):
         o1 = self.data[:, :, 6]
         o2 = self.data[:, :, 7]
         o3 = self.data[:, :, 8]
-        ovm = self.data[:, :, 9]
         p = (o1 + o2 + o3) / -3.
 
         nnodes_total = self.data.shape[1]
@@ -669,218 +650,131 @@ class RealSolidArray(OES_Object):
         else:
             v = np.zeros((ntimes, nnodes, 3, 3), dtype=fdtype)
 
+        # the center row of each element has the coordinate system line
+        cnnodes = nnodes + 1
+        is_center = np.arange(nnodes_total) % cnnodes == 0
+        ueids3, ifirst = np.unique(eids3, return_index=True)
+        cids = np.zeros(nnodes_total, dtype=cids3.dtype)
+        cids[is_center] = cids3[ifirst[np.searchsorted(ueids3, eids2[is_center])]]
+
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f06_file.write(''.join(header + msg_temp))
 
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
-            oxx = self.data[itime, :, 0]
-            oyy = self.data[itime, :, 1]
-            ozz = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            tyz = self.data[itime, :, 4]
-            txz = self.data[itime, :, 5]
             o1 = self.data[itime, :, 6]
             o2 = self.data[itime, :, 7]
             o3 = self.data[itime, :, 8]
-            ovm = self.data[itime, :, 9]
             vi = v[itime, :, :, :]
             pi = p[itime, :]
 
-            cnnodes = nnodes + 1
-            for i, deid, node_id, doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dv, dovm in zip(
-                    count(), eids2, nodes, oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, pi, vi, ovm):
-
-                # o1-max
-                # o2-mid
-                # o3-min
-                assert do1 >= do2 >= do3, 'o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (deid, do1, do2, do3)
-                [oxxi, oyyi, ozzi, txyi, tyzi, txzi, o1i, o2i, o3i, pii, ovmi] = write_floats_13e(
-                    [doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm])
-
-                if i % cnnodes == 0:
-                    j = where(eids3 == deid)[0][0]
-                    cid = cids3[j]
-                    f06_file.write('0  %8s    %8iGRID CS  %i GP\n' % (deid, cid, nnodes))
-                    f06_file.write(
-                        '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                        '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                        '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                        % ('CENTER', oxxi, txyi, o1i, dv[0, 1], dv[0, 2], dv[0, 0], pii, ovmi,
-                           '', oyyi, tyzi, o2i, dv[1, 1], dv[1, 2], dv[1, 0],
-                           '', ozzi, txzi, o3i, dv[2, 1], dv[2, 2], dv[2, 0]))
-                else:
-                    f06_file.write(
-                        '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                        '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                        '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                        % (node_id, oxxi, txyi, o1i, dv[0, 1], dv[0, 2], dv[0, 0], pii, ovmi,
-                           '', oyyi, tyzi, o2i, dv[1, 1], dv[1, 2], dv[1, 0],
-                           '', ozzi, txzi, o3i, dv[2, 1], dv[2, 2], dv[2, 0]))
-                i += 1
+            # o1-max
+            # o2-mid
+            # o3-min
+            is_sorted = (o1 >= o2) & (o2 >= o3)
+            if not is_sorted.all():
+                i = np.where(~is_sorted)[0][0]
+                raise AssertionError('o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (
+                    eids2[i], o1[i], o2[i], o3[i]))
+
+            write_f06_block(
+                f06_file,
+                lambda i0, i1: _get_solid_f06_fields(
+                    nnodes, is_center[i0:i1], eids2[i0:i1], cids[i0:i1], nodes[i0:i1],
+                    self.data[itime, i0:i1, :], pi[i0:i1], vi[i0:i1, :, :]),
+                nnodes_total)
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
 
     def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
+                  date, is_mag_phase=False, endian: bytes=b'<', size: int=4):
+        """
+        Writes an OP2
+
+        The principal directions are calculated a time step at a time,
+        so a lazy (HDF5) result is read a time step at a time.
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+
+        """
         import inspect
-        calculate_directional_vectors = True
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
             #print('***************', itable)
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, size=size, endian=endian)
             itable = -3
 
-        #if isinstance(self.nonlinear_factor, float):
-            #op2_format = '%sif' % (7 * self.ntimes)
-            #raise NotImplementedError()
-        #else:
-            #op2_format = 'i21f'
-        #s = Struct(op2_format)
-        nnodes_expected = self.nnodes
-
         eids2 = self.element_node[:, 0]
         nodes = self.element_node[:, 1]
-        #nelements_nodes = len(nodes)
 
         eids3 = self.element_cid[:, 0]
         cids3 = self.element_cid[:, 1]
-        element_device = eids3 * 10 + self.device_code
+        element_device = eids3.astype('int64') * 10 + self.device_code
 
         # table 4 info
-        #ntimes = self.data.shape[0]
         nnodes = self.data.shape[1]
         ueids2 = np.unique(eids2)
         nelements = len(ueids2)
         if len(ueids2) == 1 and len(eids3) != 1:
             raise RuntimeError(f'SORT2: ueids2={ueids2}')
+        assert nnodes > 1, nnodes
+        assert len(element_device) == nelements, f'element_device.shape={element_device.shape} nelements={nelements}'
 
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
         nnodes_centroid = self.nnodes_per_element
         nnodes_no_centroid = self.nnodes_per_element_no_centroid
-        ntotali = 4 + 21 * nnodes_no_centroid
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        assert nnodes > 1, nnodes
-        #assert self.ntimes == 1, self.ntimes
 
         op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-        ntimes = self.ntimes
-
-        #print('ntotal=%s' % (ntotal))
         if not self.is_sort1:
             raise NotImplementedError('SORT2')
-        #op2_format = endian + b'2i6f'
-
-        idtype = self.element_cid.dtype
-        fdtype = self.data.dtype
-        if self.size == fdtype.itemsize:
-            grid_bytes = b'GRID'
-        else:
-            warnings.warn(f'downcasting {self.class_name}...')
-            idtype = np.int32(1)
-            fdtype = np.float32(1.0)
-            grid_bytes = b'GRID'
-
-        cen_array = np.full(nelements, grid_bytes, dtype='|S4')
-        nnodes_no_centroid_array = np.full(nelements, nnodes_no_centroid, dtype=idtype)
-
-        assert len(element_device) == nelements, f'element_device.shape={element_device.shape} nelements={nelements}'
-        assert len(cen_array) == nelements, f'cen_array.shape={cen_array.shape} cen_array={nelements}'
-        element_wise_data = to_column_bytes([
-            element_device, # ints
-            cids3, # ints
-            cen_array, # bytes
-            nnodes_no_centroid_array, # ints
-        ], fdtype, debug=False)
-
-        oxx = self.data[:, :, 0]
-        oyy = self.data[:, :, 1]
-        ozz = self.data[:, :, 2]
-        txy = self.data[:, :, 3]
-        tyz = self.data[:, :, 4]
-        txz = self.data[:, :, 5]
-        o1 = self.data[:, :, 6]
-        o2 = self.data[:, :, 7]
-        o3 = self.data[:, :, 8]
-        ovm = self.data[:, :, 9]
-        p = (o1 + o2 + o3) / -3.
-
-        # speed up transient cases, but slightly slows down static cases
-        data_out = np.empty((nelements, 4+21*nnodes_centroid), dtype=fdtype)
 
         # setting:
-        #  - CTETRA: [element_device, cid, 'CEN/', 4]
-        #  - CPYRAM: [element_device, cid, 'CEN/', 5]
-        #  - CPENTA: [element_device, cid, 'CEN/', 6]
-        #  - CHEXA:  [element_device, cid, 'CEN/', 8]
-        data_out[:, :4] = element_wise_data
-
-        # we could tack the nodes on, so we don't have to keep stacking it
-        # but we run into issues with datai
-        #
-        # total=nelements_nodes
-        #nodes_view = nodes.view(fdtype).reshape(nelements, nnodes_centroid)
-        #inode = np.arange(nnodes_centroid)
-        #data_out[:, 4+inode*21] = nodes_view[:, inode]
-
-        # v is the (3, 3) eigenvector for every time and every element
-        if calculate_directional_vectors:
-            v = calculate_principal_eigenvectors4(
-                ntimes, nnodes,
-                oxx, oyy, ozz, txy, txz, tyz,
-                fdtype)[1]
-        else:
-            v = np.zeros((ntimes, nnodes, 3, 3), dtype=fdtype)
+        #  - CTETRA: [element_device, cid, 'GRID', 4]
+        #  - CPYRAM: [element_device, cid, 'GRID', 5]
+        #  - CPENTA: [element_device, cid, 'GRID', 6]
+        #  - CHEXA:  [element_device, cid, 'GRID', 8]
+        cen_array = np.full(nelements, b'GRID', dtype='|S4')
+        nnodes_no_centroid_array = np.full(nelements, nnodes_no_centroid, dtype='int32')
+        nodes2 = nodes.reshape(nelements, nnodes_centroid)
 
+        fdtype = self.data.dtype
         op2_ascii.write(f'nelements={nelements:d}\n')
         for itime in range(self.ntimes):
-            vi = v[itime, :, :, :]
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            #print('stress itable = %s' % itable)
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            col_inputs = [
-                nodes,
-                oxx[itime, :], txy[itime, :], o1[itime, :], vi[:, 0, 1], vi[:, 0, 2], vi[:, 0, 0], p[itime, :], ovm[itime, :],
-                oyy[itime, :], tyz[itime, :], o2[itime, :], vi[:, 1, 1], vi[:, 1, 2], vi[:, 1, 0],
-                ozz[itime, :], txz[itime, :], o3[itime, :], vi[:, 2, 1], vi[:, 2, 2], vi[:, 2, 0],
-            ]
+            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime,
+                                size=size, endian=endian)
 
-            # stack each output by columns and fix any dtypes
-            datai = to_column_bytes(col_inputs, fdtype)
-            #datai2 = datai.reshape(nelements, 21*nnodes_centroid)
-            #data_out = np.hstack([element_wise_data, datai2])
-            #data_out[:, 4:] = datai2
+            datai = self.data[itime, :, :]
+            oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm = datai.T
+            p = (o1 + o2 + o3) / -3.
 
-            # switch datai to element format and put it in the output buffer
-            data_out[:, 4:] = datai.reshape(nelements, 21*nnodes_centroid)
-            op2_file.write(data_out)
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
+            # v is the (3, 3) eigenvector for every element
+            vi = calculate_principal_eigenvectors4(
+                1, nnodes,
+                oxx, oyy, ozz, txy, txz, tyz,
+                fdtype)[1][0, :, :, :]
+
+            # (nnodes, 20) -> (nelements, nnodes_centroid, 20)
+            node_data = np.column_stack([
+                oxx, txy, o1, vi[:, 0, 1], vi[:, 0, 2], vi[:, 0, 0], p, ovm,
+                oyy, tyz, o2, vi[:, 1, 1], vi[:, 1, 2], vi[:, 1, 0],
+                ozz, txz, o3, vi[:, 2, 1], vi[:, 2, 2], vi[:, 2, 0],
+            ]).reshape(nelements, nnodes_centroid, 20)
+
+            columns = [element_device, cids3, cen_array, nnodes_no_centroid_array]
+            for inode in range(nnodes_centroid):
+                columns.extend([nodes2[:, inode], node_data[:, inode, :]])
+            record = get_table4_record(columns, size=size, endian=endian)
+            itable = write_table4(op2_file, op2_ascii, itable, record,
+                                  size=size, endian=endian)
             new_result = False
         return itable
 
@@ -912,6 +806,45 @@ class RealSolidStrainArray(RealSolidArray, StrainObject):
         headers = ['exx', 'eyy', 'ezz', 'exy', 'eyz', 'exz', 'emax', 'emid', 'emin', von_mises]
         return headers
 
+def _get_solid_f06_fields(nnodes: int, is_center: np.ndarray,
+                          eids: np.ndarray, cids: np.ndarray, nodes: np.ndarray,
+                          data: np.ndarray, pressure: np.ndarray, v: np.ndarray) -> list:
+    """
+    Gets the fields of the F06 lines of a center/corner point:
+
+    0  %8s    %8iGRID CS  %i GP  (center only)
+    0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s
+                   %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f
+                   %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f
+    """
+    nrows = len(eids)
+    is_corner = ~is_center
+    oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm = data.T
+    return [
+        text_field('0  ', nrows, is_skipped=is_corner),
+        int_field(eids, 8, is_skipped=is_corner),
+        text_field('    ', nrows, is_skipped=is_corner),
+        int_field(cids, 8, is_skipped=is_corner),
+        text_field('GRID CS  %i GP\n' % nnodes, nrows, is_skipped=is_corner),
+
+        '0              ',
+        int_field(nodes, 8, is_skipped=is_center),
+        text_field('  CENTER', nrows, is_skipped=is_corner),
+        '  X  ', float_13e_field(oxx), '  XY  ', float_13e_field(txy),
+        '   A  ', float_13e_field(o1), '  LX',
+        fixed_field(v[:, 0, 1], 5, 2), fixed_field(v[:, 0, 2], 5, 2), fixed_field(v[:, 0, 0], 5, 2),
+        '  ', float_13e_field(pressure), '   ', float_13e_field(ovm, is_padded=False), '\n',
+
+        '                         Y  ', float_13e_field(oyy), '  YZ  ', float_13e_field(tyz),
+        '   B  ', float_13e_field(o2), '  LY',
+        fixed_field(v[:, 1, 1], 5, 2), fixed_field(v[:, 1, 2], 5, 2), fixed_field(v[:, 1, 0], 5, 2), '\n',
+
+        '                         Z  ', float_13e_field(ozz), '  ZX  ', float_13e_field(txz),
+        '   C  ', float_13e_field(o3), '  LZ',
+        fixed_field(v[:, 2, 1], 5, 2), fixed_field(v[:, 2, 2], 5, 2), fixed_field(v[:, 2, 0], 5, 2), '\n',
+    ]
+
+
 def _get_solid_msgs(self: RealSolidArray):
     if self.is_von_mises:
         von_mises = 'VON MISES'
@@ -959,36 +892,6 @@ def _get_f06_header_nnodes(self: RealSolidArray, is_mag_phase=True):
         raise NotImplementedError(msg)
     return nnodes, msg
 
-def calculate_principal_components(ntimes: int, nelements_nnodes: int,
-                                   oxx, oyy, ozz,
-                                   txy, tyz, txz,
-                                   is_stress: bool) -> tuple[Any, Any, Any]:
-    """
-    TODO: scale by 2 for strain
-    """
-    a_matrix = np.full((ntimes * nelements_nnodes, 3, 3), np.nan)
-    #print(a_matrix.shape, oxx.shape)
-    a_matrix[:, 0, 0] = oxx
-    a_matrix[:, 1, 1] = oyy
-    a_matrix[:, 2, 2] = ozz
-
-    # we're only filling the lower part of the A matrix
-    if is_stress:
-        a_matrix[:, 1, 0] = txy
-        a_matrix[:, 2, 0] = txz
-        a_matrix[:, 2, 1] = tyz
-    else:
-        a_matrix[:, 1, 0] = txy / 2.
-        a_matrix[:, 2, 0] = txz / 2.
-        a_matrix[:, 2, 1] = tyz / 2.
-
-    eigs = np.linalg.eigvalsh(a_matrix)  # array = (..., M, M) array
-
-    o1 = eigs[:, 2]
-    o2 = eigs[:, 1]
-    o3 = eigs[:, 0]
-    return o1, o2, o3
-
 def calculate_principal_eigenvectors5(ntimes: int, nelements: int, nnodes: int,
                                       oxx: np.ndarray, oyy: np.ndarray, ozz: np.ndarray,
                                       txy: np.ndarray, txz: np.ndarray, tyz: np.ndarray,
@@ -1062,19 +965,6 @@ def calculate_principal_eigenvectors4(ntimes: int, nnodes: int,
     return eigenvalues, eigenvectors
 
 
-def calculate_ovm_shear(oxx, oyy, ozz,
-                        txy, tyz, txz, o1, o3,
-                        is_von_mises: bool,
-                        is_stress: bool):
-    if is_von_mises:
-        # von mises
-        ovm_shear = np.sqrt((oxx - oyy)**2 + (oyy - ozz)**2 + (oxx - ozz)**2 +
-                            3. * (txy**2 + tyz**2 + txz ** 2))
-    else:
-        # max shear
-        ovm_shear = (o1 - o3) / 2.
-    return ovm_shear
-
 def set_element_cid_case(cls: RealSolidArray, data_code, is_sort1, isubcase,
                          element_node, element_cid, data, times):
     assert element_node.ndim == 2, element_node.shape
@@ -18,7 +18,8 @@ from pyNastran.utils.numpy_utils import float_types
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
-from .oes_solids import RealSolidStressArray, RealSolidStrainArray, calculate_principal_components, calculate_ovm_shear
+from pyNastran.op2.tables.oes_stressStrain.stress_invariants import von_mises, octahedral_shear
+from .oes_solids import RealSolidStressArray, RealSolidStrainArray
 
 class RealSolidArrayNx(OES_Object):
     def __init__(self, data_code, is_sort1, isubcase, dt):
@@ -136,37 +137,14 @@ class RealSolidArrayNx(OES_Object):
         return obj
 
     def update_data_components(self):
-        """calculate von_mises/max_shear stress/strain"""
-        ntimes, nelements_nnodes = oxx.shape[:2]
-        oxx = self.data[:, :, 0]
-        oyy = self.data[:, :, 1]
-        ozz = self.data[:, :, 2]
-        txy = self.data[:, :, 3]
-        tyz = self.data[:, :, 4]
-        txz = self.data[:, :, 5]
-
-        #I1 = oxx + oyy + ozz
-        #txyz = txy**2 + tyz**2 + txz ** 2
-        #I2 = oxx * oyy + oyy * ozz + ozz * oxx - txyz
-        #I3 = oxx * oyy * ozz + 2 * txy * tyz * txz + oxx * tyz**2 - oyy * txz**2 - ozz * txy
-
-        # (n_subarrays, nrows, ncols)
+        """calculate von_mises/octahedral shear stress/strain"""
+        oxx, oyy, ozz, txy, tyz, txz = (self.data[:, :, i] for i in range(6))
         if self.is_von_mises:
-            o1 = o3 = np.array([])
+            von_mises(oxx, oyy, ozz, txy, tyz, txz,
+                      is_stress=self.is_stress, out=self.data[:, :, 6])
         else:
-            o1, o2, o3 = calculate_principal_components(
-                ntimes, nelements_nnodes,
-                oxx, oyy, ozz, txy, tyz, txz,
-                self.is_stress)
-            del o2
-        ovm_sheari = calculate_ovm_shear(oxx, oyy, ozz, txy, tyz, txz, o1, o3,
-                                         self.is_von_mises, self.is_stress)
-        #ovm = np.sqrt((oxx - oyy)**2 + (oyy - ozz)**2 + (oxx - ozz)**2 +
-                      #3. * (txy**2 + tyz**2 + txz ** 2))
-        self.data[:, :, 6] = ovm_sheari
-        #A = [[doxx, dtxy, dtxz],
-             #[dtxy, doyy, dtyz],
-             #[dtxz, dtyz, dozz]]
+            self.data[:, :, 6] = octahedral_shear(
+                oxx, oyy, ozz, txy, tyz, txz, is_stress=self.is_stress)
 
     def __iadd__(self, factor):
         """[A] += b"""
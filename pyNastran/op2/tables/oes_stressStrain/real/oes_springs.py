@@ -1,3 +1,4 @@
+import inspect
 from itertools import count
 from typing import TextIO
 
@@ -11,7 +12,7 @@ from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     oes_real_data_code, set_static_case, set_modal_case,
     set_transient_case, set_post_buckling_case, set_element_case)
 from pyNastran.f06.f06_formatting import write_float_13e, write_float_13e_long, _eigenvalue_header
-from pyNastran.op2.op2_interface.write_utils import set_table3_field, view_dtype, view_idtype_as_fdtype
+from pyNastran.op2.op2_interface.write_utils import set_table3_field, view_dtype
 
 ELEMENT_NAME_TO_ELEMENT_TYPE = {
     'CELAS1': 11,
@@ -486,85 +487,24 @@ class RealSpringArray(OES_Object):
             page_num += 1
         return page_num - 1
 
-    def write_op2(self, op2_file, op2_ascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
-        """writes an OP2"""
-        import inspect
-        from struct import pack
+    def write_op2(self, op2_file, op2_ascii, itable, new_result, date,
+                  is_mag_phase=False, endian=b'<', size: int=4):
+        """
+        writes an OP2
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2
+        """
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
-        if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
-            itable = -3
-
-        #eids = self.element
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        #nnodes = self.data.shape[1]
-        nelements = self.data.shape[1]
-
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert self.ntimes == 1, self.ntimes
-
-        #device_code = self.device_code
-        op2_ascii.write(f'  ntimes = {self.ntimes}\n')
-
-        eids_device = self.element * 10 + self.device_code
-
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        if not self.is_sort1:
-            raise NotImplementedError('SORT2')
-        #struct1 = Struct(endian + b'if')
-
-        fdtype = self.data.dtype
-        if self.size == fdtype.itemsize:
-            pass
-        else:
-            print(f'downcasting {self.class_name}...')
-            #idtype = np.int32(1)
-            fdtype = np.float32(1.0)
-
-        # [eid, stress]
-        data_out = np.empty((nelements, 2), dtype=fdtype)
-        data_out[:, 0] = view_idtype_as_fdtype(eids_device, fdtype)
-
-        op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
-
-            # record 4
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
-            op2_file.write(pack('%ii' % len(header), *header))
-            op2_ascii.write('r4 [4, 0, 4]\n')
-            op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
-            op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
-
-            # [eid, stress]
-            data_out[:, 1] = self.data[itime, :, 0]
-            op2_file.write(data_out)
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
+        # [eid_device, stress]
+        return self._write_op2_element_table(
+            op2_file, op2_ascii, itable, new_result, date, endian=endian, size=size)
 
 
 class RealSpringStressArray(RealSpringArray, StressObject):
@@ -0,0 +1,425 @@
+"""
+Vectorized stress/strain invariants of the real OES results.
+
+The functions take the components as arrays of any (broadcastable)
+shape, so they work directly on slices of the (ntime, nrow, ncomponent)
+``data`` arrays (e.g., ``data[:, :, 0]``) without building (3, 3)
+tensors.  Missing components (e.g., ozz of a plate) default to 0.
+
+Strains are engineering strains, so the shear strains are halved to get
+the tensor components.  Following Nastran:
+ - the max shear strain is the engineering shear strain (emax - emin)
+ - the von Mises strain is the equivalent strain for nu=0.5
+ - the octahedral shear strain is the tensor shear strain
+
+defines:
+ - angle, omax, omin = principal_2d(oxx, oyy, txy, is_stress=True)
+ - omax, omid, omin = principal_3d(oxx, oyy, ozz, txy, tyz, txz, is_stress=True)
+ - omean = mean_stress(oxx, oyy, ozz)
+ - ovm = von_mises(oxx, oyy, ozz, txy, tyz, txz, is_stress=True)
+ - ovm = signed_von_mises(oxx, oyy, ozz, txy, tyz, txz, is_stress=True)
+ - evm = equivalent_strain(exx, eyy, ezz, exy, eyz, exz, nu=0.5)
+ - tmax = max_shear(omax, omin, is_stress=True)
+ - otresca = tresca(omax, omin)
+ - toct = octahedral_shear(oxx, oyy, ozz, txy, tyz, txz, is_stress=True)
+ - StressInvariants
+
+"""
+from __future__ import annotations
+from typing import Any, Optional
+import numpy as np
+
+from pyNastran.utils.mathematics import get_abs_max
+
+Array = np.ndarray | float
+
+
+def principal_2d(oxx: Array, oyy: Array, txy: Array,
+                 is_stress: bool=True) -> tuple[Array, Array, Array]:
+    """
+    Calculates the in-plane principal values
+
+    Parameters
+    ----------
+    oxx, oyy, txy : (...) float ndarray
+        the in-plane stresses/strains
+    is_stress : bool; default=True
+        False : txy is an engineering shear strain
+
+    Returns
+    -------
+    angle : (...) float ndarray
+        the angle of the major principal value (degrees)
+    omax / omin : (...) float ndarray
+        the major/minor principal values
+
+    """
+    if not is_stress:
+        txy = txy / 2.
+    center = (oxx + oyy) / 2.
+    radius = np.hypot((oxx - oyy) / 2., txy)
+    angle = np.degrees(np.arctan2(2. * txy, oxx - oyy)) / 2.
+    return angle, center + radius, center - radius
+
+
+def principal_3d(oxx: Array, oyy: Array, ozz: Array=0.,
+                 txy: Array=0., tyz: Array=0., txz: Array=0.,
+                 is_stress: bool=True) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculates the principal values from the closed form solution of
+    the deviatoric invariants (J2, J3), so no (3, 3) tensors are built.
+
+    Parameters
+    ----------
+    oxx, oyy, ozz, txy, tyz, txz : (...) float ndarray
+        the stresses/strains
+    is_stress : bool; default=True
+        False : the shears are engineering shear strains
+
+    Returns
+    -------
+    omax / omid / omin : (...) float64 ndarray
+        the principal values
+
+    """
+    if not is_stress:
+        txy, tyz, txz = txy / 2., tyz / 2., txz / 2.
+    oxx, oyy, ozz, txy, tyz, txz = (
+        np.asarray(value, dtype='float64') for value in (oxx, oyy, ozz, txy, tyz, txz))
+    omean = (oxx + oyy + ozz) / 3.
+    sxx = oxx - omean
+    syy = oyy - omean
+    szz = ozz - omean
+    j2 = (sxx ** 2 + syy ** 2 + szz ** 2) / 2. + txy ** 2 + tyz ** 2 + txz ** 2
+
+    # normalize the deviatoric tensor, so cos(3*theta) = det(s / r) / 2
+    radius = np.sqrt(j2 / 3.)
+    with np.errstate(divide='ignore'):
+        inv_radius = np.where(radius > 0., 1. / radius, 0.)
+    sxx, syy, szz = sxx * inv_radius, syy * inv_radius, szz * inv_radius
+    sxy, syz, sxz = txy * inv_radius, tyz * inv_radius, txz * inv_radius
+    cos3theta = (sxx * syy * szz + 2. * sxy * syz * sxz
+                 - sxx * syz ** 2 - syy * sxz ** 2 - szz * sxy ** 2) / 2.
+    theta = np.arccos(np.clip(cos3theta, -1., 1.)) / 3.
+
+    radius *= 2.
+    omax = omean + radius * np.cos(theta)
+    omid = omean + radius * np.cos(theta - 2. * np.pi / 3.)
+    omin = omean + radius * np.cos(theta + 2. * np.pi / 3.)
+    return omax, omid, omin
+
+
+def mean_stress(oxx: Array, oyy: Array, ozz: Array=0.) -> Array:
+    """the mean (hydrostatic/octahedral normal) stress or strain"""
+    return (oxx + oyy + ozz) / 3.
+
+
+def _j2(oxx: Array, oyy: Array, ozz: Array,
+        txy: Array, tyz: Array, txz: Array) -> Array:
+    """the second invariant of the deviatoric tensor (tensor shears)"""
+    return (((oxx - oyy) ** 2 + (oyy - ozz) ** 2 + (ozz - oxx) ** 2) / 6.
+            + txy ** 2 + tyz ** 2 + txz ** 2)
+
+
+def von_mises(oxx: Array, oyy: Array, ozz: Array=0.,
+              txy: Array=0., tyz: Array=0., txz: Array=0.,
+              is_stress: bool=True,
+              out: Optional[np.ndarray]=None) -> Array:
+    """
+    Calculates the von Mises stress or the equivalent strain
+
+    Parameters
+    ----------
+    oxx, oyy, ozz, txy, tyz, txz : (...) float ndarray
+        the stresses/strains; use ozz=tyz=txz=0 for plane stress
+    is_stress : bool; default=True
+        False : calculates the Nastran von Mises strain
+        (see ``equivalent_strain``)
+    out : (...) float ndarray; default=None
+        an array (e.g., ``data[:, :, 9]``) to write the result to
+
+    Returns
+    -------
+    ovm : (...) float ndarray
+        the von Mises stress/strain
+
+    """
+    if not is_stress:
+        return equivalent_strain(oxx, oyy, ozz, txy, tyz, txz, out=out)
+    return np.sqrt(3. * _j2(oxx, oyy, ozz, txy, tyz, txz), out=out)
+
+
+def equivalent_strain(exx: Array, eyy: Array, ezz: Array=0.,
+                      exy: Array=0., eyz: Array=0., exz: Array=0.,
+                      nu: float=0.5,
+                      out: Optional[np.ndarray]=None) -> Array:
+    """
+    Calculates the equivalent (von Mises) strain::
+
+        e_eq = sqrt(3 * J2) / (1 + nu)
+
+    where J2 is calculated from the tensor shear strains.
+
+    Parameters
+    ----------
+    exx, eyy, ezz, exy, eyz, exz : (...) float ndarray
+        the strains (engineering shear strains)
+    nu : float; default=0.5
+        the Poisson's ratio; 0.5 is the Nastran von Mises strain
+    out : (...) float ndarray; default=None
+        an array to write the result to
+
+    """
+    j2 = _j2(exx, eyy, ezz, exy / 2., eyz / 2., exz / 2.)
+    out = np.sqrt(3. * j2, out=out)
+    out *= 1. / (1. + nu)
+    return out
+
+
+def signed_von_mises(oxx: Array, oyy: Array, ozz: Array=0.,
+                     txy: Array=0., tyz: Array=0., txz: Array=0.,
+                     is_stress: bool=True) -> Array:
+    """the von Mises stress/strain with the sign of the mean stress/strain"""
+    ovm = von_mises(oxx, oyy, ozz, txy, tyz, txz, is_stress=is_stress)
+    return np.where(mean_stress(oxx, oyy, ozz) < 0., -ovm, ovm)
+
+
+def max_shear(omax: Array, omin: Array, is_stress: bool=True,
+              out: Optional[np.ndarray]=None) -> Array:
+    """
+    Calculates the max shear from the principal values
+
+    Parameters
+    ----------
+    omax / omin : (...) float ndarray
+        the max/min principal values
+    is_stress : bool; default=True
+        False : calculates the engineering shear strain (emax - emin)
+    out : (...) float ndarray; default=None
+        an array to write the result to
+
+    """
+    out = np.subtract(omax, omin, out=out)
+    if is_stress:
+        out *= 0.5
+    return out
+
+
+def tresca(omax: Array, omin: Array) -> Array:
+    """
+    the Tresca stress (stress intensity), which is twice the max shear
+
+    For plane stress, omax/omin should include the zero out-of-plane
+    stress (e.g., from ``principal_3d``).
+    """
+    return omax - omin
+
+
+def octahedral_shear(oxx: Array, oyy: Array, ozz: Array=0.,
+                     txy: Array=0., tyz: Array=0., txz: Array=0.,
+                     is_stress: bool=True) -> Array:
+    """
+    Calculates the octahedral shear stress/strain (sqrt(2/3 * J2))
+
+    This is what Nastran writes to the solid stress/strain tables
+    when von Mises is not requested.  The strain shears are the
+    engineering shears.
+    """
+    if is_stress:
+        return np.sqrt(2. / 3. * _j2(oxx, oyy, ozz, txy, tyz, txz))
+    return np.sqrt(2. / 3. * _j2(oxx, oyy, ozz, txy / 2., tyz / 2., txz / 2.))
+
+
+def get_components(result: Any) -> tuple[bool, tuple[Array, ...]]:
+    """
+    Gets the stress/strain components of a real OES result as views of
+    ``result.data``
+
+    Parameters
+    ----------
+    result : OES result
+        a real rod, bar, beam, plate, composite plate or solid
+        stress/strain result
+
+    Returns
+    -------
+    is_plane : bool
+        True : the result is in a state of plane stress (all but solids)
+    components : (oxx, oyy, ozz, txy, tyz, txz)
+        the components; 0. for missing components
+        - rod: (ntime, nelement); the axial and torsion stress
+        - bar: (ntime, nelement, 8); the axial + bending stress at
+          points 1-4 at end A and B
+        - beam: (ntime, nnode, 4); the stress at points C, D, E, F
+        - plate: (ntime, nnode*nlayer)
+        - composite: (ntime, nply); the interlaminar shears
+          (t1z/t2z) aren't included, which is consistent with the OP2
+          principal values
+        - solid: (ntime, nelement*nnode)
+
+    """
+    from pyNastran.op2.tables.oes_stressStrain.real.oes_rods import RealRodArray
+    from pyNastran.op2.tables.oes_stressStrain.real.oes_bars import RealBarArray
+    from pyNastran.op2.tables.oes_stressStrain.real.oes_beams import RealBeamArray
+    from pyNastran.op2.tables.oes_stressStrain.real.oes_plates import RealPlateArray
+    from pyNastran.op2.tables.oes_stressStrain.real.oes_composite_plates import RealCompositePlateArray
+    from pyNastran.op2.tables.oes_stressStrain.real.oes_solids import RealSolidArray
+    from pyNastran.op2.tables.oes_stressStrain.real.oes_solids_nx import RealSolidArrayNx
+
+    data = result.data
+    if isinstance(result, (RealSolidArray, RealSolidArrayNx)):
+        return False, tuple(data[:, :, i] for i in range(6))
+
+    if isinstance(result, RealPlateArray):
+        oxx, oyy, txy = data[:, :, 1], data[:, :, 2], data[:, :, 3]
+    elif isinstance(result, RealCompositePlateArray):
+        oxx, oyy, txy = data[:, :, 0], data[:, :, 1], data[:, :, 2]
+    elif isinstance(result, RealRodArray):
+        oxx, oyy, txy = data[:, :, 0], 0., data[:, :, 2]
+    elif isinstance(result, RealBarArray):
+        # [s1a, s2a, s3a, s4a, axial, smaxa, smina, MS_tension,
+        #  s1b, s2b, s3b, s4b,        smaxb, sminb, MS_compression]
+        oxx = data[:, :, [0, 1, 2, 3, 8, 9, 10, 11]] + data[:, :, [4]]
+        oyy = txy = 0.
+    elif isinstance(result, RealBeamArray):
+        oxx, oyy, txy = data[:, :, :4], 0., 0.
+    else:
+        raise NotImplementedError(f'{result.class_name} is not supported')
+    return True, (oxx, oyy, 0., txy, 0., 0.)
+
+
+class StressInvariants:
+    """
+    Lazily derives the invariants of a real rod, bar, beam, plate,
+    composite plate or solid stress/strain result.
+
+    Each invariant is calculated from views of ``result.data`` on first
+    use and is then cached.  The invariants have the shape of the
+    components (see ``get_components``).
+
+    The principal values/max shear of the plane stress results (all but
+    solids) are the in-plane values (like the OP2), while the Tresca
+    stress includes the zero out-of-plane stress.
+
+    Example
+    -------
+    >>> invariants = StressInvariants(model.op2_results.stress.chexa_stress[1])
+    >>> ovm = invariants.von_mises
+    >>> otresca = invariants['tresca']
+
+    """
+    names = ('max_principal', 'mid_principal', 'min_principal', 'abs_principal',
+             'mean', 'von_mises', 'signed_von_mises', 'max_shear', 'tresca',
+             'octahedral_shear')
+
+    def __init__(self, result: Any):
+        self.result = result
+        self.is_plane, self.components = get_components(result)
+        self.is_stress = result.is_stress
+        self._cache: dict[str, Array] = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """gets an invariant by name (e.g., 'von_mises')"""
+        if name not in self._cache:
+            if name not in self.names:
+                raise KeyError(f'name={name!r} is not in {self.names}')
+            getattr(self, '_calculate_' + name)()
+        return self._cache[name]
+
+    def clear(self) -> None:
+        """clears the cached invariants (e.g., after the data changes)"""
+        self._cache = {}
+
+    @property
+    def max_principal(self) -> np.ndarray:
+        return self['max_principal']
+
+    @property
+    def mid_principal(self) -> np.ndarray:
+        """the middle principal value of a solid"""
+        return self['mid_principal']
+
+    @property
+    def min_principal(self) -> np.ndarray:
+        return self['min_principal']
+
+    @property
+    def abs_principal(self) -> np.ndarray:
+        """the principal value with the largest magnitude"""
+        return self['abs_principal']
+
+    @property
+    def mean(self) -> np.ndarray:
+        """the mean (hydrostatic) stress/strain"""
+        return self['mean']
+
+    @property
+    def von_mises(self) -> np.ndarray:
+        """the von Mises stress or Nastran von Mises (equivalent) strain"""
+        return self['von_mises']
+
+    @property
+    def signed_von_mises(self) -> np.ndarray:
+        """the von Mises stress/strain with the sign of the mean"""
+        return self['signed_von_mises']
+
+    @property
+    def max_shear(self) -> np.ndarray:
+        return self['max_shear']
+
+    @property
+    def tresca(self) -> np.ndarray:
+        return self['tresca']
+
+    @property
+    def octahedral_shear(self) -> np.ndarray:
+        return self['octahedral_shear']
+
+    def _calculate_max_principal(self) -> None:
+        oxx, oyy, ozz, txy, tyz, txz = self.components
+        if self.is_plane:
+            unused_angle, omax, omin = principal_2d(oxx, oyy, txy, is_stress=self.is_stress)
+            omid = None
+        else:
+            omax, omid, omin = principal_3d(oxx, oyy, ozz, txy, tyz, txz,
+                                            is_stress=self.is_stress)
+        self._cache.update({'max_principal': omax, 'min_principal': omin})
+        if omid is not None:
+            self._cache['mid_principal'] = omid
+    _calculate_min_principal = _calculate_max_principal
+
+    def _calculate_mid_principal(self) -> None:
+        if self.is_plane:
+            raise RuntimeError('mid_principal is only defined for solids')
+        self._calculate_max_principal()
+
+    def _calculate_abs_principal(self) -> None:
+        self._cache['abs_principal'] = get_abs_max(
+            self.min_principal, self.max_principal, dtype=self.max_principal.dtype)
+
+    def _calculate_mean(self) -> None:
+        oxx, oyy, ozz = self.components[:3]
+        self._cache['mean'] = mean_stress(oxx, oyy, ozz)
+
+    def _calculate_von_mises(self) -> None:
+        self._cache['von_mises'] = von_mises(*self.components, is_stress=self.is_stress)
+
+    def _calculate_signed_von_mises(self) -> None:
+        self._cache['signed_von_mises'] = np.where(
+            self.mean < 0., -self.von_mises, self.von_mises)
+
+    def _calculate_max_shear(self) -> None:
+        self._cache['max_shear'] = max_shear(self.max_principal, self.min_principal,
+                                             is_stress=self.is_stress)
+
+    def _calculate_tresca(self) -> None:
+        omax, omin = self.max_principal, self.min_principal
+        if self.is_plane:
+            # include the zero out-of-plane principal stress
+            omax = np.maximum(omax, 0.)
+            omin = np.minimum(omin, 0.)
+        self._cache['tresca'] = tresca(omax, omin)
+
+    def _calculate_octahedral_shear(self) -> None:
+        self._cache['octahedral_shear'] = octahedral_shear(
+            *self.components, is_stress=self.is_stress)
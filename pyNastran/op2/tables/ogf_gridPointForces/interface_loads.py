@@ -0,0 +1,501 @@
+"""
+Vectorized grid point force (GPFORCE) summation for many stations and
+all the time steps at once.
+
+A GPFORCE row is the force/moment that an element (or an applied load,
+SPC, ...) puts on a node.  The interface load at a station is the sum of
+the rows whose node and element are on the selected sides of the cut,
+so a station is a row selection.  The selections are stored as a sparse
+(nstation, nrow) matrix, which turns the summation of every station and
+every time step into a single sparse matrix product.
+
+The row filtering, selections, coordinate transforms and lever arms
+only depend on the geometry and the GPFORCE (node, element) layout, so
+they're built once by an ``InterfaceLoadPlan`` and applied to all the
+time steps/modes/load cases with the same layout.
+
+defines:
+ - InterfaceLoadPlan
+ - StationLoadPlan
+ - CutLoadPlan
+ - force_global, moment_global = get_row_global_loads(
+       data, row_cds, coords)
+ - selection = get_station_selection(
+       x_row_element, x_row_node, station_x, nodes_tol)
+ - force_sum, moment_sum = sum_station_loads(
+       selection, force_global, moment_global,
+       xyz_rows, summation_points, beta_out)
+
+"""
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Optional, TYPE_CHECKING
+import numpy as np
+from scipy.sparse import csr_matrix
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import CORD
+
+
+def get_row_global_loads(data: np.ndarray, row_cds: np.ndarray,
+                         coords: dict[int, CORD]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rotates the GPFORCE rows from the analysis (CD) frame of the node
+    into the global frame.
+
+    Parameters
+    ----------
+    data : (ntime, nrow, 6) float ndarray
+        the GPFORCE forces/moments
+    row_cds : (nrow, ) int ndarray
+        the analysis coordinate system of the node of each row
+    coords : dict[cid] = CORD
+        the coordinate systems
+
+    Returns
+    -------
+    force_global / moment_global : (ntime, nrow, 3) float64 ndarray
+        the forces/moments in the global frame.  The sign is flipped
+        to be consistent with Patran (see ``transform_force_moment``).
+
+    """
+    cd_groups = get_cd_groups(row_cds, coords)
+    return _rotate_rows(data, cd_groups)
+
+
+def get_cd_groups(row_cds: np.ndarray,
+                  coords: dict[int, CORD]) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Groups the GPFORCE rows by the analysis (CD) frame of the node
+
+    Returns
+    -------
+    cd_groups : list[(irow, beta_cd)]
+        irow : (nrowi, ) int ndarray
+            the rows in the frame
+        beta_cd : (3, 3) float ndarray
+            the transformation matrix of the frame
+
+    """
+    cd_groups = []
+    for cd in np.unique(row_cds):
+        irow = np.flatnonzero(row_cds == cd)
+        cd_groups.append((irow, coords[cd].beta()))
+    return cd_groups
+
+
+def _rotate_rows(data: np.ndarray,
+                 cd_groups: list[tuple[np.ndarray, np.ndarray]]) -> tuple[np.ndarray, np.ndarray]:
+    """see ``get_row_global_loads``"""
+    ntime, nrow = data.shape[:2]
+    force_global = np.empty((ntime, nrow, 3), dtype='float64')
+    moment_global = np.empty((ntime, nrow, 3), dtype='float64')
+    for irow, beta_cd in cd_groups:
+        force_global[:, irow, :] = -data[:, irow, :3] @ beta_cd
+        moment_global[:, irow, :] = -data[:, irow, 3:] @ beta_cd
+    return force_global, moment_global
+
+
+def get_station_selection(x_row_element: np.ndarray, x_row_node: np.ndarray,
+                          station_x: np.ndarray, nodes_tol: float) -> csr_matrix:
+    """
+    Gets the GPFORCE rows of each station for a cut that keeps the
+    elements behind the station and the nodes in front of it:
+
+        x_element <= station_x  and  x_node >= station_x - nodes_tol
+
+    Parameters
+    ----------
+    x_row_element : (nrow, ) float ndarray
+        the location of the element centroid of each row in the march
+        direction
+    x_row_node : (nrow, ) float ndarray
+        the location of the node of each row in the march direction
+    station_x : (nstation, ) float ndarray
+        the location of each station in the march direction
+    nodes_tol : float
+        the tolerance behind the station to pull nodes from
+
+    Returns
+    -------
+    selection : (nstation, nrow) csr_matrix
+        1.0 if the row is used by the station
+
+    """
+    nstation = len(station_x)
+    nrow = len(x_row_element)
+    isort = np.argsort(station_x)
+    station_x_sorted = station_x[isort]
+
+    # a row is used by the stations in [x_element, x_node + nodes_tol],
+    # which is a range of the sorted stations; pad the range and
+    # recheck the pairs with the exact inequalities
+    eps = 1e-6 * max(np.abs(station_x).max(initial=0.), abs(nodes_tol), 1.)
+    istart = np.searchsorted(station_x_sorted, x_row_element - eps, side='left')
+    iend = np.searchsorted(station_x_sorted, x_row_node + nodes_tol + eps, side='right')
+    ncount = np.maximum(iend - istart, 0)
+
+    irow = np.repeat(np.arange(nrow), ncount)
+    jstation = np.repeat(istart - np.cumsum(ncount) + ncount, ncount) + np.arange(ncount.sum())
+    istation = isort[jstation]
+    station_xi = station_x[istation]
+    is_valid = ((x_row_element[irow] <= station_xi) &
+                (x_row_node[irow] >= (station_xi - nodes_tol)))
+    irow = irow[is_valid]
+    istation = istation[is_valid]
+    selection = csr_matrix(
+        (np.ones(len(irow)), (istation, irow)), shape=(nstation, nrow))
+    return selection
+
+
+def sum_station_loads(selection: csr_matrix,
+                      force_global: np.ndarray, moment_global: np.ndarray,
+                      xyz_rows: np.ndarray,
+                      summation_points: np.ndarray,
+                      beta_out: np.ndarray,
+                      consider_rxf: bool=True) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sums the GPFORCE rows of every station for every time step
+
+    Parameters
+    ----------
+    selection : (nstation, nrow) csr_matrix
+        the rows of each station (see ``get_station_selection``)
+    force_global / moment_global : (ntime, nrow, 3) float ndarray
+        the row forces/moments in the global frame
+        (see ``get_row_global_loads``)
+    xyz_rows : (nrow, 3) float ndarray
+        the global location of the node of each row
+    summation_points : (nstation, 3) float ndarray
+        the global summation point of each station
+    beta_out : (3, 3) or (nstation, 3, 3) float ndarray
+        the transformation matrix (``coord.beta()``) of the output frame
+        of all the stations or of each station
+    consider_rxf : bool; default=True
+        considers the r x F term
+
+    Returns
+    -------
+    force_sum / moment_sum : (ntime, nstation, 3) float64 ndarray
+        the forces/moments about the summation point of each station in
+        the output frame; stations without rows are nan
+
+    """
+    ntime, nrow = force_global.shape[:2]
+    nstation = selection.shape[0]
+    summation_points = np.asarray(summation_points, dtype='float64')
+
+    # the moment about the summation point p of station s is:
+    #    sum(M_r + (x_r - p) x F_r) = sum(M_r + x_r x F_r) - p x sum(F_r)
+    moment = moment_global
+    if consider_rxf:
+        moment = moment_global + np.cross(xyz_rows[np.newaxis, :, :], force_global)
+
+    # (nrow, ntime*6) -> (nstation, ntime*6)
+    loads = np.concatenate([force_global, moment], axis=2)
+    loads = loads.transpose(1, 0, 2).reshape(nrow, ntime * 6)
+    load_sum = (selection @ loads).reshape(nstation, ntime, 6).transpose(1, 0, 2)
+    force_sum = load_sum[:, :, :3]
+    moment_sum = load_sum[:, :, 3:]
+    if consider_rxf:
+        moment_sum = moment_sum - np.cross(summation_points[np.newaxis, :, :], force_sum)
+
+    # rotate into the output frame
+    beta_out = np.asarray(beta_out)
+    if beta_out.ndim == 2:
+        force_sum = force_sum @ beta_out.T
+        moment_sum = moment_sum @ beta_out.T
+    else:
+        force_sum = np.einsum('tsj,skj->tsk', force_sum, beta_out)
+        moment_sum = np.einsum('tsj,skj->tsk', moment_sum, beta_out)
+
+    is_empty = np.diff(selection.indptr) == 0
+    force_sum[:, is_empty, :] = np.nan
+    moment_sum[:, is_empty, :] = np.nan
+    return force_sum, moment_sum
+
+
+class _PlanLayout:
+    """the precomputed rows of a GPFORCE (node, element) layout"""
+    def __init__(self, node_element: np.ndarray, irow: np.ndarray,
+                 selection: csr_matrix,
+                 cd_groups: list[tuple[np.ndarray, np.ndarray]],
+                 xyz_rows: np.ndarray):
+        self.node_element = node_element
+        self.irow = irow
+        self.selection = selection
+        self.cd_groups = cd_groups
+        self.xyz_rows = xyz_rows
+
+
+class InterfaceLoadPlan(ABC):
+    """
+    The precomputed summation of the GPFORCE rows of many cuts (e.g.,
+    the stations of a shear-moment-torque diagram), which is applied to
+    any number of time steps/modes/load cases at once.
+
+    The plan stores:
+     - the GPFORCE rows that are in the node/element sets
+     - the (ncut, nrow) sparse row selection of the cuts
+     - the analysis frame (CD) transforms and node locations (lever arms)
+       of the rows
+     - the summation points and output frames of the cuts
+
+    They're built the first time a (node, element) layout is seen, so
+    the plan may be reused for other subcases of the same model.
+
+    Use ``StationLoadPlan`` or ``CutLoadPlan``.
+    """
+    def __init__(self, nids: np.ndarray, eids: np.ndarray,
+                 nid_cd: np.ndarray, xyz_cid0: np.ndarray,
+                 coords: dict[int, CORD],
+                 summation_points: np.ndarray,
+                 beta_out: np.ndarray,
+                 consider_rxf: bool=True):
+        """
+        Parameters
+        ----------
+        nids : (nnode, ) int ndarray
+            the nodes to consider; sorted
+        eids : (nelement, ) int ndarray
+            the elements to consider; sorted
+        nid_cd : (nnode_all, 2) int ndarray
+            the (node_id, cd) of all the nodes, which is consistent
+            with xyz_cid0
+        xyz_cid0 : (nnode_all, 3) float ndarray
+            the global locations of all the nodes
+        coords : dict[cid] = CORD
+            the coordinate systems
+        summation_points : (ncut, 3) float ndarray
+            the global summation point of each cut
+        beta_out : (3, 3) or (ncut, 3, 3) float ndarray
+            the transformation matrix of the output frame of all the
+            cuts or of each cut
+        consider_rxf : bool; default=True
+            considers the r x F term
+
+        """
+        self.nids = np.asarray(nids)
+        self.eids = np.asarray(eids)
+        self.nid_cd = nid_cd
+        self.xyz_cid0 = xyz_cid0
+        self.coords = coords
+        self.summation_points = np.asarray(summation_points, dtype='float64')
+        self.beta_out = np.asarray(beta_out, dtype='float64')
+        self.consider_rxf = consider_rxf
+        self.layouts: list[_PlanLayout] = []
+
+        self._inid_sort = np.argsort(nid_cd[:, 0])
+        self._nid_cd_sorted = nid_cd[self._inid_sort, 0]
+
+    @property
+    def ncut(self) -> int:
+        return self.summation_points.shape[0]
+
+    @abstractmethod
+    def _get_selection(self, row_nids: np.ndarray, row_eids: np.ndarray,
+                       inode: np.ndarray, ielem: np.ndarray) -> csr_matrix:
+        """
+        Gets the (ncut, nrow) selection of the filtered rows
+
+        Parameters
+        ----------
+        row_nids / row_eids : (nrow, ) int ndarray
+            the node/element of the filtered rows
+        inode / ielem : (nrow, ) int ndarray
+            the index into nids/eids of the filtered rows
+
+        """
+
+    def get_layout(self, node_element: np.ndarray) -> _PlanLayout:
+        """
+        Gets the precomputed rows of a GPFORCE layout (and builds it
+        the first time)
+
+        Parameters
+        ----------
+        node_element : (nrow_all, 2) int ndarray
+            the (node_id, element_id) of the GPFORCE rows of a time
+
+        """
+        for layout in self.layouts:
+            if np.array_equal(layout.node_element, node_element):
+                return layout
+
+        nids = self.nids
+        eids = self.eids
+        nid_cd = self.nid_cd
+        gpforce_nids = node_element[:, 0]
+        gpforce_eids = node_element[:, 1]
+
+        # filter out the rows that aren't in the node/element sets
+        inode = np.searchsorted(nids, gpforce_nids).clip(max=max(len(nids) - 1, 0))
+        ielem = np.searchsorted(eids, gpforce_eids).clip(max=max(len(eids) - 1, 0))
+        jnode = self._inid_sort[
+            np.searchsorted(self._nid_cd_sorted, gpforce_nids).clip(max=len(nid_cd) - 1)]
+        if len(nids) and len(eids):
+            irow = np.flatnonzero((nids[inode] == gpforce_nids) &
+                                  (eids[ielem] == gpforce_eids) &
+                                  (nid_cd[jnode, 0] == gpforce_nids))
+        else:
+            irow = np.zeros(0, dtype='int32')
+        inode = inode[irow]
+        ielem = ielem[irow]
+        jnode = jnode[irow]
+
+        selection = self._get_selection(
+            gpforce_nids[irow], gpforce_eids[irow], inode, ielem)
+        cd_groups = get_cd_groups(nid_cd[jnode, 1], self.coords)
+        layout = _PlanLayout(node_element.copy(), irow, selection, cd_groups,
+                             self.xyz_cid0[jnode, :])
+        self.layouts.append(layout)
+        return layout
+
+    def apply(self, data: np.ndarray, node_element: np.ndarray,
+              itimes: Optional[np.ndarray]=None,
+              max_nbytes: int=256 * 1024 ** 2) -> np.ndarray:
+        """
+        Sums the GPFORCE rows of every cut for every time
+
+        Parameters
+        ----------
+        data : (ntime_all, nrow_all, 6) float ndarray
+            the GPFORCE data (e.g., RealGridPointForcesArray.data)
+        node_element : (ntime_all, nrow_all, 2) int ndarray
+            the GPFORCE (node_id, element_id) layout
+        itimes : (ntime, ) int ndarray; default=None -> all
+            the times to sum
+        max_nbytes : int; default=256 MB
+            the approximate size of the temporary arrays; the times are
+            summed in chunks of this size
+
+        Returns
+        -------
+        loads : (ntime, ncut, 6) float64 ndarray
+            the [Fx, Fy, Fz, Mx, My, Mz] about the summation point of
+            each cut in the output frame; cuts without rows are nan
+
+        """
+        if itimes is None:
+            itimes = np.arange(data.shape[0])
+        itimes = np.asarray(itimes)
+        ntime = len(itimes)
+        loads = np.full((ntime, self.ncut, 6), np.nan)
+
+        # the GPFORCE rows are usually the same for all the times,
+        # so they're grouped by layout
+        jtimes_by_layout: dict[int, list[int]] = {}
+        for jtime, itime in enumerate(itimes):
+            layout = self.get_layout(node_element[itime])
+            jtimes_by_layout.setdefault(id(layout), []).append(jtime)
+
+        layouts = {id(layout): layout for layout in self.layouts}
+        for layout_id, jtimes in jtimes_by_layout.items():
+            layout = layouts[layout_id]
+            nrow = len(layout.irow)
+            if nrow == 0:
+                continue
+            # ~4 (ntime, nrow, 6) float64 temporary arrays
+            nchunk = max(1, max_nbytes // (4 * 6 * 8 * nrow))
+            jtimes = np.array(jtimes)
+            for i0 in range(0, len(jtimes), nchunk):
+                jtimes_chunk = jtimes[i0:i0 + nchunk]
+                datai = data[itimes[jtimes_chunk], :, :][:, layout.irow, :]
+                force_global, moment_global = _rotate_rows(datai, layout.cd_groups)
+                force_sum, moment_sum = sum_station_loads(
+                    layout.selection, force_global, moment_global,
+                    layout.xyz_rows, self.summation_points, self.beta_out,
+                    consider_rxf=self.consider_rxf)
+                loads[jtimes_chunk, :, :3] = force_sum
+                loads[jtimes_chunk, :, 3:] = moment_sum
+        return loads
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(ncut={self.ncut}, nnode={len(self.nids)}, '
+                f'nelement={len(self.eids)}, nlayout={len(self.layouts)})')
+
+
+class StationLoadPlan(InterfaceLoadPlan):
+    """
+    An InterfaceLoadPlan for the stations of a shear-moment-torque
+    diagram, which keep the elements behind the station and the nodes in
+    front of it (see ``get_station_selection``).
+    """
+    def __init__(self, nids: np.ndarray, eids: np.ndarray,
+                 nid_cd: np.ndarray, xyz_cid0: np.ndarray,
+                 coords: dict[int, CORD],
+                 x_node: np.ndarray, x_element: np.ndarray,
+                 station_x: np.ndarray, nodes_tol: float,
+                 summation_points: np.ndarray,
+                 beta_out: np.ndarray,
+                 consider_rxf: bool=True):
+        """
+        Parameters
+        ----------
+        x_node : (nnode, ) float ndarray
+            the location of nids in the march direction
+        x_element : (nelement, ) float ndarray
+            the location of the centroids of eids in the march direction
+        station_x : (nstation, ) float ndarray
+            the location of each station in the march direction
+        nodes_tol : float
+            the tolerance behind the station to pull nodes from
+
+        See ``InterfaceLoadPlan`` for the other parameters
+
+        """
+        super().__init__(nids, eids, nid_cd, xyz_cid0, coords,
+                         summation_points, beta_out, consider_rxf=consider_rxf)
+        self.x_node = x_node
+        self.x_element = x_element
+        self.station_x = station_x
+        self.nodes_tol = nodes_tol
+
+    def _get_selection(self, row_nids: np.ndarray, row_eids: np.ndarray,
+                       inode: np.ndarray, ielem: np.ndarray) -> csr_matrix:
+        return get_station_selection(
+            self.x_element[ielem], self.x_node[inode], self.station_x, self.nodes_tol)
+
+
+class CutLoadPlan(InterfaceLoadPlan):
+    """
+    An InterfaceLoadPlan for arbitrary cuts, where each cut is a set of
+    nodes and elements (see ``RealGridPointForcesArray.extract_interface_loads``)
+    """
+    def __init__(self, cut_nids: list[np.ndarray], cut_eids: list[np.ndarray],
+                 nid_cd: np.ndarray, xyz_cid0: np.ndarray,
+                 coords: dict[int, CORD],
+                 summation_points: np.ndarray,
+                 beta_out: np.ndarray,
+                 consider_rxf: bool=True):
+        """
+        Parameters
+        ----------
+        cut_nids / cut_eids : list[(nnodei, ) int ndarray]
+            the nodes/elements of each cut
+
+        See ``InterfaceLoadPlan`` for the other parameters
+
+        """
+        assert len(cut_nids) == len(cut_eids), (len(cut_nids), len(cut_eids))
+        self.cut_nids = [np.unique(nids) for nids in cut_nids]
+        self.cut_eids = [np.unique(eids) for eids in cut_eids]
+        nids = np.unique(np.hstack(self.cut_nids)) if len(cut_nids) else np.zeros(0, dtype='int32')
+        eids = np.unique(np.hstack(self.cut_eids)) if len(cut_eids) else np.zeros(0, dtype='int32')
+        super().__init__(nids, eids, nid_cd, xyz_cid0, coords,
+                         summation_points, beta_out, consider_rxf=consider_rxf)
+        assert self.ncut == len(cut_nids), (self.ncut, len(cut_nids))
+
+    def _get_selection(self, row_nids: np.ndarray, row_eids: np.ndarray,
+                       inode: np.ndarray, ielem: np.ndarray) -> csr_matrix:
+        nrow = len(row_nids)
+        icuts = []
+        irows = []
+        for icut, (nids, eids) in enumerate(zip(self.cut_nids, self.cut_eids)):
+            irow = np.flatnonzero(np.isin(row_nids, nids) & np.isin(row_eids, eids))
+            icuts.append(np.full(len(irow), icut))
+            irows.append(irow)
+        icut = np.hstack(icuts) if icuts else np.zeros(0, dtype='int32')
+        irow = np.hstack(irows) if irows else np.zeros(0, dtype='int32')
+        selection = csr_matrix(
+            (np.ones(len(irow)), (icut, irow)), shape=(self.ncut, nrow))
+        return selection
@@ -14,6 +14,8 @@ from pyNastran.op2.result_objects.op2_objects import BaseElement, get_times_dtyp
 from pyNastran.f06.f06_formatting import (
     write_floats_13e, write_floats_13e_long,
     _eigenvalue_header, write_imag_floats_13e)
+from pyNastran.op2.tables.ogf_gridPointForces.interface_loads import (
+    StationLoadPlan, CutLoadPlan)
 from pyNastran.op2.vector_utils import (
     transform_force_moment, transform_force_moment_sum, sortedsum1d)
 from pyNastran.utils.numpy_utils import integer_types, float_types
@@ -683,6 +685,50 @@ class RealGridPointForcesArray(GridPointForces):
             debug=debug, log=log, idtype=idtype)
         return force_out_sum, moment_out_sum
 
+    def get_interface_load_plan(self,
+                                cut_nids: list[NDArrayNint],
+                                cut_eids: list[NDArrayNint],
+                                coord_out: CORD,
+                                coords: dict[int, CORD],
+                                nid_cd: NDArrayN2int,
+                                xyz_cid0: NDArrayN3float,
+                                summation_points: Optional[NDArrayN3float]=None,
+                                consider_rxf: bool=True) -> CutLoadPlan:
+        """
+        Builds the interface loads of many cuts, which may be applied to
+        all the times (or other subcases of the model) at once:
+
+        >>> plan = gpforce.get_interface_load_plan(cut_nids, cut_eids, ...)
+        >>> loads = plan.apply(gpforce.data, gpforce.node_element)
+        >>> force_out_sum = loads[:, :, :3]  # (ntimes, ncuts, 3)
+
+        Parameters
+        ----------
+        cut_nids / cut_eids : list[(Nnodes, ) int ndarray]
+            the nodes/elements of each cut
+        summation_points : (ncuts, 3) float ndarray; default=None -> 0
+            the summation point of each cut in the global frame
+
+        See ``extract_interface_loads`` for the other parameters
+
+        Returns
+        -------
+        plan : CutLoadPlan
+            the precomputed cuts
+
+        """
+        _check_array(nid_cd, 'int', 2)
+        _check_array(xyz_cid0, 'float', 2)
+        nid_cd = _get_nid_cd_from_nid_cp_cd(nid_cd)
+        ncut = len(cut_nids)
+        if summation_points is None:
+            summation_points = np.zeros((ncut, 3))
+        summation_points = np.asarray(summation_points).reshape(ncut, 3)
+        plan = CutLoadPlan(cut_nids, cut_eids, nid_cd, xyz_cid0, coords,
+                           summation_points, coord_out.beta(),
+                           consider_rxf=consider_rxf)
+        return plan
+
     def _extract_interface_loads(self,
                                 nids: NDArrayNint,
                                 eids: NDArrayNint,
@@ -894,7 +940,7 @@ class RealGridPointForcesArray(GridPointForces):
                              coords: dict[int, CORD],
                              coord_out: CORD,
                              iaxis_march: Optional[NDArray3float]=None,
-                             itime: int=0,
+                             itime: Optional[int]=0,
                              icoord: int=None,
                              idir: int=0,
                              nodes_tol: Optional[float]=None,
@@ -945,11 +991,15 @@ class RealGridPointForcesArray(GridPointForces):
             and placed in new_coords; useful for debugging
         nodes_tol : float; default=None -> dstation
             the tolerance bending the plane to pull nodes from
+        itime : int; default=0
+            the time to extract loads for
+            None : all the times
 
         Returns
         -------
         force_sum / moment_sum : (nstations, 3) float ndarray
             the forces/moments at the station
+            (ntimes, nstations, 3) : itime=None
         new_coords: dict[int, CORD2R]
             the station march coords starting from icoord
         nelems, nnodes: (nstations,) int ndarray
@@ -964,6 +1014,9 @@ class RealGridPointForcesArray(GridPointForces):
         3.  Extract the interface loads and sum them about the
             summation point.
 
+        The stations/times are summed at once with a ``StationLoadPlan``
+        (see ``get_shear_moment_plan`` and ``_shear_moment_diagram_itimes``).
+
         Examples
         --------
         Imagine a swept aircraft wing.  Define a coordinate system
@@ -974,6 +1027,99 @@ class RealGridPointForcesArray(GridPointForces):
 
         .. todo:: Not Tested...Does 3b work?  Can 3a give the right answer?
 
+        """
+        fdtype = xyz_cid0.dtype
+        plan, new_coords, nelems, nnodes = self.get_shear_moment_plan(
+            nids, xyz_cid0, nid_cd, icd_transform,
+            eids, element_centroids_cid0, stations, coords, coord_out,
+            iaxis_march=iaxis_march, icoord=icoord, idir=idir,
+            nodes_tol=nodes_tol)
+
+        itimes = np.arange(self.ntimes) if itime is None else [itime]
+        force_sum, moment_sum = self._shear_moment_diagram_itimes(itimes, plan)
+        force_sum = force_sum.astype(fdtype)
+        moment_sum = moment_sum.astype(fdtype)
+
+        # stations without any elements/nodes are nan
+        is_empty = (nelems == 0) | (nnodes == 0)
+        force_sum[:, is_empty, :] = np.nan
+        moment_sum[:, is_empty, :] = np.nan
+        if stop_on_nan and not np.all(np.isfinite(force_sum[:, ~is_empty, 0])):
+            istation = np.flatnonzero(~np.isfinite(force_sum[:, :, 0]).all(axis=0) & ~is_empty)
+            raise RuntimeError(f'stations={stations[istation]} are nan')
+        if debug and log is not None:
+            log.debug(f'nelems={nelems}\nnnodes={nnodes}')
+
+        if itime is not None:
+            force_sum = force_sum[0]
+            moment_sum = moment_sum[0]
+        return force_sum, moment_sum, new_coords, nelems, nnodes
+
+    def _shear_moment_diagram_itimes(self, itimes: list[int],
+                                     plan: StationLoadPlan) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sums the GPFORCE rows of all the stations for the times in a
+        few sparse matrix products (see ``interface_loads.py``).
+
+        The GPFORCE rows are usually the same for all the times, so the
+        row filtering and station selection of each (node, element)
+        layout is built once by the plan and reused for the other times
+        (and by later calls with the same plan).
+
+        Parameters
+        ----------
+        itimes : (ntime, ) int list/ndarray
+            the times to sum
+        plan : StationLoadPlan
+            the precomputed stations (see ``get_shear_moment_plan``)
+
+        Returns
+        -------
+        force_sum / moment_sum : (ntime, nstations, 3) float ndarray
+            the forces/moments at the stations
+
+        """
+        loads = plan.apply(self.data, self.node_element, itimes=itimes)
+        force_sum = loads[:, :, :3]
+        moment_sum = loads[:, :, 3:]
+        return force_sum, moment_sum
+
+    def get_shear_moment_plan(self,
+                              nids: np.ndarray,
+                              xyz_cid0: np.ndarray,
+                              nid_cd: NDArrayN2int,
+                              icd_transform: dict[int, NDArrayNint],
+                              eids: np.ndarray,
+                              element_centroids_cid0: NDArrayN3float,
+                              stations: NDArrayNfloat,
+                              coords: dict[int, CORD],
+                              coord_out: CORD,
+                              iaxis_march: Optional[NDArray3float]=None,
+                              icoord: int=None,
+                              idir: int=0,
+                              nodes_tol: Optional[float]=None) -> tuple[StationLoadPlan,
+                                                                        dict[int, CORD],
+                                                                        NDArrayNint, NDArrayNint]:
+        """
+        Builds the station summation of ``shear_moment_diagram``, which
+        may be applied to all the times (or other subcases of the model)
+        at once:
+
+        >>> plan, new_coords, nelems, nnodes = gpforce.get_shear_moment_plan(...)
+        >>> loads = plan.apply(gpforce.data, gpforce.node_element)
+        >>> force_sum = loads[:, :, :3]  # (ntimes, nstations, 3)
+
+        See ``shear_moment_diagram`` for the parameters
+
+        Returns
+        -------
+        plan : StationLoadPlan
+            the precomputed stations
+        new_coords: dict[int, CORD2R]
+            the station march coords starting from icoord
+        nelems, nnodes: (nstations,) int ndarray
+            the number of elements/nodes included in the summation
+
         """
         _check_array(nids, 'int', 1)
         _check_array(nid_cd, 'int', 2)
@@ -991,7 +1137,6 @@ class RealGridPointForcesArray(GridPointForces):
 
         nid_cd = _get_nid_cd_from_nid_cp_cd(nid_cd)
         idtype = nid_cd.dtype
-        fdtype = xyz_cid0.dtype
 
         if iaxis_march is None:
             iaxis_march = deepcopy(coord_out.i)
@@ -1001,7 +1146,6 @@ class RealGridPointForcesArray(GridPointForces):
         assert len(eids.shape) == 1, eids.shape
         assert len(nids.shape) == 1, nids.shape
         assert len(stations.shape) == 1, stations.shape
-        nstations = len(stations)
         assert coord_out.type in ['CORD2R', 'CORD1R'], coord_out.type
         #assert coord_march.type in ['CORD2R', 'CORD1R'], coord_march.type
         #i_axis_march = deepcopy(coord_march.i)
@@ -1021,13 +1165,6 @@ class RealGridPointForcesArray(GridPointForces):
         x_coord = xyz_coord[:, idir]
 
         eids = np.unique(eids)
-        force_sum = np.full((nstations, 3), np.nan, dtype=fdtype)
-        moment_sum = np.full((nstations, 3), np.nan, dtype=fdtype)
-
-        offset = np.zeros(3, dtype=fdtype)
-        new_coords = {}
-        nelems_list = []
-        nnodes_list = []
 
         # calculate the value of dstation_x for the 1st station
         doffset = (stations[1] - stations[0]) * iaxis_march
@@ -1038,92 +1175,35 @@ class RealGridPointForcesArray(GridPointForces):
             nodes_tol = dstation
         #assert nodes_tol >= 0., nodes_tol
 
-        for istation, station in enumerate(stations):
-            # summation point creation
-            # in the global coordinate system
-            offset = station * iaxis_march
-
-            summation_point = coord_out.origin + offset  # in basic frame
-            summation_point_coord = coord_out.transform_node_to_local(summation_point)
-            station_x = summation_point_coord[idir]
-            # we're picking the elements on one side of the centroid
-            # and nodes on the other side
-
-            # Calculate the nodes on the boundary.
-            #
-            # If we make a cutting plane and find all the nodes on
-            # one side of the cutting plane, we can take all the
-            # nodes within some tolerance of the station direction and
-            # find the free nodes
-            #
-            ielem = np.where(x_elem_centroid <= station_x)[0]
-            nelem = len(ielem)
-            nelems_list.append(nelem)
-
-            # We want to do this similarly for the elements.  Ideally,
-            # we want a single line of elements (and not include extra)
-            # to reduce the size of the array sooner.
-            #
-            # We'll include a few extra nodes (with dstation) to include
-            # all the nodes for the boundary elements.  The extra nodes
-            # will have +forces and -forces, so they'll cancel.  The alternative
-            # is that we miss some the boundary nodes and get no force/moment.
-            #
-            jnode = np.where(x_coord >= (station_x-nodes_tol))[0]
-            nnode = len(jnode)
-            nnodes_list.append(nnode)
+        # summation point creation in the global coordinate system
+        offsets = stations[:, np.newaxis] * iaxis_march[np.newaxis, :]
+        summation_points = coord_out.origin + offsets  # in basic frame
+        station_x = coord_out.transform_node_to_local_array(summation_points)[:, idir]
 
+        new_coords = {}
+        for offset, summation_point in zip(offsets, summation_points):
             coord_save = deepcopy(coord_out)
             coord_save.cid = icoord
             coord_save.translate(offset)
-
             assert np.allclose(coord_save.e1, summation_point)
-            new_coords[icoord] = deepcopy(coord_save)
-            #station_x_old = station_x
-
-            # we'd break if we knew the user was traveling in the
-            # "correct" direction, but we don't
+            new_coords[icoord] = coord_save
             icoord += 1
-            if nelem == 0:
-                continue
-            if nnode == 0:
-                continue
-
-            eidsi = eids[ielem]
-            nidsj = nids[jnode]
-            assert len(eidsi) == len(np.unique(eidsi))
-            assert len(nidsj) == len(np.unique(nidsj))
-            if 0: # pragma: no cover
-                # I don't think this will work...
-                forcei, momenti = self.extract_freebody_loads(
-                    eidsi,
-                    coord_out, coords, nid_cd, icd_transform,
-                    # xyz_cid0, summation_point,
-                    itime=itime, debug=debug, log=log)
-
-                force_sum[istation, :] = forcei.sum(axis=0)
-                # TODO: extract_freebody_loads doesn't sum forces/moments
-                #       sum loads about summation point
-                moment_sum[istation, :] = momenti.sum(axis=0)
-            else:
-                #print(f'eids={eidsi}; nids={nidsj}')
-                force_sumi, moment_sumi = self.extract_interface_loads(
-                    nidsj, eidsi,
-                    coord_out, coords, nid_cd, icd_transform,
-                    xyz_cid0, summation_point, assume_sorted=True,
-                    itime=itime, stop_on_nan=stop_on_nan,
-                    debug=debug, log=log)
-                #log.info(f'neids={len(ielem):d} nnodes={len(jnode):d} station={station:g}; '
-                         #f'force={force_sumi} moment={moment_sumi}')
-                if not np.isfinite(force_sumi[0]):
-                    if stop_on_nan:
-                        raise RuntimeError(f'station={station} is nan; force_sum={force_sumi}')
-                    continue
-                force_sum[istation, :] = force_sumi
-                moment_sum[istation, :] = moment_sumi
-        nelems = np.array(nelems_list, dtype=idtype)
-        nnodes = np.array(nnodes_list, dtype=idtype)
-        return force_sum, moment_sum, new_coords, nelems, nnodes
+
+        # We're picking the elements on one side of the station (by
+        # centroid) and the nodes on the other side.  We'll include a few
+        # extra nodes (with nodes_tol) to include all the nodes of the
+        # boundary elements.  The extra nodes will have +forces and
+        # -forces, so they'll cancel.  The alternative is that we miss
+        # some the boundary nodes and get no force/moment.
+        nelems = np.searchsorted(np.sort(x_elem_centroid), station_x, side='right').astype(idtype)
+        nnodes = (len(x_coord) - np.searchsorted(
+            np.sort(x_coord), station_x - nodes_tol, side='left')).astype(idtype)
+
+        plan = StationLoadPlan(
+            nids, eids, nid_cd, xyz_cid0, coords,
+            x_coord, x_elem_centroid, station_x, nodes_tol,
+            summation_points, coord_out.beta())
+        return plan, new_coords, nelems, nnodes
 
     def add_sort1(self, dt, node_id, eid, ename, t1, t2, t3, r1, r2, r3):
         """unvectorized method for adding SORT1 transient data"""
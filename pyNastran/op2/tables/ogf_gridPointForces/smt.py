@@ -16,7 +16,7 @@ defines:
 """
 from __future__ import annotations
 import numpy as np
-from typing import cast, TYPE_CHECKING
+from typing import cast, Optional, TYPE_CHECKING
 
 try:
     import matplotlib.pyplot as plt
@@ -45,6 +45,7 @@ def create_shear_moment_torque(model: BDF,
                                station_location: str='End-Origin',
                                cid_p1: int=0, cid_p2: int=0, cid_p3: int=0, cid_zaxis: int=0,
                                nplanes: int=20,
+                               itime: Optional[int]=0,
                                element_ids: Optional[np.ndarray]=None,
                                root_filename=None,
                                csv_filename=None,
@@ -91,15 +92,19 @@ def create_shear_moment_torque(model: BDF,
          'Z-Axis Projection':
            zaxis:  point on the z-axis
            p2:     p2 is a point on the xz-plane
+    itime : int; default=0
+        the time to extract loads for
+        None : all the times, which are summed at once
     element_ids : (n,) int array; default=None -> []
         element_ids to include
     show: bool; default=True
-        shows the plots
+        shows the plots (not for itime=None)
 
     Returns
     -------
     force_sum / moment_sum : (nstations, 3) float ndarray
         the forces/moments at the station
+        (ntimes, nstations, 3) : itime=None
 
     Example
     -------
@@ -176,7 +181,7 @@ def create_shear_moment_torque(model: BDF,
         eids, element_centroids_cid0,
         stations, model.coords, coord,
         iaxis_march=iaxis_march,
-        itime=0, idir=0,
+        itime=itime, idir=0,
         nodes_tol=None, debug=False, log=log)
 
     force_sum *= force_scale
@@ -195,7 +200,7 @@ def create_shear_moment_torque(model: BDF,
             length_unit=length_unit,
             force_unit=force_unit,
             moment_unit=moment_unit)
-    if IS_MATPLOTLIB:
+    if IS_MATPLOTLIB and itime is not None:
         plot_smt(
             xyz_stations,
             force_sum, moment_sum,
@@ -478,7 +483,20 @@ def write_smt_to_csv(csv_filename: str,
                      length_unit: str='',
                      force_unit: str='',
                      moment_unit: str='') -> None:
-    """writes the shear, moment, torque data"""
+    """
+    writes the shear, moment, torque data
+
+    force_sum / moment_sum : (nstations, 3) float ndarray
+        the forces/moments at the station
+        (ntimes, nstations, 3) : all the times, which adds an itime column
+    """
+    if force_sum.ndim == 3:
+        _write_smt_to_csv_times(
+            csv_filename, stations, nelems, nnodes, cids, origins,
+            force_sum, moment_sum,
+            length_unit=length_unit, force_unit=force_unit,
+            moment_unit=moment_unit)
+        return
     length_label = f'({length_unit})' if length_unit else ''
     force_label = f'({force_unit})' if force_unit else ''
     moment_label = f'({moment_unit})' if moment_unit else ''
@@ -496,3 +514,35 @@ def write_smt_to_csv(csv_filename: str,
                 f'{origin[0]},{origin[1]},{origin[2]},'
                 f'{force_sumi[0]},{force_sumi[1]},{force_sumi[2]},'
                 f'{moment_sumi[0]},{moment_sumi[1]},{moment_sumi[2]}\n')
+
+
+def _write_smt_to_csv_times(csv_filename: str,
+                            stations: np.ndarray,
+                            nelems: np.ndarray, nnodes: np.ndarray,
+                            cids: list[int],
+                            origins: np.ndarray,
+                            force_sum: np.ndarray,
+                            moment_sum: np.ndarray,
+                            length_unit: str='',
+                            force_unit: str='',
+                            moment_unit: str='') -> None:
+    """writes the shear, moment, torque data for all the times"""
+    length_label = f'({length_unit})' if length_unit else ''
+    force_label = f'({force_unit})' if force_unit else ''
+    moment_label = f'({moment_unit})' if moment_unit else ''
+    ntimes, nstations = force_sum.shape[:2]
+    with open(csv_filename, 'w') as csv_file:
+        header = (
+            f'itime,Station{length_label},nelements,nnodes,'
+            f'coord_id,origin_x{length_label},origin_y{length_label},origin_z{length_label},'
+            f'Fx{force_label},Fy{force_label},Fz{force_label},'
+            f'Mx{moment_label},My{moment_label},Mz{moment_label}\n')
+        csv_file.write(header)
+        for itime in range(ntimes):
+            for station, nelem, nnode, coord_id, origin, force_sumi, moment_sumi in zip(
+                stations, nelems, nnodes, cids, origins, force_sum[itime], moment_sum[itime]):
+                csv_file.write(
+                    f'{itime:d},{station},{nelem:d},{nnode:d},{coord_id:d},'
+                    f'{origin[0]},{origin[1]},{origin[2]},'
+                    f'{force_sumi[0]},{force_sumi[1]},{force_sumi[2]},'
+                    f'{moment_sumi[0]},{moment_sumi[1]},{moment_sumi[2]}\n')
@@ -12,8 +12,10 @@ from pyNastran.bdf.bdf import BDF, CORD2R, read_bdf
 from pyNastran.op2.op2 import OP2, read_op2
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
 
-from pyNastran.op2.tables.ogf_gridPointForces.smt import smt_setup, plot_smt, create_shear_moment_torque
+from pyNastran.op2.tables.ogf_gridPointForces.smt import (
+    smt_setup, setup_coord_from_plane, plot_smt, create_shear_moment_torque)
 from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
+from pyNastran.op2.tables.ogf_gridPointForces.interface_loads import InterfaceLoadPlan
 
 from pyNastran.bdf.mesh_utils.cut_model_by_plane import (
     get_element_centroids, _p1_p2_zaxis_to_cord2r,
@@ -144,6 +146,95 @@ class TestGridPointForcesSMT(unittest.TestCase):
             element_ids=spar1_element_ids,
             show=True)
 
+    def test_wingbox_all_times(self):
+        """sums the stations for all the times at once"""
+        dirname = MODEL_PATH / 'wingbox'
+        bdf_filename = dirname / 'wingbox_stitched_together-000.bdf'
+        op2_filename = dirname / 'wingbox_stitched_together-000.op2'
+        log = SimpleLogger(level='warning')
+        bdf_model = read_bdf(bdf_filename, log=log)
+        op2_model = read_op2(op2_filename, include_results='grid_point_forces', log=log)
+        gpforce = op2_model.grid_point_forces[1]
+
+        nids, nid_cd, xyz_cid0, icd_transform, eids, element_centroids_cid0 = smt_setup(bdf_model)
+        p1 = np.array([110.95, 0.0, 22.8])
+        p3 = np.array([110.95, 96., 22.8])
+        p2 = np.array([0., 1., 0.])
+        zaxis = np.array([0., 0., 1.])
+        xyz1, xyz2, xyz3, i, k, coord_out, iaxis_march, dim_max, stations = setup_coord_from_plane(
+            bdf_model, xyz_cid0, p1, p2, p3, zaxis, method='vector',
+            cid_p1=0, cid_p2=0, cid_p3=0, cid_zaxis=0, nplanes=20)
+
+        force_sum, moment_sum, new_coords, nelems, nnodes = gpforce.shear_moment_diagram(
+            nids, xyz_cid0, nid_cd, icd_transform,
+            eids, element_centroids_cid0,
+            stations, bdf_model.coords, coord_out,
+            iaxis_march=iaxis_march, itime=0, nodes_tol=2.0, log=log)
+        assert force_sum.shape == (20, 3), force_sum.shape
+        assert len(new_coords) == 20
+
+        # fake a second load case that's twice the first one
+        gpforce.data = np.vstack([gpforce.data, 2 * gpforce.data])
+        gpforce.node_element = np.vstack([gpforce.node_element, gpforce.node_element])
+        gpforce.ntimes = 2
+        force_sum2, moment_sum2, new_coords, nelems2, nnodes2 = gpforce.shear_moment_diagram(
+            nids, xyz_cid0, nid_cd, icd_transform,
+            eids, element_centroids_cid0,
+            stations, bdf_model.coords, coord_out,
+            iaxis_march=iaxis_march, itime=None, nodes_tol=2.0, log=log)
+        assert force_sum2.shape == (2, 20, 3), force_sum2.shape
+        assert np.allclose(force_sum2[0], force_sum, equal_nan=True)
+        assert np.allclose(moment_sum2[1], 2 * moment_sum, equal_nan=True)
+        assert np.array_equal(nelems2, nelems)
+        assert np.array_equal(nnodes2, nnodes)
+
+        # the plan is built once and reused for all the times
+        plan, new_coords, nelems3, nnodes3 = gpforce.get_shear_moment_plan(
+            nids, xyz_cid0, nid_cd, icd_transform,
+            eids, element_centroids_cid0,
+            stations, bdf_model.coords, coord_out,
+            iaxis_march=iaxis_march, nodes_tol=2.0)
+        loads = plan.apply(gpforce.data, gpforce.node_element)
+        assert loads.shape == (2, 20, 6), loads.shape
+        assert len(plan.layouts) == 1, plan
+        assert np.allclose(loads[1, :, :3], force_sum2[1], equal_nan=True)
+        assert np.allclose(loads[0, :, 3:], moment_sum2[0], equal_nan=True)
+        loads2 = plan.apply(gpforce.data, gpforce.node_element, itimes=[1, 0], max_nbytes=1)
+        assert np.allclose(loads2[::-1], loads, equal_nan=True)
+        force_sum3, moment_sum3 = gpforce._shear_moment_diagram_itimes([1], plan)
+        assert np.allclose(force_sum3[0], force_sum2[1], equal_nan=True)
+        assert np.allclose(moment_sum3[0], moment_sum2[1], equal_nan=True)
+        assert len(plan.layouts) == 1, plan
+        with self.assertRaises(TypeError):
+            InterfaceLoadPlan(nids, eids, nid_cd, xyz_cid0, bdf_model.coords,
+                              np.zeros((1, 3)), np.eye(3))
+
+        forces_sum, moments_sum = create_shear_moment_torque(
+            bdf_model, gpforce, p1, p2, p3, zaxis, method='vector',
+            nplanes=20, itime=None, show=False)
+        assert forces_sum.shape == (2, 20, 3), forces_sum.shape
+
+        # arbitrary cuts match extract_interface_loads
+        y_node = xyz_cid0[:, 1]
+        y_element = element_centroids_cid0[:, 1]
+        cut_nids = [nids[y_node >= 20.], nids[y_node >= 48.], nids[y_node >= 60.]]
+        cut_eids = [eids[y_element < 22.], eids[y_element < 50.], eids]
+        summation_points = np.array([[110., 10., 20.], [0., 0., 0.], [111., 50., 22.]])
+        plan = gpforce.get_interface_load_plan(
+            cut_nids, cut_eids, coord_out, bdf_model.coords,
+            nid_cd, xyz_cid0, summation_points=summation_points)
+        loads = plan.apply(gpforce.data, gpforce.node_element)
+        assert loads.shape == (2, 3, 6), loads.shape
+        for icut, (nidsi, eidsi, summation_point) in enumerate(zip(cut_nids, cut_eids, summation_points)):
+            force_out_sum, moment_out_sum = gpforce.extract_interface_loads(
+                nidsi, eidsi, coord_out, bdf_model.coords,
+                nid_cd, icd_transform, xyz_cid0,
+                summation_point=summation_point, itime=1, log=log)
+            scale = np.abs(force_out_sum).max()
+            assert np.allclose(loads[1, icut, :3], force_out_sum, atol=1e-4 * scale)
+            scale = np.abs(moment_out_sum).max()
+            assert np.allclose(loads[1, icut, 3:], moment_out_sum, atol=1e-4 * scale)
+
     def test_cutting_plane_bwb(self):
         model = BDF(debug=False)
         model.cross_reference()
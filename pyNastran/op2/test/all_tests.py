@@ -9,8 +9,14 @@ from pyNastran.op2.test.examples.test_op2_in_material_coord_panel_SOL_108 import
 from pyNastran.op2.tables.geom.test.test_geom import TestOP2GeomUnit
 from pyNastran.op2.tables.test.test_grid_point_forces import TestGridPointForces
 from pyNastran.op2.tables.test.test_oug import TestOUG
-from pyNastran.op2.writer.test_op2_writer import TestOP2Writer
+from pyNastran.op2.writer.test_op2_writer import TestOP2Writer, TestOP2Writer64
 from pyNastran.op2.op2_interface.test.test_results_set import TestResultSet
+from pyNastran.op2.test.test_load_combination import TestLoadCombination
+from pyNastran.op2.test.test_op2_parquet import TestOP2Parquet
+from pyNastran.op2.test.test_op2_hdf5_export import TestOP2HDF5Export
+from pyNastran.op2.test.test_op2_follower import TestOP2Follower
+from pyNastran.op2.test.test_stress_invariants import TestStressInvariants
+from pyNastran.op2.test.test_random_response import TestRandomResponse
 
 
 if __name__ == "__main__":  # pragma: no cover
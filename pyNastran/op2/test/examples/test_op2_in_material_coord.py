@@ -11,7 +11,8 @@ from pyNastran.op2.test.test_op2 import IS_PANDAS
 from pyNastran.op2.data_in_material_coord import (
     data_in_material_coord,
     get_eids_from_op2_vector, force_vectors, stress_vectors,
-    strain_vectors, get_eid_to_theta_rad, get_eid_to_theta_rad2)
+    strain_vectors, get_eid_to_theta_rad, get_eid_to_theta_rad2,
+    get_shell_orientation_table)
 
 PKG_PATH = pyNastran.__path__[0]
 TEST_PATH = os.path.join(PKG_PATH, 'op2', 'test', 'examples', 'coord_transform')
@@ -65,6 +66,47 @@ class TestMaterialCoordReal(unittest.TestCase):
 
         x = 1
 
+    def test_shell_orientation_table(self):
+        """mixed quads/trias with THETA/MCID on a skewed, out of plane mesh"""
+        log = get_logger(level='error')
+        model = BDF(debug=False, log=log)
+        pid = 10
+        mid = 100
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1.2, 0.1, 0.])
+        model.add_grid(3, [1.0, 1.3, 0.2])
+        model.add_grid(4, [-0.1, 0.9, 0.1])
+        model.add_pshell(pid, mid1=mid, t=0.1)
+        model.add_mat1(mid, 3.0e7, None, 0.3)
+        model.add_cord2r(5, [0., 0., 0.], [0., 0., 1.], [1., 1., 0.])
+
+        model.add_cquad4(1, pid, [1, 2, 3, 4], theta_mcid=0.0)
+        model.add_cquad4(2, pid, [1, 2, 3, 4], theta_mcid=30.0)
+        model.add_cquad4(3, pid, [2, 3, 4, 1], theta_mcid=5)
+        model.add_ctria3(4, pid, [1, 2, 3], theta_mcid=0)
+        model.add_ctria3(5, pid, [1, 2, 3], theta_mcid=-15.0)
+        model.add_ctria3(6, pid, [3, 4, 1], theta_mcid=5)
+        model.add_conrod(7, mid, [1, 2], A=1.0)
+        model.cross_reference()
+
+        eid_to_theta_rad = get_eid_to_theta_rad(model, debug=False)
+        table = get_shell_orientation_table(model)
+        assert table is get_shell_orientation_table(model)
+        assert np.array_equal(table.eids, [1, 2, 3, 4, 5, 6])
+        for eid, theta in zip(table.eids, table.theta_rad):
+            assert np.allclose(theta, eid_to_theta_rad[eid]), eid
+        assert np.allclose(np.degrees(table.theta_rad[1] - table.theta_rad[0]), 30.)
+
+        # the CONROD and missing elements have theta=0
+        theta_rad = table.get_theta_rad([6, 7, 1, 100, 1])
+        assert np.allclose(theta_rad, table.theta_rad[[5, -1, 0, -1, 0]] * [1, 0, 1, 0, 1])
+
+        # adding an element rebuilds the table
+        model.add_ctria3(8, pid, [1, 2, 3], theta_mcid=45.0)
+        table2 = get_shell_orientation_table(model)
+        assert table2 is not table
+        assert np.allclose(table2.get_theta_rad([8]), np.radians(45.))
+
     def test_ctria6_mcid_real(self):
         log = get_logger(level='error')
         bdf = BDF(debug=False, log=log)
@@ -195,6 +237,7 @@ def _check_theta(model: BDF, eid_to_theta_deg_expected: dict[int, float]):
         theta_deg_expected = eid_to_theta_deg_expected[eid]
         theta_deg = np.degrees(theta)
         assert np.allclose(theta_deg, theta_deg_expected), f'eid={eid} theta_deg={theta_deg} expected={theta_deg_expected}'
+        assert np.allclose(eid_to_theta_rad2[eid], theta), f'eid={eid}'
     model.uncross_reference()
 
 
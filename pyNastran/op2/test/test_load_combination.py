@@ -0,0 +1,115 @@
+"""tests the load combination envelopes"""
+import copy
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.load_combination import combine_results, combine_op2_results
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+# the linear components of each result
+NLINEAR = {
+    'stress.cquad4_stress': (1, 4),
+    'strain.ctria3_strain': (1, 4),
+    'stress.chexa_stress': (0, 6),
+    'strain.ctetra_strain': (0, 6),
+    'stress.cquad4_composite_stress': (0, 5),
+    'strain.ctria3_composite_strain': (0, 5),
+}
+
+
+class TestLoadCombination(unittest.TestCase):
+    def test_combine_static_elements(self):
+        """combines the static_elements subcase with itself"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'elements' / 'static_elements.op2'
+        model = read_op2(op2_filename, log=log)
+
+        for result_name, (i0, i1) in NLINEAR.items():
+            result = model.get_result(result_name)[1]
+
+            # the derived columns are recomputed
+            envelope = combine_results([result], [[1.0]])
+            data = result.data[0].astype('float64')
+            scale = np.abs(data).max(axis=0)
+            assert np.allclose(envelope.max, data, atol=1e-5 * scale.max()), result_name
+            assert np.array_equal(envelope.max, envelope.min), result_name
+            assert np.all(envelope.max_combo_id == 1), result_name
+
+            # a fake second subcase with the components flipped and the
+            # principal/von Mises recomputed
+            result2 = copy.deepcopy(result)
+            result2.data[:, :, i0:i1] *= -0.5
+            combine = combine_results([result2], [[1.0]])
+            result2.data[0] = combine.max
+
+            factors = np.array([
+                [1.0, 0.0],
+                [0.0, 1.0],
+                [1.0, 1.0],
+                [1.5, -2.0],
+                [-1.0, 0.5],
+            ])
+            combo_ids = np.array([101, 102, 103, 104, 105])
+            envelope = combine_results([result, result2], factors, combo_ids=combo_ids)
+            envelope_chunked = combine_results([result, result2], factors, combo_ids=combo_ids,
+                                               max_nbytes=1)
+            assert np.array_equal(envelope.max, envelope_chunked.max, equal_nan=True)
+            assert np.array_equal(envelope.min_combo_id, envelope_chunked.min_combo_id)
+
+            # brute force
+            combos = []
+            for factor1, factor2 in factors:
+                combo = combine_results([result, result2], [[factor1, factor2]])
+                combos.append(combo.max)
+            combos = np.array(combos)
+            assert np.allclose(envelope.max, combos.max(axis=0)), result_name
+            assert np.allclose(envelope.min, combos.min(axis=0)), result_name
+            imax = combo_ids[combos.argmax(axis=0)]
+            is_unique = (combos == combos.max(axis=0)).sum(axis=0) == 1
+            assert np.array_equal(envelope.max_combo_id[is_unique], imax[is_unique]), result_name
+
+            # the linear components are the factored sums
+            combo = 1.5 * result.data[0, :, i0:i1] - 2.0 * result2.data[0, :, i0:i1]
+            assert np.allclose(combos[3][:, i0:i1], combo, atol=1e-5 * scale.max()), result_name
+
+            max_result = envelope.get_envelope_result('max')
+            assert max_result.data.shape == result.data.shape
+            assert max_result.data.dtype == result.data.dtype
+
+    def test_combine_op2_results(self):
+        """combines all the results of an OP2"""
+        log = SimpleLogger(level='error')
+        op2_filename = MODEL_PATH / 'elements' / 'static_elements.op2'
+        model = read_op2(op2_filename, log=log)
+        factors = np.array([[2.0, 0.0], [-1.0, 0.0], [0.5, 0.5]])
+        envelopes = combine_op2_results(model, [1, 1], factors, log=log)
+        assert 'strain_energy.cquad4_strain_energy' not in envelopes
+
+        disp = model.displacements[1].data[0]
+        envelope = envelopes['displacements']
+        assert np.allclose(envelope.max, np.maximum(2 * disp, -disp))
+        assert np.allclose(envelope.min, np.minimum(2 * disp, -disp))
+        is_positive = disp > 0
+        assert np.all(envelope.max_combo_id[is_positive] == 1)
+        assert np.all(envelope.min_combo_id[is_positive] == 2)
+
+        # margins aren't enveloped
+        envelope = envelopes['stress.crod_stress']
+        assert np.all(np.isnan(envelope.max[:, [1, 3]]))
+        assert np.all(envelope.max_combo_id[:, [1, 3]] == 0)
+
+        gpforce = model.grid_point_forces[1].data[0]
+        envelope = envelopes['grid_point_forces']
+        assert np.allclose(envelope.max, np.maximum(2 * gpforce, -gpforce))
+        assert envelope.get_envelope_result('min').node_element.shape[0] == 1
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,102 @@
+"""tests following an OP2 that is being written"""
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.op2_follower import OP2Follower
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+RESULT_NAMES = ['displacements', 'stress.cquad4_stress', 'stress.chexa_stress',
+                'force.cbar_force', 'strain.cbeam_strain']
+
+
+class TestOP2Follower(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.log = SimpleLogger(level='error')
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def _write_in_chunks(self, op2_filename: str, nchunks: int) -> tuple[OP2Follower, list]:
+        """copies an OP2 in chunks and polls after each chunk"""
+        with open(op2_filename, 'rb') as op2_file:
+            data = op2_file.read()
+        op2_filename2 = os.path.join(self.dirname, 'run.op2')
+        follower = OP2Follower(op2_filename2, combine=False, log=self.log)
+        assert follower.poll() is None
+
+        models = []
+        n0 = 0
+        with open(op2_filename2, 'wb') as op2_file:
+            for n1 in np.linspace(0, len(data), nchunks + 1).astype('int64')[1:]:
+                op2_file.write(data[n0:n1])
+                op2_file.flush()
+                n0 = n1
+                model = follower.poll()
+                if model is not None:
+                    models.append(model)
+        return follower, models
+
+    def _check_results(self, op2_filename: str, models: list) -> None:
+        """the updates stack up to the full results"""
+        model = read_op2(op2_filename, combine=False, log=self.log)
+        for result_name in RESULT_NAMES:
+            for key, result in model.get_result(result_name).items():
+                results = [modeli.get_result(result_name)[key] for modeli in models
+                           if key in modeli.get_result(result_name)]
+                data = np.vstack([resulti.data for resulti in results])
+                times = np.hstack([resulti._times for resulti in results])
+                assert np.array_equal(data, result.data), result_name
+                assert np.array_equal(times, result._times), result_name
+
+    def test_follow_transient(self):
+        """follows a transient OP2 as it's written"""
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        follower, models = self._write_in_chunks(op2_filename, 40)
+        assert follower.is_finished
+        assert follower.poll() is None
+        self._check_results(op2_filename, models)
+
+        # the result tables were decoded before they were closed
+        disps = [modeli.displacements for modeli in models if modeli.displacements]
+        assert len(disps) > 1, len(disps)
+
+    def test_follow_64_bit(self):
+        """follows a finished 64-bit OP2"""
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=self.log)
+        op2_filename64 = os.path.join(self.dirname, 'transient64.op2')
+        model.write_op2(op2_filename64, size=8, skips=['grid_point_forces'])
+
+        follower = OP2Follower(op2_filename64, combine=False, log=self.log)
+        models = list(follower.follow(interval=0.0))
+        assert len(models) == 1, len(models)
+        assert follower.size == 8
+        self._check_results(op2_filename64, models)
+
+    def test_follow_missing(self):
+        """waits for an OP2 that doesn't exist"""
+        op2_filename = os.path.join(self.dirname, 'missing.op2')
+        follower = OP2Follower(op2_filename, log=self.log)
+        assert list(follower.follow(interval=0.0, timeout=0.0)) == []
+        assert not follower.is_finished
+
+        # a partial header
+        with open(op2_filename, 'wb') as op2_file:
+            op2_file.write(b'\x04\x00\x00\x00\x03\x00')
+        assert follower.poll() is None
+        assert follower.n == 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,90 @@
+"""tests the chunked/compressed HDF5 export and the lazy HDF5 load"""
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import OP2, read_op2
+try:
+    import h5py
+    from pyNastran.op2.op2_interface.hdf5_interface import HDF5Exporter, get_chunk_shape
+    IS_H5PY = True
+except ModuleNotFoundError:  # pragma: no cover
+    IS_H5PY = False
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+@unittest.skipIf(not IS_H5PY, 'h5py is required')
+class TestOP2HDF5Export(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_chunk_shape(self):
+        """the time/element axes are split and the columns aren't"""
+        assert get_chunk_shape((50, 100_000, 6), 4) == (4, 6250, 6)
+        assert get_chunk_shape((1, 100_000, 6), 4) == (1, 25000, 6)
+        assert get_chunk_shape((10, 20, 6), 4) == (10, 20, 6)
+        assert get_chunk_shape((100_000, 3), 4) == (50000, 3)
+        assert get_chunk_shape((0, 3), 4) is None
+
+    def test_hdf5_export_compressed(self):
+        """the compressed exports match the default export"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=log)
+
+        # a small chunk size, so the results are split into many chunks
+        exporters = [
+            HDF5Exporter(compression='gzip', chunk_nbytes=4096, min_nbytes=0, nthreads=1),
+            HDF5Exporter(compression='gzip', chunk_nbytes=4096, min_nbytes=0, nthreads=4),
+            HDF5Exporter(compression='lzf', chunk_nbytes=4096, min_nbytes=0),
+        ]
+        displacement = model.displacements[1]
+        stress = model.op2_results.stress.chexa_stress[1]
+        for i, exporter in enumerate(exporters):
+            hdf5_filename = os.path.join(self.dirname, f'model_{i}.h5')
+            model.export_hdf5_filename(hdf5_filename, exporter=exporter)
+
+            with h5py.File(hdf5_filename, 'r') as h5_file:
+                dataset = h5_file['Subcase=1']['displacements']['data']
+                assert dataset.compression == exporter.compression
+                assert dataset.chunks == get_chunk_shape(
+                    displacement.data.shape, displacement.data.dtype.itemsize, 4096)
+
+            model2 = OP2(log=log)
+            model2.load_hdf5_filename(hdf5_filename)
+            displacement2 = model2.displacements[1]
+            assert np.array_equal(displacement.data, displacement2.data)
+            stress2 = model2.op2_results.stress.chexa_stress[1]
+            assert np.array_equal(stress.data, stress2.data)
+
+    def test_hdf5_load_lazy(self):
+        """the data is sliced from the file"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model = read_op2(op2_filename, log=log)
+        hdf5_filename = os.path.join(self.dirname, 'model.h5')
+        model.export_hdf5_filename(hdf5_filename, exporter=HDF5Exporter(compression='gzip'))
+
+        model2 = OP2(log=log)
+        model2.load_hdf5_filename(hdf5_filename, lazy=True)
+        displacement = model.displacements[1]
+        data = model2.displacements[1].data
+        assert isinstance(data, h5py.Dataset)
+        assert np.array_equal(data[:, 3, :], displacement.data[:, 3, :])
+        assert np.array_equal(data[2], displacement.data[2])
+        model2.h5_file.close()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
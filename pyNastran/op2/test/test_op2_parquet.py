@@ -0,0 +1,95 @@
+"""tests the Parquet export of the OP2 results"""
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.op2_interface.parquet_interface import IS_PYARROW, get_partition
+if IS_PYARROW:
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+@unittest.skipIf(not IS_PYARROW, 'pyarrow is required')
+class TestOP2Parquet(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_parquet_static(self):
+        """exports the real results and queries them as a dataset"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'elements' / 'static_elements.op2'
+        model = read_op2(op2_filename, log=log)
+        parquet_filenames = model.export_parquet(self.dirname, row_group_size=20)
+        assert len(parquet_filenames) == 84, len(parquet_filenames)
+
+        # the columns vary by result/element type
+        dataset = ds.dataset(Path(self.dirname) / 'result_type=stress' / 'element_type=cquad4',
+                             format='parquet', partitioning='hive')
+        stress = model.op2_results.stress.cquad4_stress[1]
+        table = dataset.to_table(
+            columns=['element_id', 'node_id', 'oxx', 'von_mises', 'subcase'],
+            filter=ds.field('subcase') == 1)
+        assert table.num_rows == stress.data.shape[1]
+        assert np.array_equal(table['element_id'].to_numpy(), stress.element_node[:, 0])
+        assert np.array_equal(table['node_id'].to_numpy(), stress.element_node[:, 1])
+        assert np.array_equal(table['von_mises'].to_numpy(), stress.data[0, :, 7])
+        assert np.all(table['subcase'].to_numpy() == 1)
+
+        # many row groups
+        parquet_file = pq.ParquetFile(
+            Path(self.dirname) / 'result_type=stress' / 'element_type=cquad4' / 'subcase=1' / 'part-0.parquet')
+        assert parquet_file.num_row_groups == int(np.ceil(stress.data.shape[1] / 20))
+        metadata = parquet_file.schema_arrow.metadata
+        assert metadata[b'class_name'] == b'RealPlateStressArray'
+
+        # the grid point force ids are per time
+        gpforce = model.grid_point_forces[1]
+        table = pq.read_table(
+            Path(self.dirname) / 'result_type=grid_point_forces' / 'element_type=all' / 'subcase=1' / 'part-0.parquet')
+        assert np.array_equal(table['node_id'].to_numpy(), gpforce.node_element[0, :, 0])
+        assert table['element_name'].to_pylist() == gpforce.element_names[0].tolist()
+        assert np.array_equal(table['f1'].to_numpy(), gpforce.data[0, :, 0])
+
+    def test_parquet_complex_modes(self):
+        """splits the complex results and adds the mode/eigenvalue columns"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'elements' / 'modes_complex_elements.op2'
+        model = read_op2(op2_filename, log=log)
+        model.export_parquet(self.dirname, result_names=['eigenvectors'], row_group_size=7)
+
+        eigenvectors = model.eigenvectors[1]
+        ntimes, nnodes = eigenvectors.data.shape[:2]
+        table = ds.dataset(self.dirname, format='parquet', partitioning='hive').to_table()
+        assert table.num_rows == ntimes * nnodes
+        assert table.column_names[:4] == ['mode', 'eigr', 'eigi', 'node_id'], table.column_names
+        assert np.array_equal(table['mode'].to_numpy(), np.repeat(eigenvectors.modes, nnodes))
+        assert np.array_equal(table['node_id'].to_numpy(),
+                              np.tile(eigenvectors.node_gridtype[:, 0], ntimes))
+        t1 = eigenvectors.data[:, :, 0].ravel()
+        assert np.array_equal(table['t1_real'].to_numpy(), t1.real)
+        assert np.array_equal(table['t1_imag'].to_numpy(), t1.imag)
+
+    def test_get_partition(self):
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'elements' / 'static_elements.op2'
+        model = read_op2(op2_filename, log=log)
+        stress = model.op2_results.stress.cquad4_composite_stress[1]
+        assert get_partition('stress.cquad4_composite_stress', 1, stress) == ('stress', 'cquad4_composite', '1')
+        assert get_partition('displacements', (1, 2, 1, 0, 0, '', ''),
+                             model.displacements[1]) == ('displacements', 'node', '1')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
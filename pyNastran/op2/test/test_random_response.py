@@ -0,0 +1,110 @@
+"""tests the random response of frequency response results"""
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.random_response import (
+    get_input_psd, psd_response, spectral_moments, rms_response,
+    zero_crossing_rate, miles_rms, random_results, random_op2_results)
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+class TestRandomResponse(unittest.TestCase):
+    def test_nastran_rms(self):
+        """the RMS/zero crossings of the Nastran PSDs match Nastran"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'random' / 'rms_tri_oesrmx1.op2'
+        model = read_op2(op2_filename, log=log)
+        for result_name in ['displacements', 'accelerations', 'spc_forces', 'cbar_stress']:
+            psd = getattr(model.op2_results.psd, result_name)[(1, 5, 2, 0, 0, '', '')]
+            rms = getattr(model.op2_results.rms, result_name)[(1, 5, 1, 0, 0, '', '')].data[0]
+            no = getattr(model.op2_results.no, result_name)[(1, 5, 1, 0, 0, '', '')].data[0]
+
+            freqs = psd._times
+            scale = np.abs(rms).max()
+            assert np.allclose(rms_response(psd.data, freqs), rms, atol=1e-6 * scale), result_name
+            assert np.allclose(zero_crossing_rate(psd.data, freqs), no, rtol=1e-5), result_name
+
+    def test_spectral_moments(self):
+        """the moments of a piecewise linear PSD are exact"""
+        freqs = np.array([1., 2.5, 4., 4., 10.])
+        psd = 3. * freqs + 1.
+        moments = spectral_moments(psd, freqs, orders=(0, 1, 2, 4))
+        for order, moment in zip((0, 1, 2, 4), moments):
+            expected = 3. * (10. ** (order + 2) - 1.) / (order + 2) + (10. ** (order + 1) - 1.) / (order + 1)
+            assert np.allclose(moment, expected), (order, moment, expected)
+
+    def test_miles(self):
+        """a single degree of freedom system on a flat base PSD"""
+        freqs = np.linspace(10., 2000., 20001)
+        fn = 100.
+        q = 10.
+        ratio = freqs / fn
+        damping = 1. / q * ratio * 1j
+        transmissibility = (1. + damping) / (1. - ratio ** 2 + damping)
+
+        asd = 0.04
+        s_in = np.full((len(freqs), 1, 1), asd, dtype='complex128')
+        psd = psd_response(transmissibility[np.newaxis, :], s_in)
+        grms = rms_response(psd, freqs)
+        assert np.allclose(grms, miles_rms(fn, q, asd), rtol=0.01)
+
+        # the response is dominated by the resonance
+        assert np.allclose(zero_crossing_rate(psd, freqs), fn, rtol=0.3)
+
+    def test_correlated_loads(self):
+        """correlated RANDPS loads of the good_sine subcases"""
+        log = SimpleLogger(level='warning')
+        op2_filename = MODEL_PATH / 'freq_sine' / 'good_sine.op2'
+        model = read_op2(op2_filename, log=log)
+        subcase_ids = [101, 102, 103]
+
+        bdf_model = BDF(log=log)
+        table = bdf_model.add_tabrnd1(1, [1., 10., 1000.], [0.01, 0.1, 0.1],
+                                      xaxis='LOG', yaxis='LOG')
+        bdf_model.add_randps(100, 101, 101, x=1., tid=1)
+        bdf_model.add_randps(100, 102, 102, x=1., tid=1)
+        bdf_model.add_randps(100, 101, 102, x=1., tid=1)
+        bdf_model.add_randps(100, 103, 103, x=2.)
+
+        responses = random_op2_results(
+            model, bdf_model, 100, subcase_ids,
+            result_names=['displacements', 'force.cbar_force'])
+        assert len(responses) == 2, list(responses)
+
+        for result_name, response in responses.items():
+            results = [model.get_result(result_name)[subcase_id] for subcase_id in subcase_ids]
+            h1, h2, h3 = [result.data.astype('complex128') for result in results]
+            freqs = results[0]._times
+            gf = table.interpolate(freqs)[:, np.newaxis, np.newaxis]
+
+            # the 101/102 loads are fully correlated
+            psd = np.abs(h1 + h2) ** 2 * gf + 2. * np.abs(h3) ** 2
+            assert np.allclose(response.psd, psd), result_name
+            assert np.allclose(response.rms, rms_response(psd, freqs)), result_name
+            assert np.allclose(response.zero_crossing_rate, zero_crossing_rate(psd, freqs)), result_name
+            assert response.headers == results[0].get_headers()
+            str(response)
+
+            # chunked without the PSD
+            s_in = get_input_psd(bdf_model, 100, subcase_ids, freqs)
+            response2 = random_results(results, s_in, save_psd=False, max_nbytes=1)
+            assert response2.psd is None
+            assert np.allclose(response2.rms, response.rms)
+            assert np.allclose(response2.zero_crossing_rate, response.zero_crossing_rate)
+
+        with self.assertRaises(KeyError):
+            get_input_psd(bdf_model, 100, [101, 102], freqs)
+        with self.assertRaises(KeyError):
+            get_input_psd(bdf_model, 200, subcase_ids, freqs)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
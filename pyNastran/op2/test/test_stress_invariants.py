@@ -0,0 +1,132 @@
+"""tests the vectorized stress/strain invariants"""
+import unittest
+from pathlib import Path
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.tables.oes_stressStrain.stress_invariants import (
+    principal_2d, principal_3d, von_mises, equivalent_strain, max_shear,
+    octahedral_shear, StressInvariants)
+
+PKG_PATH = Path(pyNastran.__path__[0])
+MODEL_PATH = (PKG_PATH / '..' / 'models').resolve()
+
+
+def _relative_error(actual: np.ndarray, expected: np.ndarray) -> float:
+    scale = max(np.abs(expected).max(), 1e-30)
+    return np.abs(actual - expected).max() / scale
+
+
+class TestStressInvariants(unittest.TestCase):
+    def test_principal_3d(self):
+        """the closed form principal values match the eigenvalues"""
+        rng = np.random.default_rng(42)
+        components = rng.uniform(-100., 100., size=(6, 1000))
+
+        # hydrostatic, uniaxial, pure shear and a repeated root
+        components[:, 0] = [5., 5., 5., 0., 0., 0.]
+        components[:, 1] = [7., 0., 0., 0., 0., 0.]
+        components[:, 2] = [0., 0., 0., 3., 0., 0.]
+        components[:, 3] = [1., 1., 4., 0., 0., 0.]
+        components[:, 4] = 0.
+        oxx, oyy, ozz, txy, tyz, txz = components
+
+        a_matrix = np.zeros((1000, 3, 3))
+        a_matrix[:, 0, 0] = oxx
+        a_matrix[:, 1, 1] = oyy
+        a_matrix[:, 2, 2] = ozz
+        a_matrix[:, 0, 1] = a_matrix[:, 1, 0] = txy
+        a_matrix[:, 1, 2] = a_matrix[:, 2, 1] = tyz
+        a_matrix[:, 0, 2] = a_matrix[:, 2, 0] = txz
+        eigenvalues = np.linalg.eigvalsh(a_matrix)
+
+        omax, omid, omin = principal_3d(*components)
+        assert np.allclose(omax, eigenvalues[:, 2], atol=1e-10)
+        assert np.allclose(omid, eigenvalues[:, 1], atol=1e-10)
+        assert np.allclose(omin, eigenvalues[:, 0], atol=1e-10)
+
+        # engineering shear strains are halved
+        omax2, omid2, omin2 = principal_3d(oxx, oyy, ozz, 2 * txy, 2 * tyz, 2 * txz,
+                                           is_stress=False)
+        assert np.allclose(omax2, omax)
+        assert np.allclose(omin2, omin)
+
+        # the plane stress values include the zero principal
+        angle, omax_2d, omin_2d = principal_2d(oxx, oyy, txy)
+        omax, omid, omin = principal_3d(oxx, oyy, txy=txy)
+        assert np.allclose(np.maximum(omax_2d, 0.), omax)
+        assert np.allclose(np.minimum(omin_2d, 0.), omin)
+        assert np.all(np.abs(angle) <= 90.)
+
+    def test_von_mises(self):
+        """von mises from the components and principal values"""
+        oxx, oyy, ozz, txy, tyz, txz = np.random.default_rng(0).uniform(-1., 1., size=(6, 100))
+        omax, omid, omin = principal_3d(oxx, oyy, ozz, txy, tyz, txz)
+        ovm = np.sqrt(0.5 * ((omax - omid) ** 2 + (omid - omin) ** 2 + (omin - omax) ** 2))
+        assert np.allclose(von_mises(oxx, oyy, ozz, txy, tyz, txz), ovm)
+        assert np.allclose(octahedral_shear(oxx, oyy, ozz, txy, tyz, txz),
+                           np.sqrt(2.) / 3. * ovm)
+
+        # uniaxial strain for an incompressible material
+        assert np.allclose(equivalent_strain(1., -0.5, -0.5), 1.)
+        assert np.allclose(von_mises(1., -0.5, -0.5, is_stress=False), 1.)
+
+        # the out array
+        out = np.zeros(100)
+        von_mises(oxx, oyy, ozz, txy, tyz, txz, out=out)
+        assert np.allclose(out, ovm)
+        max_shear(omax, omin, out=out)
+        assert np.allclose(out, (omax - omin) / 2.)
+        assert np.allclose(max_shear(omax, omin, is_stress=False), omax - omin)
+
+    def test_nastran_columns(self):
+        """the invariants match the Nastran derived columns"""
+        log = SimpleLogger(level='warning')
+        for op2_filename, is_von_mises in [
+                (MODEL_PATH / 'elements' / 'static_elements.op2', True),
+                (MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar_straincurve_shear.op2', False)]:
+            model = read_op2(op2_filename, log=log)
+            if is_von_mises:
+                displacement = model.displacements[1]
+            for result_name in ['stress.chexa_stress', 'strain.ctetra_strain',
+                                'stress.cquad4_stress', 'strain.ctria3_strain',
+                                'stress.cquad4_composite_stress', 'strain.ctria3_composite_strain']:
+                result = model.get_result(result_name)[1]
+                data = result.data
+                invariants = StressInvariants(result)
+                if 'composite' in result_name:
+                    expected = [('max_principal', 6), ('min_principal', 7), ('max_shear', 8)]
+                elif data.shape[2] == 10:
+                    assert result.is_von_mises is is_von_mises
+                    expected = [('max_principal', 6), ('mid_principal', 7), ('min_principal', 8),
+                                ('von_mises' if is_von_mises else 'octahedral_shear', 9)]
+                else:
+                    expected = [('max_principal', 5), ('min_principal', 6),
+                                ('von_mises' if result.is_von_mises else 'max_shear', 7)]
+
+                    # plane stress doesn't use the zero out-of-plane principal
+                    omax = invariants.max_principal
+                    assert omax.shape == data.shape[:2]
+                    angle = principal_2d(data[:, :, 1], data[:, :, 2], data[:, :, 3],
+                                         is_stress=result.is_stress)[0]
+                    assert _relative_error(angle, data[:, :, 4]) < 1e-5, result_name
+
+                for name, icolumn in expected:
+                    error = _relative_error(invariants[name], data[:, :, icolumn])
+                    assert error < 1e-5, (result_name, name, error)
+
+                # the derived columns are recomputed from the components
+                if data.shape[2] == 10:
+                    data0 = data.copy()
+                    result.update_data_components()
+                    assert _relative_error(result.data[:, :, 6:], data0[:, :, 6:]) < 1e-5
+
+        with self.assertRaises(NotImplementedError):
+            StressInvariants(displacement)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -30,7 +30,8 @@ from struct import calcsize
 from itertools import count
 from typing import Optional, TYPE_CHECKING
 import numpy as np
-from numpy import arccos, sqrt, pi, cos, unique, cross, ndarray
+from numpy import unique, cross, ndarray
+from pyNastran.op2.tables.oes_stressStrain.stress_invariants import principal_3d as _principal_3d
 if TYPE_CHECKING:  # pragma: no cover
     from cpylog import SimpleLogger
     from pyNastran.bdf.bdf import Coord
@@ -334,23 +335,12 @@ def abs_max_min(values: np.ndarray, global_abs_max: bool=True):
 
 
 def principal_3d(o11, o22, o33, o12, o23, o13):
-    """http://www.continuummechanics.org/cm/principalstrain.html"""
-    # e = a
-    i1 = o11 + o22 + o33
-    i2 = o11*o22 + o22*o33 + o11*o33 - o12**2 - o13**2 - o23**2
-    i3 = o11*o22*o33 - o11*o23**2 - o22*o13**2 + 2*o12*o13*o23
-    Q = 3 * i2 - i1**2
-    R = (2*i1**3 - 9*i1*i2 + 27*i3) / 54.
-    theta = arccos(R / sqrt(-Q**3))
-
-    q2 = 2 * sqrt(-Q)
-    i13 = 1./3. * i1
-    p1 = q2 * cos(theta/3) + i13
-    p2 = q2 * cos(theta/3 + 2*pi/3.) + i13
-    p3 = q2 * cos(theta/3 + 4*pi/3.) + i13
-    max_min_mid = np.array([p1, p2, p3])
-    pmax = max_min_mid.max(axis=0)
-    pmin = max_min_mid.min(axis=0)
+    """
+    Gets the max/min principal stresses
+
+    See ``stress_invariants.principal_3d`` for the mid value and strains.
+    """
+    pmax, unused_pmid, pmin = _principal_3d(o11, o22, o33, o12, o23, o13)
     return pmax, pmin
 
 
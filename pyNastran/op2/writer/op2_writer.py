@@ -1,14 +1,16 @@
 #pylint: disable=W0201,C0301,C0111
 from __future__ import annotations
 import datetime
+import inspect
 from collections import defaultdict
 from struct import pack, Struct
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 from cpylog import get_logger2
 
 #import pyNastran
 from pyNastran.op2.op2_interface.op2_f06_common import OP2_F06_Common
 from pyNastran.op2.op2_interface.write_utils import _write_markers
+from pyNastran.op2.writer.utils import write_markers, pack_record
 #from pyNastran.op2.errors import FatalError
 from .case_writer import write_casecc
 from .geom1_writer import write_geom1
@@ -46,7 +48,8 @@ class OP2Writer(OP2_F06_Common):
                   endian: bytes=b'<',
                   includes: Optional[list[str]]=None,
                   skips: Optional[list[str]]=None,
-                  nastran_format: Optional[str]=None) -> int:
+                  nastran_format: Optional[str]=None,
+                  size: int=4) -> int:
         """
         Writes an OP2 file based on the data we have stored in the object
 
@@ -64,6 +67,9 @@ class OP2Writer(OP2_F06_Common):
             list of results to skip; exclusive with includes
         nastran_format : str; default=None -> 'msc'
             supported formats: ['msc', 'nx', 'optistruct']
+        size : int; default=4
+            4 : 32-bit OP2
+            8 : 64-bit OP2 (NX-style); only the result tables are written
         #is_mag_phase : bool; default=False
             #should complex data be written using Magnitude/Phase
             #instead of Real/Imaginary (default=False; Real/Imag)
@@ -73,6 +79,7 @@ class OP2Writer(OP2_F06_Common):
         if nastran_format is None:
             nastran_format = self._nastran_format
         assert nastran_format in {'msc', 'nx', 'optistruct'}, nastran_format
+        assert size in {4, 8}, size
         skips = _set_skips(self, includes, skips)
 
         #print('writing %s' % op2_outname)
@@ -95,7 +102,7 @@ class OP2Writer(OP2_F06_Common):
                 op2_file, fop2_ascii, self,
                 skips,
                 post=post, endian=endian,
-                nastran_format=nastran_format)
+                nastran_format=nastran_format, size=size)
         except Exception:  # NotImplementedError
             if close:
                 op2_file.close()
@@ -157,13 +164,23 @@ def _set_skips(model: OP2Writer, includes: Optional[list[str]], skips: Optional[
 def _write_op2(op2_file, fop2_ascii, obj: OP2,
                skips: set[str],
                post: int=-1, endian: bytes=b'<',
-               nastran_format: str='nx') -> tuple[int, list[str]]:
+               nastran_format: str='nx', size: int=4) -> tuple[int, list[str]]:
     """actually writes the op2"""
     date = obj.date
     #op2_ascii.write('writing [3, 7, 0] header\n')
 
+    if size == 8:
+        # the geometry writers are 32-bit only
+        geom_tables = {'GEOM1', 'GEOM2', 'GEOM3', 'GEOM4', 'EPT', 'MPT',
+                       'EDT', 'EDOM', 'DIT', 'grid_point_weight'}
+        if (hasattr(obj, 'nodes') or obj.grid_point_weight) and not geom_tables.issubset(skips):
+            obj.log.warning('skipping the geometry tables and grid_point_weight; '
+                            '64-bit OP2 writing only supports result tables')
+        skips = skips | geom_tables
+
     struct_3i = Struct(endian + b'3i')
-    write_op2_header(obj, op2_file, fop2_ascii, struct_3i, post=post, endian=endian)
+    write_op2_header(obj, op2_file, fop2_ascii, struct_3i, post=post, endian=endian,
+                     size=size)
     #if 'CASECC' not in skips:
         #write_casecc(op2_file, fop2_ascii, obj, endian=endian, nastran_format=nastran_format)
     obj.log.debug(f'nastran_format={nastran_format}')
@@ -197,12 +214,13 @@ def _write_op2(op2_file, fop2_ascii, obj: OP2,
     # nastran puts the tables in order of the Case Control deck,
     # but we're lazy so we just hardcode the order
 
-    case_count, table_names = _write_result_tables(obj, op2_file, fop2_ascii, struct_3i, endian, skips)
+    case_count, table_names = _write_result_tables(obj, op2_file, fop2_ascii, struct_3i, endian, skips,
+                                                   size=size)
     return case_count, table_names
 
 def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                          struct_3i,
-                         endian, skips: set[str]) -> tuple[int, list[str]]:
+                         endian, skips: set[str], size: int=4) -> tuple[int, list[str]]:
     """writes the op2 result tables"""
     table_names_found = []
     date = obj.date
@@ -358,10 +376,10 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
         #'OUGV1',
     ]
 
-    footer = [4, 0, 4]
-    footer_bytes = struct_3i.pack(*footer)
-
-    struct_9i = Struct(endian + b'9i')
+    footer = [size, 0, size]
+    # only pass size to the 64-bit writers, so the 32-bit path is unchanged
+    size_kwargs = {} if size == 4 else {'size': size}
+    skipped_classes = set()
     for table_name in pretables + table_order:
         if table_name not in res_categories2:
             # no LAMA table in a static run
@@ -380,6 +398,13 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                 #print(element_name)
 
             #print(result.class_name)
+            if size_kwargs and not _supports_size(result):
+                class_name = result.__class__.__name__
+                if class_name not in skipped_classes:
+                    log.warning(f'skipping {class_name}; 64-bit OP2 writing is not supported')
+                    skipped_classes.add(class_name)
+                continue
+
             if hasattr(result, 'write_op2'):
                 if result.table_name not in table_names_found:
                     table_names_found.append(result.table_name)
@@ -399,7 +424,8 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                         #table_name, result.__class__.__name__,
                         #isubcase, element_name, itable, new_result))
                     itable = result.write_op2(op2_file, fop2_ascii, itable, new_result,
-                                              date, is_mag_phase=False, endian=endian)
+                                              date, is_mag_phase=False, endian=endian,
+                                              **size_kwargs)
                 except Exception:
                     print(f' {result.__class__.__name__} - isubcase={isubcase}{element_name}')
                     raise
@@ -414,14 +440,10 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                 #continue
 
             case_count += 1
-            header = [
-                4, itable, 4,
-                4, 1, 4,
-                4, 0, 4,
-            ]
+            header = [itable, 1, 0]
             #print('writing itable=%s' % itable)
             assert itable is not None, '%s itable is None' % result.__class__.__name__
-            op2_file.write(struct_9i.pack(*header))
+            write_markers(op2_file, header, size=size, endian=endian)
             fop2_ascii.write('footer2 = %s\n' % header)
             new_result = False
 
@@ -430,7 +452,7 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
             #print(result.table_name, itable)
             #print('res_category_name=%s case_count=%s'  % (res_category_name, case_count))
             # close off the result - [4, 0, 4]
-            op2_file.write(footer_bytes)
+            write_markers(op2_file, [0], size=size, endian=endian)
             fop2_ascii.write('close_a = %s\n' % footer)
             fop2_ascii.write('---------------\n')
             total_case_count += case_count
@@ -440,12 +462,17 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
         #raise FatalError('total_case_count = 0')
 
     # close off the op2 - [4, 0, 4]
-    op2_file.write(footer_bytes)
+    write_markers(op2_file, [0], size=size, endian=endian)
     fop2_ascii.write('close_b = %s\n' % footer)
     op2_file.close()
     fop2_ascii.close()
     return total_case_count, table_names_found
 
+def _supports_size(result: Any) -> bool:
+    """can the result be written to a 64-bit OP2?"""
+    write_op2 = getattr(result, 'write_op2', None)
+    return write_op2 is not None and 'size' in inspect.signature(write_op2).parameters
+
 def _fix_subcase_id(key: int | tuple[Any], res: Any) -> None:
     """
     The subcase id may be inconsistent between the op2 result object
@@ -459,8 +486,13 @@ def _fix_subcase_id(key: int | tuple[Any], res: Any) -> None:
 
 def write_op2_header(model: OP2, op2_file, fop2_ascii,
                      struct_3i: Struct,
-                     post: int=-1, endian: bytes=b'<'):
-    """writes the op2 header"""
+                     post: int=-1, endian: bytes=b'<', size: int=4):
+    """
+    writes the op2 header
+
+    The 64-bit (size=8) header is always written in the NX style
+    (interlaced strings), so it's consistent with the result tables.
+    """
     is_nx = model.is_nx
     is_msc = model.is_msc
     #is_nasa95 = model.is_nasa95
@@ -469,7 +501,18 @@ def write_op2_header(model: OP2, op2_file, fop2_ascii,
         today = datetime.datetime.today()
         model.date = (today.month, today.day, today.year)
 
-    if post == -1:
+    if size == 8:
+        if post != -1:
+            raise RuntimeError(f'post = {post:d}; use -1 for a 64-bit OP2')
+        month, day, year = model.date
+        write_markers(op2_file, [3], size=size, endian=endian)
+        op2_file.write(pack_record(b'3i', [month, day, year - 2000], size=size, endian=endian))
+        write_markers(op2_file, [7], size=size, endian=endian)
+        op2_file.write(pack_record(b'28s', [b'NASTRAN FORT TAPE ID CODE - '], size=size, endian=endian))
+        write_markers(op2_file, [2], size=size, endian=endian)
+        op2_file.write(pack_record(b'8s', [b'NX8.5   '], size=size, endian=endian))
+        write_markers(op2_file, [-1, 0], size=size, endian=endian)
+    elif post == -1:
     #_write_markers(op2_file, op2_ascii, [3, 0, 7])
         op2_file.write(struct_3i.pack(*[4, 3, 4,]))
         tape_code = b'NASTRAN FORT TAPE ID CODE - '
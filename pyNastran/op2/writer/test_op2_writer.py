@@ -1,5 +1,10 @@
 import unittest
 import os
+import shutil
+import tempfile
+from unittest import mock
+
+import numpy as np
 from cpylog import SimpleLogger
 
 import pyNastran
@@ -7,7 +12,13 @@ import pyNastran
 #from pyNastran.op2.op2 import FatalError
 #from pyNastran.op2.op2_interface.op2_common import get_scode_word
 from pyNastran.op2.op2_geom import read_op2_geom
-from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2 import OP2, read_op2
+from pyNastran.op2.writer.utils import get_table4_record
+try:
+    import h5py  # pylint: disable=unused-import
+    IS_H5PY = True
+except ModuleNotFoundError:  # pragma: no cover
+    IS_H5PY = False
 #from pyNastran.op2.test.test_op2 import run_op2
 #from pyNastran.op2.writer.op2_writer import OP2Writer
 
@@ -401,5 +412,91 @@ class TestOP2Writer(unittest.TestCase):
                              #skip_results=['params', ],
                              #stop_on_failure=True, debug=False)
 
+
+class TestOP2Writer64(unittest.TestCase):
+    """tests the structured record/64-bit OP2 writer"""
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_get_table4_record(self):
+        """the 32/64-bit layouts of a table 4 record"""
+        eids_device = np.array([11, 21])
+        data = np.array([[1., 2.], [3., 4.]])
+        words = np.array([b'CEN/', b'CEN/'])
+        record = get_table4_record([eids_device, words, data], size=4)
+        assert record.itemsize == 16, record.itemsize
+        assert record.tobytes()[:16] == (
+            np.array([11], dtype='<i4').tobytes() + b'CEN/' +
+            np.array([1., 2.], dtype='<f4').tobytes())
+
+        record = get_table4_record([eids_device, words, data], size=8, endian=b'>')
+        assert record.itemsize == 32, record.itemsize
+        assert record.tobytes()[:32] == (
+            np.array([11], dtype='>i8').tobytes() + b'CEN/    ' +
+            np.array([1., 2.], dtype='>f8').tobytes())
+
+    def test_write_64_bit(self):
+        """a 64-bit OP2 reads back the same results"""
+        log = SimpleLogger(level='error')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        model = read_op2(op2_filename, log=log)
+        op2_filename_out = os.path.join(self.dirname, 'transient_64.op2')
+        model.write_op2(op2_filename_out, size=8)
+        with open(op2_filename_out, 'rb') as op2_file:
+            assert op2_file.read(16) == np.array([8, 3, 8], dtype='<i4').tobytes()[:4] + \
+                np.array([3], dtype='<i8').tobytes() + np.array([8], dtype='<i4').tobytes()
+
+        model2 = read_op2(op2_filename_out, log=log)
+        _check_results(model, model2, [
+            'displacements', 'spc_forces', 'stress.chexa_stress', 'stress.cquad4_stress',
+            'stress.crod_stress', 'stress.cbar_stress', 'force.crod_force', 'force.cbar_force'])
+
+    def test_write_64_bit_blocks(self):
+        """large records are split into multiple blocks"""
+        log = SimpleLogger(level='error')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model = read_op2(op2_filename, log=log)
+        op2_filename_out = os.path.join(self.dirname, 'static_64.op2')
+        with mock.patch('pyNastran.op2.writer.utils.MAX_BLOCK_NBYTES', 200):
+            model.write_op2(op2_filename_out, size=8)
+        model2 = read_op2(op2_filename_out, log=log)
+        _check_results(model, model2, [
+            'displacements', 'stress.chexa_stress', 'stress.ctria3_stress', 'strain.cquad4_strain'])
+
+    @unittest.skipIf(not IS_H5PY, 'h5py is required')
+    def test_write_lazy_hdf5(self):
+        """an HDF5-backed model is written a time step at a time"""
+        log = SimpleLogger(level='error')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        model = read_op2(op2_filename, log=log)
+        hdf5_filename = os.path.join(self.dirname, 'transient.h5')
+        model.export_hdf5_filename(hdf5_filename)
+
+        model_h5 = OP2(log=log)
+        model_h5.load_hdf5_filename(hdf5_filename, lazy=True)
+        model_h5.set_mode('msc')
+        assert isinstance(model_h5.displacements[1].data, h5py.Dataset)
+        for size in [4, 8]:
+            op2_filename_out = os.path.join(self.dirname, f'transient_{size}.op2')
+            model_h5.write_op2(op2_filename_out, size=size, skips=['grid_point_forces'])
+            model2 = read_op2(op2_filename_out, log=log)
+            _check_results(model, model2, [
+                'displacements', 'stress.chexa_stress', 'stress.cquad4_stress', 'force.cbar_force'])
+        model_h5.h5_file.close()
+
+
+def _check_results(model: OP2, model2: OP2, table_types: list[str]) -> None:
+    """the results were written and read back"""
+    for table_type in table_types:
+        results = model.get_result(table_type)
+        results2 = model2.get_result(table_type)
+        assert len(results), table_type
+        assert len(results) == len(results2), table_type
+        for result, result2 in zip(results.values(), results2.values()):
+            assert np.array_equal(result.data, result2.data), table_type
+
 if __name__ == '__main__':   # pragma: no cover
     unittest.main()
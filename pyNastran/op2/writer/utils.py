@@ -1,8 +1,14 @@
-from typing import Any
+import re
+from struct import pack
+from typing import Any, BinaryIO
 import numpy as np
 
+#: the maximum number of bytes in an OP2 block; a larger table 4 record
+#: is split into multiple blocks
+MAX_BLOCK_NBYTES = 2 ** 30
+
 def fix_table3_types(table3, size: int=4) -> list[Any]:
-    assert size == 4, size
+    assert size in (4, 8), size
     table3_new = []
     n = 0
     for v in table3:
@@ -11,10 +17,12 @@ def fix_table3_types(table3, size: int=4) -> list[Any]:
         elif isinstance(v, str):
             n += len(v)
         elif isinstance(v, np.int64):
-            v = v.astype('int32')
+            if size == 4:
+                v = v.astype('int32')
             n += 4
         elif isinstance(v, np.float64):
-            v = v.astype('float32')
+            if size == 4:
+                v = v.astype('float32')
             n += 4
         else:
             #print('write_table_3', v)
@@ -22,3 +30,193 @@ def fix_table3_types(table3, size: int=4) -> list[Any]:
         table3_new.append(v)
     assert n == 584, n
     return table3_new
+
+def interlace_bytes(value: bytes) -> bytes:
+    """
+    Converts a 32-bit string to the 64-bit (interlaced) format.
+
+    Example
+    -------
+    >>> interlace_bytes(b'ABCDEFGH')
+    b'ABCD    EFGH    '
+    """
+    assert len(value) % 4 == 0, value
+    return b''.join(value[i:i+4] + b'    ' for i in range(0, len(value), 4))
+
+def write_markers(op2_file: BinaryIO, markers: list[int],
+                  size: int=4, endian: bytes=b'<') -> None:
+    """
+    Writes a set of markers.
+
+    Parameters
+    ----------
+    op2_file : file
+        the op2 file object
+    markers : list[int]
+        a set of 3 markers such as [-3, 1, 0] will write as
+         - size=4: [4, -3, 4, 4, 1, 4, 4, 0, 4]
+         - size=8: [8, -3, 8, 8, 1, 8, 8, 0, 8], where the markers are int64
+    size : int; default=4
+        4 : 32-bit OP2
+        8 : 64-bit OP2
+    endian : bytes; default='<'
+        the endian
+
+    """
+    word = b'i' if size == 4 else b'q'
+    fmt = endian + (b'i' + word + b'i') * len(markers)
+    data = []
+    for marker in markers:
+        data += [size, marker, size]
+    op2_file.write(pack(fmt, *data))
+
+def pack_record(fmt: bytes, data: list[Any],
+                size: int=4, endian: bytes=b'<',
+                is_interlaced: bool=True) -> bytes:
+    """
+    Packs a record with the Fortran [nbytes, data, nbytes] framing.
+
+    Parameters
+    ----------
+    fmt : bytes
+        the 32-bit format without the endian (e.g., b'50i 128s 128s 128s')
+    data : list[int/float/bytes]
+        the values
+    size : int; default=4
+        4 : 32-bit OP2
+        8 : 64-bit OP2; ints/floats are written as int64/float64
+    endian : bytes; default='<'
+        the endian
+    is_interlaced : bool; default=True
+        how strings are written in a 64-bit OP2
+        True : b'ABCDEFGH' -> b'ABCD    EFGH    '
+        False : b'ABCDEFGH' -> b'ABCDEFGH        '
+
+    Returns
+    -------
+    record : bytes
+        the framed record
+
+    """
+    if size == 8:
+        fmt8 = b''
+        data8 = []
+        idata = 0
+        for count, code in re.findall(rb'(\d*)([a-z])', fmt):
+            if code == b's':
+                value = data[idata]
+                if is_interlaced:
+                    value = interlace_bytes(value)
+                else:
+                    value = value + b' ' * len(value)
+                fmt8 += b'%is' % len(value)
+                data8.append(value)
+                idata += 1
+                continue
+            ncount = int(count) if count else 1
+            fmt8 += count + {b'i': b'q', b'f': b'd'}[code]
+            data8.extend(data[idata:idata+ncount])
+            idata += ncount
+        assert idata == len(data), (idata, len(data))
+        fmt, data = fmt8, data8
+
+    payload = pack(endian + fmt, *data)
+    nbytes = len(payload)
+    return pack(endian + b'i', nbytes) + payload + pack(endian + b'i', nbytes)
+
+def get_table4_record(columns: list[np.ndarray],
+                      size: int=4, endian: bytes=b'<') -> np.ndarray:
+    """
+    Builds a table 4 record (one row per node/element) as a structured array.
+
+    Parameters
+    ----------
+    columns : list[(nrows, ) or (nrows, ncols) ndarray]
+        the int/float/bytes columns (e.g., [eid_device, oxx, oyy, ...]);
+        bytes must be a multiple of 4 characters (e.g., b'CEN/')
+    size : int; default=4
+        4 : ints/floats are written as int32/float32
+        8 : ints/floats are written as int64/float64 and strings are interlaced
+    endian : bytes; default='<'
+        the endian
+
+    Returns
+    -------
+    record : (nrows, ) structured ndarray
+        the record, which may be written with ``op2_file.write(record)``
+
+    """
+    uendian = endian.decode('latin1')
+    dtype_fields = []
+    values = []
+    for i, column in enumerate(columns):
+        column = np.asarray(column)
+        kind = column.dtype.kind
+        if kind in 'iu':
+            dtype = f'{uendian}i{size}'
+        elif kind == 'f':
+            dtype = f'{uendian}f{size}'
+        elif kind == 'S':
+            nchars = column.dtype.itemsize
+            assert nchars % 4 == 0, column.dtype
+            if size == 8:
+                words = np.char.ljust(column, nchars).view('S4')
+                column = np.char.add(words, b'    ').view(f'S{2*nchars}').reshape(column.shape)
+            dtype = f'S{nchars * size // 4}'
+        else:  # pragma: no cover
+            raise TypeError(f'column {i} has an unsupported dtype={column.dtype}')
+        dtype_fields.append((f'f{i}', dtype, column.shape[1:]))
+        values.append(column)
+
+    nrows = len(values[0])
+    record = np.empty(nrows, dtype=dtype_fields)
+    for (name, unused_dtype, unused_shape), value in zip(dtype_fields, values):
+        record[name] = value
+    return record
+
+def write_table4(op2_file: BinaryIO, fascii, itable: int, record: np.ndarray,
+                 size: int=4, endian: bytes=b'<') -> int:
+    """
+    Writes a table 4 record (the data of a time/mode/frequency).
+
+    Large records are split into multiple blocks, so each block has
+    fewer than MAX_BLOCK_NBYTES.
+
+    Parameters
+    ----------
+    op2_file : file
+        the op2 file object
+    fascii : file
+        the debug file object
+    itable : int
+        the current table marker (e.g., -3)
+    record : (nrows, ) structured ndarray
+        the data from ``get_table4_record``
+    size : int; default=4
+        4 : 32-bit OP2
+        8 : 64-bit OP2
+    endian : bytes; default='<'
+        the endian
+
+    Returns
+    -------
+    itable : int
+        the next table marker
+
+    """
+    itable -= 1
+    nrows = len(record)
+    nrows_per_block = max(MAX_BLOCK_NBYTES // max(record.itemsize, 1), 1)
+    struct_i = endian + b'i'
+    for irow in range(0, max(nrows, 1), nrows_per_block):
+        block = record[irow:irow + nrows_per_block]
+        nbytes = block.nbytes
+        nwords = nbytes // size
+        markers = [itable, 1, 0, nwords] if irow == 0 else [nwords]
+        write_markers(op2_file, markers, size=size, endian=endian)
+        fascii.write(f'r4 [4, {itable:d}, 4]; nwords={nwords:d}\n')
+        op2_file.write(pack(struct_i, nbytes))
+        op2_file.write(block.data)
+        op2_file.write(pack(struct_i, nbytes))
+    itable -= 1
+    return itable